@@ -1,28 +1,124 @@
-from flask import Flask, redirect, render_template, request, session
-from flask_session import Session
+import atexit
+
+from datetime import datetime, timedelta
+from flask import (Flask, g, jsonify, redirect, render_template, request,
+        session)
 from flask_sqlalchemy import SQLAlchemy
 from werkzeug.exceptions import default_exceptions
-from werkzeug.security import check_password_hash, generate_password_hash
 
 from config import app, db
-from stocks import stocks
+from leaderboard import board
+from pricefeed import PriceFeed, PriceStore
+from sessionstore import SessionStore
+import commands
+import dbpool
 import helpers as h
+import instrumentation
+import migrations
+import passwords
+import pricehistory
 import queries as q
+import quotes
+import replicas
+import symbols
 
 app.jinja_env.filters['usd'] = h.usd
+h.quote_provider = quotes.create_provider(app.config)
+h.quote_cache.configure(
+        app.config['QUOTE_CACHE_TTL'],
+        app.config['QUOTE_CACHE_STALE_TTL'],
+        app.config['QUOTE_CACHE_SIZE'])
+board.max_age = app.config['LEADERBOARD_MAX_AGE']
+instrumentation.init_app(app, [lambda: dbpool.metrics(db.engine.pool)])
+app.session_interface = SessionStore(
+        app.config['SESSION_CACHE_SIZE'],
+        app.config['SESSION_CACHE_TTL'],
+        app.config['SESSION_TOUCH_INTERVAL'])
+passwords.hasher.configure(
+        app.config['PASSWORD_METHOD'],
+        app.config['PASSWORD_SALT_LENGTH'],
+        app.config['PASSWORD_WORKERS'])
 login_required = h.login_required
 
+
+if app.config['PRICE_HISTORY_INTERVAL'] > 0:
+    h.price_recorder = pricehistory.Recorder(
+            app, app.config['PRICE_HISTORY_INTERVAL'])
+    atexit.register(h.price_recorder.flush)
+
+
+@app.before_request
+def forget_users():
+    """Drop users loaded by an earlier request in the same app context"""
+    g.pop('users', None)
+    g.pop('user', None)
+
+
+def log_in(user_id):
+    """Start a fresh session for user_id under a new session id"""
+    replicas.clear_flask_session()
+    session.regenerate()
+    session['user_id'] = user_id
+
+
+@app.errorhandler(passwords.Busy)
+def passwords_busy(e):
+    """Ask the user to retry when password hashing is saturated"""
+    return h.apology("Too many logins right now, try again", 503), 503
+
+
+def held_symbols():
+    """Symbols for the price feed to poll, without holding a DB session"""
+    try:
+        return q.select_held_symbols()
+    finally:
+        db.session.remove()
+
+
+@app.before_first_request
+def check_money_columns():
+    """
+    Refuse to serve a database still holding float dollars, which the
+    app would read as cents, until `flask convert-money` has run
+    """
+    tables = [table.name for table in migrations.float_money_tables()]
+    if tables:
+        message = (f"Money columns of {', '.join(tables)} are still "
+                "floats; run `flask convert-money` first")
+        app.logger.critical(message)
+        raise RuntimeError(message)
+
+
+price_feed = None
+if app.config['PRICE_STORE_PATH']:
+    h.price_store = PriceStore(
+            app.config['PRICE_STORE_PATH'],
+            app.config['PRICE_MAX_AGE'])
+    price_feed = PriceFeed(
+            h.price_store,
+            h.fetch_upstream,
+            held_symbols,
+            app.config['PRICE_FEED_INTERVAL'])
+
+    @app.before_first_request
+    def start_price_feed():
+        """
+        Start polling once this worker is serving requests, unless
+        polling is left to a separate `flask price-feed` process
+        """
+        if app.config['PRICE_FEED_IN_WORKERS']:
+            price_feed.start(app)
+
+
 @app.route('/')
 @login_required
 def index():
     """Show portfolio of user's stocks"""
-    user = q.select_user_by_id(session['user_id'])
     portfolio = h.build_portfolio(
-            q.select_stocks_by_user(user.id),
-            user.cash)
+            q.select_stocks_by_user(g.user.id),
+            g.user.cash)
 
-    return render_template("index.html", portfolio=portfolio,
-            stocks=stocks)
+    return render_template("index.html", portfolio=portfolio)
 
 
 @app.route('/buy', methods=['GET', 'POST'])
@@ -37,72 +133,61 @@ def buy():
             return h.apology("Provide a symbol")
         elif not shares or not shares.isdigit():
             return h.apology("Provide a valid quantity")
+        shares = int(shares)
 
         quote = h.lookup(symbol)
         if not quote:
             return h.apology("No such company")
 
-        order_total = float(shares) * float(quote['price'])
-        user = q.select_user_by_id(session['user_id'])
-
-        if order_total <= user.cash:
-            stock = q.select_stock_by_symbol(quote['symbol'])
-            try: stock.id
-            except AttributeError:
-                q.insert_stock(quote['symbol'], quote['name'])
-                stock = q.select_stock_by_symbol(quote['symbol'])
-            q.insert_transaction(
-                    session['user_id'],
-                    stock.id,
-                    shares,
-                    quote['price']
-                    )
-            q.update_user_cash(order_total*-1, session['user_id'])
-            return redirect('/')
-        return h.apology("Not enough cash")
+        try:
+            q.execute_trade(g.user.id, quote['symbol'],
+                    quote['name'], shares, quote['price'])
+        except q.TradeError as e:
+            return h.apology(str(e))
+        board.record_trade(g.user.id, quote['symbol'],
+                shares, quote['price'])
+        return redirect('/')
     else:
-        return render_template('buy.html', stocks=stocks)
+        return render_template('buy.html')
 
 
 @app.route('/history')
 @login_required
 def history():
-    """Show history of transactions"""
-    history = dict(sorted(
-        h.build_history(
-            q.select_transactions_by_user(
-                session['user_id']
-            )).items()
-        ))
-    return render_template('history.html', history=history)
+    """Show history of transactions, newest first, a page at a time"""
+    if request.args.get('stream'):
+        return h.stream_template('history.html', history=h.iter_history(
+            q.stream_transactions_by_user(g.user.id)))
+
+    before = request.args.get('before')
+    cursor = h.decode_cursor(before) if before else None
+    if before and not cursor:
+        return h.apology("Invalid page")
+
+    page_size = app.config['HISTORY_PAGE_SIZE']
+    transactions = q.select_transactions_page(
+            g.user.id, cursor, page_size + 1)
+    next_page = None
+    if len(transactions) > page_size:
+        transactions = transactions[:page_size]
+        next_page = h.encode_cursor(transactions[-1])
+    return render_template('history.html',
+            history=h.iter_history(transactions),
+            next_page=next_page, paged=bool(before))
 
 
 @app.route('/leaders')
 @login_required
 def leaders():
     """Show leader board"""
-    users = q.select_all_users()
-    leaders = []
-    for user in users:
-        total = user.cash
-        stocks = q.select_stocks_by_user(user.id)
-        for stock in stocks:
-            if stock.quantity > 0:
-                price = h.lookup(stock.symbol)['price']
-                total += stock.quantity * price
-        leaders.append([user.username, total])
-    leaders.sort(reverse=True, key=lambda x: x[1])
-    leaders = leaders[:10]
-    for i in range(len(leaders)):
-        leaders[i][1] = h.usd(leaders[i][1])
-    return render_template('leaders.html', leaders=leaders[:11])
+    board.refresh()
+    board.reprice(h.lookup_many(board.symbols()))
+    return render_template('leaders.html', leaders=board.top())
 
 
 @app.route('/login', methods=['GET','POST'])
 def login():
     """Log user in"""
-    session.clear()
-
     if request.method == 'POST':
         username = request.form.get('username')
         password = request.form.get('password')
@@ -112,8 +197,11 @@ def login():
 
         user = q.select_user_by_username(username)
         try:
-            if check_password_hash(user.password_hash, password):
-                session['user_id'] = user.id
+            if passwords.hasher.check(user.password_hash, password):
+                if passwords.hasher.needs_rehash(user.password_hash):
+                    q.update_user_hash(
+                            passwords.hasher.hash(password), user.id)
+                log_in(user.id)
                 return redirect('/')
             else:
                 return h.apology("Incorrect password")
@@ -126,7 +214,7 @@ def login():
 @app.route('/logout')
 def logout():
     """Log user out"""
-    [session.pop(key) for key in list(session.keys())]
+    session.clear()
     return redirect('/login')
 
 
@@ -139,13 +227,40 @@ def nuke():
         if not confirm or confirm == 'no':
             return h.apology("Ok, we won't reset your portfolio")
         if confirm == 'yes':
-            q.delete_transactions_by_user(session['user_id'])
-            user = q.select_user_by_id(session['user_id'])
-            q.update_user_cash(10000-user.cash, session['user_id'])
+            q.reset_user(g.user.id)
+            board.reset_user(g.user.id, q.STARTING_CASH)
         return redirect('/')
     return redirect('/profile')
 
 
+@app.route('/performance')
+@login_required
+def performance():
+    """
+    Portfolio value over time as JSON, every step seconds (a day by
+    default) from start to end, ISO times in UTC unless they carry an
+    offset, defaulting to the last 30 days
+    """
+    args = request.args
+    try:
+        end = (h.parse_utc(args['end']) if 'end' in args
+                else datetime.utcnow())
+        start = (h.parse_utc(args['start']) if 'start' in args
+                else end - timedelta(days=30))
+        step = timedelta(seconds=float(args.get('step', 86400)))
+    except (OverflowError, TypeError, ValueError):
+        return jsonify(error='Invalid range'), 400
+    if start > end or step <= timedelta(0):
+        return jsonify(error='Invalid range'), 400
+    if (end - start) / step >= app.config['PERFORMANCE_MAX_POINTS']:
+        return jsonify(error='Too many points'), 400
+
+    series = pricehistory.portfolio_series(
+            g.user.id, start, end, step)
+    return jsonify(points=[[when.isoformat(), value]
+        for when, value in series])
+
+
 @app.route('/profile', methods=['GET', 'POST'])
 @login_required
 def profile():
@@ -159,17 +274,15 @@ def profile():
         elif new_password != confirmation:
             return h.apology("New password and confirmation don't match")
 
-        user = q.select_user_by_id(session['user_id'])
-        if check_password_hash(user.password_hash, password):
-            new_hash = generate_password_hash(new_password)
-            q.update_user_hash(new_hash, session['user_id'])
+        if passwords.hasher.check(g.user.password_hash, password):
+            new_hash = passwords.hasher.hash(new_password)
+            q.update_user_hash(new_hash, g.user.id)
+            replicas.clear_flask_session()
             return redirect('/login')
         else:
             return h.apology("Incorrect password")
     else:
-        user = q.select_user_by_id(session['user_id'])
-        user.cash = h.usd(user.cash)
-        return render_template('profile.html', user=user)
+        return render_template('profile.html', user=g.user)
 
 
 @app.route('/quote', methods=['GET', 'POST'])
@@ -187,13 +300,12 @@ def quote():
                 name=quote['name'],
                 )
     else:
-        return render_template('quote.html', stocks=stocks)
+        return render_template('quote.html')
 
 
 @app.route('/register', methods=['GET', 'POST'])
 def register():
     """Register user"""
-    session.clear()
     if request.method == 'POST':
         username, password, confirmation = (
                 request.form.get('username'),
@@ -210,20 +322,31 @@ def register():
         elif password != confirmation:
             return h.apology("Password doesn't match confirmation")
 
-        password_hash = generate_password_hash(password)
+        password_hash = passwords.hasher.hash(password)
 
         try:
             q.insert_user(username, password_hash)
         except Exception:
             return h.apology("Username already exists")
 
-        session['user_id'] = q.select_user_by_username(username).id
+        user = q.select_user_by_username(username)
+        log_in(user.id)
+        board.add_user(user.id, user.username, user.cash)
 
         return redirect('/')
 
     return render_template("register.html")
 
 
+@app.route('/symbols')
+@login_required
+def symbol_search():
+    """Suggest stocks matching the start of a symbol or company name"""
+    matches = symbols.search(request.args.get('q', ''))
+    return jsonify([{'label': f'{symbol} - {name}', 'value': symbol}
+        for symbol, name in matches])
+
+
 @app.route('/sell', methods=['GET', 'POST'])
 @login_required
 def sell():
@@ -235,32 +358,21 @@ def sell():
             return h.apology("Provide a symbol")
         elif not shares or not shares.isdigit():
             return h.apology("Provide a valid quantity")
-        shares = float(shares)
+        shares = int(shares)
         quote = h.lookup(symbol)
         if not quote:
             return h.apology("No such company")
         try:
-            stock = q.select_stock_by_symbol(symbol)
-            position = q.select_transactions_by_stock(
-                    stock.id,
-                    session['user_id'])
-            if position.shares >= shares:
-                order_total = shares * quote['price']
-                q.insert_transaction(
-                        session['user_id'],
-                        stock.id,
-                        shares*-1,
-                        quote['price'])
-                q.update_user_cash(order_total, session['user_id'])
-                return redirect('/')
-            else:
-                return h.apology("You don't own enough of that stock.")
-        except AttributeError:
-            return h.apology("You don't own that stock")
+            q.execute_trade(g.user.id, quote['symbol'],
+                    quote['name'], shares*-1, quote['price'])
+        except q.TradeError as e:
+            return h.apology(str(e))
+        board.record_trade(g.user.id, quote['symbol'],
+                shares*-1, quote['price'])
+        return redirect('/')
     else:
-        user = q.select_user_by_id(session['user_id'])
         return render_template('sell.html',
                 portfolio=h.build_portfolio(
-                    q.select_stocks_by_user(user.id),
-                    user.cash)
+                    q.select_stocks_by_user(g.user.id),
+                    g.user.cash)
                 )
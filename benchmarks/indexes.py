@@ -0,0 +1,96 @@
+"""
+Compare query plans and timings of the hot ledger queries with and
+without the transaction indexes.
+
+    python -m benchmarks.indexes --transactions 2000000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import text
+
+from benchmarks.seed import app, db, seed, sqlite_url
+from models import Transaction
+
+QUERIES = {
+    'history page': '''
+        SELECT t.id, t.quantity, t.price, t.time, s.name, s.symbol
+        FROM "transaction" t JOIN stock s ON s.id = t.stock_id
+        WHERE t.user_id = :user_id
+        ORDER BY t.time DESC, t.id DESC LIMIT 50''',
+    'holdings by user': '''
+        SELECT stock_id, sum(quantity) FROM "transaction"
+        WHERE user_id = :user_id GROUP BY stock_id''',
+    'shares of one stock': '''
+        SELECT sum(quantity) FROM "transaction"
+        WHERE user_id = :user_id AND stock_id = :stock_id''',
+    'holders of a stock': '''
+        SELECT user_id, sum(quantity) FROM "transaction"
+        WHERE stock_id = :stock_id GROUP BY user_id''',
+}
+
+
+def explain(conn, sql, params):
+    """One-line query plan for sql"""
+    if conn.engine.dialect.name == 'sqlite':
+        rows = conn.execute(text('EXPLAIN QUERY PLAN ' + sql), params)
+        return '; '.join(row[-1] for row in rows)
+    rows = conn.execute(text('EXPLAIN ' + sql), params)
+    return '; '.join(row[0].strip() for row in rows)
+
+
+def measure(conn, args, rng):
+    """Plan and median time in ms of each query over random parameters"""
+    results = {}
+    for name, sql in QUERIES.items():
+        timings = []
+        for _ in range(args.repeat):
+            params = {'user_id': rng.randint(1, args.users),
+                    'stock_id': rng.randint(1, args.stocks)}
+            start = time.perf_counter()
+            conn.execute(text(sql), params).fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = (explain(conn, sql, params),
+                statistics.median(timings))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=10000)
+    parser.add_argument('--stocks', type=int, default=2000)
+    parser.add_argument('--transactions', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app.config['SQLALCHEMY_DATABASE_URI'] = sqlite_url(
+                os.path.join(tmp, 'bench.db'))
+        with app.app_context():
+            start = time.perf_counter()
+            seed(args.users, args.stocks, args.transactions)
+            print(f'Seeded {args.transactions:,} transactions in '
+                    f'{time.perf_counter() - start:.1f}s\n')
+
+            with db.engine.connect() as conn:
+                for index in Transaction.__table__.indexes:
+                    index.drop(conn)
+                plain = measure(conn, args, random.Random(1))
+            with db.engine.connect() as conn:
+                for index in Transaction.__table__.indexes:
+                    index.create(conn)
+                indexed = measure(conn, args, random.Random(1))
+
+    for name in QUERIES:
+        print(name)
+        print(f'  no index  {plain[name][1]:9.2f} ms  {plain[name][0]}')
+        print(f'  indexed   {indexed[name][1]:9.2f} ms  {indexed[name][0]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Compare aggregating money as float dollars with integer cents.
+
+Fills two copies of a ledger in SQLite, one with float dollar prices and
+one with integer cents, and times the per-user SUM(quantity * price)
+that portfolio and leaderboard totals need, in SQL and in Python. Then
+replays the same trades against one cash balance both ways and reports
+how far the float balance drifts from the exact one.
+
+    python -m benchmarks.money --rows 1000000
+"""
+import argparse
+import random
+import sqlite3
+import statistics
+import time
+
+
+def fill(conn, rows, users, rng_seed=0):
+    """Create float and integer ledgers holding the same trades"""
+    rng = random.Random(rng_seed)
+    conn.execute('CREATE TABLE dollars (user_id INTEGER, quantity REAL, '
+            'price REAL)')
+    conn.execute('CREATE TABLE cents (user_id INTEGER, quantity INTEGER, '
+            'price INTEGER)')
+    trades = [(rng.randint(1, users), rng.randint(-20, 20),
+            rng.randint(100, 50000)) for _ in range(rows)]
+    conn.executemany('INSERT INTO dollars VALUES (?, ?, ?)',
+            [(user_id, float(quantity), price / 100)
+                for user_id, quantity, price in trades])
+    conn.executemany('INSERT INTO cents VALUES (?, ?, ?)', trades)
+    conn.commit()
+    return trades
+
+
+def timed(fn, repeat):
+    """Median seconds of fn over repeat runs"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--users', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(':memory:')
+    trades = fill(conn, args.rows, args.users)
+    rows = {table: conn.execute(f'SELECT * FROM {table}').fetchall()
+            for table in ('dollars', 'cents')}
+
+    for table in ('dollars', 'cents'):
+        sql = (f'SELECT user_id, SUM(quantity * price) FROM {table} '
+                'GROUP BY user_id')
+        in_sql = timed(lambda: conn.execute(sql).fetchall(), args.repeat)
+
+        def in_python():
+            totals = {}
+            for user_id, quantity, price in rows[table]:
+                totals[user_id] = totals.get(user_id, 0) + quantity * price
+            return totals
+
+        in_py = timed(in_python, args.repeat)
+        print(f'{table:8} SQL {in_sql * 1000:9.1f} ms   '
+                f'Python {in_py * 1000:9.1f} ms')
+
+    cash_dollars, cash_cents = 10000.0, 1000000
+    for _, quantity, price in trades:
+        cash_dollars -= quantity * (price / 100)
+        cash_cents -= quantity * price
+    drift = abs(cash_dollars * 100 - cash_cents)
+    print(f'\nAfter {args.rows:,} trades float cash is off by {drift:.3g} '
+            f'cents ({cash_dollars!r} vs {cash_cents} cents)')
+
+
+if __name__ == '__main__':
+    main()
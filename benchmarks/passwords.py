@@ -0,0 +1,63 @@
+"""
+Login throughput at several password hashing costs.
+
+For each PBKDF2 iteration count, checks one stored hash from many
+threads at once, hashing inline on the request threads and through the
+bounded process pool, and reports checks per second and the p95 time a
+login waits for its check.
+
+    python -m benchmarks.passwords --iterations 50000 150000 260000
+"""
+import argparse
+import os
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from passwords import Hasher
+
+
+def percentile(values, p):
+    """Nearest-rank percentile p of values"""
+    values = sorted(values)
+    return values[min(len(values) - 1, round(p / 100 * (len(values) - 1)))]
+
+
+def run(hasher, pwhash, logins, concurrency):
+    """(checks per second, p95 seconds) of logins concurrent checks"""
+    def login(_):
+        began = time.perf_counter()
+        assert hasher.check(pwhash, 'password')
+        return time.perf_counter() - began
+
+    hasher.check(pwhash, 'password')
+    with ThreadPoolExecutor(concurrency) as pool:
+        start = time.perf_counter()
+        timings = list(pool.map(login, range(logins)))
+        elapsed = time.perf_counter() - start
+    return logins / elapsed, percentile(timings, 95)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, nargs='+',
+            default=[50000, 150000, 260000])
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    print(f'{"iterations":>10} {"mode":>8} {"logins/s":>9} {"p95 ms":>9}')
+    for iterations in args.iterations:
+        method = f'pbkdf2:sha256:{iterations}'
+        for mode, workers in (('inline', 0), ('pool', args.workers)):
+            hasher = Hasher(method, workers=workers, timeout=60)
+            rate, p95 = run(hasher, hasher.hash('password'), args.logins,
+                    args.concurrency)
+            print(f'{iterations:>10} {mode:>8} {rate:9.1f} {p95 * 1000:9.1f}')
+            hasher.configure(method, 16, 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Compare the history and portfolio builders that pre-format every row
+into a dict of strings with the namedtuple rows the templates now format
+through the usd filter.
+
+For each size, reports the time and peak traced allocation of building
+the rows and of rendering them through the row loops of history.html
+and index.html, written both ways.
+
+    python -m benchmarks.rendering --rows 10000 100000
+"""
+import argparse
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime
+
+from jinja2 import Environment
+
+import benchmarks.seed  # noqa: F401 - sets the environment the app needs
+import helpers as h
+
+Transaction = namedtuple('Transaction', 'id quantity price time name symbol')
+Stock = namedtuple('Stock', 'quantity name symbol')
+
+env = Environment()
+env.filters['usd'] = h.usd
+
+# The row loops of history.html and index.html, reading dict rows as
+# they used to and formatting rows with the usd filter as they do now
+DICT_HISTORY = env.from_string('''{% for row in history %}
+<td>{{ row["type"] }}</td><td>{{ row["name"] }}</td>
+<td>{{ row["symbol"] }}</td><td>{{ row["price"] }}</td>
+<td>{{ row["quantity"] }}</td><td>{{ row["total"] }}</td>
+<td>{{ row["time"] }}</td>{% endfor %}''')
+DICT_PORTFOLIO = env.from_string('''{% for stock in portfolio['stocks'] %}
+<td>{{ portfolio['stocks'][stock]['name'] }}</td><td>{{ stock }}</td>
+<td>{{ portfolio['stocks'][stock]['quantity'] }}</td>
+<td>{{ portfolio['stocks'][stock]['price'] }}</td>
+<td>{{ portfolio['stocks'][stock]['value'] }}</td>{% endfor %}
+{{ portfolio['cash'] }} {{ portfolio['total'] }}''')
+ROW_HISTORY = env.from_string('''{% for row in history %}
+<td>{{ row.type }}</td><td>{{ row.name }}</td>
+<td>{{ row.symbol }}</td><td>{{ row.price | usd }}</td>
+<td>{{ row.quantity }}</td><td>{{ row.total | usd }}</td>
+<td>{{ row.time }}</td>{% endfor %}''')
+ROW_PORTFOLIO = env.from_string('''{% for stock in portfolio.stocks %}
+<td>{{ stock.name }}</td><td>{{ stock.symbol }}</td>
+<td>{{ stock.quantity }}</td><td>{{ stock.price | usd }}</td>
+<td>{{ stock.value | usd }}</td>{% endfor %}
+{{ portfolio.cash | usd }} {{ portfolio.total | usd }}''')
+
+
+def dict_history(transactions):
+    """History rows as the builder used to make them"""
+    for transaction in transactions:
+        yield {
+                'name': transaction.name,
+                'symbol': transaction.symbol,
+                'quantity': transaction.quantity,
+                'price': h.usd(transaction.price),
+                'type': 'Sell' if transaction.quantity < 0 else 'Buy',
+                'total': h.usd(transaction.price * transaction.quantity),
+                'time': transaction.time
+        }
+
+
+def dict_portfolio(stocks, cash):
+    """Portfolio as the builder used to make it"""
+    portfolio = {'stocks': {}, 'cash': h.usd(cash), 'total': cash}
+    quotes = h.lookup_many(stock.symbol for stock in stocks)
+    for stock in stocks:
+        price = quotes[stock.symbol]['price']
+        value = stock.quantity * price
+        portfolio['stocks'][stock.symbol] = {
+            'name': stock.name,
+            'quantity': stock.quantity,
+            'price': h.usd(price),
+            'value': h.usd(value),
+        }
+        portfolio['total'] += value
+    portfolio['total'] = h.usd(portfolio['total'])
+    return portfolio
+
+
+def measure(fn):
+    """Seconds and peak traced MB of fn()"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def cases(rows):
+    """(name, old, new) callables for rows rows"""
+    transactions = [Transaction(i, i % 40 - 20 or 1, 1234 + i,
+            datetime(2019, 1, 1), f'Stock {i}', f'S{i}')
+            for i in range(rows)]
+    stocks = [Stock(i % 100 + 1, f'Stock {i}', f'S{i}') for i in range(rows)]
+    h.quote_cache.configure(3600, 0, rows)
+    h.quote_cache.put_many({stock.symbol: {'name': stock.name,
+            'price': 1234, 'symbol': stock.symbol} for stock in stocks})
+    return [
+        ('history build',
+            lambda: list(dict_history(transactions)),
+            lambda: list(h.iter_history(transactions))),
+        ('history render',
+            lambda: DICT_HISTORY.render(
+                history=dict_history(transactions)),
+            lambda: ROW_HISTORY.render(
+                history=h.iter_history(transactions))),
+        ('portfolio build',
+            lambda: dict_portfolio(stocks, 100000),
+            lambda: h.build_portfolio(stocks, 100000)),
+        ('portfolio render',
+            lambda: DICT_PORTFOLIO.render(
+                portfolio=dict_portfolio(stocks, 100000)),
+            lambda: ROW_PORTFOLIO.render(
+                portfolio=h.build_portfolio(stocks, 100000))),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+',
+            default=[10000, 100000])
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        print(f'{rows:,} rows')
+        for name, old, new in cases(rows):
+            old_time, old_mb = measure(old)
+            new_time, new_mb = measure(new)
+            print(f'  {name:17} dicts {old_time * 1000:8.1f} ms '
+                    f'{old_mb:8.1f} MB   rows {new_time * 1000:8.1f} ms '
+                    f'{new_mb:8.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
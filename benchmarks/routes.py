@@ -0,0 +1,313 @@
+"""
+Latency, throughput, SQL and memory profile of the main routes.
+
+Seeds a SQLite database at the given scale, then drives /, /history,
+/leaders, /buy and /sell as random seeded users, either in-process
+through the Flask test client or over HTTP against a multi-worker
+gunicorn server. Quotes come from the simulated provider, so runs need
+no network and see the same prices every time.
+
+Results can be saved as a baseline and later runs compared against it;
+a route whose p95 is slower than its baseline by more than --tolerance
+fails the run.
+
+    python -m benchmarks.routes --users 10000 --transactions 1000000
+    python -m benchmarks.routes --server --workers 4 --concurrency 16
+    python -m benchmarks.routes --save benchmarks/baseline.json
+    python -m benchmarks.routes --compare benchmarks/baseline.json
+"""
+import argparse
+import functools
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from sqlalchemy import event
+
+from benchmarks.seed import app, db, seed, sqlite_url
+from models import Position, Stock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ROUTES = ('/', '/history', '/leaders', '/buy', '/sell')
+
+# Scale arguments a baseline is only comparable at
+SCALE = ('users', 'stocks', 'transactions', 'requests', 'server',
+        'workers', 'concurrency')
+
+
+class Workload:
+    """Random requests from seeded users"""
+
+    def __init__(self, users, symbols, held, rng_seed=1):
+        self.users = users
+        self.symbols = symbols
+        self.held = held
+        self.rng = random.Random(rng_seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, users):
+        """Workload over the stocks and positions in the database"""
+        symbols = [symbol for symbol, in db.session.query(Stock.symbol)]
+        held = db.session.query(Position.user_id, Stock.symbol).join(
+                Stock, Stock.id == Position.stock_id).filter(
+                Position.quantity > 0).all()
+        return cls(users, symbols, held)
+
+    def request(self, route):
+        """(user_id, method, form data) for one request to route"""
+        with self._lock:
+            if route == '/buy':
+                return (self.rng.randint(1, self.users), 'POST',
+                        {'symbol': self.rng.choice(self.symbols),
+                            'shares': 1})
+            if route == '/sell':
+                user_id, symbol = self.rng.choice(self.held)
+                return user_id, 'POST', {'symbol': symbol, 'shares': 1}
+            return self.rng.randint(1, self.users), 'GET', None
+
+
+class QueryCounter:
+    """Count statements executed on an engine"""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, 'before_cursor_execute', self._count)
+
+    def _count(self, *args):
+        self.count += 1
+
+
+@functools.lru_cache(maxsize=None)
+def session_cookie(user_id):
+    """Session cookie logging in user_id, stored once per user"""
+    return app.session_interface.create(app, {'user_id': user_id})
+
+
+def percentile(values, p):
+    """Nearest-rank percentile p of values"""
+    values = sorted(values)
+    return values[min(len(values) - 1, round(p / 100 * (len(values) - 1)))]
+
+
+def peak_rss_mb(pid='self'):
+    """Peak resident memory of a process in MB, or None off Linux"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def summarize(timings, elapsed, errors, queries, rss):
+    """Report for one route from per-request timings in seconds"""
+    return {
+        'p50': percentile(timings, 50) * 1000,
+        'p95': percentile(timings, 95) * 1000,
+        'p99': percentile(timings, 99) * 1000,
+        'rps': len(timings) / elapsed,
+        'errors': errors,
+        'queries': sum(queries) / len(queries) if queries else None,
+        'rss_mb': rss,
+    }
+
+
+def run_client(workload, args):
+    """Drive each route in-process, one request at a time"""
+    client = app.test_client()
+    counter = QueryCounter(db.engine)
+    results = {}
+    for route in ROUTES:
+        timings, queries, errors = [], [], 0
+        for i in range(args.warmup + args.requests):
+            if i == args.warmup:
+                start = time.perf_counter()
+            user_id, method, data = workload.request(route)
+            client.set_cookie('localhost', app.session_cookie_name,
+                    session_cookie(user_id))
+            counter.count = 0
+            began = time.perf_counter()
+            response = client.open(route, method=method, data=data)
+            if i >= args.warmup:
+                timings.append(time.perf_counter() - began)
+                queries.append(counter.count)
+                errors += response.status_code >= 400
+        results[route] = summarize(timings, time.perf_counter() - start,
+                errors, queries, peak_rss_mb())
+        db.session.remove()
+    return results
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_for(port, proc, timeout=30):
+    """Wait until something listens on port, or the server exits"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError('Server exited during startup')
+        try:
+            socket.create_connection(('127.0.0.1', port), 0.1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError('Server did not start')
+
+
+def worker_pids(parent):
+    """Pids of a process's direct children"""
+    pids = []
+    for entry in os.listdir('/proc'):
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                if int(f.read().rsplit(')', 1)[1].split()[1]) == parent:
+                    pids.append(int(entry))
+        except (OSError, ValueError, IndexError):
+            continue
+    return pids
+
+
+def run_server(workload, args, path):
+    """Drive each route concurrently over HTTP against gunicorn workers"""
+    port = free_port()
+    env = dict(os.environ, DATABASE_URL=sqlite_url(path))
+    proc = subprocess.Popen([sys.executable, '-m', 'gunicorn',
+            '--workers', str(args.workers), '--bind', f'127.0.0.1:{port}',
+            '--log-level', 'warning', 'application:app'], cwd=ROOT, env=env)
+    local = threading.local()
+    base = f'http://127.0.0.1:{port}'
+
+    def send(route):
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+        user_id, method, data = workload.request(route)
+        with app.app_context():
+            cookie = session_cookie(user_id)
+        local.session.cookies.set(app.session_cookie_name, cookie)
+        began = time.perf_counter()
+        response = local.session.request(method, base + route, data=data,
+                allow_redirects=False)
+        return time.perf_counter() - began, response.status_code >= 400
+
+    results = {}
+    try:
+        wait_for(port, proc)
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            for route in ROUTES:
+                list(pool.map(send, [route] * args.warmup))
+                start = time.perf_counter()
+                done = list(pool.map(send, [route] * args.requests))
+                elapsed = time.perf_counter() - start
+                rss = [peak_rss_mb(pid) for pid in worker_pids(proc.pid)]
+                results[route] = summarize(
+                        [seconds for seconds, _ in done], elapsed,
+                        sum(failed for _, failed in done), [],
+                        sum(mb for mb in rss if mb is not None))
+    finally:
+        proc.terminate()
+        proc.wait()
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Routes whose p95 regressed past tolerance, with both values"""
+    regressions = []
+    for route, stats in results.items():
+        base = baseline['routes'].get(route)
+        if base and stats['p95'] > base['p95'] * (1 + tolerance):
+            regressions.append((route, base['p95'], stats['p95']))
+    return regressions
+
+
+def report(results, baseline=None):
+    print(f'{"route":10} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} '
+            f'{"req/s":>9} {"errors":>7} {"queries":>8} {"rss MB":>8}'
+            + ('  p95 vs baseline' if baseline else ''))
+    for route, s in results.items():
+        queries = '-' if s['queries'] is None else f'{s["queries"]:.1f}'
+        rss = '-' if s['rss_mb'] is None else f'{s["rss_mb"]:.1f}'
+        line = (f'{route:10} {s["p50"]:9.2f} {s["p95"]:9.2f} '
+                f'{s["p99"]:9.2f} {s["rps"]:9.1f} {s["errors"]:7} '
+                f'{queries:>8} {rss:>8}')
+        base = baseline and baseline['routes'].get(route)
+        if base:
+            line += f'  {(s["p95"] / base["p95"] - 1) * 100:+.0f}%'
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--stocks', type=int, default=2000)
+    parser.add_argument('--transactions', type=int, default=100000)
+    parser.add_argument('--requests', type=int, default=200,
+            help='measured requests per route')
+    parser.add_argument('--warmup', type=int, default=10,
+            help='unmeasured requests per route before measuring')
+    parser.add_argument('--server', action='store_true',
+            help='run against gunicorn instead of the test client')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--save', metavar='PATH',
+            help='write results as a baseline')
+    parser.add_argument('--compare', metavar='PATH',
+            help='compare with a saved baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+            help='allowed p95 slowdown over the baseline (default 0.2)')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        scale = {name: getattr(args, name) for name in SCALE}
+        if baseline['scale'] != scale:
+            print(f'Warning: baseline was run at {baseline["scale"]}\n')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        app.config['SQLALCHEMY_DATABASE_URI'] = sqlite_url(path)
+        with app.app_context():
+            start = time.perf_counter()
+            seed(args.users, args.stocks, args.transactions)
+            print(f'Seeded {args.users:,} users and {args.transactions:,} '
+                    f'transactions in {time.perf_counter() - start:.1f}s\n')
+            workload = Workload.load(args.users)
+            db.session.remove()
+            if args.server:
+                results = run_server(workload, args, path)
+            else:
+                results = run_client(workload, args)
+
+    report(results, baseline)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'scale': {name: getattr(args, name) for name in SCALE},
+                'routes': results}, f, indent=2)
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        for route, before, after in regressions:
+            print(f'{route}: p95 {before:.2f} ms -> {after:.2f} ms')
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
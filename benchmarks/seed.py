@@ -0,0 +1,80 @@
+"""
+Seed a database with synthetic users, stocks and a transaction ledger.
+
+Rows are written with executemany on the raw tables, which is fast
+enough for millions of ledger rows. Every seeded transaction is a buy,
+so positions can be derived from the ledger with one INSERT ... SELECT.
+Stocks take real symbols from the symbols file first, so the local
+quote providers can price them.
+"""
+import os
+import random
+from datetime import datetime, timedelta
+
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ.setdefault('QUOTE_PROVIDER', 'simulated')
+os.environ.setdefault('PRICE_HISTORY_INTERVAL', '0')
+
+from application import app, db
+from models import User, Stock, Transaction, Position, STARTING_CASH
+import symbols
+
+CHUNK = 50000
+
+
+def seed(users, stocks, transactions, rng_seed=0):
+    """Create all tables and fill them; call inside an app context"""
+    rng = random.Random(rng_seed)
+    db.create_all()
+    with db.engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {'id': i, 'username': f'user{i}', 'password_hash': 'x',
+                'cash': STARTING_CASH}
+            for i in range(1, users + 1)])
+        conn.execute(Stock.__table__.insert(), [
+            {'id': i, 'symbol': symbol, 'name': name}
+            for i, (symbol, name) in enumerate(stock_names(stocks), 1)])
+
+        start = datetime(2019, 1, 1)
+        for offset in range(0, transactions, CHUNK):
+            conn.execute(Transaction.__table__.insert(), [
+                {'id': i + 1,
+                    'user_id': rng.randint(1, users),
+                    'stock_id': rng.randint(1, stocks),
+                    'quantity': rng.randint(1, 20),
+                    'price': rng.randint(100, 50000),
+                    'time': start + timedelta(seconds=i)}
+                for i in range(offset, min(offset + CHUNK, transactions))])
+
+        conn.execute(Position.__table__.insert().from_select(
+            ['user_id', 'stock_id', 'quantity', 'cost'],
+            db.select([
+                Transaction.user_id,
+                Transaction.stock_id,
+                db.func.sum(Transaction.quantity),
+                db.func.sum(Transaction.quantity * Transaction.price),
+            ]).group_by(Transaction.user_id, Transaction.stock_id)))
+
+
+def stock_names(count):
+    """
+    count (symbol, name) pairs with unique names, synthetic once real
+    symbols run out
+    """
+    index = symbols.get_index()
+    seen = set()
+    names = []
+    for symbol, name in zip(index.symbols, index.names):
+        if len(names) == count:
+            break
+        if name not in seen:
+            seen.add(name)
+            names.append((symbol, name))
+    names += [(f'S{i}', f'Stock {i}') for i in range(len(names), count)]
+    return names
+
+
+def sqlite_url(path):
+    """Database URL for a throwaway SQLite file"""
+    return f'sqlite:///{os.path.abspath(path)}'
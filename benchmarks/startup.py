@@ -0,0 +1,88 @@
+"""
+Compare per-process startup cost of the symbol universe as a Python
+literal (the old stocks.py) with the lazily loaded data/symbols.tsv.
+
+Each case runs in a fresh interpreter, as a gunicorn worker would, and
+reports median import time and peak RSS over the interpreter baseline.
+The literal is regenerated from the data file with symbol and name
+only, so it understates the old module, which also carried iexId, date,
+type and isEnabled for a third of its entries.
+
+    python -m benchmarks.startup --runs 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Peak RSS in KB. ru_maxrss survives fork+exec on Linux and would include
+# this script's own memory, so prefer the exec-fresh VmHWM when there is one.
+PROBE = '''
+import resource, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+try:
+    with open('/proc/self/status') as f:
+        peak = next(int(line.split()[1]) for line in f
+                if line.startswith('VmHWM:'))
+except OSError:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, peak)
+'''
+
+CASES = {
+    'interpreter only': 'pass',
+    'stocks.py literal': 'from stocks import stocks',
+    'import symbols': 'import symbols',
+    'symbols + first search': 'import symbols; symbols.search("A")',
+}
+
+
+def run(code, path, runs):
+    """Median seconds and peak RSS in KB of code over runs interpreters"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([path, ROOT]),
+            PYTHONDONTWRITEBYTECODE='1')
+    times, rss = [], []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', PROBE.format(code=code)],
+                env=env, stdout=subprocess.PIPE, check=True).stdout.split()
+        times.append(float(out[0]))
+        rss.append(int(out[1]))
+    return statistics.median(times), statistics.median(rss)
+
+
+def write_literal(path):
+    """Write the symbols file back out as the old list-of-dicts module"""
+    sys.path.insert(0, ROOT)
+    import symbols
+    index = symbols.SymbolIndex.load()
+    stocks = [{'symbol': symbol, 'name': name}
+            for symbol, name in zip(index.symbols, index.names)]
+    with open(os.path.join(path, 'stocks.py'), 'w') as f:
+        f.write(f'stocks = {stocks!r}\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_literal(tmp)
+        results = {name: run(code, tmp, args.runs)
+                for name, code in CASES.items()}
+
+    base_rss = results['interpreter only'][1]
+    for name, (seconds, rss) in results.items():
+        print(f'{name:24} {seconds * 1000:8.2f} ms '
+                f'{(rss - base_rss) / 1024:8.2f} MB over baseline')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Time valuing every user's portfolio after a price tick, with a Python
+loop over per-user position dicts (how the leaderboard used to do it)
+and with the columnar Valuation.
+
+    python -m benchmarks.valuation --users 100000 --positions 20
+"""
+import argparse
+import heapq
+import random
+import statistics
+import time
+
+import benchmarks.seed  # noqa: F401 - sets the environment the app needs
+from valuation import Valuation
+
+
+def timed(fn, repeat):
+    """Median seconds of fn over repeat runs, and its last result"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=100000)
+    parser.add_argument('--positions', type=int, default=20,
+            help='positions per user')
+    parser.add_argument('--symbols', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    symbols = [f'S{i}' for i in range(args.symbols)]
+    users = [(i, f'user{i}', rng.randint(0, 1000000))
+            for i in range(args.users)]
+    positions = [(user_id, symbol, rng.randint(1, 100))
+            for user_id, _, _ in users
+            for symbol in rng.sample(symbols, args.positions)]
+    quotes = {symbol: {'price': rng.randint(100, 50000)}
+            for symbol in symbols}
+
+    cash = {user_id: balance for user_id, _, balance in users}
+    held = {user_id: {} for user_id in cash}
+    for user_id, symbol, quantity in positions:
+        held[user_id][symbol] = quantity
+    prices = {symbol: quote['price'] for symbol, quote in quotes.items()}
+
+    def loop():
+        totals = {user_id: cash[user_id] + sum(
+                quantity * prices[symbol]
+                for symbol, quantity in held[user_id].items())
+                for user_id in cash}
+        return heapq.nlargest(10, totals.items(), key=lambda item: item[1])
+
+    valuation = Valuation()
+    valuation.add_users(users)
+    valuation.add_positions(positions)
+    valuation.reprice(quotes)
+
+    def vectorized():
+        return valuation.top(10)
+
+    loop_time, expected = timed(loop, args.repeat)
+    vector_time, best = timed(vectorized, args.repeat)
+    assert [total for _, total in best] == [total for _, total in expected]
+    what_if_time, _ = timed(lambda: valuation.what_if(quotes), args.repeat)
+
+    print(f'{args.users:,} users, {len(positions):,} positions')
+    print(f'Python loop   {loop_time * 1000:9.1f} ms')
+    print(f'Valuation     {vector_time * 1000:9.1f} ms')
+    print(f'what-if       {what_if_time * 1000:9.1f} ms '
+            '(including building the price vector)')
+
+
+if __name__ == '__main__':
+    main()
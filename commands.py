@@ -0,0 +1,104 @@
+import json
+
+import click
+
+from config import app
+import helpers as h
+import migrations
+import queries as q
+import symbols
+from valuation import Valuation
+
+
+@app.cli.command('create-tables')
+def create_tables():
+    """Add tables defined on the models to an existing database"""
+    for name in migrations.create_tables():
+        click.echo(f'Created {name}')
+
+
+@app.cli.command('create-indexes')
+def create_indexes():
+    """Add indexes defined on the models to an existing database"""
+    for name in migrations.create_indexes():
+        click.echo(f'Created {name}')
+
+
+@app.cli.command('convert-money')
+def convert_money():
+    """Convert float dollar columns of an old database to integer cents"""
+    for name in migrations.convert_money_to_cents():
+        click.echo(f'Converted {name}')
+
+
+@app.cli.command('reset-users')
+@click.argument('user_ids', nargs=-1, type=int)
+@click.option('--all', 'everyone', is_flag=True,
+        help='Reset every user, restarting the whole competition.')
+def reset_users(user_ids, everyone):
+    """Reset the given users' portfolios to the starting balance"""
+    if not user_ids and not everyone:
+        raise click.UsageError('Give user ids or --all')
+    q.reset_users(None if everyone else user_ids)
+    click.echo('Portfolios reset')
+
+
+@app.cli.command('rebuild-positions')
+def rebuild_positions():
+    """Regenerate the positions table from the transaction ledger"""
+    q.rebuild_positions()
+    click.echo('Positions rebuilt')
+
+
+@app.cli.command('check-positions')
+def check_positions():
+    """Report positions that don't match the transaction ledger"""
+    mismatches = q.check_positions()
+    for user_id, stock_id, stored, expected in mismatches:
+        click.echo(f'user {user_id} stock {stock_id}: '
+                f'stored {stored}, ledger {expected}')
+    if mismatches:
+        raise SystemExit(1)
+    click.echo('Positions match the ledger')
+
+
+@app.cli.command('purge-sessions')
+def purge_sessions():
+    """Delete expired sessions from the session table"""
+    count = app.session_interface.purge()
+    click.echo(f'Purged {count} sessions')
+
+
+@app.cli.command('build-symbols')
+@click.argument('source', type=click.File('r'))
+def build_symbols(source):
+    """Regenerate data/symbols.tsv from an IEX ref-data/symbols JSON dump"""
+    stocks = json.load(source)
+    symbols.write(stocks)
+    click.echo(f'Wrote {len(stocks)} symbols to {symbols.PATH}')
+
+
+@app.cli.command('price-feed')
+def price_feed():
+    """Poll held symbols into the price store until interrupted"""
+    from application import price_feed as feed
+    if feed is None:
+        raise click.UsageError('Set PRICE_STORE_PATH to run the price feed')
+    if feed.interval <= 0:
+        raise click.UsageError('Set PRICE_FEED_INTERVAL above 0')
+    click.echo(f'Publishing prices to {feed.store.path} '
+            f'every {feed.interval}s once no other poller holds the lock')
+    feed.run_when_leader()
+
+
+@app.cli.command('portfolio-report')
+@click.option('--top', 'count', default=10, help='Number of leaders to list.')
+def portfolio_report(count):
+    """Value every portfolio at current prices and list the leaders"""
+    valuation = Valuation.load()
+    valuation.reprice(h.lookup_many(valuation.held_symbols()))
+    totals = valuation.totals()
+    click.echo(f'{len(totals)} users worth {h.usd(int(totals.sum()))}')
+    for rank, (username, total) in enumerate(
+            valuation.top(count, totals), 1):
+        click.echo(f'{rank:3}. {username:20} {h.usd(total):>16}')
@@ -1,9 +1,16 @@
 import os
 
+from datetime import timedelta
+
 from dotenv import load_dotenv
 from flask import Flask
 from flask_heroku import Heroku
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import orm
+
+import dbpool
+import replicas
+from quotes import IEX_URL
 
 load_dotenv()
 
@@ -12,12 +19,94 @@ def create_app(db_uri):
     app.config['SQLALCHEMY_DATABASE_URI'] = db_uri
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['TEMPLATES_AUTO_RELOAD'] = True
+    app.config['DB_POOL_SIZE'] = int(os.getenv('DB_POOL_SIZE', 5))
+    app.config['DB_MAX_OVERFLOW'] = int(os.getenv('DB_MAX_OVERFLOW', 5))
+    app.config['DB_POOL_TIMEOUT'] = float(os.getenv('DB_POOL_TIMEOUT', 10))
+    app.config['DB_POOL_RECYCLE'] = int(os.getenv('DB_POOL_RECYCLE', 1800))
+    app.config['DB_POOL_PRE_PING'] = os.getenv(
+            'DB_POOL_PRE_PING', '1') not in ('', '0')
+    app.config['DB_STATEMENT_TIMEOUT'] = int(
+            os.getenv('DB_STATEMENT_TIMEOUT', 30000))
+    if os.getenv('DATABASE_REPLICA_URL'):
+        app.config['SQLALCHEMY_BINDS'] = {
+                replicas.REPLICA: os.getenv('DATABASE_REPLICA_URL')}
+    app.config['REPLICA_STICKY_SECONDS'] = float(
+            os.getenv('REPLICA_STICKY_SECONDS', 5))
+    app.config['QUOTE_CACHE_TTL'] = float(os.getenv('QUOTE_CACHE_TTL', 60))
+    app.config['QUOTE_CACHE_STALE_TTL'] = float(
+            os.getenv('QUOTE_CACHE_STALE_TTL', 300))
+    app.config['QUOTE_CACHE_SIZE'] = int(os.getenv('QUOTE_CACHE_SIZE', 4096))
+    app.config['QUOTE_PROVIDER'] = os.getenv('QUOTE_PROVIDER', 'http')
+    app.config['QUOTE_URL'] = os.getenv('QUOTE_URL', IEX_URL)
+    app.config['QUOTE_SEED'] = int(os.getenv('QUOTE_SEED', 0))
+    app.config['QUOTE_TICK_INTERVAL'] = float(
+            os.getenv('QUOTE_TICK_INTERVAL', 1))
+    app.config['QUOTE_REPLAY_PATH'] = os.getenv('QUOTE_REPLAY_PATH')
+    app.config['QUOTE_REPLAY_SPEED'] = float(
+            os.getenv('QUOTE_REPLAY_SPEED', 1))
+    app.config['QUOTE_CONNECT_TIMEOUT'] = float(
+            os.getenv('QUOTE_CONNECT_TIMEOUT', 3.05))
+    app.config['QUOTE_READ_TIMEOUT'] = float(
+            os.getenv('QUOTE_READ_TIMEOUT', 5))
+    app.config['QUOTE_RETRIES'] = int(os.getenv('QUOTE_RETRIES', 2))
+    app.config['QUOTE_POOL_SIZE'] = int(os.getenv('QUOTE_POOL_SIZE', 10))
+    app.config['QUOTE_WORKERS'] = int(os.getenv('QUOTE_WORKERS', 4))
+    app.config['PRICE_STORE_PATH'] = os.getenv('PRICE_STORE_PATH')
+    app.config['PRICE_FEED_INTERVAL'] = float(
+            os.getenv('PRICE_FEED_INTERVAL', 15))
+    app.config['PRICE_FEED_IN_WORKERS'] = os.getenv(
+            'PRICE_FEED_IN_WORKERS', '1') not in ('', '0')
+    app.config['PRICE_MAX_AGE'] = float(os.getenv('PRICE_MAX_AGE', 60))
+    app.config['PRICE_HISTORY_INTERVAL'] = float(
+            os.getenv('PRICE_HISTORY_INTERVAL', 300))
+    app.config['PERFORMANCE_MAX_POINTS'] = int(
+            os.getenv('PERFORMANCE_MAX_POINTS', 1000))
+    app.config['LEADERBOARD_MAX_AGE'] = float(
+            os.getenv('LEADERBOARD_MAX_AGE', 60))
+    app.config['HISTORY_PAGE_SIZE'] = int(os.getenv('HISTORY_PAGE_SIZE', 50))
+    app.config['INSTRUMENTATION'] = bool(os.getenv('INSTRUMENTATION'))
+    app.config['METRICS_TOKEN'] = os.getenv('METRICS_TOKEN', '')
+    app.config['PROFILE_ENDPOINTS'] = [endpoint for endpoint
+            in os.getenv('PROFILE_ENDPOINTS', '').split(',') if endpoint]
+    app.config['PROFILE_INTERVAL'] = float(
+            os.getenv('PROFILE_INTERVAL', 0.005))
+    app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(
+            seconds=float(os.getenv('SESSION_LIFETIME', 7 * 86400)))
+    app.config['SESSION_CACHE_SIZE'] = int(
+            os.getenv('SESSION_CACHE_SIZE', 1024))
+    app.config['SESSION_CACHE_TTL'] = float(
+            os.getenv('SESSION_CACHE_TTL', 10))
+    app.config['SESSION_TOUCH_INTERVAL'] = float(
+            os.getenv('SESSION_TOUCH_INTERVAL', 300))
+    app.config['PASSWORD_METHOD'] = os.getenv(
+            'PASSWORD_METHOD', 'pbkdf2:sha256:150000')
+    app.config['PASSWORD_SALT_LENGTH'] = int(
+            os.getenv('PASSWORD_SALT_LENGTH', 16))
+    app.config['PASSWORD_WORKERS'] = int(os.getenv('PASSWORD_WORKERS', 0))
     app.secret_key = os.getenv('SECRET_KEY').encode('utf-8')
     return app
 
 app = create_app(os.getenv('DATABASE_URL'))
 
-db = SQLAlchemy()
+class Database(SQLAlchemy):
+    """
+    Flask-SQLAlchemy with pool settings from the app config for server
+    databases (SQLite keeps Flask-SQLAlchemy's own pool choice) and
+    sessions that can route reads to a replica
+    """
+
+    def apply_driver_hacks(self, app, sa_url, options):
+        if sa_url.get_backend_name() != 'sqlite':
+            options.update(dbpool.engine_options(
+                    app.config, sa_url.get_backend_name()))
+        return super().apply_driver_hacks(app, sa_url, options)
+
+    def create_session(self, options):
+        return orm.sessionmaker(class_=replicas.RoutingSession, db=self,
+                **options)
+
+
+db = Database()
 db.init_app(app)
 
 # Ensure responses aren't cached
@@ -0,0 +1,111 @@
+"""
+Database connection pool settings and health.
+
+Server databases (anything but SQLite) get a MeteredPool sized by the
+DB_POOL_* settings, with pre-ping and recycling so connections dropped
+by the server or a proxy are replaced rather than handed to a request.
+On Postgres every connection also gets a statement_timeout.
+
+Pools are per process. Connections record the pid that opened them and
+are discarded on checkout in any other process, so a worker forked from
+a master that had already connected never shares a socket with it.
+"""
+import os
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+
+def engine_options(config, backend):
+    """create_engine options from the app config for a backend"""
+    options = {
+        'poolclass': MeteredPool,
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+        'pool_recycle': config['DB_POOL_RECYCLE'],
+        'pool_pre_ping': config['DB_POOL_PRE_PING'],
+    }
+    if backend in ('postgres', 'postgresql') and config['DB_STATEMENT_TIMEOUT']:
+        options['connect_args'] = {'options':
+                f"-c statement_timeout={config['DB_STATEMENT_TIMEOUT']}"}
+    return options
+
+
+class MeteredPool(QueuePool):
+    """QueuePool that counts checkouts, time spent waiting and timeouts"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._meter_lock = threading.Lock()
+        self._waiting = threading.local()
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        # QueuePool._do_get calls itself to retry; only time the outer call
+        if getattr(self._waiting, 'active', False):
+            return super()._do_get()
+        self._waiting.active = True
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._meter_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            self._waiting.active = False
+            with self._meter_lock:
+                self.checkouts += 1
+                self.wait_seconds += time.perf_counter() - start
+
+    def stats(self):
+        """Current gauges and counters of this pool"""
+        with self._meter_lock:
+            return {
+                'size': self.size(),
+                'checked_out': self.checkedout(),
+                'overflow': max(self.overflow(), 0),
+                'checkouts': self.checkouts,
+                'wait_seconds': self.wait_seconds,
+                'timeouts': self.timeouts,
+            }
+
+
+@event.listens_for(MeteredPool, 'connect')
+def _record_pid(dbapi_connection, connection_record):
+    connection_record.info['pid'] = os.getpid()
+
+
+@event.listens_for(MeteredPool, 'checkout')
+def _check_pid(dbapi_connection, connection_record, connection_proxy):
+    if connection_record.info['pid'] != os.getpid():
+        # Opened before a fork: drop it without closing the parent's socket
+        connection_record.connection = connection_proxy.connection = None
+        raise exc.DisconnectionError(
+                'Connection belongs to another process')
+
+
+def metrics(pool):
+    """Prometheus text lines for pool, if it is metered"""
+    if not isinstance(pool, MeteredPool):
+        return []
+    stats = pool.stats()
+    return [
+        '# TYPE app_db_pool_size gauge',
+        f'app_db_pool_size {stats["size"]}',
+        '# TYPE app_db_pool_checked_out gauge',
+        f'app_db_pool_checked_out {stats["checked_out"]}',
+        '# TYPE app_db_pool_overflow gauge',
+        f'app_db_pool_overflow {stats["overflow"]}',
+        '# TYPE app_db_pool_checkouts_total counter',
+        f'app_db_pool_checkouts_total {stats["checkouts"]}',
+        '# TYPE app_db_pool_wait_seconds_total counter',
+        f'app_db_pool_wait_seconds_total {stats["wait_seconds"]}',
+        '# TYPE app_db_pool_timeouts_total counter',
+        f'app_db_pool_timeouts_total {stats["timeouts"]}',
+    ]
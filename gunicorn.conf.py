@@ -0,0 +1,10 @@
+"""Gunicorn settings; see dbpool.py for why the master drops connections."""
+
+
+def pre_fork(server, worker):
+    """Close any database connections the master opened before forking"""
+    import sys
+    application = sys.modules.get('application')
+    if application is not None:
+        with application.app.app_context():
+            application.db.engine.dispose()
@@ -1,9 +1,46 @@
-import requests
-import urllib.parse
+import threading
+import time
 
-from flask import redirect, render_template, request, session
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timezone
+from dateutil.parser import isoparse
+from flask import (Response, current_app, g, redirect, render_template,
+        request, session, stream_with_context)
 from functools import wraps
 
+from instrumentation import timed
+from quotes import HTTPProvider
+import queries as q
+
+CURSOR_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+
+
+# Rows handed to templates keep money in integer cents; templates format
+# it with the usd filter as they render
+class HistoryRow(namedtuple('HistoryRow', 'name symbol quantity price time')):
+    """One transaction in the history table"""
+    __slots__ = ()
+
+    @property
+    def type(self):
+        return 'Sell' if self.quantity < 0 else 'Buy'
+
+    @property
+    def total(self):
+        return self.price * self.quantity
+
+
+class Holding(namedtuple('Holding', 'name symbol quantity price')):
+    """One stock in a portfolio, at its current price"""
+    __slots__ = ()
+
+    @property
+    def value(self):
+        return self.quantity * self.price
+
+
+Portfolio = namedtuple('Portfolio', 'stocks cash total')
+
 
 def apology(error, code=400):
     """Render error as an apology to user."""
@@ -11,82 +48,229 @@ def apology(error, code=400):
 
 
 def build_history(transactions):
-    history = {}
+    return {transaction.id: row for transaction, row
+            in zip(transactions, iter_history(transactions))}
+
+
+def iter_history(transactions):
+    """Lazily turn transactions into rows of the history table"""
     for transaction in transactions:
-        history[transaction.id] = {
-                'name': transaction.name,
-                'symbol': transaction.symbol,
-                'quantity': transaction.quantity,
-                'price': usd(transaction.price),
-                'type': 'Sell' if transaction.quantity < 0 else 'Buy',
-                'total': usd(transaction.price * transaction.quantity),
-                'time': transaction.time
-        }
-    return history
+        yield HistoryRow(transaction.name, transaction.symbol,
+                transaction.quantity, transaction.price, transaction.time)
 
 
 def build_portfolio(stocks, cash):
     """Build portfolio of current stock values."""
-    portfolio = {
-        'stocks': {},
-        'cash': usd(cash),
-        'total': cash
-    }
-    for stock in stocks:
-        if stock.quantity <= 0:
-            portfolio['stocks'].pop(stock, None)
-        else:
-            price = lookup(stock.symbol)['price']
-            value = stock.quantity * price
-            portfolio['stocks'][stock.symbol] = {
-                'name': stock.name,
-                'quantity': stock.quantity,
-                'price': usd(price),
-                'value': usd(value),
-            }
-            portfolio['total'] += value
-    portfolio['total'] = usd(portfolio['total'])
-    return portfolio
+    quotes = lookup_many(
+            stock.symbol for stock in stocks if stock.quantity > 0)
+    holdings = [Holding(stock.name, stock.symbol, stock.quantity,
+                quotes[stock.symbol]['price'])
+            for stock in stocks if stock.quantity > 0]
+    return Portfolio(holdings, cash,
+            cash + sum(holding.value for holding in holdings))
+
+
+def encode_cursor(transaction):
+    """Keyset pagination cursor pointing just past transaction"""
+    return f"{transaction.time.strftime(CURSOR_TIME_FORMAT)}_{transaction.id}"
+
+
+def decode_cursor(cursor):
+    """Turn a cursor back into (time, id); None if it's malformed"""
+    try:
+        time, transaction_id = cursor.rsplit('_', 1)
+        return (datetime.strptime(time, CURSOR_TIME_FORMAT),
+                int(transaction_id))
+    except (AttributeError, ValueError):
+        return None
+
+
+def parse_utc(text):
+    """An ISO 8601 time as a naive UTC datetime, like the database's"""
+    when = isoparse(text)
+    if when.tzinfo is not None:
+        when = when.astimezone(timezone.utc).replace(tzinfo=None)
+    return when
 
 
 def login_required(f):
     """
-    Decorate routes to require login.
+    Decorate routes to require login. The logged-in user is loaded once
+    and kept in g.user for the rest of the request.
     http://flask.pocoo.org/docs/0.12/patterns/viewdecorators/
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if session.get("user_id") is None:
+        user_id = session.get("user_id")
+        g.user = load_user(user_id) if user_id is not None else None
+        if g.user is None:
             return redirect("/login")
         return f(*args, **kwargs)
     return decorated_function
 
 
+def load_user(user_id):
+    """Get a user, loading each one at most once per request"""
+    users = g.setdefault('users', {})
+    if user_id not in users:
+        users[user_id] = q.select_user_by_id(user_id)
+    return users[user_id]
+
+
 def lookup(symbol):
+    """Look up a quote for a stock symbol, served from the quote cache."""
+    return quote_cache.get(symbol)
+
+
+def lookup_many(symbols):
     """
-    Look up a quote for a stock symbol.
-    https://iextrading.com/developer/docs/
+    Look up quotes for many symbols at once, served from the quote cache.
+    Returns a dict of upper-case symbol to quote; unknown symbols are left
+    out.
     """
+    return quote_cache.get_many(symbols)
 
-    # Contact API
-    try:
-        response = requests.get(f"https://api.iextrading.com/1.0/stock/{urllib.parse.quote_plus(symbol)}/quote")
-        response.raise_for_status()
-    except requests.RequestException: # pragma: no cover
-        return None
 
-    # Parse response
-    try:
-        quote = response.json()
-        return {
-            'name': quote['companyName'],
-            'price': float(quote['latestPrice']),
-            'symbol': quote['symbol']
-        }
-    except (KeyError, TypeError, ValueError): # pragma: no cover
-        return None
+def fetch_quotes(symbols):
+    """
+    Fetch fresh quotes for symbols: from the price feed's store when one
+    is configured and has a recent price, otherwise from the API
+    """
+    symbols = list(symbols)
+    quotes = {}
+    with timed('quote'):
+        if price_store is not None:
+            quotes = price_store.get_many(symbols)
+            symbols = [symbol for symbol in symbols if symbol not in quotes]
+        if symbols:
+            quotes.update(fetch_upstream(symbols))
+    return quotes
+
+
+def fetch_upstream(symbols):
+    """Fetch quotes from the provider, recording them in price history"""
+    quotes = quote_provider.fetch_quotes(symbols)
+    if price_recorder is not None:
+        price_recorder.record(quotes)
+    return quotes
+
+
+quote_provider = HTTPProvider()
+price_store = None
+price_recorder = None
+
+
+class QuoteCache:
+    """
+    Size-bounded LRU cache of quotes with a TTL.
+
+    Entries younger than ttl are served as-is. Entries that have expired
+    but are younger than ttl + stale_ttl are served immediately while a
+    single background thread refreshes them (stale-while-revalidate).
+    Anything older is fetched synchronously, with all misses of one
+    get_many call fetched together through fetch_many.
+    """
+
+    def __init__(self, fetch_many, ttl=60, stale_ttl=300, maxsize=1024):
+        self.fetch_many = fetch_many
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.configure(ttl, stale_ttl, maxsize)
+
+    def configure(self, ttl, stale_ttl, maxsize):
+        """Set cache parameters and drop all entries and counters"""
+        with self._lock:
+            self.ttl = ttl
+            self.stale_ttl = stale_ttl
+            self.maxsize = maxsize
+            self._entries.clear()
+            self.hits = self.stale_hits = self.misses = self.refreshes = 0
+
+    def get(self, symbol):
+        """Get a quote for symbol, fetching it if not cached"""
+        if not symbol:
+            return None
+        return self.get_many([symbol]).get(symbol.upper())
+
+    def get_many(self, symbols):
+        """Get quotes for symbols, fetching all uncached ones in one go"""
+        quotes, missing, stale = {}, [], []
+        now = time.monotonic()
+        with self._lock:
+            for key in {symbol.upper() for symbol in symbols if symbol}:
+                entry = self._entries.get(key)
+                if entry is None or now - entry[1] >= self.ttl + self.stale_ttl:
+                    self.misses += 1
+                    missing.append(key)
+                    continue
+                self._entries.move_to_end(key)
+                quotes[key] = entry[0]
+                if now - entry[1] < self.ttl:
+                    self.hits += 1
+                else:
+                    self.stale_hits += 1
+                    stale.append(key)
+            self._revalidate(stale)
+        if missing:
+            fetched = self.fetch_many(missing)
+            self.put_many(fetched)
+            quotes.update(fetched)
+        return quotes
+
+    def put_many(self, quotes):
+        """Store freshly fetched quotes, evicting the oldest if full"""
+        now = time.monotonic()
+        with self._lock:
+            for symbol, quote in quotes.items():
+                self._entries[symbol.upper()] = (quote, now)
+                self._entries.move_to_end(symbol.upper())
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        """Counters for monitoring cache effectiveness"""
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'refreshes': self.refreshes,
+            }
+
+    def _revalidate(self, keys):
+        """Start one background refresh for keys (caller holds the lock)"""
+        keys = [key for key in keys if key not in self._refreshing]
+        if not keys:
+            return
+        self._refreshing.update(keys)
+        threading.Thread(target=self._refresh, args=(keys,),
+                daemon=True).start()
+
+    def _refresh(self, keys):
+        try:
+            self.put_many(self.fetch_many(keys))
+        finally:
+            with self._lock:
+                self._refreshing.difference_update(keys)
+                self.refreshes += len(keys)
+
+
+quote_cache = QuoteCache(fetch_quotes)
+
+
+def stream_template(template_name, **context):
+    """
+    Render a template as a streamed response, so rows can be sent as
+    they're produced instead of after the whole page is built.
+    """
+    app = current_app._get_current_object()
+    app.update_template_context(context)
+    template = app.jinja_env.get_template(template_name)
+    return Response(stream_with_context(template.generate(context)))
 
 
-def usd(value):
-    """Format value as USD."""
-    return f"${value:,.2f}"
+def usd(cents):
+    """Format an amount of integer cents as USD."""
+    return f"${cents / 100:,.2f}"
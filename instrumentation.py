@@ -0,0 +1,338 @@
+"""
+Opt-in per-request instrumentation.
+
+With INSTRUMENTATION set, every request records its SQL statement count
+and time, outbound quote fetch count and time, template render time and
+total wall time. Each request's numbers go back to the client as a
+Server-Timing header, are logged as one JSON line, and are summed per
+endpoint for /metrics in Prometheus text format, next to the database
+connection pool's gauges and counters. Metrics are kept per process, so
+with several gunicorn workers a scrape sees the worker that answered it.
+Streamed responses are logged and counted once their body has been sent;
+their Server-Timing header, sent first, covers only the work before it.
+
+Endpoints listed in PROFILE_ENDPOINTS are also stack-sampled while they
+run, and /debug/profile serves the samples as collapsed stacks for flame
+graph tools. Both endpoints answer 404 unless the request carries the
+METRICS_TOKEN bearer token, or, with no token set, comes from localhost.
+"""
+import hmac
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from flask import Response, abort, g, has_request_context, request
+from jinja2 import Template
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# What each timed kind counts, as named in metrics
+KINDS = {
+    'sql': 'sql_statements',
+    'quote': 'quote_fetches',
+    'template': 'template_renders',
+}
+
+# Addresses that may read metrics when no METRICS_TOKEN is set
+LOOPBACK = ('127.0.0.1', '::1')
+
+# Upper bounds in seconds of the request duration histogram
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+log = logging.getLogger(__name__)
+
+
+def current():
+    """This request's timings, or None outside an instrumented request"""
+    if has_request_context():
+        return g.get('timings')
+    return None
+
+
+def record(kind, seconds, count=1):
+    """Add count calls taking seconds to this request's kind"""
+    timings = current()
+    if timings is not None:
+        timings[kind][0] += count
+        timings[kind][1] += seconds
+
+
+@contextmanager
+def timed(kind):
+    """Record the time spent in the block against this request's kind"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(kind, time.perf_counter() - start)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context,
+        executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context,
+        executemany):
+    record('sql', time.perf_counter() - conn.info['query_start'].pop())
+
+
+class TimedTemplate(Template):
+    """Jinja template that records its render time"""
+
+    def render(self, *args, **kwargs):
+        with timed('template'):
+            return super().render(*args, **kwargs)
+
+    def generate(self, *args, **kwargs):
+        """Stream the template, recording the time spent making chunks"""
+        record('template', 0)
+        chunks = super().generate(*args, **kwargs)
+        while True:
+            start = time.perf_counter()
+            chunk = next(chunks, None)
+            record('template', time.perf_counter() - start, count=0)
+            if chunk is None:
+                return
+            yield chunk
+
+
+class Metrics:
+    """
+    Per-endpoint request totals in Prometheus text format, followed by
+    the lines of each collector callable
+    """
+
+    def __init__(self, collectors=()):
+        self.collectors = list(collectors)
+        self._lock = threading.Lock()
+        self.requests = Counter()
+        self.buckets = defaultdict(lambda: [0] * len(BUCKETS))
+        self.durations = defaultdict(float)
+        self.counts = Counter()
+        self.seconds = defaultdict(float)
+
+    def observe(self, endpoint, method, status, total, timings):
+        """Add one finished request"""
+        with self._lock:
+            self.requests[endpoint, method, status] += 1
+            buckets = self.buckets[endpoint]
+            for i, bound in enumerate(BUCKETS):
+                if total <= bound:
+                    buckets[i] += 1
+            self.durations[endpoint] += total
+            for kind, (count, seconds) in timings.items():
+                self.counts[endpoint, kind] += count
+                self.seconds[endpoint, kind] += seconds
+
+    def render(self):
+        """Exposition text for all endpoints seen so far"""
+        with self._lock:
+            lines = [
+                '# HELP app_requests_total Requests handled.',
+                '# TYPE app_requests_total counter',
+            ]
+            for (endpoint, method, status), n in sorted(
+                    self.requests.items()):
+                lines.append(f'app_requests_total{{endpoint="{endpoint}",'
+                        f'method="{method}",status="{status}"}} {n}')
+
+            lines += [
+                '# HELP app_request_duration_seconds Request wall time.',
+                '# TYPE app_request_duration_seconds histogram',
+            ]
+            for endpoint, buckets in sorted(self.buckets.items()):
+                label = f'endpoint="{endpoint}"'
+                for bound, n in zip(BUCKETS, buckets):
+                    lines.append('app_request_duration_seconds_bucket'
+                            f'{{{label},le="{bound}"}} {n}')
+                total = sum(n for (e, _, _), n in self.requests.items()
+                        if e == endpoint)
+                lines += [
+                    'app_request_duration_seconds_bucket'
+                    f'{{{label},le="+Inf"}} {total}',
+                    f'app_request_duration_seconds_sum{{{label}}} '
+                    f'{self.durations[endpoint]}',
+                    f'app_request_duration_seconds_count{{{label}}} '
+                    f'{total}',
+                ]
+
+            for kind, name in KINDS.items():
+                endpoints = sorted(e for e, k in self.counts if k == kind)
+                lines.append(f'# TYPE app_{name}_total counter')
+                lines += [f'app_{name}_total{{endpoint="{endpoint}"}} '
+                        f'{self.counts[endpoint, kind]}'
+                        for endpoint in endpoints]
+                lines.append(f'# TYPE app_{kind}_seconds_total counter')
+                lines += [f'app_{kind}_seconds_total{{endpoint="{endpoint}"}} '
+                        f'{self.seconds[endpoint, kind]}'
+                        for endpoint in endpoints]
+        for collect in self.collectors:
+            lines += collect()
+        return '\n'.join(lines) + '\n'
+
+
+class Sampler:
+    """
+    Stack sampler for the threads serving profiled requests.
+
+    One background thread wakes every interval seconds while any
+    profiled request is running and counts the stack of each such
+    thread, keyed by endpoint.
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.stacks = defaultdict(Counter)
+        self._active = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def start(self, endpoint):
+        """Sample the calling thread as endpoint until stop()"""
+        with self._lock:
+            self._active[threading.get_ident()] = endpoint
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run,
+                        daemon=True)
+                self._thread.start()
+            self._wake.set()
+
+    def stop(self):
+        """Stop sampling the calling thread"""
+        with self._lock:
+            self._active.pop(threading.get_ident(), None)
+            if not self._active:
+                self._wake.clear()
+
+    def collapsed(self, endpoint=None):
+        """Samples as "frame;frame;frame count" lines, root first"""
+        with self._lock:
+            return ''.join(
+                    f'{stack} {n}\n'
+                    for name, stacks in sorted(self.stacks.items())
+                    if endpoint in (None, name)
+                    for stack, n in stacks.most_common())
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            time.sleep(self.interval)
+            frames = sys._current_frames()
+            with self._lock:
+                for ident, endpoint in self._active.items():
+                    frame = frames.get(ident)
+                    if frame is not None:
+                        self.stacks[endpoint][collapse(frame)] += 1
+
+
+def collapse(frame):
+    """A frame's call stack as one ;-separated line, outermost first"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+def allowed(token):
+    """
+    Whether this request may read metrics and profiles: it must carry
+    token as a bearer token, or come from this host if token is empty
+    """
+    if token:
+        return hmac.compare_digest(request.headers.get('Authorization', ''),
+                f'Bearer {token}')
+    return request.remote_addr in LOOPBACK
+
+
+def server_timing(timings, total):
+    """Server-Timing header value for a request's timings"""
+    parts = [f'{kind};dur={seconds * 1000:.2f};desc="{count} calls"'
+            for kind, (count, seconds) in timings.items()]
+    parts.append(f'total;dur={total * 1000:.2f}')
+    return ', '.join(parts)
+
+
+def init_app(app, collectors=()):
+    """
+    Instrument app's requests if its INSTRUMENTATION setting is on;
+    collectors are callables returning extra lines for /metrics
+    """
+    if not app.config['INSTRUMENTATION']:
+        return
+    if not event.contains(Engine, 'before_cursor_execute',
+            _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+    app.jinja_env.template_class = TimedTemplate
+    if not log.handlers:
+        log.addHandler(logging.StreamHandler())
+        log.setLevel(logging.INFO)
+
+    metrics = Metrics(collectors)
+    sampler = Sampler(app.config['PROFILE_INTERVAL'])
+    profiled = set(app.config['PROFILE_ENDPOINTS'])
+    app.extensions['instrumentation'] = (metrics, sampler)
+
+    @app.before_request
+    def start_timing():
+        g.timings = {kind: [0, 0.0] for kind in KINDS}
+        g.request_start = time.perf_counter()
+        if request.endpoint in profiled:
+            sampler.start(request.endpoint)
+
+    @app.after_request
+    def report_timing(response):
+        timings, start = g.timings, g.request_start
+        entry = {'method': request.method, 'path': request.path,
+                'endpoint': request.endpoint,
+                'status': response.status_code}
+
+        def report(total):
+            metrics.observe(entry['endpoint'], entry['method'],
+                    entry['status'], total, timings)
+            entry['total_ms'] = round(total * 1000, 2)
+            for kind, (count, seconds) in timings.items():
+                entry[f'{kind}_count'] = count
+                entry[f'{kind}_ms'] = round(seconds * 1000, 2)
+            log.info(json.dumps(entry))
+
+        total = time.perf_counter() - start
+        response.headers['Server-Timing'] = server_timing(timings, total)
+        if response.is_streamed:
+            # The body hasn't been produced yet: report once it's sent
+            response.call_on_close(
+                    lambda: report(time.perf_counter() - start))
+        else:
+            report(total)
+        return response
+
+    @app.teardown_request
+    def stop_sampling(exc):
+        sampler.stop()
+
+    @app.route('/metrics')
+    def metrics_view():
+        """Aggregated request metrics for this process"""
+        if not allowed(app.config['METRICS_TOKEN']):
+            abort(404)
+        return Response(metrics.render(),
+                mimetype='text/plain; version=0.0.4')
+
+    @app.route('/debug/profile')
+    def profile_view():
+        """Collapsed stack samples, optionally for one endpoint"""
+        if not allowed(app.config['METRICS_TOKEN']):
+            abort(404)
+        return Response(sampler.collapsed(request.args.get('endpoint')),
+                mimetype='text/plain')
@@ -0,0 +1,88 @@
+import threading
+import time
+
+from valuation import Valuation
+
+
+class Leaderboard:
+    """
+    Standings of every user's portfolio value.
+
+    Users' cash and positions are loaded from the database into a
+    Valuation once and then kept up to date by record_trade / reset_user
+    as trades happen, so a price tick costs one vectorized revaluation
+    of every user. Trades made by other worker processes are picked up
+    by reloading the snapshot once it is older than max_age seconds.
+    """
+
+    def __init__(self, size=10, max_age=60):
+        self.size = size
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        """Forget everything; the next refresh reloads from the database"""
+        with self._lock:
+            self._loaded_at = None
+            self._valuation = Valuation()
+            self._top = None
+
+    def load(self):
+        """Rebuild the standings from the database"""
+        with self._lock:
+            self.clear()
+            self._valuation = Valuation.load()
+            self._loaded_at = time.monotonic()
+
+    def refresh(self):
+        """Reload the standings if they were never loaded or are too old"""
+        with self._lock:
+            if (self._loaded_at is None
+                    or time.monotonic() - self._loaded_at > self.max_age):
+                self.load()
+
+    def symbols(self):
+        """All symbols currently held by any user"""
+        with self._lock:
+            return self._valuation.held_symbols()
+
+    def add_user(self, user_id, username, cash):
+        """Put a newly registered user on the board"""
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            self._valuation.add_users([(user_id, username, cash)])
+            self._top = None
+
+    def record_trade(self, user_id, symbol, quantity, price):
+        """Apply a buy (positive quantity) or sell (negative) to a user"""
+        with self._lock:
+            if self._loaded_at is None or user_id not in self._valuation:
+                return
+            self._valuation.trade(user_id, symbol, quantity, price)
+            self._top = None
+
+    def reset_user(self, user_id, cash):
+        """Clear a user's positions after their portfolio is nuked"""
+        with self._lock:
+            if self._loaded_at is None or user_id not in self._valuation:
+                return
+            self._valuation.reset(user_id, cash)
+            self._top = None
+
+    def reprice(self, quotes):
+        """Take new prices, re-ranking only if any changed"""
+        with self._lock:
+            if self._valuation.reprice(quotes):
+                self._top = None
+
+    def top(self):
+        """The best (username, total) pairs, highest total first"""
+        with self._lock:
+            if self._top is None:
+                self._top = self._valuation.top(self.size)
+            return self._top
+
+
+board = Leaderboard()
@@ -0,0 +1,111 @@
+"""
+Schema changes for databases created before a model changed. Each
+function is safe to run more than once.
+"""
+from sqlalchemy import Integer, inspect
+from sqlalchemy.schema import CreateTable
+
+from config import db
+
+# Columns that moved from float dollars and shares to integers, with the
+# SQL converting each old value
+INTEGER_MONEY = {
+    'user': {'cash': 'round(cash * 100)'},
+    'transaction': {
+        'quantity': 'round(quantity)',
+        'price': 'round(price * 100)',
+    },
+    'position': {
+        'quantity': 'round(quantity)',
+        'cost': 'round(cost * 100)',
+    },
+}
+
+
+def create_tables():
+    """Create any model tables missing from the database"""
+    tables = set(inspect(db.engine).get_table_names())
+    created = []
+    for table in db.Model.metadata.sorted_tables:
+        if table.name not in tables:
+            table.create(db.engine)
+            created.append(table.name)
+    return created
+
+
+def create_indexes():
+    """Create any model indexes missing from the database"""
+    inspector = inspect(db.engine)
+    tables = set(inspector.get_table_names())
+    created = []
+    for table in db.Model.metadata.sorted_tables:
+        if table.name not in tables:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(db.engine)
+                created.append(index.name)
+    return created
+
+
+def float_money_tables():
+    """Tables whose money or share columns aren't integers yet"""
+    inspector = inspect(db.engine)
+    tables = set(inspector.get_table_names())
+    found = []
+    for table in db.Model.metadata.sorted_tables:
+        columns = INTEGER_MONEY.get(table.name)
+        if not columns or table.name not in tables:
+            continue
+        types = {column['name']: column['type']
+                for column in inspector.get_columns(table.name)}
+        if not all(isinstance(types[name], Integer) for name in columns):
+            found.append(table)
+    return found
+
+
+def convert_money_to_cents():
+    """
+    Convert float dollar and share columns to integer cents and shares.
+    Tables already converted are skipped. Returns the tables converted.
+    """
+    # Reflect before converting: the inspector's own connections would
+    # reset a SQLite connection shared with the open transaction
+    converted = float_money_tables()
+    with db.engine.begin() as conn:
+        for table in converted:
+            if conn.dialect.name == 'postgresql':
+                _alter_to_integer(conn, table, INTEGER_MONEY[table.name])
+            else:
+                _copy_to_integer(conn, table, INTEGER_MONEY[table.name])
+    return [table.name for table in converted]
+
+
+def _alter_to_integer(conn, table, columns):
+    """Change column types in place, converting with each USING clause"""
+    quote = conn.dialect.identifier_preparer.quote
+    conn.execute(f'ALTER TABLE {quote(table.name)} ' + ', '.join(
+            f'ALTER COLUMN {quote(name)} TYPE '
+            f'{table.c[name].type.compile(conn.dialect)} USING {sql}'
+            for name, sql in columns.items()))
+
+
+def _copy_to_integer(conn, table, columns):
+    """
+    Rebuild a table with the model's column types, for databases like
+    SQLite that can't change a column's type in place
+    """
+    quote = conn.dialect.identifier_preparer.quote
+    name, new = quote(table.name), quote(f'{table.name}_new')
+    create = str(CreateTable(table).compile(conn))
+    conn.execute(create.replace(f'CREATE TABLE {name}',
+            f'CREATE TABLE {new}', 1))
+    names = ', '.join(quote(column.name) for column in table.columns)
+    values = ', '.join(columns.get(column.name, quote(column.name))
+            for column in table.columns)
+    conn.execute(f'INSERT INTO {new} ({names}) SELECT {values} FROM {name}')
+    conn.execute(f'DROP TABLE {name}')
+    conn.execute(f'ALTER TABLE {new} RENAME TO {name}')
+    for index in table.indexes:
+        index.create(conn)
@@ -1,13 +1,17 @@
-from application import db
+from config import db
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
+# Money is stored as integer cents: cash, prices and cost basis
+STARTING_CASH = 1000000
 
 class User(db.Model):
     __tablename__ = 'user'
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False) 
     password_hash = db.Column(db.String(120), nullable=False)
-    cash = db.Column(db.Float, default=10000.00)
+    cash = db.Column(db.BigInteger, default=STARTING_CASH)
     transactions = db.relationship('Transaction', cascade='all,delete',
             backref='user')
 
@@ -29,6 +33,11 @@ class Stock(db.Model):
 
 class Transaction(db.Model):
     __tablename__ = 'transaction'
+    __table_args__ = (
+        db.Index('ix_transaction_user_stock', 'user_id', 'stock_id'),
+        db.Index('ix_transaction_user_time', 'user_id', 'time', 'id'),
+        db.Index('ix_transaction_stock', 'stock_id'),
+    )
     id = db.Column(db.Integer, primary_key=True)
 
     user_id = db.Column(db.Integer, 
@@ -39,10 +48,83 @@ class Transaction(db.Model):
         db.ForeignKey('stock.id', ondelete='CASCADE'), 
         nullable=False)
 
-    quantity = db.Column(db.Float, nullable=False)
-    price = db.Column(db.Float, nullable=False)
+    quantity = db.Column(db.Integer, nullable=False)
+    price = db.Column(db.BigInteger, nullable=False)
     time = db.Column(db.DateTime, nullable=False,
         default=datetime.utcnow)
 
     def __repr__(self):
         return f'<Transaction {self.user}: {self.stock}>'
+
+
+class Position(db.Model):
+    """Current holding of one stock by one user, kept in step with the
+    transaction ledger on every flush."""
+    __tablename__ = 'position'
+    user_id = db.Column(db.Integer,
+        db.ForeignKey('user.id', ondelete='CASCADE'),
+        primary_key=True)
+
+    stock_id = db.Column(db.Integer,
+        db.ForeignKey('stock.id', ondelete='CASCADE'),
+        primary_key=True)
+
+    quantity = db.Column(db.Integer, nullable=False, default=0)
+    cost = db.Column(db.BigInteger, nullable=False, default=0)
+
+    def apply(self, quantity, price):
+        """Add a buy or sell to the position, at average cost"""
+        if quantity > 0:
+            self.cost += quantity * price
+        elif self.quantity > 0:
+            self.cost -= (self.cost * min(-quantity, self.quantity)
+                    // self.quantity)
+        self.quantity += quantity
+        if self.quantity <= 0:
+            self.cost = 0
+
+    def __repr__(self):
+        return f'<Position {self.user_id}: {self.stock_id} x{self.quantity}>'
+
+
+class PriceTick(db.Model):
+    """One recorded quote. Ticks are only ever appended; the key orders
+    each symbol's ticks by day and time, so a symbol's prices over a
+    range are one index scan."""
+    __tablename__ = 'price_tick'
+    symbol = db.Column(db.String(20), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    time = db.Column(db.DateTime, primary_key=True)
+    price = db.Column(db.BigInteger, nullable=False)
+
+    def __repr__(self):
+        return f'<PriceTick {self.symbol} {self.time}: {self.price}>'
+
+
+class StoredSession(db.Model):
+    """Server-side session data, keyed by the id in the session cookie"""
+    __tablename__ = 'user_session'
+    id = db.Column(db.String(64), primary_key=True)
+    data = db.Column(db.LargeBinary, nullable=False)
+    expiry = db.Column(db.DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f'<StoredSession {self.id}>'
+
+
+@event.listens_for(db.session, 'before_flush')
+def update_positions(session, flush_context, instances):
+    """Apply new transactions to positions in the same flush"""
+    positions = {}
+    with session.no_autoflush:
+        for obj in session.new:
+            if not isinstance(obj, Transaction):
+                continue
+            key = (obj.user_id, obj.stock_id)
+            if key not in positions:
+                positions[key] = session.query(Position).get(key)
+            if positions[key] is None:
+                positions[key] = Position(user_id=obj.user_id,
+                        stock_id=obj.stock_id, quantity=0, cost=0)
+                session.add(positions[key])
+            positions[key].apply(int(obj.quantity), int(obj.price))
@@ -0,0 +1,95 @@
+"""
+Password hashing.
+
+Hashes are werkzeug's method$salt$hash strings, made with the method set
+by PASSWORD_METHOD (pbkdf2:sha256:150000 by default), so the cost can be
+tuned without invalidating old hashes: each hash names its own method,
+and a hash made with another method or salt length is replaced on the
+next login.
+
+With workers > 0, hashing and checking run in a pool of that many
+processes. At most workers * queue_factor hashes are queued or running
+at once; more wait up to timeout seconds for a slot and then fail with
+Busy, so a burst of logins queues a bounded amount of CPU work instead
+of every request thread hashing at once.
+"""
+import multiprocessing
+import os
+import sys
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class Busy(Exception):
+    """Every hashing slot stayed taken for the whole timeout"""
+
+
+class Hasher:
+    """Hash and check passwords, inline or in a bounded process pool"""
+
+    def __init__(self, method='pbkdf2:sha256:150000', salt_length=16,
+            workers=0, queue_factor=4, timeout=10):
+        self.configure(method, salt_length, workers, queue_factor, timeout)
+
+    def configure(self, method, salt_length, workers, queue_factor=4,
+            timeout=10):
+        """Set hashing parameters, shutting down any running pool"""
+        if getattr(self, '_pid', None) == os.getpid():
+            self._pool.shutdown(wait=False)
+        self.method = method
+        self.salt_length = salt_length
+        self.workers = workers
+        self.timeout = timeout
+        self._format = None
+        self._slots = threading.BoundedSemaphore(
+                max(workers, 1) * queue_factor)
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pid = None
+
+    def hash(self, password):
+        """A new salted hash of password"""
+        return self._run(generate_password_hash, password, self.method,
+                self.salt_length)
+
+    def check(self, pwhash, password):
+        """Whether password matches pwhash"""
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """Whether pwhash was made with a different method or salt length"""
+        if self._format is None:
+            method, salt, _ = generate_password_hash(
+                    '', self.method, self.salt_length).split('$', 2)
+            self._format = (method, len(salt))
+        parts = pwhash.split('$', 2)
+        return len(parts) < 3 or (parts[0], len(parts[1])) != self._format
+
+    def _run(self, fn, *args):
+        if not self.workers:
+            return fn(*args)
+        if not self._slots.acquire(timeout=self.timeout):
+            raise Busy('Too many password checks in progress')
+        try:
+            return self._executor().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def _executor(self):
+        """This process's pool, started on first use and after a fork"""
+        with self._lock:
+            if self._pid != os.getpid():
+                options = {}
+                if sys.version_info >= (3, 7):
+                    # Workers forked from a threaded server can inherit
+                    # locks held by other threads; spawn them fresh
+                    options['mp_context'] = multiprocessing.get_context(
+                            'spawn')
+                self._pool = ProcessPoolExecutor(self.workers, **options)
+                self._pid = os.getpid()
+            return self._pool
+
+
+hasher = Hasher()
@@ -0,0 +1,138 @@
+"""
+Background price feed.
+
+One poller fetches the latest quotes for every symbol any user holds
+and writes them to a PriceStore, a small SQLite file on local disk that
+every gunicorn worker reads. Request handlers then get held prices with
+a local primary-key lookup, and upstream API calls scale with the
+number of distinct held symbols rather than with page views.
+"""
+import fcntl
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+# SQLite's default limit on bound parameters is 999
+IN_CHUNK = 500
+
+log = logging.getLogger(__name__)
+
+
+class PriceStore:
+    """Latest quote per symbol in a SQLite file shared between processes"""
+
+    def __init__(self, path, max_age=60):
+        self.path = path
+        self.max_age = max_age
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''CREATE TABLE IF NOT EXISTS price (
+                symbol TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                cents INTEGER NOT NULL,
+                updated REAL NOT NULL)''')
+
+    def put_many(self, quotes, now=None):
+        """Publish quotes, replacing older prices for the same symbols"""
+        now = time.time() if now is None else now
+        with self._connect() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO price VALUES (?, ?, ?, ?)',
+                [(q['symbol'], q['name'], q['price'], now)
+                    for q in quotes.values()])
+
+    def get_many(self, symbols, now=None):
+        """Quotes for symbols published within the last max_age seconds"""
+        now = time.time() if now is None else now
+        symbols = list(symbols)
+        quotes = {}
+        conn = self._connect()
+        for i in range(0, len(symbols), IN_CHUNK):
+            chunk = symbols[i:i + IN_CHUNK]
+            rows = conn.execute(
+                'SELECT symbol, name, cents FROM price '
+                f'WHERE symbol IN ({",".join("?" * len(chunk))}) '
+                'AND updated >= ?', (*chunk, now - self.max_age))
+            for symbol, name, price in rows:
+                quotes[symbol] = {'name': name, 'price': price,
+                        'symbol': symbol}
+        return quotes
+
+    def _connect(self):
+        """This thread's connection, reopened after a fork"""
+        local = self._local
+        if getattr(local, 'pid', None) != os.getpid():
+            local.conn = sqlite3.connect(self.path, timeout=5)
+            local.pid = os.getpid()
+        return local.conn
+
+
+class PriceFeed:
+    """Poll held symbols in batches and publish them to a PriceStore"""
+
+    def __init__(self, store, fetch_many, held_symbols, interval=15):
+        self.store = store
+        self.fetch_many = fetch_many
+        self.held_symbols = held_symbols
+        self.interval = interval
+        self._thread = None
+        self._lock_file = None
+
+    def poll_once(self):
+        """Fetch and publish one round of prices; returns how many"""
+        symbols = self.held_symbols()
+        quotes = self.fetch_many(symbols) if symbols else {}
+        self.store.put_many(quotes)
+        return len(quotes)
+
+    def run(self, stop=None):
+        """Poll every interval seconds until stop is set"""
+        if self.interval <= 0:
+            raise ValueError('Price feed interval must be positive')
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            started = time.monotonic()
+            try:
+                self.poll_once()
+            except Exception:
+                log.exception('Price feed poll failed')
+            stop.wait(max(0, self.interval - (time.monotonic() - started)))
+
+    def start(self, app=None):
+        """
+        Poll in a daemon thread of this process, inside app's context if
+        given. Every worker may call this; an exclusive lock on the store
+        file makes sure only one of them polls at a time, and another
+        takes over if that worker exits.
+        """
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self.run_when_leader,
+                args=(app,), daemon=True)
+        self._thread.start()
+
+    def run_when_leader(self, app=None):
+        """
+        Wait for the store's lock and then poll, inside app's context if
+        given, so only one poller runs against a store at a time
+        """
+        while not self._acquire():
+            time.sleep(self.interval)
+        if app is None:
+            self.run()
+        else:
+            with app.app_context():
+                self.run()
+
+    def _acquire(self):
+        lock_file = open(self.store.path + '.lock', 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
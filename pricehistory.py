@@ -0,0 +1,135 @@
+"""
+Price history and portfolio value over time.
+
+Quotes fetched from the provider are recorded as ticks in the append-only
+price_tick table, at most one per symbol every interval seconds in each
+process, and written in batches so recording costs one INSERT per batch
+rather than one per lookup.
+
+A user's portfolio value over a range is computed by replaying their
+ledger from the first trade: the transactions and each traded symbol's
+ticks are already sorted by time, so heapq.merge walks them together
+with the sample times in one pass, keeping cash and the value of the
+holdings up to date as it goes.
+"""
+import heapq
+import logging
+import threading
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from flask import has_app_context
+from itertools import chain
+
+from models import STARTING_CASH
+import queries as q
+
+# Order of events at the same instant: trades, then prices, then samples,
+# so a sample sees everything that happened at its time
+TRADE, TICK, SAMPLE = 0, 1, 2
+
+log = logging.getLogger(__name__)
+
+
+class Recorder:
+    """Buffer fetched quotes and append them to the price history"""
+
+    def __init__(self, app, interval=300, batch_size=500, flush_after=60):
+        self.app = app
+        self.interval = timedelta(seconds=interval)
+        self.batch_size = batch_size
+        self.flush_after = timedelta(seconds=flush_after)
+        self._last = {}
+        self._pending = []
+        self._flushed = datetime.utcnow()
+        self._lock = threading.Lock()
+
+    def record(self, quotes, now=None):
+        """Queue quotes that are due a new tick, flushing when due"""
+        now = datetime.utcnow() if now is None else now
+        with self._lock:
+            for symbol, quote in quotes.items():
+                last = self._last.get(symbol)
+                if last is not None and now - last < self.interval:
+                    continue
+                self._last[symbol] = now
+                self._pending.append({'symbol': symbol, 'day': now.date(),
+                    'time': now, 'price': quote['price']})
+            due = (len(self._pending) >= self.batch_size
+                    or now - self._flushed >= self.flush_after)
+        if due:
+            self.flush(now)
+
+    def flush(self, now=None):
+        """Write queued ticks; returns how many were written"""
+        with self._lock:
+            ticks, self._pending = self._pending, []
+            self._flushed = datetime.utcnow() if now is None else now
+        if not ticks:
+            return 0
+        try:
+            # Inside a request the app context is already there, and
+            # popping one of our own would close the request's session
+            if has_app_context():
+                q.insert_price_ticks(ticks)
+            else:
+                with self.app.app_context():
+                    q.insert_price_ticks(ticks)
+        except Exception:
+            log.exception('Recording %d price ticks failed', len(ticks))
+            return 0
+        return len(ticks)
+
+
+def sample_times(start, end, step):
+    """start, start + step, ... up to and including end"""
+    when = start
+    while when <= end:
+        yield when
+        when += step
+
+
+def value_series(ledger, ticks, times, cash=STARTING_CASH):
+    """
+    Yield (time, cash plus holdings value) at each of times.
+
+    ledger holds (time, symbol, quantity, price) trades and ticks holds
+    one iterable of (time, symbol, price) per symbol, all in time order.
+    Holdings are valued at the latest tick or trade price of each symbol.
+    """
+    events = heapq.merge(
+            ((when, TRADE, symbol, quantity, price)
+                for when, symbol, quantity, price in ledger),
+            *(((when, TICK, symbol, 0, price)
+                for when, symbol, price in stream) for stream in ticks),
+            ((when, SAMPLE, '', 0, 0) for when in times))
+    held = defaultdict(int)
+    prices = {}
+    holdings = 0
+    for when, kind, symbol, quantity, price in events:
+        if kind == SAMPLE:
+            yield when, cash + holdings
+            continue
+        holdings += held[symbol] * (price - prices.get(symbol, price))
+        prices[symbol] = price
+        if kind == TRADE:
+            cash -= quantity * price
+            held[symbol] += quantity
+            holdings += quantity * price
+
+
+def portfolio_series(user_id, start, end, step):
+    """A user's (time, value) every step from start to end"""
+    ledger = ((t.time, t.symbol, t.quantity, t.price)
+            for t in q.stream_ledger_by_user(user_id))
+    ticks = [_ticks(symbol, start, end)
+            for symbol in q.select_traded_symbols(user_id)]
+    return value_series(ledger, ticks, sample_times(start, end, step))
+
+
+def _ticks(symbol, start, end):
+    """symbol's last price before start, then its prices up to end"""
+    last = q.select_last_price(symbol, start)
+    ticks = q.stream_price_ticks(symbol, start, end + timedelta.resolution)
+    return ((tick.time, symbol, tick.price)
+            for tick in chain([last] if last else [], ticks))
@@ -1,17 +1,114 @@
+from functools import wraps
+
 from config import db
-from models import User, Stock, Transaction
-from sqlalchemy.sql import func
+from models import (User, Stock, Transaction, Position, PriceTick,
+        StoredSession, STARTING_CASH)
+from sqlalchemy import bindparam
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext import baked
+from sqlalchemy.sql import and_, or_, select
+import replicas
+
+
+# Fixed-shape queries run on most requests are baked: SQLAlchemy builds
+# and compiles each one once per process and reuses the SQL
+bakery = baked.bakery()
+
+# Stocks are never deleted or renamed, so once a symbol's row is
+# committed its id is kept for the life of the process
+stock_ids = {}
+
+
+def _replica(f):
+    """Run a read-only query on the read replica when routing allows"""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        with replicas.reading(db.session()):
+            return f(*args, **kwargs)
+    return decorated
+
+
+class TradeError(Exception):
+    """An order that can't be filled; the message is shown to the user"""
 
 
+def check_positions():
+    """
+    Compare the positions table against a replay of the ledger. Returns
+    a list of (user_id, stock_id, stored, expected) for each mismatch,
+    where stored and expected are (quantity, cost) or None.
+    """
+    stored = {(p.user_id, p.stock_id): (p.quantity, p.cost)
+            for p in Position.query}
+    mismatches = []
+    for key, expected in _replay_ledger():
+        actual = stored.pop(key, None)
+        if actual != expected:
+            mismatches.append((*key, actual, expected))
+    for key, actual in stored.items():
+        if actual[0] != 0:
+            mismatches.append((*key, actual, None))
+    return mismatches
+
+def delete_expired_sessions(now):
+    """Delete every stored session that expired before now"""
+    table = StoredSession.__table__
+    with db.engine.begin() as conn:
+        return conn.execute(table.delete().where(
+                table.c.expiry <= now)).rowcount
+
+def delete_session(session_id):
+    """Delete one stored session"""
+    table = StoredSession.__table__
+    with db.engine.begin() as conn:
+        conn.execute(table.delete().where(table.c.id == session_id))
+
 def delete_transactions_by_user(user_id):
     """ Delete all a user's transactions to reset their portfolio """
-    transactions = Transaction.query.filter(
-            Transaction.user_id==user_id
-            ).all()
-    for t in transactions:
-        db.session.delete(t)
+    Transaction.query.filter(Transaction.user_id==user_id).delete(
+            synchronize_session=False)
+    Position.query.filter(Position.user_id==user_id).delete(
+            synchronize_session=False)
     db.session.commit()
 
+def execute_trade(user_id, symbol, name, quantity, price):
+    """
+    Buy (positive quantity) or sell (negative quantity) shares in a
+    single DB transaction: the ledger row, position and cash change are
+    committed together or not at all. Cash is debited with a conditional
+    UPDATE and a sale locks the position row while it is checked, so
+    concurrent orders can neither overspend nor oversell.
+    Returns the traded stock's id; raises TradeError if the order can't
+    fill, including a new stock whose name another symbol already has.
+    """
+    for attempt in range(2):
+        try:
+            stock_id = _execute_trade(user_id, symbol, name, quantity, price)
+            db.session.commit()
+            stock_ids[symbol] = stock_id
+            return stock_id
+        except IntegrityError:
+            db.session.rollback()
+            if not attempt and select_stock_id(symbol) is not None:
+                # Another order inserted the same new stock first
+                continue
+            if Stock.query.filter(Stock.name == name,
+                    Stock.symbol != symbol).first() is not None:
+                raise TradeError(
+                        f"{symbol} shares its name with a listed stock")
+            raise
+        except Exception:
+            db.session.rollback()
+            raise
+
+def insert_price_ticks(ticks):
+    """
+    Append recorded prices, dicts of symbol, day, time and price, on a
+    connection of their own so any open session is left alone
+    """
+    with db.engine.begin() as conn:
+        conn.execute(PriceTick.__table__.insert(), ticks)
+
 def insert_stock(symbol, name):
     """ Add a new stock to the database """
     stock = Stock(symbol=symbol, name=name)
@@ -31,65 +128,296 @@ def insert_user(username, password_hash):
     db.session.add(user)
     db.session.commit()
 
+def rebuild_positions():
+    """Regenerate the positions table from the transaction ledger"""
+    Position.__table__.create(db.engine, checkfirst=True)
+    Position.query.delete()
+    db.session.bulk_insert_mappings(Position, [
+        {'user_id': key[0], 'stock_id': key[1],
+            'quantity': quantity, 'cost': cost}
+        for key, (quantity, cost) in _replay_ledger()])
+    db.session.commit()
+
+def reset_user(user_id):
+    """Reset one user's portfolio to the starting balance"""
+    reset_users([user_id])
+
+def reset_users(user_ids=None, cash=STARTING_CASH):
+    """
+    Reset portfolios to cash with no holdings using set-based statements
+    in one transaction; resets every user when user_ids is None
+    """
+    transactions, positions, users = (
+            Transaction.query, Position.query, User.query)
+    if user_ids is not None:
+        user_ids = list(user_ids)
+        transactions = transactions.filter(
+                Transaction.user_id.in_(user_ids))
+        positions = positions.filter(Position.user_id.in_(user_ids))
+        users = users.filter(User.id.in_(user_ids))
+    try:
+        transactions.delete(synchronize_session=False)
+        positions.delete(synchronize_session=False)
+        users.update({User.cash: cash}, synchronize_session=False)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+@_replica
 def select_all_users():
     """Get all users"""
     return User.query.all()
 
+@_replica
+def select_held_symbols():
+    """Get the distinct symbols any user currently holds"""
+    return [symbol for symbol, in db.session.query(Stock.symbol).filter(
+                Stock.id.in_(db.session.query(Position.stock_id).filter(
+                    Position.quantity > 0))
+            )]
+
+@_replica
+def select_last_price(symbol, before):
+    """Get the last recorded (time, price) of symbol before a time"""
+    return (db.session.query(PriceTick.time, PriceTick.price).filter(
+                PriceTick.symbol == symbol,
+                PriceTick.day <= before.date(),
+                PriceTick.time < before
+            ).order_by(
+                PriceTick.day.desc(), PriceTick.time.desc()
+            ).first())
+
+@_replica
+def select_positions(user_ids=None, held_only=False):
+    """
+    Get every user's net position in each stock in one query, optionally
+    only for user_ids and only where the user still holds shares
+    """
+    criteria = []
+    if user_ids is not None:
+        criteria.append(Position.user_id.in_(list(user_ids)))
+    return _positions_query(*criteria, held_only=held_only,
+            columns=(Position.user_id,)).all()
+
+@_replica
 def select_user_by_id(user_id):
     """Get user object where id"""
-    return User.query.filter_by(id=user_id).first()
+    query = bakery(lambda session: session.query(User))
+    query += lambda query: query.filter(User.id == bindparam('user_id'))
+    return query(db.session()).params(user_id=user_id).first()
 
+@_replica
 def select_user_by_username(username):
     """Get user object where username"""
-    return User.query.filter_by(username=username).first()
+    query = bakery(lambda session: session.query(User))
+    query += lambda query: query.filter(
+            User.username == bindparam('username'))
+    return query(db.session()).params(username=username).first()
+
+def select_session(session_id):
+    """Get the (data, expiry) of a stored session"""
+    table = StoredSession.__table__
+    with db.engine.connect() as conn:
+        return conn.execute(select([table.c.data, table.c.expiry]).where(
+                table.c.id == session_id)).first()
 
+@_replica
 def select_stock_by_symbol(symbol):
     """Get stock object where symbol"""
-    return Stock.query.filter_by(symbol=symbol).first()
+    stock_id = stock_ids.get(symbol)
+    if stock_id is not None:
+        return Stock.query.get(stock_id)
+    stock = Stock.query.filter_by(symbol=symbol).first()
+    if stock is not None:
+        stock_ids[symbol] = stock.id
+    return stock
 
-def select_stocks_by_user(user_id):
+def select_stock_id(symbol):
+    """Get the id of the stock with symbol, or None if there's none yet"""
+    stock_id = stock_ids.get(symbol)
+    if stock_id is None:
+        query = bakery(lambda session: session.query(Stock.id))
+        query += lambda query: query.filter(
+                Stock.symbol == bindparam('symbol'))
+        row = query(db.session()).params(symbol=symbol).first()
+        if row is not None:
+            stock_id = stock_ids[symbol] = row.id
+    return stock_id
+
+@_replica
+def select_stocks_by_user(user_id, held_only=False):
     """Get list of stocks owned by a given user"""
-    return (db.session.query(
-                func.sum(Transaction.quantity).label('quantity'),
-                Stock.name,
-                Stock.symbol,
-            ).join(User).join(Stock).group_by(
-                Transaction.stock_id, Stock, User
-            ).filter(User.id==user_id).all())
+    query = bakery(lambda session: _positions_query(
+            Position.user_id == bindparam('user_id'), session=session))
+    if held_only:
+        query += lambda query: query.filter(Position.quantity > 0)
+    return query(db.session()).params(user_id=user_id).all()
 
+@_replica
+def select_traded_symbols(user_id):
+    """Get the distinct symbols in a user's transactions"""
+    return [symbol for symbol, in db.session.query(Stock.symbol).filter(
+                Stock.id.in_(db.session.query(Transaction.stock_id).filter(
+                    Transaction.user_id == user_id))
+            )]
+
+@_replica
 def select_transactions_by_user(user_id):
     """Get a list of all a user's transactions"""
-    return (db.session.query(
-                Transaction.id,
-                Transaction.quantity,
-                Transaction.price,
-                Transaction.time,
-                Stock.name,
-                Stock.symbol,
-            ).join(Stock).filter(
-                Transaction.user_id==user_id
-            ).all())
+    return _transactions_query(user_id).all()
 
+@_replica
+def select_transactions_page(user_id, before=None, limit=50):
+    """
+    Get a page of a user's transactions, newest first. before is the
+    (time, id) of the last row on the previous page.
+    """
+    query = _transactions_query(user_id)
+    if before is not None:
+        time, transaction_id = before
+        query = query.filter(or_(
+            Transaction.time < time,
+            and_(Transaction.time == time, Transaction.id < transaction_id)))
+    return query.order_by(
+            Transaction.time.desc(), Transaction.id.desc()
+            ).limit(limit).all()
 
+@_replica
 def select_transactions_by_stock(stock_id, user_id):
-    """Get the sum of all a user's transactions of a certain stock"""
+    """Get the number of shares a user holds of a certain stock"""
     return (db.session.query(
-                func.sum(Transaction.quantity).label('shares')
-            ).group_by(
-                Transaction.stock_id
+                Position.quantity.label('shares')
             ).filter(
-                Transaction.stock_id == stock_id,
-                Transaction.user_id == user_id
+                Position.stock_id == stock_id,
+                Position.user_id == user_id
             ).one())
 
+def stream_transactions_by_user(user_id, batch_size=1000):
+    """Iterate over all a user's transactions, newest first, in batches"""
+    return (_transactions_query(user_id).order_by(
+                Transaction.time.desc(), Transaction.id.desc()
+            ).execution_options(stream_results=True).yield_per(batch_size))
+
+def stream_ledger_by_user(user_id, batch_size=1000):
+    """Iterate over all a user's transactions, oldest first, in batches"""
+    return (_transactions_query(user_id).order_by(
+                Transaction.time, Transaction.id
+            ).execution_options(stream_results=True).yield_per(batch_size))
+
+def stream_price_ticks(symbol, start, end, batch_size=1000):
+    """Iterate over symbol's recorded prices from start until end"""
+    return (db.session.query(PriceTick.time, PriceTick.price).filter(
+                PriceTick.symbol == symbol,
+                PriceTick.day.between(start.date(), end.date()),
+                PriceTick.time >= start,
+                PriceTick.time < end
+            ).order_by(
+                PriceTick.day, PriceTick.time
+            ).execution_options(stream_results=True).yield_per(batch_size))
+
+def upsert_session(session_id, data, expiry):
+    """Store a session's data, replacing any stored under its id"""
+    table = StoredSession.__table__
+    with db.engine.begin() as conn:
+        if not conn.execute(table.update().where(
+                table.c.id == session_id).values(
+                data=data, expiry=expiry)).rowcount:
+            conn.execute(table.insert().values(
+                id=session_id, data=data, expiry=expiry))
+
 def update_user_cash(change, user_id):
     """ Change user cash after buy or sell """
-    user = select_user_by_id(user_id)
-    user.cash = user.cash + change
+    User.query.filter(User.id==user_id).update(
+            {User.cash: User.cash + change}, synchronize_session=False)
     db.session.commit()
 
 def update_user_hash(new_hash, user_id):
     """ Update the user's password hash on password reset """
-    user = select_user_by_id(user_id)
-    user.password_hash = new_hash
+    User.query.filter(User.id==user_id).update(
+            {User.password_hash: new_hash}, synchronize_session=False)
     db.session.commit()
+
+def _execute_trade(user_id, symbol, name, quantity, price):
+    """Stage one order in the current DB transaction; returns its stock id"""
+    stock_id = select_stock_id(symbol)
+    if stock_id is None:
+        if quantity < 0:
+            raise TradeError("You don't own that stock")
+        stock = Stock(symbol=symbol, name=name)
+        db.session.add(stock)
+        db.session.flush()
+        stock_id = stock.id
+
+    # Lock the user row before the position row on both buys and sells so
+    # concurrent orders of one user can't deadlock. A sale can't fail this
+    # check, since its total is negative.
+    total = quantity * price
+    if not User.query.filter(User.id==user_id, User.cash >= total).update(
+            {User.cash: User.cash - total}, synchronize_session=False):
+        raise TradeError("Not enough cash")
+
+    if quantity < 0:
+        position = (Position.query.filter_by(
+                    user_id=user_id, stock_id=stock_id
+                ).with_for_update().first())
+        if position is None or position.quantity <= 0:
+            raise TradeError("You don't own that stock")
+        if position.quantity < -quantity:
+            raise TradeError("You don't own enough of that stock.")
+
+    db.session.add(Transaction(user_id=user_id, stock_id=stock_id,
+            quantity=quantity, price=price))
+    return stock_id
+
+def _positions_query(*criteria, held_only=False, columns=(), session=None):
+    """Quantity held of each stock, from positions matching criteria"""
+    query = ((session or db.session).query(
+                *columns,
+                Position.quantity,
+                Stock.name,
+                Stock.symbol,
+            ).join(Stock).filter(*criteria))
+    if held_only:
+        query = query.filter(Position.quantity > 0)
+    return query
+
+def _transactions_query(user_id):
+    """A user's transactions joined to their stock"""
+    return (db.session.query(
+                Transaction.id,
+                Transaction.quantity,
+                Transaction.price,
+                Transaction.time,
+                Stock.name,
+                Stock.symbol,
+            ).join(Stock).filter(
+                Transaction.user_id==user_id
+            ))
+
+def _replay_ledger():
+    """
+    Yield ((user_id, stock_id), (quantity, cost)) for every pair in the
+    ledger, replaying transactions in order one pair at a time
+    """
+    transactions = (db.session.query(
+                Transaction.user_id,
+                Transaction.stock_id,
+                Transaction.quantity,
+                Transaction.price,
+            ).order_by(
+                Transaction.user_id,
+                Transaction.stock_id,
+                Transaction.time,
+                Transaction.id,
+            ).yield_per(10000))
+    key, position = None, None
+    for t in transactions:
+        if (t.user_id, t.stock_id) != key:
+            if key is not None:
+                yield key, (position.quantity, position.cost)
+            key = (t.user_id, t.stock_id)
+            position = Position(quantity=0, cost=0)
+        position.apply(t.quantity, t.price)
+    if key is not None:
+        yield key, (position.quantity, position.cost)
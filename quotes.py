@@ -0,0 +1,262 @@
+"""
+Quote providers.
+
+Every provider answers fetch_quotes(symbols) with a dict of upper-case
+symbol to {'name', 'price', 'symbol'}, price in integer cents, leaving
+out symbols it doesn't know. HTTPProvider calls a live batch quote API;
+SimulatedProvider and ReplayProvider generate prices locally, so the app
+can be run and load tested offline with reproducible prices.
+QUOTE_PROVIDER picks one.
+"""
+import csv
+import math
+import os
+import random
+import requests
+import threading
+import time
+
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import symbols as symbol_index
+
+IEX_URL = "https://api.iextrading.com/1.0/stock/market/batch"
+
+# Most symbols the IEX batch endpoint accepts per request
+BATCH_SIZE = 100
+
+
+class QuoteProvider:
+    """Source of current quotes"""
+
+    def fetch_quotes(self, symbols):
+        """Quotes for symbols, keyed by symbol; unknown symbols left out"""
+        raise NotImplementedError
+
+
+def to_cents(dollars):
+    """Round a dollar amount to integer cents"""
+    return int(round(float(dollars) * 100))
+
+
+def parse_quote(quote):
+    """Reduce an API quote to the fields the app uses"""
+    return {
+        'name': quote['companyName'],
+        'price': to_cents(quote['latestPrice']),
+        'symbol': quote['symbol']
+    }
+
+
+class HTTPProvider(QuoteProvider):
+    """
+    Quotes from an IEX-style batch quote endpoint.
+
+    Requests share one pooled requests.Session with connect and read
+    timeouts and retries with exponential backoff on connection errors
+    and 429/5xx responses. Symbol lists longer than one batch are
+    fetched concurrently on a small thread pool. The session and pool
+    are created lazily per process, so they are never shared across a
+    gunicorn fork.
+    https://iextrading.com/developer/docs/#batch-requests
+    """
+
+    def __init__(self, url=IEX_URL, timeout=(3.05, 5), retries=2,
+            backoff=0.3, pool_size=10, workers=4, batch_size=BATCH_SIZE,
+            session=None):
+        self.url = url
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self.workers = workers
+        self.batch_size = batch_size
+        self._session = session
+        self._executor = None
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """Pooled HTTP session for this process"""
+        self._check_fork()
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    retry = Retry(total=self.retries,
+                            backoff_factor=self.backoff,
+                            status_forcelist=(429, 500, 502, 503, 504))
+                    adapter = HTTPAdapter(pool_maxsize=self.pool_size,
+                            max_retries=retry)
+                    session = requests.Session()
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+
+    def fetch_quotes(self, symbols):
+        """Fetch quotes for symbols, one request per batch_size symbols"""
+        symbols = list(symbols)
+        chunks = [symbols[i:i + self.batch_size]
+                for i in range(0, len(symbols), self.batch_size)]
+        if len(chunks) > 1 and self.workers > 1:
+            results = self._pool().map(self.fetch_batch, chunks)
+        else:
+            results = map(self.fetch_batch, chunks)
+        quotes = {}
+        for batch in results:
+            quotes.update(batch)
+        return quotes
+
+    def fetch_batch(self, symbols):
+        """Fetch one batch of quotes; an empty dict if the request fails"""
+
+        # Contact API
+        try:
+            response = self.session.get(self.url, timeout=self.timeout,
+                    params={'symbols': ','.join(symbols), 'types': 'quote'})
+            response.raise_for_status()
+            batch = response.json()
+        except (requests.RequestException, ValueError): # pragma: no cover
+            return {}
+
+        # Parse response
+        quotes = {}
+        for data in batch.values():
+            try:
+                quote = parse_quote(data['quote'])
+            except (KeyError, TypeError, ValueError): # pragma: no cover
+                continue
+            quotes[quote['symbol']] = quote
+        return quotes
+
+    def _pool(self):
+        self._check_fork()
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.workers)
+        return self._executor
+
+    def _check_fork(self):
+        """Drop the parent's session and threads after a fork"""
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._session = None
+            self._executor = None
+            self._lock = threading.Lock()
+
+
+class SimulatedProvider(QuoteProvider):
+    """
+    Random-walk prices for every symbol in the symbols file.
+
+    Each symbol starts at a price and follows a path drawn from its own
+    generator seeded by seed and symbol, taking one step per interval
+    seconds of clock since the provider was created. The same seed gives
+    the same price at the same step, so runs are reproducible.
+    """
+
+    def __init__(self, seed=0, interval=1, volatility=0.01,
+            clock=time.monotonic):
+        self.seed = seed
+        self.interval = interval
+        self.volatility = volatility
+        self.clock = clock
+        self._start = clock()
+        self._walks = {}
+        self._lock = threading.Lock()
+
+    def fetch_quotes(self, symbols):
+        step = int((self.clock() - self._start) / self.interval)
+        quotes = {}
+        for symbol in symbols:
+            name = symbol_index.name(symbol)
+            if name is not None:
+                quotes[symbol] = {'name': name,
+                        'price': to_cents(self.price(symbol, step)),
+                        'symbol': symbol}
+        return quotes
+
+    def price(self, symbol, step):
+        """Price of symbol in dollars after step steps of its walk"""
+        with self._lock:
+            walk = self._walks.get(symbol)
+            if walk is None or walk[1] > step:
+                rng = random.Random(f'{self.seed}:{symbol}')
+                walk = [rng, 0, rng.uniform(10, 500)]
+                self._walks[symbol] = walk
+            rng, taken, price = walk
+            for _ in range(step - taken):
+                price *= math.exp(rng.gauss(0, self.volatility))
+            walk[1:] = step, price
+            return price
+
+
+class ReplayProvider(QuoteProvider):
+    """
+    Prices replayed from a recorded tick file.
+
+    The file is a CSV with a header and "seconds,symbol,price" rows,
+    seconds counted from the start of the recording and prices in
+    dollars. A symbol's price is its last tick at or before the time
+    since the provider was created, times speed, or its first tick
+    before that. With loop set the recording restarts when it runs out.
+    Names come from the symbols file, falling back to the symbol.
+    """
+
+    def __init__(self, path, speed=1, loop=True, clock=time.monotonic):
+        self.speed = speed
+        self.loop = loop
+        self.clock = clock
+        ticks = {}
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                ticks.setdefault(row['symbol'].upper(), []).append(
+                        (float(row['seconds']), to_cents(row['price'])))
+        self.ticks = {}
+        for symbol, rows in ticks.items():
+            rows.sort()
+            self.ticks[symbol] = ([t for t, _ in rows], [p for _, p in rows])
+        self.duration = max((times[-1] for times, _ in self.ticks.values()),
+                default=0)
+        self._start = clock()
+
+    def fetch_quotes(self, symbols):
+        elapsed = (self.clock() - self._start) * self.speed
+        if self.loop and self.duration:
+            elapsed %= self.duration
+        quotes = {}
+        for symbol in symbols:
+            if symbol not in self.ticks:
+                continue
+            times, prices = self.ticks[symbol]
+            i = max(bisect_right(times, elapsed) - 1, 0)
+            quotes[symbol] = {'name': symbol_index.name(symbol) or symbol,
+                    'price': prices[i], 'symbol': symbol}
+        return quotes
+
+
+def create_provider(config):
+    """The quote provider named by config['QUOTE_PROVIDER']"""
+    kind = config['QUOTE_PROVIDER']
+    if kind == 'http':
+        return HTTPProvider(
+                url=config['QUOTE_URL'],
+                timeout=(config['QUOTE_CONNECT_TIMEOUT'],
+                    config['QUOTE_READ_TIMEOUT']),
+                retries=config['QUOTE_RETRIES'],
+                pool_size=config['QUOTE_POOL_SIZE'],
+                workers=config['QUOTE_WORKERS'])
+    if kind == 'simulated':
+        return SimulatedProvider(
+                seed=config['QUOTE_SEED'],
+                interval=config['QUOTE_TICK_INTERVAL'])
+    if kind == 'replay':
+        return ReplayProvider(
+                config['QUOTE_REPLAY_PATH'],
+                speed=config['QUOTE_REPLAY_SPEED'])
+    raise ValueError(f'Unknown QUOTE_PROVIDER {kind!r}')
@@ -0,0 +1,92 @@
+"""
+Read-replica routing.
+
+When SQLALCHEMY_BINDS has a 'replica' bind, queries run inside reading()
+go to it instead of the primary. Everything else, and every flush, goes
+to the primary.
+
+Reads stay on the primary whenever they might miss a write the replica
+hasn't caught up with yet: for the rest of a session that has written,
+and for REPLICA_STICKY_SECONDS after a request wrote, tracked per user
+in their Flask session so the next page they load after a trade shows
+the trade.
+"""
+import time
+
+from contextlib import contextmanager
+from flask import has_request_context, session as flask_session
+from flask_sqlalchemy import SignallingSession
+from sqlalchemy import event
+
+REPLICA = 'replica'
+
+
+class RoutingSession(SignallingSession):
+    """Session that sends reads marked by reading() to the replica"""
+
+    def __init__(self, db, **options):
+        self.db = db
+        super().__init__(db, **options)
+
+    def get_bind(self, mapper=None, clause=None):
+        if self.info.get('read_replica') and not self._flushing:
+            return self.db.get_engine(self.app, bind=REPLICA)
+        return super().get_bind(mapper, clause)
+
+
+def has_replica(app):
+    return REPLICA in (app.config.get('SQLALCHEMY_BINDS') or {})
+
+
+def can_read_replica(session):
+    """Whether session's reads may go to the replica right now"""
+    if not has_replica(session.app) or session.info.get('wrote'):
+        return False
+    if has_request_context():
+        wrote_at = flask_session.get('wrote_at')
+        if wrote_at is not None:
+            return (time.time() - wrote_at
+                    >= session.app.config['REPLICA_STICKY_SECONDS'])
+    return True
+
+
+@contextmanager
+def reading(session):
+    """Route session's queries in the block to the replica if allowed"""
+    previous = session.info.get('read_replica')
+    session.info['read_replica'] = can_read_replica(session)
+    try:
+        yield
+    finally:
+        session.info['read_replica'] = previous
+
+
+def mark_write(session):
+    """Keep session, and the user's next requests, on the primary"""
+    if not has_replica(session.app):
+        return
+    session.info['wrote'] = True
+    if has_request_context():
+        flask_session['wrote_at'] = time.time()
+
+
+def clear_flask_session():
+    """
+    Empty the Flask session but keep the time of its last write, so
+    logging in or out doesn't send the next reads to a lagging replica
+    """
+    wrote_at = flask_session.get('wrote_at')
+    flask_session.clear()
+    if wrote_at is not None:
+        flask_session['wrote_at'] = wrote_at
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _after_flush(session, flush_context):
+    mark_write(session)
+
+
+@event.listens_for(RoutingSession, 'after_bulk_update')
+@event.listens_for(RoutingSession, 'after_bulk_delete')
+def _after_bulk(context):
+    mark_write(context.session)
@@ -0,0 +1,156 @@
+"""
+Server-side sessions.
+
+The session cookie carries only a signed random id; the data is kept in
+the user_session table. Each process keeps its most recently used
+sessions in an LRU, so most requests read no row at all. A cached copy
+is trusted for cache_ttl seconds before the row is read again, which
+bounds how long a logout on another worker goes unseen here.
+
+Sessions are written only when their data changes or when their expiry
+has moved on by touch_interval, not on every request. Rows that expire
+stay in the table until purge() deletes them all in one statement.
+"""
+import pickle
+import secrets
+import threading
+import time
+
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from flask_session.sessions import ServerSideSession, SessionInterface
+from itsdangerous import BadSignature, want_bytes
+
+import queries as q
+
+
+class ServerSession(ServerSideSession):
+    """Session data stored under sid"""
+    expiry = None
+    replaces = None
+
+    def regenerate(self):
+        """
+        Move the session to a new id, dropping the old one, so an id
+        known before login can't be used to ride the logged-in session
+        """
+        if self.replaces is None:
+            self.replaces = self.sid
+        self.sid = new_sid()
+        self.modified = True
+
+
+def new_sid():
+    return secrets.token_urlsafe(32)
+
+
+class SessionStore(SessionInterface):
+    """Flask session interface backed by the database and an LRU"""
+    session_class = ServerSession
+    serializer = pickle
+
+    def __init__(self, cache_size=1024, cache_ttl=10, touch_interval=300):
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.touch_interval = timedelta(seconds=touch_interval)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open_session(self, app, request):
+        sid = self._unsign(app, request.cookies.get(app.session_cookie_name))
+        stored = self._load(sid) if sid else None
+        if stored is None:
+            return self.session_class(sid=new_sid())
+        data, expiry = stored
+        session = self.session_class(self.serializer.loads(data), sid=sid)
+        session.expiry = expiry
+        return session
+
+    def save_session(self, app, session, response):
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        if session.replaces is not None:
+            self._delete(session.replaces)
+        if not session:
+            if session.modified:
+                if session.expiry is not None:
+                    self._delete(session.sid)
+                response.delete_cookie(app.session_cookie_name,
+                        domain=domain, path=path)
+            return
+
+        expiry = datetime.utcnow() + app.permanent_session_lifetime
+        if (not session.modified and session.expiry is not None
+                and expiry - session.expiry < self.touch_interval):
+            return
+        self._store(session.sid, self.serializer.dumps(dict(session)),
+                expiry)
+        response.set_cookie(app.session_cookie_name,
+                self._sign(app, session.sid),
+                expires=self.get_expiration_time(app, session),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain, path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app))
+
+    def create(self, app, data):
+        """Store a new session holding data; returns its cookie value"""
+        sid = new_sid()
+        self._store(sid, self.serializer.dumps(data),
+                datetime.utcnow() + app.permanent_session_lifetime)
+        return self._sign(app, sid)
+
+    def purge(self, now=None):
+        """Delete every expired session; returns how many rows went"""
+        now = datetime.utcnow() if now is None else now
+        with self._lock:
+            for sid in [sid for sid, (_, expiry, _) in self._cache.items()
+                    if expiry <= now]:
+                del self._cache[sid]
+        return q.delete_expired_sessions(now)
+
+    def _load(self, sid):
+        """A live session's (data, expiry), from the LRU or the table"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(sid)
+            if entry is not None and now - entry[2] < self.cache_ttl:
+                self._cache.move_to_end(sid)
+                stored = entry[:2]
+            else:
+                stored = None
+        if stored is None:
+            stored = q.select_session(sid)
+            if stored is not None:
+                self._cache_put(sid, stored.data, stored.expiry)
+        if stored is None or stored[1] <= datetime.utcnow():
+            return None
+        return stored
+
+    def _store(self, sid, data, expiry):
+        q.upsert_session(sid, data, expiry)
+        self._cache_put(sid, data, expiry)
+
+    def _delete(self, sid):
+        q.delete_session(sid)
+        with self._lock:
+            self._cache.pop(sid, None)
+
+    def _cache_put(self, sid, data, expiry):
+        with self._lock:
+            self._cache[sid] = (data, expiry, time.monotonic())
+            self._cache.move_to_end(sid)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _sign(self, app, sid):
+        return self._get_signer(app).sign(want_bytes(sid)).decode()
+
+    def _unsign(self, app, cookie):
+        """The session id in a cookie value, or None if it's forged"""
+        if not cookie:
+            return None
+        try:
+            return self._get_signer(app).unsign(cookie).decode()
+        except BadSignature:
+            return None
@@ -0,0 +1,29 @@
+// Suggest stocks for inputs marked data-symbol-search as the user types,
+// using the /symbols search endpoint instead of a list embedded in the page
+(function () {
+  document.querySelectorAll('input[data-symbol-search]').forEach(function (input) {
+    if (input.awesomplete) {
+      return;
+    }
+    var completer = input.awesomplete = new Awesomplete(input, {
+      minChars: 1,
+      sort: false
+    });
+    var pending;
+    input.addEventListener('input', function () {
+      clearTimeout(pending);
+      var query = input.value.trim();
+      if (!query) {
+        return;
+      }
+      pending = setTimeout(function () {
+        fetch('/symbols?q=' + encodeURIComponent(query), {credentials: 'same-origin'})
+          .then(function (response) { return response.json(); })
+          .then(function (list) {
+            completer.list = list;
+            completer.evaluate();
+          });
+      }, 150);
+    });
+  });
+})();
@@ -1 +0,0 @@
-stocks = [{'symbol': 'A', 'name': 'Agilent Technologies Inc.'}, {'symbol': 'AA', 'name': 'Alcoa Corporation'}, {'symbol': 'AABA', 'name': 'Altaba Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7653'}, {'symbol': 'AAC', 'name': 'AAC Holdings Inc.'}, {'symbol': 'AAL', 'name': 'American Airlines Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8148'}, {'symbol': 'AAMC', 'name': 'Altisource Asset Management Corp Com'}, {'symbol': 'AAME', 'name': 'Atlantic American Corporation'}, {'symbol': 'AAN', 'name': "Aaron's Inc."}, {'symbol': 'AAOI', 'name': 'Applied Optoelectronics Inc.'}, {'symbol': 'AAON', 'name': 'AAON Inc.'}, {'symbol': 'AAP', 'name': 'Advance Auto Parts Inc W/I'}, {'symbol': 'AAPL', 'name': 'Apple Inc.'}, {'symbol': 'AAT', 'name': 'American Assets Trust Inc.'}, {'symbol': 'AAU', 'name': 'Almaden Minerals Ltd.'}, {'symbol': 'AAWW', 'name': 'Atlas Air Worldwide Holdings'}, {'symbol': 'AAXN', 'name': 'Axon Enterprise Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6667'}, {'symbol': 'AB', 'name': 'AllianceBernstein Holding L.P. Units'}, {'symbol': 'ABB', 'name': 'ABB Ltd'}, {'symbol': 'ABBV', 'name': 'AbbVie Inc.'}, {'symbol': 'ABC', 'name': 'AmerisourceBergen Corporation'}, {'symbol': 'ABCB', 'name': 'Ameris Bancorp'}, {'symbol': 'ABDC', 'name': 'Alcentra Capital Corp.'}, {'symbol': 'ABEO', 'name': 'Abeona Therapeutics Inc.'}, {'symbol': 'ABEV', 'name': 'Ambev S.A. American Depositary Shares (Each representing 1)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '36'}, {'symbol': 'ABG', 'name': 'Asbury Automotive Group Inc'}, {'symbol': 'ABIL', 'name': 'Ability Inc.'}, {'symbol': 'ABIO', 'name': 'ARCA biopharma Inc.'}, {'symbol': 'ABM', 'name': 'ABM Industries Incorporated'}, {'symbol': 'ABMD', 'name': 'ABIOMED Inc.'}, {'symbol': 'ABR', 'name': 'Arbor Realty Trust'}, {'symbol': 'ABR-B', 'name': 'Arbor Realty Trust Cumulative Redeemable Preferred Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '33'}, {'symbol': 'ABT', 'name': 'Abbott Laboratories', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '34'}, {'symbol': 'ABTX', 'name': 'Allegiance Bancshares Inc.'}, {'symbol': 'ABUS', 'name': 'Arbutus Biopharma Corporation'}, {'symbol': 'AC', 'name': 'Associated Capital Group Inc.'}, {'symbol': 'ACA', 'name': 'Arcosa Inc.'}, {'symbol': 'ACAD', 'name': 'ACADIA Pharmaceuticals Inc.'}, {'symbol': 'ACB', 'name': 'Aurora Cannabis Inc.'}, {'symbol': 'ACBI', 'name': 'Atlantic Capital Bancshares Inc.'}, {'symbol': 'ACC', 'name': 'American Campus Communities Inc'}, {'symbol': 'ACCO', 'name': 'Acco Brands Corporation'}, {'symbol': 'ACER', 'name': 'Acer Therapeutics Inc.'}, {'symbol': 'ACET', 'name': 'Aceto Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '49'}, {'symbol': 'ACGL', 'name': 'Arch Capital Group Ltd.'}, {'symbol': 'ACGLP', 'name': 'Arch Capital Group Ltd. Depositary Shares Representing Interest in 5.25% Non-Cumulative Preferred Series E Shrs', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14575'}, {'symbol': 'ACH', 'name': 'Aluminum Corporation of China Limited American Depositary Shares'}, {'symbol': 'ACHC', 'name': 'Acadia Healthcare Company Inc.'}, {'symbol': 'ACHN', 'name': 'Achillion Pharmaceuticals Inc.'}, {'symbol': 'ACHV', 'name': 'Achieve Life Sciences Inc.'}, {'symbol': 'ACIA', 'name': 'Acacia Communications Inc.'}, {'symbol': 'ACIU', 'name': 'AC Immune SA', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11879'}, {'symbol': 'ACIW', 'name': 'ACI Worldwide Inc.'}, {'symbol': 'ACLS', 'name': 'Axcelis Technologies Inc.'}, {'symbol': 'ACM', 'name': 'AECOM'}, {'symbol': 'ACMR', 'name': 'ACM Research Inc.'}, {'symbol': 'ACN', 'name': 'Accenture plc Class A (Ireland)'}, {'symbol': 'ACNB', 'name': 'ACNB Corporation'}, {'symbol': 'ACOR', 'name': 'Acorda Therapeutics Inc.'}, {'symbol': 'ACP', 'name': 'Aberdeen Income Credit Strategies Fund'}, {'symbol': 'ACRE', 'name': 'Ares Commercial Real Estate Corporation'}, {'symbol': 'ACRS', 'name': 'Aclaris Therapeutics Inc.'}, {'symbol': 'ACRX', 'name': 'AcelRx Pharmaceuticals Inc.'}, {'symbol': 'ACSI', 'name': 'American Customer Satisfaction', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12028'}, {'symbol': 'ACST', 'name': 'Acasti Pharma Inc.'}, {'symbol': 'ACTG', 'name': 'Acacia Research Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '73'}, {'symbol': 'ACU', 'name': 'Acme United Corporation.'}, {'symbol': 'ACV', 'name': 'AllianzGI Diversified Income & Convertible Fund of Beneficial Interest'}, {'symbol': 'ACWI', 'name': 'iShares MSCI ACWI Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '79'}, {'symbol': 'ACWX', 'name': 'iShares MSCI ACWI ex US Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '81'}, {'symbol': 'ACY', 'name': 'AeroCentury Corp.'}, {'symbol': 'ADAP', 'name': 'Adaptimmune Therapeutics plc'}, {'symbol': 'ADBE', 'name': 'Adobe Inc.'}, {'symbol': 'ADC', 'name': 'Agree Realty Corporation'}, {'symbol': 'ADES', 'name': 'Advanced Emissions Solutions Inc.'}, {'symbol': 'ADI', 'name': 'Analog Devices Inc.'}, {'symbol': 'ADIL', 'name': 'Adial Pharmaceuticals Inc'}, {'symbol': 'ADM', 'name': 'Archer-Daniels-Midland Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '96'}, {'symbol': 'ADMA', 'name': 'ADMA Biologics Inc'}, {'symbol': 'ADMP', 'name': 'Adamis Pharmaceuticals Corporation'}, {'symbol': 'ADMS', 'name': 'Adamas Pharmaceuticals Inc.'}, {'symbol': 'ADNT', 'name': 'Adient plc'}, {'symbol': 'ADOM', 'name': 'ADOMANI Inc.'}, {'symbol': 'ADP', 'name': 'Automatic Data Processing Inc.'}, {'symbol': 'ADRD', 'name': 'Invesco BLDRS Developed Markets 100 ADR Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '100'}, {'symbol': 'ADRO', 'name': 'Aduro Biotech Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9823'}, {'symbol': 'ADS', 'name': 'Alliance Data Systems Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '103'}, {'symbol': 'ADSK', 'name': 'Autodesk Inc.'}, {'symbol': 'ADSW', 'name': 'Advanced Disposal Services Inc.'}, {'symbol': 'ADT', 'name': 'ADT Inc.'}, {'symbol': 'ADTN', 'name': 'ADTRAN Inc.'}, {'symbol': 'ADUS', 'name': 'Addus HomeCare Corporation'}, {'symbol': 'ADVM', 'name': 'Adverum Biotechnologies Inc.'}, {'symbol': 'ADX', 'name': 'Adams Diversified Equity Fund Inc.'}, {'symbol': 'ADXS', 'name': 'Advaxis Inc.'}, {'symbol': 'AE', 'name': 'Adams Resources & Energy Inc.'}, {'symbol': 'AED', 'name': 'AEGON N.V. Perp. Cap. Securities (Netherlands)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'bo', 'iexId': '14577'}, {'symbol': 'AEE', 'name': 'Ameren Corporation'}, {'symbol': 'AEF', 'name': 'Aberdeen Emerging Markets Equity Income Fund Inc.'}, {'symbol': 'AEG', 'name': 'AEGON N.V.'}, {'symbol': 'AEGN', 'name': 'Aegion Corp'}, {'symbol': 'AEHR', 'name': 'Aehr Test Systems', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '117'}, {'symbol': 'AEIS', 'name': 'Advanced Energy Industries Inc.'}, {'symbol': 'AEL', 'name': 'American Equity Investment Life Holding Company'}, {'symbol': 'AEM', 'name': 'Agnico Eagle Mines Limited'}, {'symbol': 'AEMD', 'name': 'Aethlon Medical Inc.'}, {'symbol': 'AEO', 'name': 'American Eagle Outfitters Inc.'}, {'symbol': 'AEP', 'name': 'American Electric Power Company Inc.'}, {'symbol': 'AER', 'name': 'AerCap Holdings N.V.'}, {'symbol': 'AERI', 'name': 'Aerie Pharmaceuticals Inc.'}, {'symbol': 'AES', 'name': 'The AES Corporation'}, {'symbol': 'AETI', 'name': 'American Electric Technologies Inc.'}, {'symbol': 'AEY', 'name': 'ADDvantage Technologies Group Inc.'}, {'symbol': 'AEYE', 'name': 'AudioEye Inc.'}, {'symbol': 'AEZS', 'name': 'Aeterna Zentaris Inc.'}, {'symbol': 'AFB', 'name': 'AllianceBernstein National Municipal Income Fund Inc'}, {'symbol': 'AFG', 'name': 'American Financial Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '141'}, {'symbol': 'AFGH', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10869'}, {'symbol': 'AFH', 'name': 'Atlas Financial Holdings Inc.'}, {'symbol': 'AFI', 'name': 'Armstrong Flooring Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11150'}, {'symbol': 'AFIN', 'name': 'American Finance Trust Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14844'}, {'symbol': 'AFL', 'name': 'AFLAC Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '144'}, {'symbol': 'AFMD', 'name': 'Affimed N.V.'}, {'symbol': 'AFT', 'name': 'Apollo Senior Floating Rate Fund Inc.'}, {'symbol': 'AG', 'name': 'First Majestic Silver Corp. (Canada)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '154'}, {'symbol': 'AGCO', 'name': 'AGCO Corporation'}, {'symbol': 'AGD', 'name': 'Aberdeen Global Dynamic Dividend Fund'}, {'symbol': 'AGE', 'name': 'AgeX Therapeutics Inc.'}, {'symbol': 'AGEN', 'name': 'Agenus Inc.'}, {'symbol': 'AGFS', 'name': 'AgroFresh Solutions Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8522'}, {'symbol': 'AGG', 'name': 'iShares Core U.S. Aggregate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '162'}, {'symbol': 'AGGP', 'name': 'IQ Enhanced Core Plus Bond U.S.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11328'}, {'symbol': 'AGI', 'name': 'Alamos Gold Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10266'}, {'symbol': 'AGIO', 'name': 'Agios Pharmaceuticals Inc.'}, {'symbol': 'AGLE', 'name': 'Aeglea BioTherapeutics Inc.'}, {'symbol': 'AGM', 'name': 'Federal Agricultural Mortgage Corporation'}, {'symbol': 'AGM-B', 'name': 'Federal Agricultural Mortgage Corporation Non Cumulative Preferred Stock Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '8508'}, {'symbol': 'AGM.A', 'name': 'Federal Agricultural Mortgage Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '170'}, {'symbol': 'AGMH', 'name': 'AGM Group Holdings Inc.'}, {'symbol': 'AGN', 'name': 'Allergan plc'}, {'symbol': 'AGNC', 'name': 'AGNC Investment Corp.'}, {'symbol': 'AGNCN', 'name': 'AGNC Investment Corp. Depositary Shares Each Representing a 1/1000th Interest in a Share of 7.00% Series C Fixed-To-Floating Rate Cumulative Redeemable Preferre', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13319'}, {'symbol': 'AGO', 'name': 'Assured Guaranty Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '174'}, {'symbol': 'AGO-E', 'name': 'Assured Guaranty Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '176'}, {'symbol': 'AGQ', 'name': 'ProShares Ultra Silver', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '179'}, {'symbol': 'AGR', 'name': 'Avangrid Inc.'}, {'symbol': 'AGRO', 'name': 'Adecoagro S.A.'}, {'symbol': 'AGRX', 'name': 'Agile Therapeutics Inc.'}, {'symbol': 'AGS', 'name': 'PlayAGS Inc.'}, {'symbol': 'AGTC', 'name': 'Applied Genetic Technologies Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8331'}, {'symbol': 'AGX', 'name': 'Argan Inc.'}, {'symbol': 'AGYS', 'name': 'Agilysys Inc.'}, {'symbol': 'AGZD', 'name': 'WisdomTree Interest Rate Hedged U.S. Aggregate Bond Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8170'}, {'symbol': 'AHC', 'name': 'A.H. Belo Corporation (TX)'}, {'symbol': 'AHH', 'name': 'Armada Hoffler Properties Inc.'}, {'symbol': 'AHL', 'name': 'Aspen Insurance Holdings Limited'}, {'symbol': 'AHL-D', 'name': 'Aspen Insurance Holdings Limited 5.625% Perpetual Non-Cumulative Preference Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14581'}, {'symbol': 'AHPI', 'name': 'Allied Healthcare Products Inc.'}, {'symbol': 'AHT', 'name': 'Ashford Hospitality Trust Inc'}, {'symbol': 'AHT-F', 'name': 'Ashford Hospitality Trust Inc 7.375% Series F Cumulative Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11628'}, {'symbol': 'AHT-H', 'name': 'Ashford Hospitality Trust Inc 7.50% Series H Cumulative Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13325'}, {'symbol': 'AI', 'name': 'Arlington Asset Investment Corp Class A (new)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '198'}, {'symbol': 'AIA', 'name': 'iShares Asia 50 ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '199'}, {'symbol': 'AIEQ', 'name': 'AI Powered Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13582'}, {'symbol': 'AIF', 'name': 'Apollo Tactical Income Fund Inc.'}, {'symbol': 'AIG', 'name': 'American International Group Inc.'}, {'symbol': 'AIHS', 'name': 'Senmiao Technology Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13684'}, {'symbol': 'AIMC', 'name': 'Altra Industrial Motion Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '203'}, {'symbol': 'AIMT', 'name': 'Aimmune Therapeutics Inc.'}, {'symbol': 'AIN', 'name': 'Albany International Corporation'}, {'symbol': 'AINC', 'name': 'Ashford Inc. (Holding Company)'}, {'symbol': 'AINV', 'name': 'Apollo Investment Corporation'}, {'symbol': 'AIPT', 'name': 'Precision Therapeutics Inc.'}, {'symbol': 'AIR', 'name': 'AAR Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '207'}, {'symbol': 'AIRG', 'name': 'Airgain Inc.'}, {'symbol': 'AIRI', 'name': 'Air Industries Group'}, {'symbol': 'AIRT', 'name': 'Air T Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '210'}, {'symbol': 'AIT', 'name': 'Applied Industrial Technologies Inc.'}, {'symbol': 'AIV', 'name': 'Apartment Investment and Management Company'}, {'symbol': 'AIW', 'name': 'Arlington Asset Investment Corp 6.625% Notes due 2023', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '214'}, {'symbol': 'AIZ', 'name': 'Assurant Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '217'}, {'symbol': 'AJG', 'name': 'Arthur J. Gallagher & Co.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '219'}, {'symbol': 'AJRD', 'name': 'Aerojet Rocketdyne Holdings Inc.'}, {'symbol': 'AJX', 'name': 'Great Ajax Corp.'}, {'symbol': 'AKAM', 'name': 'Akamai Technologies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '220'}, {'symbol': 'AKAO', 'name': 'Achaogen Inc.'}, {'symbol': 'AKBA', 'name': 'Akebia Therapeutics Inc.'}, {'symbol': 'AKCA', 'name': 'Akcea Therapeutics Inc.'}, {'symbol': 'AKER', 'name': 'Akers Biosciences Inc.'}, {'symbol': 'AKG', 'name': 'Asanko Gold Inc.'}, {'symbol': 'AKO.A', 'name': 'Embotelladora Andina S.A.'}, {'symbol': 'AKO.B', 'name': 'Embotelladora Andina S.A.'}, {'symbol': 'AKP', 'name': 'Alliance California Municipal Income Fund Inc'}, {'symbol': 'AKR', 'name': 'Acadia Realty Trust'}, {'symbol': 'AKRX', 'name': 'Akorn Inc.'}, {'symbol': 'AKS', 'name': 'AK Steel Holding Corporation'}, {'symbol': 'AKTS', 'name': 'Akoustis Technologies Inc.'}, {'symbol': 'AKTX', 'name': 'Akari Therapeutics Plc'}, {'symbol': 'AL', 'name': 'Air Lease Corporation Class A'}, {'symbol': 'ALAC', 'name': 'Alberton Acquisition Corporation'}, {'symbol': 'ALACU', 'name': 'Alberton Acquisition Corporation Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '15155'}, {'symbol': 'ALB', 'name': 'Albemarle Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '229'}, {'symbol': 'ALBO', 'name': 'Albireo Pharma Inc.'}, {'symbol': 'ALCO', 'name': 'Alico Inc.'}, {'symbol': 'ALDR', 'name': 'Alder BioPharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8477'}, {'symbol': 'ALDX', 'name': 'Aldeyra Therapeutics Inc.'}, {'symbol': 'ALE', 'name': 'Allete Inc.'}, {'symbol': 'ALEX', 'name': 'Alexander & Baldwin Inc. REIT Holding Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13761'}, {'symbol': 'ALG', 'name': 'Alamo Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '237'}, {'symbol': 'ALGN', 'name': 'Align Technology Inc.'}, {'symbol': 'ALGR', 'name': 'Allegro Merger Corp.'}, {'symbol': 'ALGRU', 'name': 'Allegro Merger Corp. Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14793'}, {'symbol': 'ALGT', 'name': 'Allegiant Travel Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '239'}, {'symbol': 'ALIM', 'name': 'Alimera Sciences Inc.'}, {'symbol': 'ALJJ', 'name': 'ALJ Regional Holdings Inc.'}, {'symbol': 'ALK', 'name': 'Alaska Air Group Inc.'}, {'symbol': 'ALKS', 'name': 'Alkermes plc'}, {'symbol': 'ALL', 'name': 'Allstate Corporation (The)'}, {'symbol': 'ALL-B', 'name': 'Allstate Corporation (The) 5.100% Fixed-to-Floating Rate Subordinated Debentures due 2053', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '246'}, {'symbol': 'ALL-E', 'name': 'Allstate Corporation Depositary Shares Series E', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '8323'}, {'symbol': 'ALL-G', 'name': 'Allstate Corporation (The) Depositary Shares Series G', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14338'}, {'symbol': 'ALLE', 'name': 'Allegion plc'}, {'symbol': 'ALLK', 'name': 'Allakos Inc.'}, {'symbol': 'ALLO', 'name': 'Allogene Therapeutics Inc.'}, {'symbol': 'ALLT', 'name': 'Allot Ltd.'}, {'symbol': 'ALLY', 'name': 'Ally Financial Inc.'}, {'symbol': 'ALNA', 'name': 'Allena Pharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13516'}, {'symbol': 'ALNY', 'name': 'Alnylam Pharmaceuticals Inc.'}, {'symbol': 'ALO', 'name': 'Alio Gold Inc. (Canada)'}, {'symbol': 'ALOT', 'name': 'AstroNova Inc.'}, {'symbol': 'ALPN', 'name': 'Alpine Immune Sciences Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9991'}, {'symbol': 'ALQA', 'name': 'Alliqua BioMedical Inc.'}, {'symbol': 'ALRM', 'name': 'Alarm.com Holdings Inc.'}, {'symbol': 'ALRN', 'name': 'Aileron Therapeutics Inc.'}, {'symbol': 'ALSK', 'name': 'Alaska Communications Systems Group Inc.'}, {'symbol': 'ALSN', 'name': 'Allison Transmission Holdings Inc.'}, {'symbol': 'ALT', 'name': 'Altimmune Inc.'}, {'symbol': 'ALTM', 'name': 'Altus Midstream Company'}, {'symbol': 'ALTR', 'name': 'Altair Engineering Inc.'}, {'symbol': 'ALTY', 'name': 'Global X SuperDividend Alternatives ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10294'}, {'symbol': 'ALV', 'name': 'Autoliv Inc.'}, {'symbol': 'ALX', 'name': "Alexander's Inc."}, {'symbol': 'ALXN', 'name': 'Alexion Pharmaceuticals Inc.'}, {'symbol': 'ALYA', 'name': 'Alithya Group inc.'}, {'symbol': 'AM', 'name': 'Antero Midstream Partners LP representing limited partner interests'}, {'symbol': 'AMAG', 'name': 'AMAG Pharmaceuticals Inc.'}, {'symbol': 'AMAL', 'name': 'Amalgamated Bank'}, {'symbol': 'AMAT', 'name': 'Applied Materials Inc.'}, {'symbol': 'AMBA', 'name': 'Ambarella Inc.'}, {'symbol': 'AMBC', 'name': 'Ambac Financial Group Inc.'}, {'symbol': 'AMBO', 'name': 'Ambow Education Holding Ltd. American Depository Shares each representing two Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '280'}, {'symbol': 'AMBR', 'name': 'Amber Road Inc.'}, {'symbol': 'AMC', 'name': 'AMC Entertainment Holdings Inc. Class A'}, {'symbol': 'AMCI', 'name': 'AMCI Acquisition Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15181'}, {'symbol': 'AMCIW', 'name': 'AMCI Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15337'}, {'symbol': 'AMCN', 'name': 'AirMedia Group Inc'}, {'symbol': 'AMCX', 'name': 'AMC Networks Inc.'}, {'symbol': 'AMD', 'name': 'Advanced Micro Devices Inc.'}, {'symbol': 'AME', 'name': 'AMETEK Inc.'}, {'symbol': 'AMED', 'name': 'Amedisys Inc'}, {'symbol': 'AMEH', 'name': 'Apollo Medical Holdings Inc.'}, {'symbol': 'AMG', 'name': 'Affiliated Managers Group Inc.'}, {'symbol': 'AMGN', 'name': 'Amgen Inc.'}, {'symbol': 'AMGP', 'name': 'Antero Midstream GP LP of Beneficial Interests'}, {'symbol': 'AMH', 'name': 'American Homes 4 Rent of Beneficial Interest'}, {'symbol': 'AMH-E', 'name': 'American Homes 4 Rent 6.35% Series E Cumulative Redeemable Perpetual Preferred Shares of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11558'}, {'symbol': 'AMH-G', 'name': 'American Homes 4 Rent Series G cumulative redeemable perpetual preferred shares of beneficial interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13160'}, {'symbol': 'AMID', 'name': 'American Midstream Partners LP representing Limited Partner Interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '294'}, {'symbol': 'AMJL', 'name': 'Credit Suisse X-Links Monthly Pay 2xLeveraged Alerian MLP Index Exchange Traded Notes due May 16 2036', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11385'}, {'symbol': 'AMKR', 'name': 'Amkor Technology Inc.'}, {'symbol': 'AMN', 'name': 'AMN Healthcare Services Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '192'}, {'symbol': 'AMNB', 'name': 'American National Bankshares Inc.'}, {'symbol': 'AMOT', 'name': 'Allied Motion Technologies Inc.'}, {'symbol': 'AMOV', 'name': 'America Movil S.A.B. de C.V. Class An Depositary Shares'}, {'symbol': 'AMP', 'name': 'Ameriprise Financial Inc.'}, {'symbol': 'AMPE', 'name': 'Ampio Pharmaceuticals Inc.'}, {'symbol': 'AMPH', 'name': 'Amphastar Pharmaceuticals Inc.'}, {'symbol': 'AMR', 'name': 'Alta Mesa Resources Inc.'}, {'symbol': 'AMRB', 'name': 'American River Bankshares'}, {'symbol': 'AMRC', 'name': 'Ameresco Inc. Class A'}, {'symbol': 'AMRH', 'name': 'Ameri Holdings Inc.'}, {'symbol': 'AMRK', 'name': 'A-Mark Precious Metals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8339'}, {'symbol': 'AMRN', 'name': 'Amarin Corporation plc'}, {'symbol': 'AMRS', 'name': 'Amyris Inc.'}, {'symbol': 'AMRX', 'name': 'Amneal Pharmaceuticals Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13988'}, {'symbol': 'AMS', 'name': 'American Shared Hospital Services'}, {'symbol': 'AMSC', 'name': 'American Superconductor Corporation'}, {'symbol': 'AMSF', 'name': 'AMERISAFE Inc.'}, {'symbol': 'AMSWA', 'name': 'American Software Inc. Class A Common Stock'}, {'symbol': 'AMT', 'name': 'American Tower Corporation (REIT)'}, {'symbol': 'AMTB', 'name': 'Mercantil Bank Holding Corporation'}, {'symbol': 'AMTBB', 'name': 'Mercantil Bank Holding Corporation Class B Common Stock'}, {'symbol': 'AMTD', 'name': 'TD Ameritrade Holding Corporation'}, {'symbol': 'AMTX', 'name': 'Aemetis Inc'}, {'symbol': 'AMUB', 'name': 'ETRACS Alerian MLP Index ETN Series B due July 18 2042', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10675'}, {'symbol': 'AMWD', 'name': 'American Woodmark Corporation'}, {'symbol': 'AMX', 'name': 'America Movil S.A.B. de C.V.n Depository Receipt Series L'}, {'symbol': 'AMZN', 'name': 'Amazon.com Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '323'}, {'symbol': 'AN', 'name': 'AutoNation Inc.'}, {'symbol': 'ANAB', 'name': 'AnaptysBio Inc.'}, {'symbol': 'ANAT', 'name': 'American National Insurance Company'}, {'symbol': 'ANDE', 'name': 'The Andersons Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '334'}, {'symbol': 'ANDX', 'name': 'Andeavor Logistics LP representing Limited Partner Interests'}, {'symbol': 'ANET', 'name': 'Arista Networks Inc.'}, {'symbol': 'ANF', 'name': 'Abercrombie & Fitch Company'}, {'symbol': 'ANFI', 'name': 'Amira Nature Foods Ltd'}, {'symbol': 'ANGI', 'name': 'ANGI Homeservices Inc.'}, {'symbol': 'ANGO', 'name': 'AngioDynamics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '340'}, {'symbol': 'ANH', 'name': 'Anworth Mortgage Asset Corporation'}, {'symbol': 'ANH-B', 'name': 'Anworth Mortgage Asset Corporation Preferred Stock Series B 6.25%', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '343'}, {'symbol': 'ANIK', 'name': 'Anika Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '344'}, {'symbol': 'ANIP', 'name': 'ANI Pharmaceuticals Inc.'}, {'symbol': 'ANIX', 'name': 'Anixa Biosciences Inc.'}, {'symbol': 'ANSS', 'name': 'ANSYS Inc.'}, {'symbol': 'ANTM', 'name': 'Anthem Inc.'}, {'symbol': 'ANY', 'name': 'Sphere 3D Corp.'}, {'symbol': 'AOBC', 'name': 'American Outdoor Brands Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6604'}, {'symbol': 'AOD', 'name': 'Aberdeen Total Dynamic Dividend Fund'}, {'symbol': 'AOM', 'name': 'iShares Core Moderate Allocation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '358'}, {'symbol': 'AON', 'name': 'Aon plc Class A (UK)'}, {'symbol': 'AOS', 'name': 'A.O. Smith Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '361'}, {'symbol': 'AOSL', 'name': 'Alpha and Omega Semiconductor Limited'}, {'symbol': 'AP', 'name': 'Ampco-Pittsburgh Corporation'}, {'symbol': 'APA', 'name': 'Apache Corporation'}, {'symbol': 'APAM', 'name': 'Artisan Partners Asset Management Inc. Class A'}, {'symbol': 'APC', 'name': 'Anadarko Petroleum Corporation'}, {'symbol': 'APD', 'name': 'Air Products and Chemicals Inc.'}, {'symbol': 'APDN', 'name': 'Applied DNA Sciences Inc'}, {'symbol': 'APEI', 'name': 'American Public Education Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '370'}, {'symbol': 'APEN', 'name': 'Apollo Endosurgery Inc.'}, {'symbol': 'APF', 'name': 'Morgan Stanley Asia-Pacific Fund Inc.'}, {'symbol': 'APH', 'name': 'Amphenol Corporation'}, {'symbol': 'APHA', 'name': 'Aphria Inc.'}, {'symbol': 'APHB', 'name': 'AmpliPhi Biosciences Corporation'}, {'symbol': 'APLE', 'name': 'Apple Hospitality REIT Inc.'}, {'symbol': 'APLS', 'name': 'Apellis Pharmaceuticals Inc.'}, {'symbol': 'APM', 'name': 'Aptorum Group Limited'}, {'symbol': 'APO', 'name': 'Apollo Global Management LLC Class A Representing Class A Limitied Liability Company Interests'}, {'symbol': 'APO-B', 'name': 'Apollo Global Management LLC 6.375% Series B Preferred Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14302'}, {'symbol': 'APOG', 'name': 'Apogee Enterprises Inc.'}, {'symbol': 'APOP', 'name': 'Cellect Biotechnology Ltd.'}, {'symbol': 'APPF', 'name': 'AppFolio Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10013'}, {'symbol': 'APPN', 'name': 'Appian Corporation'}, {'symbol': 'APPS', 'name': 'Digital Turbine Inc.'}, {'symbol': 'APRN', 'name': 'Blue Apron Holdings Inc. Class A'}, {'symbol': 'APT', 'name': 'Alpha Pro Tech Ltd.'}, {'symbol': 'APTO', 'name': 'Aptose Biosciences Inc.'}, {'symbol': 'APTS', 'name': 'Preferred Apartment Communities Inc.'}, {'symbol': 'APTV', 'name': 'Aptiv PLC'}, {'symbol': 'APTX', 'name': 'Aptinyx Inc.'}, {'symbol': 'APU', 'name': 'AmeriGas Partners L.P.'}, {'symbol': 'APVO', 'name': 'Aptevo Therapeutics Inc.'}, {'symbol': 'APWC', 'name': 'Asia Pacific Wire & Cable Corporation Limited'}, {'symbol': 'APY', 'name': 'Apergy Corporation'}, {'symbol': 'APYX', 'name': 'Apyx Medical Corporation'}, {'symbol': 'AQ', 'name': 'Aquantia Corp.'}, {'symbol': 'AQB', 'name': 'AquaBounty Technologies Inc.'}, {'symbol': 'AQMS', 'name': 'Aqua Metals Inc.'}, {'symbol': 'AQN', 'name': 'Algonquin Power & Utilities Corp.'}, {'symbol': 'AQST', 'name': 'Aquestive Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14784'}, {'symbol': 'AQUA', 'name': 'Evoqua Water Technologies Corp.'}, {'symbol': 'AQXP', 'name': 'Aquinox Pharmaceuticals Inc.'}, {'symbol': 'AR', 'name': 'Antero Resources Corporation'}, {'symbol': 'ARA', 'name': 'American Renal Associates Holdings Inc'}, {'symbol': 'ARAV', 'name': 'Aravive Inc.'}, {'symbol': 'ARAY', 'name': 'Accuray Incorporated'}, {'symbol': 'ARC', 'name': 'ARC Document Solutions Inc.'}, {'symbol': 'ARCB', 'name': 'ArcBest Corporation'}, {'symbol': 'ARCC', 'name': 'Ares Capital Corporation'}, {'symbol': 'ARCE', 'name': 'Arco Platform Limited'}, {'symbol': 'ARCH', 'name': 'Arch Coal Inc. Class A'}, {'symbol': 'ARCI', 'name': 'Appliance Recycling Centers of America Inc.'}, {'symbol': 'ARCO', 'name': 'Arcos Dorados Holdings Inc. Class A Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '395'}, {'symbol': 'ARCT', 'name': 'Arcturus Therapeutics Ltd.'}, {'symbol': 'ARCW', 'name': 'ARC Group Worldwide Inc.'}, {'symbol': 'ARD', 'name': 'Ardagh Group S.A.'}, {'symbol': 'ARDC', 'name': 'Ares Dynamic Credit Allocation Fund Inc.'}, {'symbol': 'ARDS', 'name': 'Aridis Pharmaceuticals Inc.'}, {'symbol': 'ARDX', 'name': 'Ardelyx Inc.'}, {'symbol': 'ARE', 'name': 'Alexandria Real Estate Equities Inc.'}, {'symbol': 'ARES', 'name': 'Ares Management Corporation Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8515'}, {'symbol': 'AREX', 'name': 'Approach Resources Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '402'}, {'symbol': 'ARGO', 'name': 'Argo Group International Holdings Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '164'}, {'symbol': 'ARGX', 'name': 'argenx SE', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12807'}, {'symbol': 'ARI', 'name': 'Apollo Commercial Real Estate Finance Inc'}, {'symbol': 'ARKF', 'name': 'ARK Fintech Innovation', 'date': '2019-02-08', 'isEnabled': False, 'type': 'N/A', 'iexId': '15419'}, {'symbol': 'ARKK', 'name': 'ARK Innovation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9442'}, {'symbol': 'ARKR', 'name': 'Ark Restaurants Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '411'}, {'symbol': 'ARL', 'name': 'American Realty Investors Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '412'}, {'symbol': 'ARLO', 'name': 'Arlo Technologies Inc.'}, {'symbol': 'ARLP', 'name': 'Alliance Resource Partners L.P.'}, {'symbol': 'ARMK', 'name': 'Aramark'}, {'symbol': 'ARNA', 'name': 'Arena Pharmaceuticals Inc.'}, {'symbol': 'ARNC', 'name': 'Arconic Inc.'}, {'symbol': 'AROC', 'name': 'Archrock Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2368'}, {'symbol': 'AROW', 'name': 'Arrow Financial Corporation'}, {'symbol': 'ARPO', 'name': 'Aerpio Pharmaceuticals Inc.'}, {'symbol': 'ARQL', 'name': 'ArQule Inc.'}, {'symbol': 'ARR', 'name': 'ARMOUR Residential REIT Inc.'}, {'symbol': 'ARR-B', 'name': 'ARMOUR Residential REIT Inc. Preferred Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '424'}, {'symbol': 'ARRS', 'name': 'ARRIS International plc'}, {'symbol': 'ARRY', 'name': 'Array BioPharma Inc.'}, {'symbol': 'ARTNA', 'name': 'Artesian Resources Corporation Class A Non-Voting Common Stock'}, {'symbol': 'ARTW', 'name': "Art's-Way Manufacturing Co. Inc."}, {'symbol': 'ARTX', 'name': 'Arotech Corporation'}, {'symbol': 'ARVN', 'name': 'Arvinas Inc.'}, {'symbol': 'ARW', 'name': 'Arrow Electronics Inc.'}, {'symbol': 'ARWR', 'name': 'Arrowhead Pharmaceuticals Inc.'}, {'symbol': 'ARYA', 'name': 'ARYA Sciences Acquisition Corp.'}, {'symbol': 'ARYAW', 'name': 'ARYA Sciences Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15204'}, {'symbol': 'ASA', 'name': 'ASA Gold and Precious Metals Limited'}, {'symbol': 'ASB', 'name': 'Associated Banc-Corp'}, {'symbol': 'ASB-D', 'name': 'Associated Banc-Corp Depositary Shares Series D', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11880'}, {'symbol': 'ASC', 'name': 'Ardmore Shipping Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '442'}, {'symbol': 'ASCMA', 'name': 'Ascent Capital Group Inc. Series A Common Stock'}, {'symbol': 'ASET', 'name': 'FlexShares Real Assets Allocation Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10874'}, {'symbol': 'ASFI', 'name': 'Asta Funding Inc.'}, {'symbol': 'ASG', 'name': 'Liberty All-Star Growth Fund Inc.'}, {'symbol': 'ASGN', 'name': 'ASGN Incorporated'}, {'symbol': 'ASH', 'name': 'Ashland Global Holdings Inc.'}, {'symbol': 'ASHS', 'name': 'Xtrackers Harvest CSI 500 China A-Shares Small Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8647'}, {'symbol': 'ASIX', 'name': 'AdvanSix Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11838'}, {'symbol': 'ASLN', 'name': 'ASLAN Pharmaceuticals Limited'}, {'symbol': 'ASM', 'name': 'Avino Silver & Gold Mines Ltd. (Canada)'}, {'symbol': 'ASMB', 'name': 'Assembly Biosciences Inc.'}, {'symbol': 'ASML', 'name': 'ASML Holding N.V.'}, {'symbol': 'ASNA', 'name': 'Ascena Retail Group Inc.'}, {'symbol': 'ASND', 'name': 'Ascendis Pharma A/S'}, {'symbol': 'ASNS', 'name': 'Arsanis Inc.'}, {'symbol': 'ASPN', 'name': 'Aspen Aerogels Inc.'}, {'symbol': 'ASPS', 'name': 'Altisource Portfolio Solutions S.A.'}, {'symbol': 'ASPU', 'name': 'Aspen Group Inc.'}, {'symbol': 'ASR', 'name': 'Grupo Aeroportuario del Sureste S.A. de C.V.'}, {'symbol': 'ASRT', 'name': 'Assertio Therapeutics Inc.'}, {'symbol': 'ASRV', 'name': 'AmeriServ Financial Inc.'}, {'symbol': 'AST', 'name': 'Asterias Biotherapeutics Inc. Common Series A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9359'}, {'symbol': 'ASTC', 'name': 'Astrotech Corporation'}, {'symbol': 'ASTE', 'name': 'Astec Industries Inc.'}, {'symbol': 'ASUR', 'name': 'Asure Software Inc'}, {'symbol': 'ASV', 'name': 'ASV Holdings Inc.'}, {'symbol': 'ASX', 'name': 'ASE Technology Holding Co. Ltd. American Depositary Shares (each representing Two)'}, {'symbol': 'ASYS', 'name': 'Amtech Systems Inc.'}, {'symbol': 'AT', 'name': 'Atlantic Power Corporation (Canada)'}, {'symbol': 'ATAI', 'name': 'ATA Inc.'}, {'symbol': 'ATAX', 'name': 'America First Multifamily Investors L.P.'}, {'symbol': 'ATEC', 'name': 'Alphatec Holdings Inc.'}, {'symbol': 'ATEN', 'name': 'A10 Networks Inc.'}, {'symbol': 'ATGE', 'name': 'Adtalem Global Education Inc.'}, {'symbol': 'ATH', 'name': 'Athene Holding Ltd. Class A'}, {'symbol': 'ATHM', 'name': 'Autohome Inc. American Depositary Shares each representing one class A.'}, {'symbol': 'ATHN', 'name': 'athenahealth Inc.'}, {'symbol': 'ATHX', 'name': 'Athersys Inc.'}, {'symbol': 'ATI', 'name': 'Allegheny Technologies Incorporated'}, {'symbol': 'ATIS', 'name': 'Attis Industries Inc.'}, {'symbol': 'ATKR', 'name': 'Atkore International Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11329'}, {'symbol': 'ATLC', 'name': 'Atlanticus Holdings Corporation'}, {'symbol': 'ATLO', 'name': 'Ames National Corporation'}, {'symbol': 'ATNI', 'name': 'ATN International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '491'}, {'symbol': 'ATNM', 'name': 'Actinium Pharmaceuticals Inc. (Delaware)'}, {'symbol': 'ATNX', 'name': 'Athenex Inc.'}, {'symbol': 'ATO', 'name': 'Atmos Energy Corporation'}, {'symbol': 'ATOM', 'name': 'Atomera Incorporated'}, {'symbol': 'ATOS', 'name': 'Atossa Genetics Inc.'}, {'symbol': 'ATR', 'name': 'AptarGroup Inc.'}, {'symbol': 'ATRA', 'name': 'Atara Biotherapeutics Inc.'}, {'symbol': 'ATRC', 'name': 'AtriCure Inc.'}, {'symbol': 'ATRI', 'name': 'Atrion Corporation'}, {'symbol': 'ATRO', 'name': 'Astronics Corporation'}, {'symbol': 'ATRS', 'name': 'Antares Pharma Inc.'}, {'symbol': 'ATSG', 'name': 'Air Transport Services Group Inc'}, {'symbol': 'ATTO', 'name': 'Atento S.A.'}, {'symbol': 'ATTU', 'name': 'Attunity Ltd.'}, {'symbol': 'ATU', 'name': 'Actuant Corporation'}, {'symbol': 'ATUS', 'name': 'Altice USA Inc. Class A'}, {'symbol': 'ATV', 'name': 'Acorn International Inc. ADS'}, {'symbol': 'ATVI', 'name': 'Activision Blizzard Inc'}, {'symbol': 'ATXI', 'name': 'Avenue Therapeutics Inc.'}, {'symbol': 'AU', 'name': 'AngloGold Ashanti Limited'}, {'symbol': 'AUBN', 'name': 'Auburn National Bancorporation Inc.'}, {'symbol': 'AUDC', 'name': 'AudioCodes Ltd.'}, {'symbol': 'AUG', 'name': 'Auryn Resources Inc.'}, {'symbol': 'AUMN', 'name': 'Golden Minerals Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '512'}, {'symbol': 'AUO', 'name': 'AU Optronics Corp American Depositary Shares'}, {'symbol': 'AUPH', 'name': 'Aurinia Pharmaceuticals Inc'}, {'symbol': 'AUSF', 'name': 'Global X Funds Adaptive U.S. Factor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14953'}, {'symbol': 'AUTL', 'name': 'Autolus Therapeutics plc'}, {'symbol': 'AUTO', 'name': 'AutoWeb Inc.'}, {'symbol': 'AUY', 'name': 'Yamana Gold Inc. (Canada)'}, {'symbol': 'AVA', 'name': 'Avista Corporation'}, {'symbol': 'AVAL', 'name': 'Grupo Aval Acciones y Valores S.A. ADR (Each representing 20 preferred shares)'}, {'symbol': 'AVAV', 'name': 'AeroVironment Inc.'}, {'symbol': 'AVB', 'name': 'AvalonBay Communities Inc.'}, {'symbol': 'AVCO', 'name': 'Avalon GloboCare Corp.'}, {'symbol': 'AVD', 'name': 'American Vanguard Corporation ($0.10 Par Value)'}, {'symbol': 'AVDL', 'name': 'Avadel Pharmaceuticals plc'}, {'symbol': 'AVEO', 'name': 'AVEO Pharmaceuticals Inc.'}, {'symbol': 'AVGO', 'name': 'Broadcom Inc.'}, {'symbol': 'AVGR', 'name': 'Avinger Inc.'}, {'symbol': 'AVH', 'name': 'Avianca Holdings S.A. American Depositary Shares (Each representing 8 preferred Shares)'}, {'symbol': 'AVID', 'name': 'Avid Technology Inc.'}, {'symbol': 'AVK', 'name': 'Advent Claymore Convertible Securities and Income Fund'}, {'symbol': 'AVLR', 'name': 'Avalara Inc.'}, {'symbol': 'AVNS', 'name': 'Avanos Medical Inc.'}, {'symbol': 'AVNW', 'name': 'Aviat Networks Inc.'}, {'symbol': 'AVP', 'name': 'Avon Products Inc.'}, {'symbol': 'AVRO', 'name': 'AVROBIO Inc.'}, {'symbol': 'AVT', 'name': 'Avnet Inc.'}, {'symbol': 'AVX', 'name': 'AVX Corporation'}, {'symbol': 'AVXL', 'name': 'Anavex Life Sciences Corp.'}, {'symbol': 'AVY', 'name': 'Avery Dennison Corporation'}, {'symbol': 'AVYA', 'name': 'Avaya Holdings Corp.'}, {'symbol': 'AWF', 'name': 'Alliancebernstein Global High Income Fund'}, {'symbol': 'AWI', 'name': 'Armstrong World Industries Inc'}, {'symbol': 'AWK', 'name': 'American Water Works Company Inc.'}, {'symbol': 'AWP', 'name': 'Aberdeen Global Premier Properties Fund of Beneficial Interest'}, {'symbol': 'AWR', 'name': 'American States Water Company'}, {'symbol': 'AWRE', 'name': 'Aware Inc.'}, {'symbol': 'AWSM', 'name': 'Cool Holdings Inc.'}, {'symbol': 'AWX', 'name': 'Avalon Holdings Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '549'}, {'symbol': 'AX', 'name': 'Axos Financial Inc.'}, {'symbol': 'AXAS', 'name': 'Abraxas Petroleum Corporation'}, {'symbol': 'AXDX', 'name': 'Accelerate Diagnostics Inc.'}, {'symbol': 'AXE', 'name': 'Anixter International Inc.'}, {'symbol': 'AXGN', 'name': 'AxoGen Inc.'}, {'symbol': 'AXJV', 'name': 'iShares Edge MSCI A Min Vol Asia ex Japan', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8686'}, {'symbol': 'AXL', 'name': 'American Axle & Manufacturing Holdings Inc.'}, {'symbol': 'AXNX', 'name': 'Axonics Modulation Technologies Inc.'}, {'symbol': 'AXON', 'name': 'Axovant Sciences Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9979'}, {'symbol': 'AXP', 'name': 'American Express Company'}, {'symbol': 'AXR', 'name': 'AMREP Corporation'}, {'symbol': 'AXS', 'name': 'Axis Capital Holdings Limited'}, {'symbol': 'AXS-E', 'name': 'Axis Capital Holdings Limited Depositary Shares Series E', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14583'}, {'symbol': 'AXSM', 'name': 'Axsome Therapeutics Inc.'}, {'symbol': 'AXTA', 'name': 'Axalta Coating Systems Ltd.'}, {'symbol': 'AXTI', 'name': 'AXT Inc'}, {'symbol': 'AXU', 'name': 'Alexco Resource Corp (Canada)'}, {'symbol': 'AY', 'name': 'Atlantica Yield plc'}, {'symbol': 'AYI', 'name': 'Acuity Brands Inc.'}, {'symbol': 'AYR', 'name': 'Aircastle Limited'}, {'symbol': 'AYTU', 'name': 'Aytu BioScience Inc.'}, {'symbol': 'AYX', 'name': 'Alteryx Inc. Class A'}, {'symbol': 'AZN', 'name': 'Astrazeneca PLC'}, {'symbol': 'AZO', 'name': 'AutoZone Inc.'}, {'symbol': 'AZPN', 'name': 'Aspen Technology Inc.'}, {'symbol': 'AZRE', 'name': 'Azure Power Global Limited Equity Shares'}, {'symbol': 'AZRX', 'name': 'AzurRx BioPharma Inc.'}, {'symbol': 'AZUL', 'name': 'Azul S.A. American Depositary Shares (each representing three preferred shares)'}, {'symbol': 'AZZ', 'name': 'AZZ Inc.'}, {'symbol': 'B', 'name': 'Barnes Group Inc.'}, {'symbol': 'BA', 'name': 'The Boeing Company'}, {'symbol': 'BABA', 'name': 'Alibaba Group Holding Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8884'}, {'symbol': 'BABY', 'name': 'Natus Medical Incorporated'}, {'symbol': 'BAC', 'name': 'Bank of America Corporation'}, {'symbol': 'BAC-B', 'name': 'Bank of America Corporation Depositary Shares Series G', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14565'}, {'symbol': 'BAC-E', 'name': 'Bank of America Corporation Depositary Sh repstg 1/1000th Perp Pfd Ser E', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '593'}, {'symbol': 'BAC-L', 'name': 'Bank of America Corporation Non Cumulative Perpetual Conv Pfd Ser L', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '595'}, {'symbol': 'BAC-Y', 'name': 'Bank of America Corporation Depositary Shares Series Y', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '9700'}, {'symbol': 'BAF', 'name': 'BlackRock Municipal Income Investment Quality Trust'}, {'symbol': 'BAH', 'name': 'Booz Allen Hamilton Holding Corporation'}, {'symbol': 'BAK', 'name': 'Braskem SA ADR'}, {'symbol': 'BAM', 'name': 'Brookfield Asset Management Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '604'}, {'symbol': 'BANC', 'name': 'Banc of California Inc.'}, {'symbol': 'BANC-E', 'name': 'Banc of California Inc. Depositary Shares Series E', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11063'}, {'symbol': 'BAND', 'name': 'Bandwidth Inc.'}, {'symbol': 'BANF', 'name': 'BancFirst Corporation'}, {'symbol': 'BANR', 'name': 'Banner Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '611'}, {'symbol': 'BANX', 'name': 'StoneCastle Financial Corp'}, {'symbol': 'BAP', 'name': 'Credicorp Ltd.'}, {'symbol': 'BAS', 'name': 'Basic Energy Services Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '614'}, {'symbol': 'BASI', 'name': 'Bioanalytical Systems Inc.'}, {'symbol': 'BATRA', 'name': 'Liberty Media Corporation Series A Liberty Braves Common Stock'}, {'symbol': 'BATRK', 'name': 'Liberty Media Corporation Series C Liberty Braves Common Stock'}, {'symbol': 'BAX', 'name': 'Baxter International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '616'}, {'symbol': 'BB', 'name': 'BlackBerry Limited'}, {'symbol': 'BBBY', 'name': 'Bed Bath & Beyond Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '619'}, {'symbol': 'BBCA', 'name': 'JPMorgan BetaBuilders Canada', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14896'}, {'symbol': 'BBCP', 'name': 'Concrete Pumping Holdings Inc.'}, {'symbol': 'BBD', 'name': 'Banco Bradesco Sa American Depositary Shares'}, {'symbol': 'BBDC', 'name': 'Barings BDC Inc.'}, {'symbol': 'BBDO', 'name': 'Banco Bradesco Sa American Depositary Shares (each representing one)'}, {'symbol': 'BBF', 'name': 'BlackRock Municipal Income Investment Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '624'}, {'symbol': 'BBGI', 'name': 'Beasley Broadcast Group Inc.'}, {'symbol': 'BBJP', 'name': 'JPMorgan BetaBuilders Japan', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14739'}, {'symbol': 'BBK', 'name': 'Blackrock Municipal Bond Trust'}, {'symbol': 'BBL', 'name': 'BHP Group PlcSponsored ADR'}, {'symbol': 'BBN', 'name': 'BlackRock Taxable Municipal Bond Trust of Beneficial Interest'}, {'symbol': 'BBRC', 'name': 'Columbia Beyond BRICs', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '633'}, {'symbol': 'BBSI', 'name': 'Barrett Business Services Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '636'}, {'symbol': 'BBT', 'name': 'BB&T Corporation'}, {'symbol': 'BBT-E', 'name': 'BB&T Corporation Depositary Shares Series E', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '639'}, {'symbol': 'BBT-G', 'name': 'BB&T Corporation Depositary Shares Series G', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '641'}, {'symbol': 'BBU', 'name': 'Brookfield Business Partners L.P. Limited Partnership Units', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11421'}, {'symbol': 'BBVA', 'name': 'Banco Bilbao Vizcaya Argentaria S.A.'}, {'symbol': 'BBW', 'name': 'Build-A-Bear Workshop Inc.'}, {'symbol': 'BBX', 'name': 'BBX Capital Corporation Class A'}, {'symbol': 'BBY', 'name': 'Best Buy Co. Inc.'}, {'symbol': 'BC', 'name': 'Brunswick Corporation'}, {'symbol': 'BC-B', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15290'}, {'symbol': 'BCAC', 'name': 'Bison Capital Acquisition Corp.'}, {'symbol': 'BCACU', 'name': 'Bison Capital Acquisition Corp. Units Consisting of 1 OS 1/2 WT and 1 RT', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '13029'}, {'symbol': 'BCBP', 'name': 'BCB Bancorp Inc. (NJ)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '648'}, {'symbol': 'BCC', 'name': 'Boise Cascade L.L.C.'}, {'symbol': 'BCE', 'name': 'BCE Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '650'}, {'symbol': 'BCEI', 'name': 'Bonanza Creek Energy Inc.'}, {'symbol': 'BCH', 'name': 'Banco De Chile ADS'}, {'symbol': 'BCLI', 'name': 'Brainstorm Cell Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9335'}, {'symbol': 'BCML', 'name': 'BayCom Corp', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14521'}, {'symbol': 'BCO', 'name': 'Brinks Company (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '655'}, {'symbol': 'BCOM', 'name': 'B Communications Ltd.'}, {'symbol': 'BCOR', 'name': 'Blucora Inc.'}, {'symbol': 'BCOV', 'name': 'Brightcove Inc.'}, {'symbol': 'BCOW', 'name': '1895 Bancorp of Wisconsin Inc.'}, {'symbol': 'BCPC', 'name': 'Balchem Corporation'}, {'symbol': 'BCRH', 'name': 'Blue Capital Reinsurance Holdings Ltd.'}, {'symbol': 'BCRX', 'name': 'BioCryst Pharmaceuticals Inc.'}, {'symbol': 'BCS', 'name': 'Barclays PLC'}, {'symbol': 'BCSF', 'name': 'Bain Capital Specialty Finance Inc.'}, {'symbol': 'BCTF', 'name': 'Bancorp 34 Inc.'}, {'symbol': 'BCV', 'name': 'Bancroft Fund Ltd.'}, {'symbol': 'BCX', 'name': 'BlackRock Resources of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '665'}, {'symbol': 'BDC', 'name': 'Belden Inc'}, {'symbol': 'BDCL', 'name': '2xLeveraged Long Exchange Traded Access Securities (E-TRACS) Linked to the Wells Fargo Business Development Company Index due May 24 2041', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '668'}, {'symbol': 'BDCZ', 'name': 'ETRACS Wells Fargo Business Development Company Index ETN Series B due April 26 2041', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10676'}, {'symbol': 'BDGE', 'name': 'Bridge Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '673'}, {'symbol': 'BDJ', 'name': 'Blackrock Enhanced Equity Dividend Trust'}, {'symbol': 'BDL', 'name': "Flanigan's Enterprises Inc."}, {'symbol': 'BDN', 'name': 'Brandywine Realty Trust'}, {'symbol': 'BDR', 'name': 'Blonder Tongue Laboratories Inc.'}, {'symbol': 'BDSI', 'name': 'BioDelivery Sciences International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '680'}, {'symbol': 'BDX', 'name': 'Becton Dickinson and Company'}, {'symbol': 'BE', 'name': 'Bloom Energy Corporation Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14735'}, {'symbol': 'BEAT', 'name': 'BioTelemetry Inc.'}, {'symbol': 'BECN', 'name': 'Beacon Roofing Supply Inc.'}, {'symbol': 'BEDU', 'name': 'Bright Scholar Education Holdings Limited American Depositary Shares each representing one Class A'}, {'symbol': 'BEL', 'name': 'Belmond Ltd. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5098'}, {'symbol': 'BELFA', 'name': 'Bel Fuse Inc. Class A Common Stock'}, {'symbol': 'BELFB', 'name': 'Bel Fuse Inc. Class B Common Stock'}, {'symbol': 'BEN', 'name': 'Franklin Resources Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '693'}, {'symbol': 'BEP', 'name': 'Brookfield Renewable Partners L.P.'}, {'symbol': 'BERY', 'name': 'Berry Global Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '696'}, {'symbol': 'BF.A', 'name': 'Brown Forman Inc Class A'}, {'symbol': 'BF.B', 'name': 'Brown Forman Inc Class B'}, {'symbol': 'BFAM', 'name': 'Bright Horizons Family Solutions Inc.'}, {'symbol': 'BFC', 'name': 'Bank First National Corporation'}, {'symbol': 'BFIN', 'name': 'BankFinancial Corporation'}, {'symbol': 'BFK', 'name': 'BlackRock Municipal Income Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '701'}, {'symbol': 'BFO', 'name': 'Blackrock Florida Municipal 2020 Term Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '702'}, {'symbol': 'BFR', 'name': 'BBVA Banco Frances S.A.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '704'}, {'symbol': 'BFRA', 'name': 'Biofrontera AG'}, {'symbol': 'BFS', 'name': 'Saul Centers Inc.'}, {'symbol': 'BFS-D', 'name': 'Saul Centers Inc. Depositary Shares Series D', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14082'}, {'symbol': 'BFST', 'name': 'Business First Bancshares Inc.'}, {'symbol': 'BFY', 'name': 'BlackRock New York Municipal Income Trust II'}, {'symbol': 'BFZ', 'name': 'BlackRock California Municipal Income Trust'}, {'symbol': 'BG', 'name': 'Bunge Limited'}, {'symbol': 'BGB', 'name': 'Blackstone / GSO Strategic Credit Fund'}, {'symbol': 'BGCP', 'name': 'BGC Partners Inc.'}, {'symbol': 'BGFV', 'name': 'Big 5 Sporting Goods Corporation'}, {'symbol': 'BGG', 'name': 'Briggs & Stratton Corporation'}, {'symbol': 'BGH', 'name': 'Barings Global Short Duration High Yield Fund of Beneficial Interests'}, {'symbol': 'BGI', 'name': 'Birks Group Inc.'}, {'symbol': 'BGIO', 'name': 'BlackRock 2022 Global Income Opportunity Trust of Beneficial Interest'}, {'symbol': 'BGNE', 'name': 'BeiGene Ltd.'}, {'symbol': 'BGR', 'name': 'BlackRock Energy and Resources Trust'}, {'symbol': 'BGS', 'name': 'B&G Foods Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '721'}, {'symbol': 'BGSF', 'name': 'BG Staffing Inc'}, {'symbol': 'BGT', 'name': 'BlackRock Floating Rate Income Trust'}, {'symbol': 'BGX', 'name': 'Blackstone GSO Long Short Credit Income Fund'}, {'symbol': 'BGY', 'name': 'Blackrock Enhanced International Dividend Trust'}, {'symbol': 'BH', 'name': 'Biglari Holdings Inc. Class B'}, {'symbol': 'BH.A', 'name': 'Biglari Holdings Inc. Class A'}, {'symbol': 'BHB', 'name': 'Bar Harbor Bankshares Inc.'}, {'symbol': 'BHBK', 'name': 'Blue Hills Bancorp Inc.'}, {'symbol': 'BHC', 'name': 'Bausch Health Companies Inc.'}, {'symbol': 'BHE', 'name': 'Benchmark Electronics Inc.'}, {'symbol': 'BHF', 'name': 'Brighthouse Financial Inc.'}, {'symbol': 'BHGE', 'name': 'Baker Hughes a GE company Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12984'}, {'symbol': 'BHK', 'name': 'Blackrock Core Bond Trust'}, {'symbol': 'BHLB', 'name': 'Berkshire Hills Bancorp Inc.'}, {'symbol': 'BHP', 'name': 'BHP Group Limited American Depositary Shares (Each representing two)'}, {'symbol': 'BHR', 'name': 'Braemar Hotels & Resorts Inc.'}, {'symbol': 'BHR-D', 'name': 'Braemar Hotels & Resorts Inc. 8.25% Series D Cumulative Preferred Stock par value $0.01 per share', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '15255'}, {'symbol': 'BHTG', 'name': 'BioHiTech Global Inc.'}, {'symbol': 'BHV', 'name': 'BlackRock Virginia Municipal Bond Trust'}, {'symbol': 'BHVN', 'name': 'Biohaven Pharmaceutical Holding Company Ltd.'}, {'symbol': 'BIBL', 'name': 'Inspire 100', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13665'}, {'symbol': 'BID', 'name': "Sotheby's", 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '740'}, {'symbol': 'BIDU', 'name': 'Baidu Inc.'}, {'symbol': 'BIF', 'name': 'Boulder Growth & Income Fund Inc.'}, {'symbol': 'BIG', 'name': 'Big Lots Inc.'}, {'symbol': 'BIIB', 'name': 'Biogen Inc.'}, {'symbol': 'BIL', 'name': 'SPDR Bloomberg Barclays 1-3 Month T-Bill', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '747'}, {'symbol': 'BILI', 'name': 'Bilibili Inc.'}, {'symbol': 'BIO', 'name': 'Bio-Rad Laboratories Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '749'}, {'symbol': 'BIO.B', 'name': 'Bio-Rad Laboratories Inc. Class B'}, {'symbol': 'BIOC', 'name': 'Biocept Inc.'}, {'symbol': 'BIOL', 'name': 'Biolase Inc.'}, {'symbol': 'BIOS', 'name': 'BioScrip Inc.'}, {'symbol': 'BIP', 'name': 'Brookfield Infrastructure Partners LP Limited Partnership Units'}, {'symbol': 'BIQI', 'name': 'Renmin Tianli Group Inc.'}, {'symbol': 'BIT', 'name': 'BlackRock Multi-Sector Income Trust of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '760'}, {'symbol': 'BITA', 'name': 'Bitauto Holdings Limited American Depositary Shares (each representing one)'}, {'symbol': 'BIZD', 'name': 'VanEck Vectors BDC Income', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '763'}, {'symbol': 'BJ', 'name': "BJ's Wholesale Club Holdings Inc."}, {'symbol': 'BJK', 'name': 'VanEck Vectors Gaming', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '764'}, {'symbol': 'BJRI', 'name': "BJ's Restaurants Inc."}, {'symbol': 'BK', 'name': 'Bank of New York Mellon Corporation (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '767'}, {'symbol': 'BKCC', 'name': 'BlackRock Capital Investment Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '769'}, {'symbol': 'BKD', 'name': 'Brookdale Senior Living Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '770'}, {'symbol': 'BKE', 'name': 'Buckle Inc. (The)'}, {'symbol': 'BKEP', 'name': 'Blueknight Energy Partners L.P. L.L.C.'}, {'symbol': 'BKF', 'name': 'iShares MSCI BRIC Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '774'}, {'symbol': 'BKH', 'name': 'Black Hills Corporation'}, {'symbol': 'BKI', 'name': 'Black Knight Inc.'}, {'symbol': 'BKJ', 'name': 'Bancorp of New Jersey Inc'}, {'symbol': 'BKK', 'name': 'Blackrock Municipal 2020 Term Trust'}, {'symbol': 'BKN', 'name': 'BlackRock Investment Quality Municipal Trust Inc. (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '781'}, {'symbol': 'BKNG', 'name': 'Booking Holdings Inc.'}, {'symbol': 'BKS', 'name': 'Barnes & Noble Inc.'}, {'symbol': 'BKSC', 'name': 'Bank of South Carolina Corp.'}, {'symbol': 'BKT', 'name': 'BlackRock Income Trust Inc. (The)'}, {'symbol': 'BKTI', 'name': 'BK Technologies Inc.'}, {'symbol': 'BKU', 'name': 'BankUnited Inc.'}, {'symbol': 'BKYI', 'name': 'BIO-key International Inc.'}, {'symbol': 'BL', 'name': 'BlackLine Inc.'}, {'symbol': 'BLBD', 'name': 'Blue Bird Corporation'}, {'symbol': 'BLCM', 'name': 'Bellicum Pharmaceuticals Inc.'}, {'symbol': 'BLD', 'name': 'TopBuild Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10103'}, {'symbol': 'BLDP', 'name': 'Ballard Power Systems Inc.'}, {'symbol': 'BLDR', 'name': 'Builders FirstSource Inc.'}, {'symbol': 'BLE', 'name': 'BlackRock Municipal Income Trust II'}, {'symbol': 'BLFS', 'name': 'BioLife Solutions Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8496'}, {'symbol': 'BLIN', 'name': 'Bridgeline Digital Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '794'}, {'symbol': 'BLK', 'name': 'BlackRock Inc.'}, {'symbol': 'BLKB', 'name': 'Blackbaud Inc.'}, {'symbol': 'BLL', 'name': 'Ball Corporation'}, {'symbol': 'BLMN', 'name': "Bloomin' Brands Inc."}, {'symbol': 'BLMT', 'name': 'BSB Bancorp Inc.'}, {'symbol': 'BLNK', 'name': 'Blink Charging Co.'}, {'symbol': 'BLOK', 'name': 'Amplify Transformational Data Sharing', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14021'}, {'symbol': 'BLPH', 'name': 'Bellerophon Therapeutics Inc.'}, {'symbol': 'BLRX', 'name': 'BioLineRx Ltd.'}, {'symbol': 'BLUE', 'name': 'bluebird bio Inc.'}, {'symbol': 'BLW', 'name': 'Blackrock Limited Duration Income Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '808'}, {'symbol': 'BLX', 'name': 'Banco Latinoamericano de Comercio Exterior S.A.'}, {'symbol': 'BMA', 'name': 'Banco Macro S.A. ADR (representing Ten Class B)'}, {'symbol': 'BMCH', 'name': 'BMC Stock Holdings Inc.'}, {'symbol': 'BME', 'name': 'Blackrock Health Sciences Trust'}, {'symbol': 'BMI', 'name': 'Badger Meter Inc.'}, {'symbol': 'BML-H', 'name': 'Bank of America Corporation Depositary Shares Series 2', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '816'}, {'symbol': 'BML-L', 'name': 'Bank of America Corporation Depositary Shares Series 5', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '819'}, {'symbol': 'BMO', 'name': 'Bank Of Montreal', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '820'}, {'symbol': 'BMRA', 'name': 'Biomerica Inc.'}, {'symbol': 'BMRC', 'name': 'Bank of Marin Bancorp'}, {'symbol': 'BMRN', 'name': 'BioMarin Pharmaceutical Inc.'}, {'symbol': 'BMS', 'name': 'Bemis Company Inc.'}, {'symbol': 'BMTC', 'name': 'Bryn Mawr Bank Corporation'}, {'symbol': 'BMY', 'name': 'Bristol-Myers Squibb Company'}, {'symbol': 'BNCL', 'name': 'Beneficial Bancorp Inc.'}, {'symbol': 'BNDC', 'name': 'FlexShares Core Select Bond Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12107'}, {'symbol': 'BNDX', 'name': 'Vanguard Total International Bond ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '831'}, {'symbol': 'BNED', 'name': 'Barnes & Noble Education Inc'}, {'symbol': 'BNFT', 'name': 'Benefitfocus Inc.'}, {'symbol': 'BNGO', 'name': 'Bionano Genomics Inc.'}, {'symbol': 'BNO', 'name': 'United States Brent Oil Fund LP ETV', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '834'}, {'symbol': 'BNS', 'name': 'Bank Nova Scotia Halifax Pfd 3'}, {'symbol': 'BNSO', 'name': 'Bonso Electronics International Inc.'}, {'symbol': 'BNTC', 'name': 'Benitec Biopharma Limited'}, {'symbol': 'BNY', 'name': 'BlackRock New York Municipal Income Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '837'}, {'symbol': 'BOCH', 'name': 'Bank of Commerce Holdings (CA)'}, {'symbol': 'BOE', 'name': 'Blackrock Enhanced Global Dividend Trust of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '841'}, {'symbol': 'BOH', 'name': 'Bank of Hawaii Corporation'}, {'symbol': 'BOKF', 'name': 'BOK Financial Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '846'}, {'symbol': 'BOLD', 'name': 'Audentes Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11593'}, {'symbol': 'BOMN', 'name': 'Boston Omaha Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13030'}, {'symbol': 'BOOM', 'name': 'DMC Global Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '854'}, {'symbol': 'BOOT', 'name': 'Boot Barn Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9434'}, {'symbol': 'BORN', 'name': 'China New Borun Corporation American Depositary Shares'}, {'symbol': 'BOSC', 'name': 'B.O.S. Better Online Solutions', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '857'}, {'symbol': 'BOTJ', 'name': 'Bank of the James Financial Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '859'}, {'symbol': 'BOUT', 'name': 'Innovator IBD Breakout Opportunities', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15017'}, {'symbol': 'BOX', 'name': 'Box Inc. Class A'}, {'symbol': 'BOXL', 'name': 'Boxlight Corporation'}, {'symbol': 'BP', 'name': 'BP p.l.c.'}, {'symbol': 'BPFH', 'name': 'Boston Private Financial Holdings Inc.'}, {'symbol': 'BPI', 'name': 'Bridgepoint Education Inc.'}, {'symbol': 'BPL', 'name': 'Buckeye Partners L.P.'}, {'symbol': 'BPMC', 'name': 'Blueprint Medicines Corporation'}, {'symbol': 'BPMP', 'name': 'BP Midstream Partners LP representing Limited Partner Interests'}, {'symbol': 'BPMX', 'name': 'BioPharmX Corporation. Common'}, {'symbol': 'BPOP', 'name': 'Popular Inc.'}, {'symbol': 'BPOPN', 'name': 'Popular Inc. Popular Capital Trust I -6.70% Cumulative Monthly Income Trust Preferred Securities', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '871'}, {'symbol': 'BPR', 'name': 'Brookfield Property REIT Inc.'}, {'symbol': 'BPRN', 'name': 'The Bank of Princeton', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13201'}, {'symbol': 'BPT', 'name': 'BP Prudhoe Bay Royalty Trust'}, {'symbol': 'BPTH', 'name': 'Bio-Path Holdings Inc.'}, {'symbol': 'BPY', 'name': 'Brookfield Property Partners L.P.'}, {'symbol': 'BQH', 'name': 'Blackrock New York Municipal Bond Trust of Beneficial Interest'}, {'symbol': 'BR', 'name': 'Broadridge Financial Solutions Inc.Common Stock'}, {'symbol': 'BRAC', 'name': 'Black Ridge Acquisition Corp.'}, {'symbol': 'BRACU', 'name': 'Black Ridge Acquisition Corp. Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '13414'}, {'symbol': 'BRC', 'name': 'Brady Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '883'}, {'symbol': 'BREW', 'name': 'Craft Brew Alliance Inc.'}, {'symbol': 'BRFS', 'name': 'BRF S.A.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '891'}, {'symbol': 'BRG', 'name': 'Bluerock Residential Growth REIT Inc. Class A'}, {'symbol': 'BRG-C', 'name': 'Bluerock Residential Growth REIT Inc. 7.625% Series C Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11639'}, {'symbol': 'BRGL', 'name': 'Bernstein Global Research Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13557'}, {'symbol': 'BRID', 'name': 'Bridgford Foods Corporation'}, {'symbol': 'BRK.A', 'name': 'Berkshire Hathaway Inc.'}, {'symbol': 'BRK.B', 'name': 'Berkshire Hathaway Inc.'}, {'symbol': 'BRKL', 'name': 'Brookline Bancorp Inc.'}, {'symbol': 'BRKR', 'name': 'Bruker Corporation'}, {'symbol': 'BRKS', 'name': 'Brooks Automation Inc.'}, {'symbol': 'BRN', 'name': 'Barnwell Industries Inc.'}, {'symbol': 'BRO', 'name': 'Brown & Brown Inc.'}, {'symbol': 'BRPA', 'name': 'Big Rock Partners Acquisition Corp.'}, {'symbol': 'BRPAU', 'name': 'Big Rock Partners Acquisition Corp. Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '13558'}, {'symbol': 'BRQS', 'name': 'Borqs Technologies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10753'}, {'symbol': 'BRS', 'name': 'Bristow Group Inc.'}, {'symbol': 'BRSS', 'name': 'Global Brass and Copper Holdings Inc.'}, {'symbol': 'BRT', 'name': 'BRT Apartments Corp. (MD)'}, {'symbol': 'BRX', 'name': 'Brixmor Property Group Inc.'}, {'symbol': 'BRY', 'name': 'Berry Petroleum Corporation'}, {'symbol': 'BSA', 'name': 'BrightSphere Investment Group plc 5.125% Notes due 2031', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14585'}, {'symbol': 'BSAC', 'name': 'Banco Santander - Chile ADS'}, {'symbol': 'BSBE', 'name': 'Invesco BulletShares 2022 USD Emerging Markets Debt', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15105'}, {'symbol': 'BSBR', 'name': 'Banco Santander Brasil SA American Depositary Shares each representing one unit'}, {'symbol': 'BSCJ', 'name': 'Invesco BulletShares 2019 Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14360'}, {'symbol': 'BSCL', 'name': 'Invesco BulletShares 2021 Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14362'}, {'symbol': 'BSCN', 'name': 'Invesco BulletShares 2023 Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14364'}, {'symbol': 'BSCP', 'name': 'Invesco BulletShares 2025 Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14366'}, {'symbol': 'BSCR', 'name': 'Invesco BulletShares 2027 Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14368'}, {'symbol': 'BSD', 'name': 'BlackRock Strategic Municipal Trust Inc. (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '921'}, {'symbol': 'BSE', 'name': 'Blackrock New York Municipal Income Quality Trust of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '923'}, {'symbol': 'BSET', 'name': 'Bassett Furniture Industries Incorporated'}, {'symbol': 'BSGM', 'name': 'BioSig Technologies Inc.'}, {'symbol': 'BSIG', 'name': 'BrightSphere Investment Group plc'}, {'symbol': 'BSJK', 'name': 'Invesco BulletShares 2020 High Yield Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14371'}, {'symbol': 'BSJM', 'name': 'Invesco BulletShares 2022 High Yield Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14373'}, {'symbol': 'BSJO', 'name': 'Invesco BulletShares 2024 High Yield Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14375'}, {'symbol': 'BSJQ', 'name': 'Invesco BulletShares 2026 High Yield Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14898'}, {'symbol': 'BSL', 'name': 'Blackstone GSO Senior Floating Rate Term Fund of Beneficial Interest'}, {'symbol': 'BSM', 'name': 'Black Stone Minerals L.P. representing limited partner interests'}, {'symbol': 'BSMX', 'name': 'Banco Santander Mexico S.A. Institucion de Banca Multiple Grupo Financiero Santander Mexico'}, {'symbol': 'BSQR', 'name': 'BSQUARE Corporation'}, {'symbol': 'BSRR', 'name': 'Sierra Bancorp'}, {'symbol': 'BST', 'name': 'BlackRock Science and Technology Trust of Beneficial Interest'}, {'symbol': 'BSTC', 'name': 'BioSpecifics Technologies Corp'}, {'symbol': 'BSTI', 'name': 'BEST Inc. American Depositary Shares each representing one Class A'}, {'symbol': 'BSVN', 'name': 'Bank7 Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14954'}, {'symbol': 'BSX', 'name': 'Boston Scientific Corporation'}, {'symbol': 'BT', 'name': 'BT Group plc American Depositary Shares'}, {'symbol': 'BTA', 'name': 'BlackRock Long-Term Municipal Advantage Trust of Beneficial Interest'}, {'symbol': 'BTAI', 'name': 'BioXcel Therapeutics Inc.'}, {'symbol': 'BTE', 'name': 'Baytex Energy Corp', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '946'}, {'symbol': 'BTG', 'name': 'B2Gold Corp (Canada)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '948'}, {'symbol': 'BTI', 'name': 'British American Tobacco Industries p.l.c. ADR'}, {'symbol': 'BTN', 'name': 'Ballantyne Strong Inc.'}, {'symbol': 'BTO', 'name': 'John Hancock Financial Opportunities Fund'}, {'symbol': 'BTT', 'name': 'BlackRock Municipal 2030 Target Term Trust'}, {'symbol': 'BTU', 'name': 'Peabody Energy Corporation'}, {'symbol': 'BTX', 'name': 'BioTime Inc.'}, {'symbol': 'BTZ', 'name': 'BlackRock Credit Allocation Income Trust'}, {'symbol': 'BUD', 'name': 'Anheuser-Busch Inbev SA Sponsored ADR (Belgium)'}, {'symbol': 'BUI', 'name': 'BlackRock Utility Infrastructure & Power Opportunities Trust'}, {'symbol': 'BURG', 'name': 'Chanticleer Holdings Inc.'}, {'symbol': 'BURL', 'name': 'Burlington Stores Inc.'}, {'symbol': 'BUSE', 'name': 'First Busey Corporation'}, {'symbol': 'BUYN', 'name': 'USCF SummerHaven SHPEN Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13859'}, {'symbol': 'BV', 'name': 'BrightView Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14687'}, {'symbol': 'BVN', 'name': 'Buenaventura Mining Company Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '967'}, {'symbol': 'BVSN', 'name': 'BroadVision Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '968'}, {'symbol': 'BVXV', 'name': 'BiondVax Pharmaceuticals Ltd.'}, {'symbol': 'BW', 'name': 'Babcock & Wilcox Enterprises Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10113'}, {'symbol': 'BWA', 'name': 'BorgWarner Inc.'}, {'symbol': 'BWB', 'name': 'Bridgewater Bancshares Inc.'}, {'symbol': 'BWEN', 'name': 'Broadwind Energy Inc.'}, {'symbol': 'BWFG', 'name': 'Bankwell Financial Group Inc.'}, {'symbol': 'BWG', 'name': 'BrandywineGLOBAL Global Income Opportunities Fund Inc.'}, {'symbol': 'BWL.A', 'name': 'Bowl America Inc. Class A'}, {'symbol': 'BWMC', 'name': 'Boxwood Merger Corp.'}, {'symbol': 'BWMCW', 'name': 'Boxwood Merger Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15362'}, {'symbol': 'BWXT', 'name': 'BWX Technologies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '971'}, {'symbol': 'BX', 'name': 'The Blackstone Group L.P. Representing Limited Partnership Interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '983'}, {'symbol': 'BXC', 'name': 'Bluelinx Holdings Inc.'}, {'symbol': 'BXE', 'name': 'Bellatrix Exploration Ltd (Canada)'}, {'symbol': 'BXG', 'name': 'Bluegreen Vacations Corporation'}, {'symbol': 'BXMT', 'name': 'Blackstone Mortgage Trust Inc.'}, {'symbol': 'BXMX', 'name': 'Nuveen S&P 500 Buy-Write Income Fund of Beneficial Interest'}, {'symbol': 'BXP', 'name': 'Boston Properties Inc.'}, {'symbol': 'BXS', 'name': 'BancorpSouth Bank', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13692'}, {'symbol': 'BY', 'name': 'Byline Bancorp Inc.'}, {'symbol': 'BYD', 'name': 'Boyd Gaming Corporation'}, {'symbol': 'BYFC', 'name': 'Broadway Financial Corporation'}, {'symbol': 'BYM', 'name': 'Blackrock Municipal Income Quality Trust of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '997'}, {'symbol': 'BYSI', 'name': 'BeyondSpring Inc.'}, {'symbol': 'BZH', 'name': 'Beazer Homes USA Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1001'}, {'symbol': 'BZM', 'name': 'BlackRock Maryland Municipal Bond Trust of beneficial interest'}, {'symbol': 'BZUN', 'name': 'Baozun Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9967'}, {'symbol': 'C', 'name': 'Citigroup Inc.'}, {'symbol': 'C-K', 'name': 'Citigroup Inc. Dep Shs Repstg 1/1000th Pfd Ser K', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '8087'}, {'symbol': 'C-N', 'name': 'Citigroup Capital VIII 7.875% Fixed rate Floating Rate trust Preferred Securities (TruPS)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '1009'}, {'symbol': 'CAAP', 'name': 'Corporacion America Airports SA', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13878'}, {'symbol': 'CAAS', 'name': 'China Automotive Systems Inc.'}, {'symbol': 'CABO', 'name': 'Cable One Inc.'}, {'symbol': 'CAC', 'name': 'Camden National Corporation'}, {'symbol': 'CACC', 'name': 'Credit Acceptance Corporation'}, {'symbol': 'CACI', 'name': 'CACI International Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1023'}, {'symbol': 'CADC', 'name': 'China Advanced Construction Materials Group Inc.'}, {'symbol': 'CADE', 'name': 'Cadence Bancorporation Class A'}, {'symbol': 'CAE', 'name': 'CAE Inc.'}, {'symbol': 'CAF', 'name': 'Morgan Stanley China A Share Fund Inc.'}, {'symbol': 'CAG', 'name': 'ConAgra Brands Inc.'}, {'symbol': 'CAH', 'name': 'Cardinal Health Inc.'}, {'symbol': 'CAI', 'name': 'CAI International Inc.'}, {'symbol': 'CAI-B', 'name': 'CAI International Inc. 8.50% Series B Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14934'}, {'symbol': 'CAJ', 'name': 'Canon Inc. American Depositary Shares'}, {'symbol': 'CAKE', 'name': 'The Cheesecake Factory Incorporated'}, {'symbol': 'CAL', 'name': 'Caleres Inc.'}, {'symbol': 'CALA', 'name': 'Calithera Biosciences Inc.'}, {'symbol': 'CALM', 'name': 'Cal-Maine Foods Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1040'}, {'symbol': 'CALX', 'name': 'Calix Inc'}, {'symbol': 'CAMP', 'name': 'CalAmp Corp.'}, {'symbol': 'CAMT', 'name': 'Camtek Ltd.'}, {'symbol': 'CANF', 'name': 'Can-Fite Biopharma Ltd Sponsored ADR (Israel)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8124'}, {'symbol': 'CANG', 'name': 'Cango Inc. American Depositary Shares each representing two (2) Class A'}, {'symbol': 'CAPL', 'name': 'CrossAmerica Partners LP representing limited partner interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4076'}, {'symbol': 'CAPR', 'name': 'Capricor Therapeutics Inc.'}, {'symbol': 'CAR', 'name': 'Avis Budget Group Inc.'}, {'symbol': 'CARA', 'name': 'Cara Therapeutics Inc.'}, {'symbol': 'CARB', 'name': 'Carbonite Inc.'}, {'symbol': 'CARG', 'name': 'CarGurus Inc.'}, {'symbol': 'CARO', 'name': 'Carolina Financial Corporation'}, {'symbol': 'CARS', 'name': 'Cars.com Inc.'}, {'symbol': 'CART', 'name': 'Carolina Trust BancShares Inc.'}, {'symbol': 'CARV', 'name': 'Carver Bancorp Inc.'}, {'symbol': 'CASA', 'name': 'Casa Systems Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13811'}, {'symbol': 'CASH', 'name': 'Meta Financial Group Inc.'}, {'symbol': 'CASI', 'name': 'CASI Pharmaceuticals Inc.'}, {'symbol': 'CASM', 'name': 'CAS Medical Systems Inc.'}, {'symbol': 'CASS', 'name': 'Cass Information Systems Inc'}, {'symbol': 'CASY', 'name': 'Caseys General Stores Inc.'}, {'symbol': 'CAT', 'name': 'Caterpillar Inc.'}, {'symbol': 'CATB', 'name': 'Catabasis Pharmaceuticals Inc.'}, {'symbol': 'CATC', 'name': 'Cambridge Bancorp'}, {'symbol': 'CATM', 'name': 'Cardtronics plc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11571'}, {'symbol': 'CATO', 'name': 'Cato Corporation (The) Class A'}, {'symbol': 'CATS', 'name': 'Catasys Inc.'}, {'symbol': 'CATY', 'name': 'Cathay General Bancorp'}, {'symbol': 'CAW', 'name': 'CCA Industries Inc.'}, {'symbol': 'CB', 'name': 'Chubb Limited'}, {'symbol': 'CBAN', 'name': 'Colony Bankcorp Inc.'}, {'symbol': 'CBAT', 'name': 'CBAK Energy Technology Inc.'}, {'symbol': 'CBAY', 'name': 'CymaBay Therapeutics Inc.'}, {'symbol': 'CBB', 'name': 'Cincinnati Bell Inc.'}, {'symbol': 'CBD', 'name': 'Companhia Brasileira de Distribuicao ADS', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1071'}, {'symbol': 'CBFV', 'name': 'CB Financial Services Inc.'}, {'symbol': 'CBH', 'name': 'AllianzGI Convertible & Income 2024 Target Term Fund of Beneficial Interest'}, {'symbol': 'CBIO', 'name': 'Catalyst Biosciences Inc.'}, {'symbol': 'CBK', 'name': 'Christopher & Banks Corporation'}, {'symbol': 'CBL', 'name': 'CBL & Associates Properties Inc.'}, {'symbol': 'CBL-E', 'name': 'CBL & Associates Properties Inc. Depositary Shs Repstg 1/10 6.625% Ser E Cum Redeemable (Pfd Stk)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '1080'}, {'symbol': 'CBLI', 'name': 'Cleveland BioLabs Inc.'}, {'symbol': 'CBLK', 'name': 'Carbon Black Inc.'}, {'symbol': 'CBM', 'name': 'Cambrex Corporation'}, {'symbol': 'CBMB', 'name': 'CBM Bancorp Inc.'}, {'symbol': 'CBMG', 'name': 'Cellular Biomedicine Group Inc.'}, {'symbol': 'CBNK', 'name': 'Capital Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14981'}, {'symbol': 'CBOE', 'name': 'Cboe Global Markets Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1087'}, {'symbol': 'CBPO', 'name': 'China Biologic Products Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13172'}, {'symbol': 'CBPX', 'name': 'Continental Building Products Inc.'}, {'symbol': 'CBRE', 'name': 'CBRE Group Inc Class A'}, {'symbol': 'CBRL', 'name': 'Cracker Barrel Old Country Store Inc.'}, {'symbol': 'CBS', 'name': 'CBS Corporation Class B'}, {'symbol': 'CBS.A', 'name': 'CBS Corporation Class A'}, {'symbol': 'CBSH', 'name': 'Commerce Bancshares Inc.'}, {'symbol': 'CBT', 'name': 'Cabot Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1096'}, {'symbol': 'CBTX', 'name': 'CBTX Inc.'}, {'symbol': 'CBU', 'name': 'Community Bank System Inc.'}, {'symbol': 'CBZ', 'name': 'CBIZ Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1098'}, {'symbol': 'CC', 'name': 'Chemours Company (The)'}, {'symbol': 'CCA', 'name': 'MFS California Municipal Fund of Beneficial Interest'}, {'symbol': 'CCB', 'name': 'Coastal Financial Corporation'}, {'symbol': 'CCBG', 'name': 'Capital City Bank Group'}, {'symbol': 'CCC', 'name': 'Churchill Capital Corp Class A'}, {'symbol': 'CCC=', 'name': 'Churchill Capital Corp Units each consisting of one share of Class A common stock $0.0001 par value and one half of one redeemable warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14984'}, {'symbol': 'CCCL', 'name': 'China Ceramics Co. Ltd.'}, {'symbol': 'CCD', 'name': 'Calamos Dynamic Convertible & Income Fund'}, {'symbol': 'CCEP', 'name': 'Coca-Cola European Partners plc'}, {'symbol': 'CCF', 'name': 'Chase Corporation'}, {'symbol': 'CCH', 'name': 'Collier Creek Holdings Class A'}, {'symbol': 'CCH=', 'name': 'Collier Creek Holdings Units each consisting of one Class A ordinary share $0.0001 par value and one-third of one redeemable warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '15018'}, {'symbol': 'CCI', 'name': 'Crown Castle International Corp. (REIT)'}, {'symbol': 'CCIH', 'name': 'ChinaCache International Holdings Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1110'}, {'symbol': 'CCJ', 'name': 'Cameco Corporation'}, {'symbol': 'CCK', 'name': 'Crown Holdings Inc.'}, {'symbol': 'CCL', 'name': 'Carnival Corporation'}, {'symbol': 'CCLP', 'name': 'CSI Compressco LP'}, {'symbol': 'CCM', 'name': 'Concord Medical Services Holdings Limited ADS (Each represents three)'}, {'symbol': 'CCMP', 'name': 'Cabot Microelectronics Corporation'}, {'symbol': 'CCNE', 'name': 'CNB Financial Corporation'}, {'symbol': 'CCNI', 'name': 'Command Center Inc.'}, {'symbol': 'CCO', 'name': 'Clear Channel Outdoor Holdings Inc. Class A'}, {'symbol': 'CCOI', 'name': 'Cogent Communications Holdings Inc.'}, {'symbol': 'CCR', 'name': 'CONSOL Coal Resources LP representing limited partner interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9882'}, {'symbol': 'CCRC', 'name': 'China Customer Relations Centers Inc.'}, {'symbol': 'CCRN', 'name': 'Cross Country Healthcare Inc.'}, {'symbol': 'CCS', 'name': 'Century Communities Inc.'}, {'symbol': 'CCU', 'name': 'Compania Cervecerias Unidas S.A.'}, {'symbol': 'CCXI', 'name': 'ChemoCentryx Inc.'}, {'symbol': 'CDAY', 'name': 'Ceridian HCM Holding Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14326'}, {'symbol': 'CDE', 'name': 'Coeur Mining Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1128'}, {'symbol': 'CDEV', 'name': 'Centennial Resource Development Inc.'}, {'symbol': 'CDK', 'name': 'CDK Global Inc.'}, {'symbol': 'CDLX', 'name': 'Cardlytics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14022'}, {'symbol': 'CDMO', 'name': 'Avid Bioservices Inc.'}, {'symbol': 'CDNA', 'name': 'CareDx Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8693'}, {'symbol': 'CDNS', 'name': 'Cadence Design Systems Inc.'}, {'symbol': 'CDOR', 'name': 'Condor Hospitality Trust Inc.'}, {'symbol': 'CDR', 'name': 'Cedar Realty Trust Inc.'}, {'symbol': 'CDR-C', 'name': 'Cedar Realty Trust Inc. 6.50% Series C Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13315'}, {'symbol': 'CDTX', 'name': 'Cidara Therapeutics Inc.'}, {'symbol': 'CDW', 'name': 'CDW Corporation'}, {'symbol': 'CDXC', 'name': 'ChromaDex Corporation'}, {'symbol': 'CDXS', 'name': 'Codexis Inc.'}, {'symbol': 'CDZI', 'name': 'Cadiz Inc.'}, {'symbol': 'CE', 'name': 'Celanese Corporation'}, {'symbol': 'CEA', 'name': 'China Eastern Airlines Corporation Ltd.'}, {'symbol': 'CECE', 'name': 'CECO Environmental Corp.'}, {'symbol': 'CECO', 'name': 'Career Education Corporation'}, {'symbol': 'CEE', 'name': 'The Central and Eastern Europe Fund Inc. (The)'}, {'symbol': 'CEF', 'name': 'Sprott Physical Gold and Silver Trust Units'}, {'symbol': 'CEFS', 'name': 'Exchange Listed Funds Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12481'}, {'symbol': 'CEI', 'name': 'Camber Energy Inc.'}, {'symbol': 'CEIX', 'name': 'CONSOL Energy Inc.'}, {'symbol': 'CEL', 'name': 'Cellcom Israel Ltd.'}, {'symbol': 'CELC', 'name': 'Celcuity Inc.'}, {'symbol': 'CELG', 'name': 'Celgene Corporation'}, {'symbol': 'CELH', 'name': 'Celsius Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12960'}, {'symbol': 'CELP', 'name': 'Cypress Energy Partners L.P. representing limited partner interests'}, {'symbol': 'CEM', 'name': 'ClearBridge MLP and Midstream Fund Inc.'}, {'symbol': 'CEMI', 'name': 'Chembio Diagnostics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1152'}, {'symbol': 'CEN', 'name': 'Center Coast Brookfield MLP & Energy Infrastructure Fund'}, {'symbol': 'CENT', 'name': 'Central Garden & Pet Company'}, {'symbol': 'CENTA', 'name': 'Central Garden & Pet Company Class A Common Stock Nonvoting'}, {'symbol': 'CENX', 'name': 'Century Aluminum Company'}, {'symbol': 'CEO', 'name': 'CNOOC Limited'}, {'symbol': 'CEPU', 'name': 'Central Puerto S.A. American Depositary Shares (each represents ten)'}, {'symbol': 'CEQP', 'name': 'Crestwood Equity Partners LP'}, {'symbol': 'CERC', 'name': 'Cerecor Inc.'}, {'symbol': 'CERN', 'name': 'Cerner Corporation'}, {'symbol': 'CERS', 'name': 'Cerus Corporation'}, {'symbol': 'CET', 'name': 'Central Securities Corporation'}, {'symbol': 'CETV', 'name': 'Central European Media Enterprises Ltd.'}, {'symbol': 'CETX', 'name': 'Cemtrex Inc.'}, {'symbol': 'CETXW', 'name': 'Cemtrex Inc. Series 1 Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12402'}, {'symbol': 'CEV', 'name': 'Eaton Vance California Municipal Income Trust Shares of Beneficial Interest'}, {'symbol': 'CEVA', 'name': 'CEVA Inc.'}, {'symbol': 'CEY', 'name': 'VictoryShares Emerging Market High Div Volatility', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13640'}, {'symbol': 'CF', 'name': 'CF Industries Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1167'}, {'symbol': 'CFBI', 'name': 'Community First Bancshares Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12819'}, {'symbol': 'CFBK', 'name': 'Central Federal Corporation'}, {'symbol': 'CFFAU', 'name': 'CF Finance Acquisition Corp. Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '15240'}, {'symbol': 'CFFI', 'name': 'C&F Financial Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1172'}, {'symbol': 'CFFN', 'name': 'Capitol Federal Financial Inc.'}, {'symbol': 'CFG', 'name': 'Citizens Financial Group Inc.'}, {'symbol': 'CFMS', 'name': 'Conformis Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10197'}, {'symbol': 'CFR', 'name': 'Cullen/Frost Bankers Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1179'}, {'symbol': 'CFRX', 'name': 'ContraFect Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8564'}, {'symbol': 'CFX', 'name': 'Colfax Corporation'}, {'symbol': 'CG', 'name': 'The Carlyle Group L.P.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1183'}, {'symbol': 'CGA', 'name': 'China Green Agriculture Inc.'}, {'symbol': 'CGBD', 'name': 'TCG BDC Inc.'}, {'symbol': 'CGC', 'name': 'Canopy Growth Corporation'}, {'symbol': 'CGEN', 'name': 'Compugen Ltd.'}, {'symbol': 'CGIX', 'name': 'Cancer Genetics Inc.'}, {'symbol': 'CGNX', 'name': 'Cognex Corporation'}, {'symbol': 'CGO', 'name': 'Calamos Global Total Return Fund'}, {'symbol': 'CGW', 'name': 'Invesco S&P Global Water Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14377'}, {'symbol': 'CHA', 'name': 'China Telecom Corp Ltd ADS'}, {'symbol': 'CHAD', 'name': 'Direxion Daily CSI 300 China A Shares Bear 1X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10131'}, {'symbol': 'CHAP', 'name': 'Chaparral Energy Inc. Class A'}, {'symbol': 'CHCI', 'name': 'Comstock Holding Companies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1196'}, {'symbol': 'CHCO', 'name': 'City Holding Company'}, {'symbol': 'CHCT', 'name': 'Community Healthcare Trust Incorporated'}, {'symbol': 'CHD', 'name': 'Church & Dwight Company Inc.'}, {'symbol': 'CHDN', 'name': 'Churchill Downs Incorporated'}, {'symbol': 'CHE', 'name': 'Chemed Corp'}, {'symbol': 'CHEF', 'name': "The Chefs' Warehouse Inc."}, {'symbol': 'CHEK', 'name': 'Check-Cap Ltd.'}, {'symbol': 'CHEKZ', 'name': 'Check-Cap Ltd. Series C Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14528'}, {'symbol': 'CHFC', 'name': 'Chemical Financial Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1205'}, {'symbol': 'CHFS', 'name': 'CHF Solutions Inc.'}, {'symbol': 'CHGG', 'name': 'Chegg Inc.'}, {'symbol': 'CHH', 'name': 'Choice Hotels International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1208'}, {'symbol': 'CHI', 'name': 'Calamos Convertible Opportunities and Income Fund'}, {'symbol': 'CHIE', 'name': 'Global X MSCI China Energy', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1210'}, {'symbol': 'CHII', 'name': 'Global X MSCI China Industrials', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1211'}, {'symbol': 'CHIL', 'name': 'Global X Funds MSCI China Large-Cap 50', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15303'}, {'symbol': 'CHIQ', 'name': 'Global X MSCI China Consumer Discretionary', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1213'}, {'symbol': 'CHIS', 'name': 'Global X Funds MSCI China Consumer Staples', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15305'}, {'symbol': 'CHIX', 'name': 'Global X MSCI China Financials', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1214'}, {'symbol': 'CHK', 'name': 'Chesapeake Energy Corporation'}, {'symbol': 'CHKE', 'name': 'Cherokee Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1217'}, {'symbol': 'CHKP', 'name': 'Check Point Software Technologies Ltd.'}, {'symbol': 'CHKR', 'name': 'Chesapeake Granite Wash Trust representing beneficial interests in the Trust'}, {'symbol': 'CHL', 'name': 'China Mobile Limited'}, {'symbol': 'CHMA', 'name': 'Chiasma Inc.'}, {'symbol': 'CHMG', 'name': 'Chemung Financial Corp'}, {'symbol': 'CHMI', 'name': 'Cherry Hill Mortgage Investment Corporation'}, {'symbol': 'CHN', 'name': 'China Fund Inc. (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1225'}, {'symbol': 'CHNR', 'name': 'China Natural Resources Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1226'}, {'symbol': 'CHRA', 'name': 'Charah Solutions Inc.'}, {'symbol': 'CHRS', 'name': 'Coherus BioSciences Inc.'}, {'symbol': 'CHRW', 'name': 'C.H. Robinson Worldwide Inc.'}, {'symbol': 'CHS', 'name': "Chico's FAS Inc."}, {'symbol': 'CHSCM', 'name': 'CHS Inc Class B Reset Rate Cumulative Redeemable Preferred Stock Series 3', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '9270'}, {'symbol': 'CHSCO', 'name': 'CHS Inc Class B Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '7808'}, {'symbol': 'CHSP', 'name': 'Chesapeake Lodging Trust of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1233'}, {'symbol': 'CHT', 'name': 'Chunghwa Telecom Co. Ltd.'}, {'symbol': 'CHTR', 'name': 'Charter Communications Inc.'}, {'symbol': 'CHU', 'name': 'China Unicom (Hong Kong) Ltd'}, {'symbol': 'CHUY', 'name': "Chuy's Holdings Inc."}, {'symbol': 'CHW', 'name': 'Calamos Global Dynamic Income Fund'}, {'symbol': 'CHY', 'name': 'Calamos Convertible and High Income Fund'}, {'symbol': 'CI', 'name': 'Cigna Corporation'}, {'symbol': 'CIA', 'name': 'Citizens Inc. Class A ($1.00 Par)'}, {'symbol': 'CIB', 'name': 'BanColombia S.A.'}, {'symbol': 'CIC', 'name': 'Capitol Investment Corp. IV Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13485'}, {'symbol': 'CIC=', 'name': 'Capitol Investment Corp. IV Units each consisting of One Class A Ordinary Share and One-Third of One redeemable Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '13274'}, {'symbol': 'CIDM', 'name': 'Cinedigm Corp', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1248'}, {'symbol': 'CIEN', 'name': 'Ciena Corporation'}, {'symbol': 'CIF', 'name': 'MFS Intermediate High Income Fund'}, {'symbol': 'CIFS', 'name': 'China Internet Nationwide Financial Services Inc.'}, {'symbol': 'CIG', 'name': 'Comp En De Mn Cemig ADS American Depositary Shares'}, {'symbol': 'CIG.C', 'name': 'Comp En De Mn Cemig ADS American Depositary Receipts'}, {'symbol': 'CIGI', 'name': 'Colliers International Group Inc.'}, {'symbol': 'CII', 'name': 'Blackrock Capital and Income Fund Inc.'}, {'symbol': 'CIK', 'name': 'Credit Suisse Asset Management Income Fund Inc.'}, {'symbol': 'CIM', 'name': 'Chimera Investment Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1257'}, {'symbol': 'CIM-B', 'name': 'Chimera Investment Corporation 8.00% Series B Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '12427'}, {'symbol': 'CIM-D', 'name': 'Chimera Investment Corporation 8.00% Series D Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '15406'}, {'symbol': 'CINF', 'name': 'Cincinnati Financial Corporation'}, {'symbol': 'CINR', 'name': 'Ciner Resources LP representing Limited Partner Interests'}, {'symbol': 'CIO', 'name': 'City Office REIT Inc.'}, {'symbol': 'CIR', 'name': 'CIRCOR International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1260'}, {'symbol': 'CISN', 'name': 'Cision Ltd.'}, {'symbol': 'CIT', 'name': 'CIT Group Inc (DEL)'}, {'symbol': 'CIVB', 'name': 'Civista Bancshares Inc.'}, {'symbol': 'CIVEC', 'name': 'Causeway ETMF Trust', 'date': '2019-02-08', 'isEnabled': False, 'type': 'N/A', 'iexId': '14434'}, {'symbol': 'CIVI', 'name': 'Civitas Solutions Inc.'}, {'symbol': 'CIX', 'name': 'CompX International Inc.'}, {'symbol': 'CIZN', 'name': 'Citizens Holding Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1269'}, {'symbol': 'CJ', 'name': 'C&J Energy Services Inc.'}, {'symbol': 'CJJD', 'name': 'China Jo-Jo Drugstores Inc.'}, {'symbol': 'CKH', 'name': 'SEACOR Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1273'}, {'symbol': 'CKPT', 'name': 'Checkpoint Therapeutics Inc.'}, {'symbol': 'CKX', 'name': 'CKX Lands Inc.'}, {'symbol': 'CL', 'name': 'Colgate-Palmolive Company'}, {'symbol': 'CLAR', 'name': 'Clarus Corporation'}, {'symbol': 'CLB', 'name': 'Core Laboratories N.V.'}, {'symbol': 'CLBK', 'name': 'Columbia Financial Inc.'}, {'symbol': 'CLBS', 'name': 'Caladrius Biosciences Inc.'}, {'symbol': 'CLCT', 'name': 'Collectors Universe Inc.'}, {'symbol': 'CLD', 'name': 'Cloud Peak Energy Inc'}, {'symbol': 'CLDC', 'name': 'China Lending Corporation'}, {'symbol': 'CLDR', 'name': 'Cloudera Inc.'}, {'symbol': 'CLDT', 'name': 'Chatham Lodging Trust (REIT) of Beneficial Interest'}, {'symbol': 'CLDX', 'name': 'Celldex Therapeutics Inc.'}, {'symbol': 'CLF', 'name': 'Cleveland-Cliffs Inc.'}, {'symbol': 'CLFD', 'name': 'Clearfield Inc.'}, {'symbol': 'CLGN', 'name': 'CollPlant Holdings Ltd.'}, {'symbol': 'CLGX', 'name': 'CoreLogic Inc.'}, {'symbol': 'CLH', 'name': 'Clean Harbors Inc.'}, {'symbol': 'CLI', 'name': 'Mack-Cali Realty Corporation'}, {'symbol': 'CLIR', 'name': 'ClearSign Combustion Corporation'}, {'symbol': 'CLLS', 'name': 'Cellectis S.A.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9761'}, {'symbol': 'CLM', 'name': 'Cornerstone Strategic Value Fund Inc.'}, {'symbol': 'CLMT', 'name': 'Calumet Specialty Products Partners L.P.'}, {'symbol': 'CLNC', 'name': 'Colony Credit Real Estate Inc. Class A'}, {'symbol': 'CLNE', 'name': 'Clean Energy Fuels Corp.'}, {'symbol': 'CLNY', 'name': 'Colony Capital Inc.'}, {'symbol': 'CLNY-E', 'name': 'Colony Capital Inc. 8.75% Series E cumulative redeemable perpetual preferred stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '12278'}, {'symbol': 'CLNY-H', 'name': 'Colony Capital Inc. 7.125% Series H cumulative redeemable perpetual preferred stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '12285'}, {'symbol': 'CLNY-J', 'name': 'Colony Capital Inc. 7.125% Series J Cumulative Redeemable Perpetual Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13458'}, {'symbol': 'CLPR', 'name': 'Clipper Realty Inc.'}, {'symbol': 'CLPS', 'name': 'CLPS Incorporation'}, {'symbol': 'CLR', 'name': 'Continental Resources Inc.'}, {'symbol': 'CLRB', 'name': 'Cellectar Biosciences Inc.'}, {'symbol': 'CLRBZ', 'name': 'Cellectar Biosciences Inc. Series A Warrants', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11255'}, {'symbol': 'CLRO', 'name': 'ClearOne Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1302'}, {'symbol': 'CLS', 'name': 'Celestica Inc.'}, {'symbol': 'CLSD', 'name': 'Clearside Biomedical Inc.'}, {'symbol': 'CLSN', 'name': 'Celsion Corporation'}, {'symbol': 'CLUB', 'name': 'Town Sports International Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1307'}, {'symbol': 'CLVS', 'name': 'Clovis Oncology Inc.'}, {'symbol': 'CLW', 'name': 'Clearwater Paper Corporation'}, {'symbol': 'CLWT', 'name': 'Euro Tech Holdings Company Limited'}, {'symbol': 'CLX', 'name': 'Clorox Company (The)'}, {'symbol': 'CLXT', 'name': 'Calyxt Inc.'}, {'symbol': 'CM', 'name': 'Canadian Imperial Bank of Commerce'}, {'symbol': 'CMA', 'name': 'Comerica Incorporated'}, {'symbol': 'CMC', 'name': 'Commercial Metals Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1317'}, {'symbol': 'CMCL', 'name': 'Caledonia Mining Corporation Plc'}, {'symbol': 'CMCM', 'name': 'Cheetah Mobile Inc. American Depositary Shares each representing 10 Class'}, {'symbol': 'CMCO', 'name': 'Columbus McKinnon Corporation'}, {'symbol': 'CMCSA', 'name': 'Comcast Corporation Class A Common Stock'}, {'symbol': 'CMCT', 'name': 'CIM Commercial Trust Corporation'}, {'symbol': 'CMD', 'name': 'Cantel Medical Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1331'}, {'symbol': 'CME', 'name': 'CME Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1322'}, {'symbol': 'CMFN', 'name': 'CM Finance Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8270'}, {'symbol': 'CMG', 'name': 'Chipotle Mexican Grill Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1325'}, {'symbol': 'CMI', 'name': 'Cummins Inc.'}, {'symbol': 'CMLS', 'name': 'Cumulus Media Inc.'}, {'symbol': 'CMO', 'name': 'Capstead Mortgage Corporation'}, {'symbol': 'CMP', 'name': 'Compass Minerals Intl Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1334'}, {'symbol': 'CMPR', 'name': 'Cimpress N.V'}, {'symbol': 'CMRE', 'name': 'Costamare Inc. $0.0001 par value'}, {'symbol': 'CMRE-C', 'name': 'Costamare Inc. Perpetual Preferred Series C (Marshall Islands)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14587'}, {'symbol': 'CMRE-E', 'name': 'Costamare Inc. 8.875% Series E Cumulative Redeemable Perpetual Preferred Stock par value $0.0001', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14589'}, {'symbol': 'CMRX', 'name': 'Chimerix Inc.'}, {'symbol': 'CMS', 'name': 'CMS Energy Corporation'}, {'symbol': 'CMSA', 'name': 'CMS Energy Corporation 5.625% Junior Subordinated Notes due 2078', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14246'}, {'symbol': 'CMSS', 'name': 'CM Seven Star Acquisition Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13702'}, {'symbol': 'CMSSU', 'name': 'CM Seven Star Acquisition Corporation Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '13415'}, {'symbol': 'CMT', 'name': 'Core Molding Technologies Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1340'}, {'symbol': 'CMTA', 'name': 'Clementia Pharmaceuticals Inc.'}, {'symbol': 'CMTL', 'name': 'Comtech Telecommunications Corp.'}, {'symbol': 'CMU', 'name': 'MFS Municipal Income Trust'}, {'symbol': 'CNA', 'name': 'CNA Financial Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1343'}, {'symbol': 'CNAC', 'name': 'Constellation Alpha Capital Corp.'}, {'symbol': 'CNACU', 'name': 'Constellation Alpha Capital Corp. Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '12937'}, {'symbol': 'CNAT', 'name': 'Conatus Pharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1344'}, {'symbol': 'CNBKA', 'name': 'Century Bancorp Inc. Class A Common Stock'}, {'symbol': 'CNC', 'name': 'Centene Corporation'}, {'symbol': 'CNCE', 'name': 'Concert Pharmaceuticals Inc.'}, {'symbol': 'CNDT', 'name': 'Conduent Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12189'}, {'symbol': 'CNET', 'name': 'ChinaNet Online Holdings Inc.'}, {'symbol': 'CNF', 'name': 'CNFinance Holdings Limited American Depositary Shares each representing twenty (20)'}, {'symbol': 'CNFR', 'name': 'Conifer Holdings Inc.'}, {'symbol': 'CNHI', 'name': 'CNH Industrial N.V.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7809'}, {'symbol': 'CNI', 'name': 'Canadian National Railway Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1353'}, {'symbol': 'CNK', 'name': 'Cinemark Holdings Inc Inc.'}, {'symbol': 'CNMD', 'name': 'CONMED Corporation'}, {'symbol': 'CNNE', 'name': 'Cannae Holdings Inc.'}, {'symbol': 'CNO', 'name': 'CNO Financial Group Inc.'}, {'symbol': 'CNOB', 'name': 'ConnectOne Bancorp Inc.'}, {'symbol': 'CNP', 'name': 'CenterPoint Energy Inc (Holding Co)'}, {'symbol': 'CNQ', 'name': 'Canadian Natural Resources Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1362'}, {'symbol': 'CNS', 'name': 'Cohen & Steers Inc'}, {'symbol': 'CNSL', 'name': 'Consolidated Communications Holdings Inc.'}, {'symbol': 'CNST', 'name': 'Constellation Pharmaceuticals Inc.'}, {'symbol': 'CNTF', 'name': 'China TechFaith Wireless Communication Technology Limited'}, {'symbol': 'CNTY', 'name': 'Century Casinos Inc.'}, {'symbol': 'CNX', 'name': 'CNX Resources Corporation'}, {'symbol': 'CNXM', 'name': 'CNX Midstream Partners LP representing limited partner interests'}, {'symbol': 'CNXN', 'name': 'PC Connection Inc.'}, {'symbol': 'CNXT', 'name': 'VanEck Vectors ChinaAMC SME-ChNext'}, {'symbol': 'CNYA', 'name': 'iShares MSCI China A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11473'}, {'symbol': 'CO', 'name': 'Global Cord Blood Corporation'}, {'symbol': 'COCP', 'name': 'Cocrystal Pharma Inc.'}, {'symbol': 'CODA', 'name': 'Coda Octopus Group Inc.'}, {'symbol': 'CODI', 'name': 'Compass Diversified Holdings Shares of Beneficial Interest'}, {'symbol': 'CODI-B', 'name': 'Compass Diversified Holdings 7.875% Series B Fixed-to-Floating Rate Cumulative Preferred Shares representing beneficial interests in', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14260'}, {'symbol': 'CODX', 'name': 'Co-Diagnostics Inc.'}, {'symbol': 'COE', 'name': 'China Online Education Group American depositary shares each representing 15 Class A'}, {'symbol': 'COF', 'name': 'Capital One Financial Corporation'}, {'symbol': 'COF-D', 'name': 'Capital One Financial Corp Depository Shares Series D', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '9478'}, {'symbol': 'COF-G', 'name': 'Capital One Financial Corporation Depositary Shares Series G', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11694'}, {'symbol': 'COF-P', 'name': 'Capital One Financial Corp Pfd Ser B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '1386'}, {'symbol': 'COG', 'name': 'Cabot Oil & Gas Corporation'}, {'symbol': 'COHN', 'name': 'Cohen & Company Inc.'}, {'symbol': 'COHR', 'name': 'Coherent Inc.'}, {'symbol': 'COHU', 'name': 'Cohu Inc.'}, {'symbol': 'COKE', 'name': 'Coca-Cola Consolidated Inc.'}, {'symbol': 'COLB', 'name': 'Columbia Banking System Inc.'}, {'symbol': 'COLD', 'name': 'Americold Realty Trust'}, {'symbol': 'COLL', 'name': 'Collegium Pharmaceutical Inc.'}, {'symbol': 'COLM', 'name': 'Columbia Sportswear Company'}, {'symbol': 'COMB', 'name': 'GraniteShares Bloomberg Commodity Broad Strategy No K-1', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12943'}, {'symbol': 'COMM', 'name': 'CommScope Holding Company Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8040'}, {'symbol': 'CONE', 'name': 'CyrusOne Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1398'}, {'symbol': 'CONN', 'name': "Conn's Inc."}, {'symbol': 'COO', 'name': 'The Cooper Companies Inc.'}, {'symbol': 'COOP', 'name': 'Mr. Cooper Group Inc.'}, {'symbol': 'COP', 'name': 'ConocoPhillips'}, {'symbol': 'COR', 'name': 'CoreSite Realty Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1404'}, {'symbol': 'CORE', 'name': 'Core-Mark Holding Company Inc.'}, {'symbol': 'CORP', 'name': 'Pimco Investment Grade Corporate Bond Index Exchange-Traded Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1408'}, {'symbol': 'CORR', 'name': 'CorEnergy Infrastructure Trust Inc.'}, {'symbol': 'CORT', 'name': 'Corcept Therapeutics Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1410'}, {'symbol': 'CORV', 'name': 'Correvio Pharma Corp.'}, {'symbol': 'COST', 'name': 'Costco Wholesale Corporation'}, {'symbol': 'COT', 'name': 'Cott Corporation'}, {'symbol': 'COTY', 'name': 'Coty Inc. Class A'}, {'symbol': 'COUP', 'name': 'Coupa Software Incorporated'}, {'symbol': 'COWN', 'name': 'Cowen Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1418'}, {'symbol': 'COWNZ', 'name': 'Cowen Inc. 7.35% Senior Notes Due 2027', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13923'}, {'symbol': 'CP', 'name': 'Canadian Pacific Railway Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1420'}, {'symbol': 'CPA', 'name': 'Copa Holdings S.A. Class A'}, {'symbol': 'CPAC', 'name': 'Cementos Pacasmayo S.A.A. American Depositary Shares (Each representing five)'}, {'symbol': 'CPAH', 'name': 'CounterPath Corporation'}, {'symbol': 'CPB', 'name': 'Campbell Soup Company'}, {'symbol': 'CPE', 'name': 'Callon Petroleum Company'}, {'symbol': 'CPER', 'name': 'United States Copper Index Fund ETV', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1427'}, {'symbol': 'CPF', 'name': 'Central Pacific Financial Corp New'}, {'symbol': 'CPG', 'name': 'Crescent Point Energy Corporation (Canada)'}, {'symbol': 'CPHC', 'name': 'Canterbury Park Holding Corporation'}, {'symbol': 'CPHI', 'name': 'China Pharma Holdings Inc.'}, {'symbol': 'CPIX', 'name': 'Cumberland Pharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1434'}, {'symbol': 'CPK', 'name': 'Chesapeake Utilities Corporation'}, {'symbol': 'CPL', 'name': 'CPFL Energia S.A. American Depositary Shares'}, {'symbol': 'CPLG', 'name': 'CorePoint Lodging Inc.'}, {'symbol': 'CPLP', 'name': 'Capital Product Partners L.P.'}, {'symbol': 'CPRI', 'name': 'Capri Holdings Limited'}, {'symbol': 'CPRT', 'name': 'Copart Inc.'}, {'symbol': 'CPRX', 'name': 'Catalyst Pharmaceuticals Inc.'}, {'symbol': 'CPS', 'name': 'Cooper-Standard Holdings Inc.'}, {'symbol': 'CPSH', 'name': 'CPS Technologies Corp.'}, {'symbol': 'CPSI', 'name': 'Computer Programs and Systems Inc.'}, {'symbol': 'CPSS', 'name': 'Consumer Portfolio Services Inc.'}, {'symbol': 'CPST', 'name': 'Capstone Turbine Corporation'}, {'symbol': 'CPT', 'name': 'Camden Property Trust'}, {'symbol': 'CPTA', 'name': 'Capitala Finance Corp.'}, {'symbol': 'CPTAL', 'name': 'Capitala Finance Corp. 6% Notes Due 2022', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12949'}, {'symbol': 'CQP', 'name': 'Cheniere Energy Partners LP'}, {'symbol': 'CR', 'name': 'Crane Co.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1452'}, {'symbol': 'CRAI', 'name': 'CRA InternationalInc.'}, {'symbol': 'CRAY', 'name': 'Cray Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1454'}, {'symbol': 'CRBP', 'name': 'Corbus Pharmaceuticals Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9920'}, {'symbol': 'CRC', 'name': 'California Resources Corporation'}, {'symbol': 'CRCM', 'name': 'Care.com Inc.'}, {'symbol': 'CRD.A', 'name': 'Crawford & Company'}, {'symbol': 'CRD.B', 'name': 'Crawford & Company'}, {'symbol': 'CREE', 'name': 'Cree Inc.'}, {'symbol': 'CREG', 'name': 'China Recycling Energy Corporation'}, {'symbol': 'CRESY', 'name': 'Cresud S.A.C.I.F. y A. American Depositary Shares each representing ten shares of Common Stock'}, {'symbol': 'CREX', 'name': 'Creative Realities Inc.'}, {'symbol': 'CRF', 'name': 'Cornerstone Total Return Fund Inc. (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1463'}, {'symbol': 'CRH', 'name': 'CRH PLC American Depositary Shares'}, {'symbol': 'CRHM', 'name': 'CRH Medical Corporation of Beneficial Interest'}, {'symbol': 'CRI', 'name': "Carter's Inc."}, {'symbol': 'CRIS', 'name': 'Curis Inc.'}, {'symbol': 'CRK', 'name': 'Comstock Resources Inc.'}, {'symbol': 'CRL', 'name': 'Charles River Laboratories International Inc.'}, {'symbol': 'CRM', 'name': 'Salesforce.com Inc'}, {'symbol': 'CRMD', 'name': 'CorMedix Inc'}, {'symbol': 'CRMT', 'name': "America's Car-Mart Inc."}, {'symbol': 'CRNT', 'name': 'Ceragon Networks Ltd.'}, {'symbol': 'CRNX', 'name': 'Crinetics Pharmaceuticals Inc.'}, {'symbol': 'CRON', 'name': 'Cronos Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14203'}, {'symbol': 'CROX', 'name': 'Crocs Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1478'}, {'symbol': 'CRR', 'name': 'Carbo Ceramics Inc.'}, {'symbol': 'CRS', 'name': 'Carpenter Technology Corporation'}, {'symbol': 'CRSP', 'name': 'CRISPR Therapeutics AG'}, {'symbol': 'CRT', 'name': 'Cross Timbers Royalty Trust'}, {'symbol': 'CRTO', 'name': 'Criteo S.A.'}, {'symbol': 'CRUS', 'name': 'Cirrus Logic Inc.'}, {'symbol': 'CRVL', 'name': 'CorVel Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1489'}, {'symbol': 'CRVS', 'name': 'Corvus Pharmaceuticals Inc.'}, {'symbol': 'CRWS', 'name': 'Crown Crafts Inc.'}, {'symbol': 'CRY', 'name': 'CryoLife Inc.'}, {'symbol': 'CRZO', 'name': 'Carrizo Oil & Gas Inc.'}, {'symbol': 'CS', 'name': 'Credit Suisse Group American Depositary Shares'}, {'symbol': 'CSB', 'name': 'Compass EMP US Small Cap High Dividend 100 Volatil', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10272'}, {'symbol': 'CSBR', 'name': 'Champions Oncology Inc.'}, {'symbol': 'CSCO', 'name': 'Cisco Systems Inc.'}, {'symbol': 'CSF', 'name': 'VictoryShares US Discovery Enhanced Volatility Wtd ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9110'}, {'symbol': 'CSFL', 'name': 'CenterState Bank Corporation'}, {'symbol': 'CSGP', 'name': 'CoStar Group Inc.'}, {'symbol': 'CSGS', 'name': 'CSG Systems International Inc.'}, {'symbol': 'CSII', 'name': 'Cardiovascular Systems Inc.'}, {'symbol': 'CSIQ', 'name': 'Canadian Solar Inc.'}, {'symbol': 'CSL', 'name': 'Carlisle Companies Incorporated'}, {'symbol': 'CSLT', 'name': 'Castlight Health Inc. Class B'}, {'symbol': 'CSML', 'name': 'IQ Chaikin U.S. Small Cap ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12918'}, {'symbol': 'CSOD', 'name': 'Cornerstone OnDemand Inc.'}, {'symbol': 'CSPI', 'name': 'CSP Inc.'}, {'symbol': 'CSQ', 'name': 'Calamos Strategic Total Return Fund'}, {'symbol': 'CSS', 'name': 'CSS Industries Inc.'}, {'symbol': 'CSSE', 'name': 'Chicken Soup for the Soul Entertainment Inc.'}, {'symbol': 'CSTE', 'name': 'Caesarstone Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1527'}, {'symbol': 'CSTM', 'name': 'Constellium N.V.'}, {'symbol': 'CSTR', 'name': 'CapStar Financial Holdings Inc.'}, {'symbol': 'CSU', 'name': 'Capital Senior Living Corporation'}, {'symbol': 'CSV', 'name': 'Carriage Services Inc.'}, {'symbol': 'CSWC', 'name': 'Capital Southwest Corporation'}, {'symbol': 'CSWI', 'name': 'CSW Industrials Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10515'}, {'symbol': 'CSX', 'name': 'CSX Corporation'}, {'symbol': 'CTAC', 'name': 'ChaSerg Technology Acquisition Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15177'}, {'symbol': 'CTACW', 'name': 'ChaSerg Technology Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15191'}, {'symbol': 'CTAS', 'name': 'Cintas Corporation'}, {'symbol': 'CTB', 'name': 'Cooper Tire & Rubber Company'}, {'symbol': 'CTBI', 'name': 'Community Trust Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1536'}, {'symbol': 'CTEK', 'name': 'CynergisTek Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12388'}, {'symbol': 'CTG', 'name': 'Computer Task Group Incorporated'}, {'symbol': 'CTHR', 'name': 'Charles & Colvard Ltd.'}, {'symbol': 'CTIB', 'name': 'CTI Industries Corporation'}, {'symbol': 'CTIC', 'name': 'CTI BioPharma Corp.'}, {'symbol': 'CTK', 'name': 'CooTek (Cayman) Inc. American Depositary Shares each representing 50 Class A'}, {'symbol': 'CTL', 'name': 'CenturyLink Inc.'}, {'symbol': 'CTLT', 'name': 'Catalent Inc.'}, {'symbol': 'CTMX', 'name': 'CytomX Therapeutics Inc.'}, {'symbol': 'CTO', 'name': 'Consolidated-Tomoka Land Co.'}, {'symbol': 'CTR', 'name': 'ClearBridge MLP and Midstream Total Return Fund Inc.'}, {'symbol': 'CTRA', 'name': 'Contura Energy Inc.'}, {'symbol': 'CTRC', 'name': 'Centric Brands Inc.'}, {'symbol': 'CTRE', 'name': 'CareTrust REIT Inc.'}, {'symbol': 'CTRL', 'name': 'Control4 Corporation'}, {'symbol': 'CTRN', 'name': 'Citi Trends Inc.'}, {'symbol': 'CTRP', 'name': 'Ctrip.com International Ltd.'}, {'symbol': 'CTRV', 'name': 'ContraVir Pharmaceuticals Inc.'}, {'symbol': 'CTS', 'name': 'CTS Corporation'}, {'symbol': 'CTSH', 'name': 'Cognizant Technology Solutions Corporation'}, {'symbol': 'CTSO', 'name': 'CytoSorbents Corporation'}, {'symbol': 'CTT', 'name': 'CatchMark Timber Trust Inc. Class A'}, {'symbol': 'CTWS', 'name': 'Connecticut Water Service Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1560'}, {'symbol': 'CTXR', 'name': 'Citius Pharmaceuticals Inc.'}, {'symbol': 'CTXS', 'name': 'Citrix Systems Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1562'}, {'symbol': 'CTZ', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10510'}, {'symbol': 'CUB', 'name': 'Cubic Corporation'}, {'symbol': 'CUBA', 'name': 'The Herzfeld Caribbean Basin Fund Inc.'}, {'symbol': 'CUBE', 'name': 'CubeSmart'}, {'symbol': 'CUBI', 'name': 'Customers Bancorp Inc'}, {'symbol': 'CUBI-D', 'name': 'Customers Bancorp Inc Fixed-to-Floating Rate Non-Cumulative Perpetual Preferred Stock Series D', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11050'}, {'symbol': 'CUBI-F', 'name': 'Customers Bancorp Inc Fixed-to-Floating Rate Non-Cumulative Perpetual Preferred Stock Series F', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11881'}, {'symbol': 'CUE', 'name': 'Cue Biopharma Inc.'}, {'symbol': 'CUI', 'name': 'CUI Global Inc.'}, {'symbol': 'CUK', 'name': 'Carnival Plc ADS ADS'}, {'symbol': 'CULP', 'name': 'Culp Inc.'}, {'symbol': 'CUO', 'name': 'Continental Materials Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1576'}, {'symbol': 'CUR', 'name': 'Neuralstem Inc.'}, {'symbol': 'CURO', 'name': 'CURO Group Holdings Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13641'}, {'symbol': 'CUTR', 'name': 'Cutera Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1581'}, {'symbol': 'CUZ', 'name': 'Cousins Properties Incorporated'}, {'symbol': 'CVA', 'name': 'Covanta Holding Corporation'}, {'symbol': 'CVBF', 'name': 'CVB Financial Corporation'}, {'symbol': 'CVCO', 'name': 'Cavco Industries Inc.'}, {'symbol': 'CVCY', 'name': 'Central Valley Community Bancorp'}, {'symbol': 'CVE', 'name': 'Cenovus Energy Inc'}, {'symbol': 'CVEO', 'name': 'Civeo Corporation (Canada)'}, {'symbol': 'CVGI', 'name': 'Commercial Vehicle Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1593'}, {'symbol': 'CVGW', 'name': 'Calavo Growers Inc.'}, {'symbol': 'CVI', 'name': 'CVR Energy Inc.'}, {'symbol': 'CVIA', 'name': 'Covia Holdings Corporation'}, {'symbol': 'CVLT', 'name': 'Commvault Systems Inc.'}, {'symbol': 'CVLY', 'name': 'Codorus Valley Bancorp Inc'}, {'symbol': 'CVM', 'name': 'Cel-Sci Corporation ($0.001 Par Value)'}, {'symbol': 'CVNA', 'name': 'Carvana Co. Class A'}, {'symbol': 'CVR', 'name': 'Chicago Rivet & Machine Co.'}, {'symbol': 'CVRS', 'name': 'Corindus Vascular Robotics Inc. (DE)'}, {'symbol': 'CVS', 'name': 'CVS Health Corporation'}, {'symbol': 'CVTI', 'name': 'Covenant Transportation Group Inc.'}, {'symbol': 'CVU', 'name': 'CPI Aerostructures Inc.'}, {'symbol': 'CVV', 'name': 'CVD Equipment Corporation'}, {'symbol': 'CVX', 'name': 'Chevron Corporation'}, {'symbol': 'CW', 'name': 'Curtiss-Wright Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1609'}, {'symbol': 'CWB', 'name': 'SPDR Bloomberg Barclays Convertible Securities', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1610'}, {'symbol': 'CWBC', 'name': 'Community West Bancshares'}, {'symbol': 'CWBR', 'name': 'CohBar Inc.'}, {'symbol': 'CWCO', 'name': 'Consolidated Water Co. Ltd.'}, {'symbol': 'CWEN', 'name': 'Clearway Energy Inc. Class C', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10001'}, {'symbol': 'CWEN.A', 'name': 'Clearway Energy Inc. Class A'}, {'symbol': 'CWH', 'name': 'Camping World Holdings Inc. Class A Commom Stock'}, {'symbol': 'CWK', 'name': 'Cushman & Wakefield plc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14827'}, {'symbol': 'CWST', 'name': 'Casella Waste Systems Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1620'}, {'symbol': 'CWT', 'name': 'California Water Service Group'}, {'symbol': 'CX', 'name': 'Cemex S.A.B. de C.V. Sponsored ADR'}, {'symbol': 'CXDC', 'name': 'China XD Plastics Company Limited'}, {'symbol': 'CXE', 'name': 'MFS High Income Municipal Trust'}, {'symbol': 'CXH', 'name': 'MFS Investment Grade Municipal Trust'}, {'symbol': 'CXO', 'name': 'Concho Resources Inc.'}, {'symbol': 'CXP', 'name': 'Columbia Property Trust Inc.'}, {'symbol': 'CXW', 'name': 'CoreCivic Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1632'}, {'symbol': 'CY', 'name': 'Cypress Semiconductor Corporation'}, {'symbol': 'CYAD', 'name': 'Celyad SA'}, {'symbol': 'CYAN', 'name': 'Cyanotech Corporation'}, {'symbol': 'CYBE', 'name': 'CyberOptics Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1636'}, {'symbol': 'CYBR', 'name': 'CyberArk Software Ltd.'}, {'symbol': 'CYCC', 'name': 'Cyclacel Pharmaceuticals Inc.'}, {'symbol': 'CYD', 'name': 'China Yuchai International Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1640'}, {'symbol': 'CYH', 'name': 'Community Health Systems Inc.'}, {'symbol': 'CYOU', 'name': 'Changyou.com Limited'}, {'symbol': 'CYRN', 'name': 'CYREN Ltd.'}, {'symbol': 'CYRX', 'name': 'CryoPort Inc.'}, {'symbol': 'CYTK', 'name': 'Cytokinetics Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1652'}, {'symbol': 'CYTR', 'name': 'CytRx Corporation'}, {'symbol': 'CYTX', 'name': 'Cytori Therapeutics Inc.'}, {'symbol': 'CZA', 'name': 'Invesco Zacks Mid-Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14381'}, {'symbol': 'CZFC', 'name': 'Citizens First Corporation'}, {'symbol': 'CZNC', 'name': 'Citizens & Northern Corp'}, {'symbol': 'CZR', 'name': 'Caesars Entertainment Corporation'}, {'symbol': 'CZWI', 'name': 'Citizens Community Bancorp Inc.'}, {'symbol': 'CZZ', 'name': 'Cosan Limited Class A'}, {'symbol': 'D', 'name': 'Dominion Energy Inc.'}, {'symbol': 'DAC', 'name': 'Danaos Corporation'}, {'symbol': 'DAIO', 'name': 'Data I/O Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1665'}, {'symbol': 'DAKT', 'name': 'Daktronics Inc.'}, {'symbol': 'DAL', 'name': 'Delta Air Lines Inc.'}, {'symbol': 'DALT', 'name': 'Anfield Capital Diversified Alternatives ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13459'}, {'symbol': 'DAN', 'name': 'Dana Incorporated'}, {'symbol': 'DAR', 'name': 'Darling Ingredients Inc.'}, {'symbol': 'DARE', 'name': 'Dare Bioscience Inc.'}, {'symbol': 'DATA', 'name': 'Tableau Software Inc. Class A'}, {'symbol': 'DAVA', 'name': 'Endava plc American Depositary Shares (each representing one Class A)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14795'}, {'symbol': 'DAVE', 'name': "Famous Dave's of America Inc."}, {'symbol': 'DB', 'name': 'Deutsche Bank AG', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1675'}, {'symbol': 'DBAP', 'name': 'Xtrackers MSCI Asia Pacific ex Japan Hedged Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7828'}, {'symbol': 'DBB', 'name': 'Invesco DB Base Metals Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1677'}, {'symbol': 'DBD', 'name': 'Diebold Nixdorf Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1680'}, {'symbol': 'DBEF', 'name': 'Xtrackers MSCI EAFE Hedged Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1682'}, {'symbol': 'DBEU', 'name': 'Xtrackers MSCI Europe Hedged Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7829'}, {'symbol': 'DBGR', 'name': 'Xtrackers MSCI Germany Hedged Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1684'}, {'symbol': 'DBKO', 'name': 'Xtrackers MSCI South Korea Hedged Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8213'}, {'symbol': 'DBL', 'name': 'DoubleLine Opportunistic Credit Fund of Beneficial Interest'}, {'symbol': 'DBO', 'name': 'Invesco DB Oil Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1690'}, {'symbol': 'DBS', 'name': 'Invesco DB Silver Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1692'}, {'symbol': 'DBV', 'name': 'Invesco DB G10 Currency Harvest Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1694'}, {'symbol': 'DBVT', 'name': 'DBV Technologies S.A.'}, {'symbol': 'DBX', 'name': 'Dropbox Inc'}, {'symbol': 'DCAR', 'name': 'DropCar Inc.'}, {'symbol': 'DCF', 'name': 'Dreyfus Alcentra Global Credit Income 2024 Target Term Fund Inc.'}, {'symbol': 'DCI', 'name': 'Donaldson Company Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1697'}, {'symbol': 'DCIX', 'name': 'Diana Containerships Inc.'}, {'symbol': 'DCO', 'name': 'Ducommun Incorporated'}, {'symbol': 'DCOM', 'name': 'Dime Community Bancshares Inc.'}, {'symbol': 'DCP', 'name': 'DCP Midstream LP'}, {'symbol': 'DCP-C', 'name': 'DCP Midstream LP 7.95% Series C Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '15124'}, {'symbol': 'DCPH', 'name': 'Deciphera Pharmaceuticals Inc.'}, {'symbol': 'DD-A', 'name': 'E.I. du Pont de Nemours and Company Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '1709'}, {'symbol': 'DDBI', 'name': 'Legg Mason Developed EX-US Diversified Core ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10969'}, {'symbol': 'DDD', 'name': '3D Systems Corporation'}, {'symbol': 'DDE', 'name': 'Dover Downs Gaming & Entertainment Inc'}, {'symbol': 'DDF', 'name': 'Delaware Investments Dividend & Income Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1714'}, {'symbol': 'DDIV', 'name': 'First Trust RBA Quality Income ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8423'}, {'symbol': 'DDLS', 'name': 'WisdomTree Dynamic Currency Hedged International SmallCap Equity Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10998'}, {'symbol': 'DDMX', 'name': 'DD3 Acquisition Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15158'}, {'symbol': 'DDMXU', 'name': 'DD3 Acquisition Corp. Units'}, {'symbol': 'DDP', 'name': 'DB Commodity Short ETN due April 1 2038', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1717'}, {'symbol': 'DDS', 'name': "Dillard's Inc."}, {'symbol': 'DDWM', 'name': 'WisdomTree Dynamic Currency Hedged International Equity Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10999'}, {'symbol': 'DE', 'name': 'Deere & Company'}, {'symbol': 'DEA', 'name': 'Easterly Government Properties Inc.'}, {'symbol': 'DECK', 'name': 'Deckers Outdoor Corporation'}, {'symbol': 'DEF', 'name': 'Invesco Defensive Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14382'}, {'symbol': 'DEI', 'name': 'Douglas Emmett Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1730'}, {'symbol': 'DELL', 'name': 'Dell Technologies Inc. Class C'}, {'symbol': 'DELT', 'name': 'Delta Technology Holdings Limited'}, {'symbol': 'DEMG', 'name': 'Xtrackers FTSE Emerging Comprehensive Factor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11247'}, {'symbol': 'DENN', 'name': "Denny's Corporation"}, {'symbol': 'DEO', 'name': 'Diageo plc'}, {'symbol': 'DERM', 'name': 'Dermira Inc.'}, {'symbol': 'DESC', 'name': 'Xtrackers Russell 2000 Comprehensive Factor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11522'}, {'symbol': 'DESP', 'name': 'Despegar.com Corp.'}, {'symbol': 'DEST', 'name': 'Destination Maternity Corporation'}, {'symbol': 'DEUS', 'name': 'Xtrackers Russell 1000 Comprehensive Factor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10876'}, {'symbol': 'DEWJ', 'name': 'iShares Adaptive Currency Hedged MSCI Japan', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11001'}, {'symbol': 'DEX', 'name': 'Delaware Enhanced Global Dividend of Beneficial Interest'}, {'symbol': 'DF', 'name': 'Dean Foods Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1742'}, {'symbol': 'DFBH', 'name': 'DFB Healthcare Acquisitions Corp.'}, {'symbol': 'DFBHW', 'name': 'DFB Healthcare Acquisitions Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14447'}, {'symbol': 'DFEN', 'name': 'Direxion Daily Aerospace & Defense Bull 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12864'}, {'symbol': 'DFFN', 'name': 'Diffusion Pharmaceuticals Inc.'}, {'symbol': 'DFIN', 'name': 'Donnelley Financial Solutions Inc.'}, {'symbol': 'DFND', 'name': 'Realty Shares DIVCON Dividend Defender', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11014'}, {'symbol': 'DFP', 'name': 'Flaherty & Crumrine Dynamic Preferred and Income Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1745'}, {'symbol': 'DFRG', 'name': "Del Frisco's Restaurant Group Inc."}, {'symbol': 'DFS', 'name': 'Discover Financial Services'}, {'symbol': 'DFVS', 'name': 'iPath US Treasury 5-year Bear ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1753'}, {'symbol': 'DG', 'name': 'Dollar General Corporation'}, {'symbol': 'DGBP', 'name': 'ETNs linked to the VelocityShares Daily 4X Long USD vs. GBP Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13900'}, {'symbol': 'DGICA', 'name': 'Donegal Group Inc. Class A Common Stock'}, {'symbol': 'DGICB', 'name': 'Donegal Group Inc. Class B Common Stock'}, {'symbol': 'DGII', 'name': 'Digi International Inc.'}, {'symbol': 'DGLD', 'name': 'VelocityShares 3x Inverse Gold ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '1764'}, {'symbol': 'DGLY', 'name': 'Digital Ally Inc.'}, {'symbol': 'DGRE', 'name': 'WisdomTree Emerging Markets Dividend Growth Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '1767'}, {'symbol': 'DGRS', 'name': 'WisdomTree U.S. SmallCap Dividend Growth Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '1768'}, {'symbol': 'DGS', 'name': 'WisdomTree Emerging Market SmallCap Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1770'}, {'symbol': 'DGSE', 'name': 'DGSE Companies Inc.'}, {'symbol': 'DGX', 'name': 'Quest Diagnostics Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1773'}, {'symbol': 'DHDG', 'name': 'WisdomTree Dynamic Currency Hedged International Quality Dividend Growth Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12045'}, {'symbol': 'DHF', 'name': 'Dreyfus High Yield Strategies Fund'}, {'symbol': 'DHI', 'name': 'D.R. Horton Inc.'}, {'symbol': 'DHIL', 'name': 'Diamond Hill Investment Group Inc.'}, {'symbol': 'DHR', 'name': 'Danaher Corporation'}, {'symbol': 'DHT', 'name': 'DHT Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1782'}, {'symbol': 'DHX', 'name': 'DHI Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1783'}, {'symbol': 'DHXM', 'name': 'DHX Media Ltd.'}, {'symbol': 'DHY', 'name': 'Credit Suisse High Yield Bond Fund'}, {'symbol': 'DIAL', 'name': 'Columbia Diversified Fixed Income Allocation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13545'}, {'symbol': 'DIAX', 'name': 'Nuveen Dow 30SM Dynamic Overwrite Fund of Beneficial Interest'}, {'symbol': 'DIM', 'name': 'WisdomTree International MidCap Dividend Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1787'}, {'symbol': 'DIN', 'name': 'Dine Brands Global Inc.'}, {'symbol': 'DIOD', 'name': 'Diodes Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1789'}, {'symbol': 'DIS', 'name': 'The Walt Disney Company'}, {'symbol': 'DISCA', 'name': 'Discovery Inc. Series A Common Stock'}, {'symbol': 'DISCB', 'name': 'Discovery Inc. Series B Common Stock'}, {'symbol': 'DISCK', 'name': 'Discovery Inc.'}, {'symbol': 'DISH', 'name': 'DISH Network Corporation'}, {'symbol': 'DIT', 'name': 'AMCON Distributing Company'}, {'symbol': 'DIVA', 'name': 'AGFiQ Hedged Dividend Income Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9655'}, {'symbol': 'DIVC', 'name': 'Citigroup Inc. C-Tracks ETN Miller/Howard Strategic Dividend Reinvestors Due 9/16/2014', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9271'}, {'symbol': 'DIVY', 'name': 'Realty Shares DIVS', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9590'}, {'symbol': 'DJCO', 'name': 'Daily Journal Corp. (S.C.)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1799'}, {'symbol': 'DJP', 'name': 'iPath Bloomberg Commodity Index Total Return ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1800'}, {'symbol': 'DK', 'name': 'Delek US Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13096'}, {'symbol': 'DKL', 'name': 'Delek Logistics Partners L.P. representing Limited Partner Interests'}, {'symbol': 'DKS', 'name': "Dick's Sporting Goods Inc"}, {'symbol': 'DL', 'name': 'China Distance Education Holdings Limited American Depositary Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1805'}, {'symbol': 'DLA', 'name': 'Delta Apparel Inc.'}, {'symbol': 'DLB', 'name': 'Dolby Laboratories'}, {'symbol': 'DLBS', 'name': 'iPath US Treasury Long Bond Bear ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1809'}, {'symbol': 'DLHC', 'name': 'DLH Holdings Corp.'}, {'symbol': 'DLNG', 'name': 'Dynagas LNG Partners LP', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8096'}, {'symbol': 'DLNG-B', 'name': 'Dynagas LNG Partners LP 8.75% Series B Fixed to Floating Rate Cumulative Redeemable Perpetual Preferred Units liquidation preference $25.00 per Uni', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '15178'}, {'symbol': 'DLPH', 'name': 'Delphi Technologies PLC'}, {'symbol': 'DLPN', 'name': 'Dolphin Entertainment Inc.'}, {'symbol': 'DLR', 'name': 'Digital Realty Trust Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1816'}, {'symbol': 'DLR-G', 'name': 'Digital Realty Trust Inc. Preferred Series G', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '1819'}, {'symbol': 'DLR-I', 'name': 'Digital Realty Trust Inc. 6.350% Series I Cumulative Redeemable Preferred Stock par value $0.01 per share', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '10461'}, {'symbol': 'DLS', 'name': 'WisdomTree International SmallCap Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1820'}, {'symbol': 'DLTH', 'name': 'Duluth Holdings Inc.'}, {'symbol': 'DLTR', 'name': 'Dollar Tree Inc.'}, {'symbol': 'DLX', 'name': 'Deluxe Corporation'}, {'symbol': 'DMAC', 'name': 'DiaMedica Therapeutics Inc.'}, {'symbol': 'DMB', 'name': 'Dreyfus Municipal Bond Infrastructure Fund Inc.'}, {'symbol': 'DMF', 'name': 'Dreyfus Municipal Income Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1827'}, {'symbol': 'DMLP', 'name': 'Dorchester Minerals L.P.'}, {'symbol': 'DMO', 'name': 'Western Asset Mortgage Defined Opportunity Fund Inc'}, {'symbol': 'DMPI', 'name': 'DelMar Pharmaceuticals Inc.'}, {'symbol': 'DMRC', 'name': 'Digimarc Corporation'}, {'symbol': 'DMRL', 'name': 'DeltaShares S&P 500 Managed Risk', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13203'}, {'symbol': 'DMRS', 'name': 'DeltaShares S&P 600 Managed Risk', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13205'}, {'symbol': 'DNB', 'name': 'Dun & Bradstreet Corporation (The)'}, {'symbol': 'DNBF', 'name': 'DNB Financial Corp'}, {'symbol': 'DNI', 'name': 'Dividend and Income Fund'}, {'symbol': 'DNJR', 'name': 'Golden Bull Limited'}, {'symbol': 'DNKN', 'name': "Dunkin' Brands Group Inc."}, {'symbol': 'DNLI', 'name': 'Denali Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13771'}, {'symbol': 'DNN', 'name': 'Denison Mines Corp (Canada)'}, {'symbol': 'DNOW', 'name': 'NOW Inc.'}, {'symbol': 'DNP', 'name': 'DNP Select Income Fund Inc.'}, {'symbol': 'DNR', 'name': 'Denbury Resources Inc.'}, {'symbol': 'DO', 'name': 'Diamond Offshore Drilling Inc.'}, {'symbol': 'DOC', 'name': 'Physicians Realty Trust of Beneficial Interest'}, {'symbol': 'DOCU', 'name': 'DocuSign Inc.'}, {'symbol': 'DOG', 'name': 'ProShares Short Dow30', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1846'}, {'symbol': 'DOGZ', 'name': 'Dogness (International) Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13430'}, {'symbol': 'DOMO', 'name': 'Domo Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14749'}, {'symbol': 'DOO', 'name': 'WisdomTree International Dividend Top 100 Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1852'}, {'symbol': 'DOOO', 'name': 'BRP Inc.'}, {'symbol': 'DOOR', 'name': 'Masonite International Corporation (Canada)'}, {'symbol': 'DORM', 'name': 'Dorman Products Inc.'}, {'symbol': 'DOV', 'name': 'Dover Corporation'}, {'symbol': 'DOVA', 'name': 'Dova Pharmaceuticals Inc.'}, {'symbol': 'DOX', 'name': 'Amdocs Limited'}, {'symbol': 'DPG', 'name': 'Duff & Phelps Global Utility Income Fund Inc.'}, {'symbol': 'DPLO', 'name': 'Diplomat Pharmacy Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9171'}, {'symbol': 'DPW', 'name': 'DPW Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13977'}, {'symbol': 'DPZ', 'name': "Domino's Pizza Inc"}, {'symbol': 'DQ', 'name': 'DAQO New Energy Corp. American Depositary Shares each representing five'}, {'symbol': 'DRAD', 'name': 'Digirad Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1868'}, {'symbol': 'DRD', 'name': 'DRDGOLD Limited American Depositary Shares'}, {'symbol': 'DRE', 'name': 'Duke Realty Corporation'}, {'symbol': 'DRH', 'name': 'Diamondrock Hospitality Company'}, {'symbol': 'DRI', 'name': 'Darden Restaurants Inc.'}, {'symbol': 'DRIO', 'name': 'DarioHealth Corp.'}, {'symbol': 'DRIP', 'name': 'Direxion Daily S&P Oil & Gas Exp. & Prod. Bear 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10028'}, {'symbol': 'DRN', 'name': 'Direxion Daily Real Estate Bull 3x Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1883'}, {'symbol': 'DRNA', 'name': 'Dicerna Pharmaceuticals Inc.'}, {'symbol': 'DRQ', 'name': 'Dril-Quip Inc.'}, {'symbol': 'DRRX', 'name': 'DURECT Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1886'}, {'symbol': 'DRUA', 'name': 'Dominion Energy Inc. 2016 Series A 5.25% Enhanced Junior Subordinated Notes due 2076', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11657'}, {'symbol': 'DRW', 'name': 'WisdomTree Global ex-US Real Estate Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1890'}, {'symbol': 'DRYS', 'name': 'DryShips Inc.'}, {'symbol': 'DS', 'name': 'Drive Shack Inc.'}, {'symbol': 'DS-C', 'name': 'Drive Shack Inc. Preferred Series C', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '4739'}, {'symbol': 'DSE', 'name': 'Duff & Phelps Select MLP and Midstream Energy Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8874'}, {'symbol': 'DSGX', 'name': 'The Descartes Systems Group Inc.'}, {'symbol': 'DSKE', 'name': 'Daseke Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10496'}, {'symbol': 'DSL', 'name': 'DoubleLine Income Solutions Fund of Beneficial Interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1898'}, {'symbol': 'DSM', 'name': 'Dreyfus Strategic Municipal Bond Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1900'}, {'symbol': 'DSPG', 'name': 'DSP Group Inc.'}, {'symbol': 'DSS', 'name': 'Document Security Systems Inc.'}, {'symbol': 'DSU', 'name': 'Blackrock Debt Strategies Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1905'}, {'symbol': 'DSW', 'name': 'DSW Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1907'}, {'symbol': 'DSWL', 'name': 'Deswell Industries Inc.'}, {'symbol': 'DSX', 'name': 'Diana Shipping inc.'}, {'symbol': 'DTD', 'name': 'WisdomTree U.S. Total Dividend Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1911'}, {'symbol': 'DTE', 'name': 'DTE Energy Company'}, {'symbol': 'DTEA', 'name': 'DAVIDsTEA Inc.'}, {'symbol': 'DTF', 'name': 'DTF Tax-Free Income Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1913'}, {'symbol': 'DTJ', 'name': 'DTE Energy Company 2016 Series B 5.375% Junior Subordinated Debentures due 2076', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11413'}, {'symbol': 'DTN', 'name': 'WisdomTree U.S. Dividend ex-Financials Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1917'}, {'symbol': 'DTQ', 'name': 'DTE Energy Company 2012 Series C 5.25% Junior Subordinate Debentures due December 1 2062', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '1919'}, {'symbol': 'DTSS', 'name': 'Datasea Inc.'}, {'symbol': 'DTUS', 'name': 'iPath US Treasury 2-year Bear ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1923'}, {'symbol': 'DTW', 'name': 'DTE Energy Company 2017 Series E 5.25% Junior Subordinated Debentures due 2077', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13827'}, {'symbol': 'DTYL', 'name': 'iPath US Treasury 10 Year Bull ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1925'}, {'symbol': 'DUC', 'name': 'Duff & Phelps Utility & Corporate Bond Trust Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1929'}, {'symbol': 'DUK', 'name': 'Duke Energy Corporation (Holding Company)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1931'}, {'symbol': 'DUKH', 'name': 'Duke Energy Corporation 5.125% Junior Subordinated Debentures due 2073', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '1932'}, {'symbol': 'DUSA', 'name': 'Davis Select U.S. Equity ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12288'}, {'symbol': 'DUST', 'name': 'Direxion Daily Gold Miners Index Bear 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '1933'}, {'symbol': 'DVA', 'name': 'DaVita Inc.'}, {'symbol': 'DVAX', 'name': 'Dynavax Technologies Corporation'}, {'symbol': 'DVCR', 'name': 'Diversicare Healthcare Services Inc.'}, {'symbol': 'DVD', 'name': 'Dover Motorsports Inc.'}, {'symbol': 'DVHL', 'name': 'ETRACS 2xLeveraged Diversified High Income ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8099'}, {'symbol': 'DVN', 'name': 'Devon Energy Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1940'}, {'symbol': 'DVP', 'name': 'Deep Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9288'}, {'symbol': 'DVYA', 'name': 'iShares Asia / Pacific Dividend 30 Index Fund Exchange Traded Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1943'}, {'symbol': 'DVYL', 'name': 'ETRACS Monthly Pay 2x Leveraged Dow Jones Select Dividend Index ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '1945'}, {'symbol': 'DWAS', 'name': 'Invesco DWA SmallCap Momentum ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '1948'}, {'symbol': 'DWCR', 'name': 'Arrow DWA Country Rotation ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13965'}, {'symbol': 'DWDP', 'name': 'DowDuPont Inc.'}, {'symbol': 'DWIN', 'name': 'Invesco DWA Tactical Multi-Asset Income ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11137'}, {'symbol': 'DWLV', 'name': 'PowerShares DWA Momentum & Low Volatility Rotation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11600'}, {'symbol': 'DWMC', 'name': 'AdvisorShares Dorsey Wright Micro-Cap ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14812'}, {'symbol': 'DWPP', 'name': "First Trust Dorsey Wright People's Portfolio ETF", 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7280'}, {'symbol': 'DWSN', 'name': 'Dawson Geophysical Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6764'}, {'symbol': 'DWTR', 'name': 'PowerShares DWA Tactical Sector Rotation Portfolio', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10672'}, {'symbol': 'DX', 'name': 'Dynex Capital Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1955'}, {'symbol': 'DX-B', 'name': 'Dynex Capital Inc. Preferred Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '1957'}, {'symbol': 'DXC', 'name': 'DXC Technology Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12477'}, {'symbol': 'DXCM', 'name': 'DexCom Inc.'}, {'symbol': 'DXF', 'name': 'Dunxin Financial Holdings Limited American Depositary Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7608'}, {'symbol': 'DXJ', 'name': 'WisdomTree Japan Hedged Equity Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1961'}, {'symbol': 'DXJS', 'name': 'WisdomTree Japan Hedged SmallCap Equity Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '1962'}, {'symbol': 'DXLG', 'name': 'Destination XL Group Inc.'}, {'symbol': 'DXPE', 'name': 'DXP Enterprises Inc.'}, {'symbol': 'DXR', 'name': 'Daxor Corporation'}, {'symbol': 'DXYN', 'name': 'The Dixie Group Inc.'}, {'symbol': 'DY', 'name': 'Dycom Industries Inc.'}, {'symbol': 'DYLS', 'name': 'WisdomTree Dynamic Long/Short U.S. Equity Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10948'}, {'symbol': 'DYNT', 'name': 'Dynatronics Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1972'}, {'symbol': 'DYSL', 'name': 'Dynasil Corporation of America'}, {'symbol': 'DZK', 'name': 'Direxion Developed Markets Bull 3x Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1975'}, {'symbol': 'DZSI', 'name': 'DASAN Zhone Solutions Inc.'}, {'symbol': 'E', 'name': 'ENI S.p.A.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1977'}, {'symbol': 'EA', 'name': 'Electronic Arts Inc.'}, {'symbol': 'EAD', 'name': 'Wells Fargo Income Opportunities Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1982'}, {'symbol': 'EAF', 'name': 'GrafTech International Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14304'}, {'symbol': 'EAGL', 'name': 'Platinum Eagle Acquisition Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14214'}, {'symbol': 'EAGLW', 'name': 'Platinum Eagle Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14220'}, {'symbol': 'EARN', 'name': 'Ellington Residential Mortgage REIT of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1986'}, {'symbol': 'EARS', 'name': 'Auris Medical Holding AG'}, {'symbol': 'EASI', 'name': 'Amplify ETF Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14736'}, {'symbol': 'EAST', 'name': 'Eastside Distilling Inc.'}, {'symbol': 'EAT', 'name': 'Brinker International Inc.'}, {'symbol': 'EB', 'name': 'Eventbrite Inc. Class A'}, {'symbol': 'EBAY', 'name': 'eBay Inc.'}, {'symbol': 'EBF', 'name': 'Ennis Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1989'}, {'symbol': 'EBIX', 'name': 'Ebix Inc.'}, {'symbol': 'EBMT', 'name': 'Eagle Bancorp Montana Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1991'}, {'symbol': 'EBR', 'name': 'Centrais Electricas Brasileiras S A American Depositary Shares (Each representing one)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1993'}, {'symbol': 'EBR.B', 'name': 'Centrais Electricas Brasileiras S.A.- Eletrobr?!s American Depositary Shares (Each representing one Preferred Share)'}, {'symbol': 'EBS', 'name': 'Emergent Biosolutions Inc.'}, {'symbol': 'EBSB', 'name': 'Meridian Bancorp Inc.'}, {'symbol': 'EBTC', 'name': 'Enterprise Bancorp Inc'}, {'symbol': 'EC', 'name': 'Ecopetrol S.A. American Depositary Shares'}, {'symbol': 'ECA', 'name': 'Encana Corporation'}, {'symbol': 'ECC', 'name': 'Eagle Point Credit Company Inc.'}, {'symbol': 'ECCB', 'name': 'Eagle Point Credit Company Inc. 7.75% Series B Term Preferred Stock due 2026', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11964'}, {'symbol': 'ECCY', 'name': 'Eagle Point Credit Company Inc. 6.75% Notes due 2027', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13246'}, {'symbol': 'ECF', 'name': 'Ellsworth Growth and Income Fund Ltd.'}, {'symbol': 'ECH', 'name': 'iShares Inc. MSCI Chile', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2001'}, {'symbol': 'ECHO', 'name': 'Echo Global Logistics Inc.'}, {'symbol': 'ECL', 'name': 'Ecolab Inc.'}, {'symbol': 'ECOL', 'name': 'US Ecology Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2005'}, {'symbol': 'ECOM', 'name': 'ChannelAdvisor Corporation'}, {'symbol': 'ECOR', 'name': 'electroCore Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14653'}, {'symbol': 'ECPG', 'name': 'Encore Capital Group Inc'}, {'symbol': 'ECR', 'name': 'Eclipse Resources Corporation'}, {'symbol': 'ECT', 'name': 'ECA Marcellus Trust I of Beneficial Interest'}, {'symbol': 'ED', 'name': 'Consolidated Edison Inc.'}, {'symbol': 'EDAP', 'name': 'EDAP TMS S.A.'}, {'symbol': 'EDC', 'name': 'Direxion Emerging Markets Bull 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2015'}, {'symbol': 'EDD', 'name': 'Morgan Stanley Emerging Markets Domestic Debt Fund Inc.'}, {'symbol': 'EDF', 'name': 'Stone Harbor Emerging Markets Income Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2019'}, {'symbol': 'EDGE', 'name': 'Edge Therapeutics Inc.'}, {'symbol': 'EDI', 'name': 'Stone Harbor Emerging Markets Total Income Fund of Beneficial Interests'}, {'symbol': 'EDIT', 'name': 'Editas Medicine Inc.'}, {'symbol': 'EDN', 'name': 'Empresa Distribuidora Y Comercializadora Norte S.A. (Edenor) Empresa Distribuidora Y Comercializadora Norte S.A. (Edenor) American Depositary Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2025'}, {'symbol': 'EDNT', 'name': 'Edison Nation Inc.'}, {'symbol': 'EDOM', 'name': 'WisdomTree Europe Domestic Economy Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10751'}, {'symbol': 'EDRY', 'name': 'EuroDry Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14663'}, {'symbol': 'EDTX', 'name': 'EdtechX Holdings Acquisition Corp.'}, {'symbol': 'EDTXU', 'name': 'EdtechX Holdings Acquisition Corp. Unit'}, {'symbol': 'EDU', 'name': 'New Oriental Education & Technology Group Inc. Sponsored ADR representing 1 (Cayman Islands)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2029'}, {'symbol': 'EDUC', 'name': 'Educational Development Corporation'}, {'symbol': 'EDZ', 'name': 'Direxion Emerging Markets Bear 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2032'}, {'symbol': 'EE', 'name': 'El Pasoectric Company'}, {'symbol': 'EEA', 'name': 'The European Equity Fund Inc.'}, {'symbol': 'EEFT', 'name': 'Euronet Worldwide Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2036'}, {'symbol': 'EEI', 'name': 'Ecology and Environment Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2039'}, {'symbol': 'EEM', 'name': 'iShares MSCI Emerging Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2041'}, {'symbol': 'EEMD', 'name': 'AAM S&P Emerging Markets High Dividend Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13840'}, {'symbol': 'EEMS', 'name': 'Ishares MSCI Emerging Markets Small Cap Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2045'}, {'symbol': 'EEMX', 'name': 'SPDR MSCI Emerging Markets Fuel Reserves Free', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12016'}, {'symbol': 'EET', 'name': 'ProShares Ultra MSCI Emerging Markets', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2050'}, {'symbol': 'EEX', 'name': 'Emerald Expositions Events Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12756'}, {'symbol': 'EFAD', 'name': 'ProShares Trust MSCI EAFE Dividend Growers', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9163'}, {'symbol': 'EFAV', 'name': 'iShares Edge MSCI Min Vol EAFE', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2053'}, {'symbol': 'EFBI', 'name': 'Eagle Financial Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13162'}, {'symbol': 'EFC', 'name': 'Ellington Financial LLC representing Limitied Liability Company Interests no par valu'}, {'symbol': 'EFF', 'name': 'Eaton vance Floating-Rate Income Plus Fund of Beneficial Interest'}, {'symbol': 'EFG', 'name': 'iShares MSCI EAFE Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2056'}, {'symbol': 'EFII', 'name': 'Electronics for Imaging Inc.'}, {'symbol': 'EFL', 'name': 'Eaton Vance Floating-Rate 2022 Target Term Trust of Beneficial Interest'}, {'symbol': 'EFO', 'name': 'ProShares Ultra MSCI EAFE', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2060'}, {'symbol': 'EFOI', 'name': 'Energy Focus Inc.'}, {'symbol': 'EFR', 'name': 'Eaton Vance Senior Floating-Rate Fund of Beneficial Interest'}, {'symbol': 'EFSC', 'name': 'Enterprise Financial Services Corporation'}, {'symbol': 'EFT', 'name': 'Eaton Vance Floating Rate Income Trust of Beneficial Interest'}, {'symbol': 'EFV', 'name': 'iShares MSCI EAFE Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2066'}, {'symbol': 'EFX', 'name': 'Equifax Inc.'}, {'symbol': 'EGAN', 'name': 'eGain Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2069'}, {'symbol': 'EGBN', 'name': 'Eagle Bancorp Inc.'}, {'symbol': 'EGF', 'name': 'Blackrock Enhanced Government Fund Inc.'}, {'symbol': 'EGHT', 'name': '8x8 Inc'}, {'symbol': 'EGI', 'name': 'Entree Resources Ltd.'}, {'symbol': 'EGIF', 'name': 'Eagle Growth and Income Opportunities Fund of Beneficial Interest'}, {'symbol': 'EGLE', 'name': 'Eagle Bulk Shipping Inc.'}, {'symbol': 'EGO', 'name': 'Eldorado Gold Corporation'}, {'symbol': 'EGOV', 'name': 'NIC Inc.'}, {'symbol': 'EGP', 'name': 'EastGroup Properties Inc.'}, {'symbol': 'EGRX', 'name': 'Eagle Pharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8254'}, {'symbol': 'EGY', 'name': 'VAALCO Energy Inc.'}, {'symbol': 'EHC', 'name': 'Encompass Health Corporation'}, {'symbol': 'EHI', 'name': 'Western Asset Global High Income Fund Inc'}, {'symbol': 'EHIC', 'name': 'eHi Car Services Limited American Depositary Shares'}, {'symbol': 'EHT', 'name': 'Eaton Vance High Income 2021 Target Term Trust of Beneficial Interest'}, {'symbol': 'EHTH', 'name': 'eHealth Inc.'}, {'symbol': 'EIDX', 'name': 'Eidos Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14677'}, {'symbol': 'EIG', 'name': 'Employers Holdings Inc'}, {'symbol': 'EIGI', 'name': 'Endurance International Group Holdings Inc.'}, {'symbol': 'EIGR', 'name': 'Eiger BioPharmaceuticals Inc.'}, {'symbol': 'EIM', 'name': 'Eaton Vance Municipal Bond Fund of Beneficial Interest $.01 par value'}, {'symbol': 'EIS', 'name': 'iShares Inc MSCI Israel', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2095'}, {'symbol': 'EIV', 'name': 'Eaton Vance Municipal Bond Fund II of Beneficial Interest $.01 Par Value'}, {'symbol': 'EIX', 'name': 'Edison International'}, {'symbol': 'EKSO', 'name': 'Ekso Bionics Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11702'}, {'symbol': 'EL', 'name': 'Estee Lauder Companies Inc. (The)'}, {'symbol': 'ELAN', 'name': 'Elanco Animal Health Incorporated'}, {'symbol': 'ELD', 'name': 'WisdomTree Emerging Markets Local Debt Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2102'}, {'symbol': 'ELF', 'name': 'e.l.f. Beauty Inc.'}, {'symbol': 'ELGX', 'name': 'Endologix Inc.'}, {'symbol': 'ELLI', 'name': 'Ellie Mae Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2105'}, {'symbol': 'ELLO', 'name': 'Ellomay Capital Ltd (Israel)'}, {'symbol': 'ELMD', 'name': 'Electromed Inc.'}, {'symbol': 'ELOX', 'name': 'Eloxx Pharmaceuticals Inc.'}, {'symbol': 'ELP', 'name': 'Companhia Paranaense de Energia (COPEL)'}, {'symbol': 'ELS', 'name': 'Equity Lifestyle Properties Inc.'}, {'symbol': 'ELSE', 'name': 'Electro-Sensors Inc.'}, {'symbol': 'ELTK', 'name': 'Eltek Ltd.'}, {'symbol': 'ELVT', 'name': 'Elevate Credit Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11013'}, {'symbol': 'ELY', 'name': 'Callaway Golf Company'}, {'symbol': 'EMAN', 'name': 'eMagin Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2121'}, {'symbol': 'EMBH', 'name': 'iShares Interest Rate Hedged Emerging Markets Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10325'}, {'symbol': 'EMCF', 'name': 'Emclaire Financial Corp', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2126'}, {'symbol': 'EMCI', 'name': 'EMC Insurance Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2127'}, {'symbol': 'EMD', 'name': 'Western Asset Emerging Markets Debt Fund Inc'}, {'symbol': 'EME', 'name': 'EMCOR Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2134'}, {'symbol': 'EMES', 'name': 'Emerge Energy Services LP representing Limited Partner Interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2135'}, {'symbol': 'EMF', 'name': 'Templeton Emerging Markets Fund'}, {'symbol': 'EMGF', 'name': 'iShares Edge MSCI Multifactor Emerging Markets', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10914'}, {'symbol': 'EMIF', 'name': 'iShares S&P Emerging Markets Infrastructure Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2142'}, {'symbol': 'EMITF', 'name': 'Elbit Imaging Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2143'}, {'symbol': 'EMKR', 'name': 'EMCORE Corporation'}, {'symbol': 'EML', 'name': 'Eastern Company (The)'}, {'symbol': 'EMLP', 'name': 'First Trust North American Energy Infrastructure Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2149'}, {'symbol': 'EMMS', 'name': 'Emmis Communications Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2150'}, {'symbol': 'EMN', 'name': 'Eastman Chemical Company'}, {'symbol': 'EMO', 'name': 'ClearBridge Energy Midstream Opportunity Fund Inc.'}, {'symbol': 'EMQQ', 'name': 'Emerging Markets Internet and Ecommerce ETF (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9491'}, {'symbol': 'EMR', 'name': 'Emerson Electric Company'}, {'symbol': 'EMSH', 'name': 'ProShares Short Term USD Emerging Markets Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8131'}, {'symbol': 'EMTY', 'name': 'ProShares Decline of the Retail Store', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13792'}, {'symbol': 'EMX', 'name': 'EMX Royalty Corporation (Canada)'}, {'symbol': 'ENB', 'name': 'Enbridge Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2161'}, {'symbol': 'ENBL', 'name': 'Enable Midstream Partners LP representing limited partner interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8523'}, {'symbol': 'ENDP', 'name': 'Endo International plc'}, {'symbol': 'ENFC', 'name': 'Entegra Financial Corp.'}, {'symbol': 'ENG', 'name': 'ENGlobal Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2164'}, {'symbol': 'ENIA', 'name': 'Enel Americas S.A. American Depositary Shares'}, {'symbol': 'ENIC', 'name': 'Enel Chile S.A. American Depositary Shares (Each representing 50 shares of)'}, {'symbol': 'ENLC', 'name': 'EnLink Midstream LLC representing Limited Partner Interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7636'}, {'symbol': 'ENOB', 'name': 'Enochian Biosciences Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15295'}, {'symbol': 'ENPH', 'name': 'Enphase Energy Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2173'}, {'symbol': 'ENR', 'name': 'Energizer Holdings Inc.'}, {'symbol': 'ENS', 'name': 'EnerSys', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2175'}, {'symbol': 'ENSG', 'name': 'The Ensign Group Inc.'}, {'symbol': 'ENSV', 'name': 'Enservco Corporation'}, {'symbol': 'ENT', 'name': 'Global Eagle Entertainment Inc.'}, {'symbol': 'ENTA', 'name': 'Enanta Pharmaceuticals Inc.'}, {'symbol': 'ENTG', 'name': 'Entegris Inc.'}, {'symbol': 'ENTX', 'name': 'Entera Bio Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13763'}, {'symbol': 'ENV', 'name': 'Envestnet Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2181'}, {'symbol': 'ENVA', 'name': 'Enova International Inc.'}, {'symbol': 'ENX', 'name': 'Eaton Vance New York Municipal Bond Fund of Beneficial Interest $.01 par value'}, {'symbol': 'ENZ', 'name': 'Enzo Biochem Inc. ($0.01 Par Value)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2185'}, {'symbol': 'EOD', 'name': 'Wells Fargo Global Dividend Opportunity Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2189'}, {'symbol': 'EOG', 'name': 'EOG Resources Inc.'}, {'symbol': 'EOI', 'name': 'Eaton Vance Enhance Equity Income Fundd Equity Income Fund Shares of Beneficial Interest'}, {'symbol': 'EOLS', 'name': 'Evolus Inc.'}, {'symbol': 'EOS', 'name': 'Eaton Vance Enhance Equity Income Fund II'}, {'symbol': 'EOT', 'name': 'Eaton Vance Municipal Income Trust EATON VANCE NATIONAL MUNICIPAL OPPORTUNITIES TRUST'}, {'symbol': 'EPAM', 'name': 'EPAM Systems Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2198'}, {'symbol': 'EPAY', 'name': 'Bottomline Technologies Inc.'}, {'symbol': 'EPC', 'name': 'Edgewell Personal Care Company'}, {'symbol': 'EPD', 'name': 'Enterprise Products Partners L.P.'}, {'symbol': 'EPE', 'name': 'EP Energy Corporation Class A'}, {'symbol': 'EPI', 'name': 'WisdomTree India Earnings Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2204'}, {'symbol': 'EPIX', 'name': 'ESSA Pharma Inc.'}, {'symbol': 'EPM', 'name': 'Evolution Petroleum Corporation Inc.'}, {'symbol': 'EPP', 'name': 'iShares MSCI Pacific Ex-Japan Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2210'}, {'symbol': 'EPR', 'name': 'EPR Properties'}, {'symbol': 'EPR-E', 'name': 'EPR Properties Series E Cumulative Conv Pfd Shs Ser E', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '2213'}, {'symbol': 'EPRF', 'name': 'Innovator S&P Investment Grade Preferred', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11402'}, {'symbol': 'EPRT', 'name': 'Essential Properties Realty Trust Inc.'}, {'symbol': 'EPU', 'name': 'iShares Trust MSCI Peru', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2216'}, {'symbol': 'EPZM', 'name': 'Epizyme Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2218'}, {'symbol': 'EQ', 'name': 'Equillium Inc.'}, {'symbol': 'EQBK', 'name': 'Equity Bancshares Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10685'}, {'symbol': 'EQC', 'name': 'Equity Commonwealth of Beneficial Interest'}, {'symbol': 'EQH', 'name': 'AXA Equitable Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14451'}, {'symbol': 'EQIX', 'name': 'Equinix Inc.'}, {'symbol': 'EQLT', 'name': 'Workplace Equality Portfolio', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8304'}, {'symbol': 'EQM', 'name': 'EQM Midstream Partners, LP'}, {'symbol': 'EQNR', 'name': 'Equinor ASA'}, {'symbol': 'EQR', 'name': 'Equity Residential of Beneficial Interest'}, {'symbol': 'EQS', 'name': 'Equus Total Return Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2223'}, {'symbol': 'EQT', 'name': 'EQT Corporation'}, {'symbol': 'EQWM', 'name': 'Invesco Russell Midcap Equal Weight', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5698'}, {'symbol': 'ERA', 'name': 'Era Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2227'}, {'symbol': 'ERC', 'name': 'Wells Fargo Multi-Sector Income Fund no par value'}, {'symbol': 'ERF', 'name': 'Enerplus Corporation'}, {'symbol': 'ERH', 'name': 'Wells Fargo Utilities and High Income Fund'}, {'symbol': 'ERI', 'name': 'Eldorado Resorts Inc.'}, {'symbol': 'ERIC', 'name': 'Ericsson'}, {'symbol': 'ERIE', 'name': 'Erie Indemnity Company'}, {'symbol': 'ERII', 'name': 'Energy Recovery Inc.'}, {'symbol': 'ERJ', 'name': 'Embraer S.A.'}, {'symbol': 'EROS', 'name': 'Eros International PLC A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8107'}, {'symbol': 'ERUS', 'name': 'iShares MSCI Russia', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2239'}, {'symbol': 'ERY', 'name': 'Direxion Daily Energy Bear 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2242'}, {'symbol': 'ERYP', 'name': 'Erytech Pharma S.A.'}, {'symbol': 'ES', 'name': 'Eversource Energy (D/B/A)'}, {'symbol': 'ESBA', 'name': 'Empire State Realty OP L.P. Series ES Operating Partnership Units Representing Limited Partnership Interests'}, {'symbol': 'ESBK', 'name': 'Elmira Savings Bank NY (The)'}, {'symbol': 'ESCA', 'name': 'Escalade Incorporated'}, {'symbol': 'ESE', 'name': 'ESCO Technologies Inc.'}, {'symbol': 'ESEA', 'name': 'Euroseas Ltd.'}, {'symbol': 'ESGD', 'name': 'iShares ESG MSCI EAFE ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11543'}, {'symbol': 'ESGF', 'name': 'Oppenheimer Global ESG Revenue', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12029'}, {'symbol': 'ESGL', 'name': 'Oppenheimer Revenue Weighted ETF Trust ESG Revenue', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12030'}, {'symbol': 'ESGR', 'name': 'Enstar Group Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2251'}, {'symbol': 'ESGRP', 'name': 'Enstar Group Limited Depositary Shares Each Representing 1/1000th of an interest in Preference Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14823'}, {'symbol': 'ESGU', 'name': 'iShares ESG MSCI USA ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12135'}, {'symbol': 'ESGW', 'name': 'Columbia Sustainable Global Equity Income', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11459'}, {'symbol': 'ESI', 'name': 'Element Solutions Inc.'}, {'symbol': 'ESL', 'name': 'Esterline Technologies Corporation'}, {'symbol': 'ESLT', 'name': 'Elbit Systems Ltd.'}, {'symbol': 'ESNC', 'name': 'EnSync Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7679'}, {'symbol': 'ESNT', 'name': 'Essent Group Ltd.'}, {'symbol': 'ESP', 'name': 'Espey Mfg. & Electronics Corp.'}, {'symbol': 'ESPR', 'name': 'Esperion Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2258'}, {'symbol': 'ESQ', 'name': 'Esquire Financial Holdings Inc.'}, {'symbol': 'ESRT', 'name': 'Empire State Realty Trust Inc. Class A'}, {'symbol': 'ESS', 'name': 'Essex Property Trust Inc.'}, {'symbol': 'ESSA', 'name': 'ESSA Bancorp Inc.'}, {'symbol': 'ESTA', 'name': 'Establishment Labs Holdings Inc.'}, {'symbol': 'ESTC', 'name': 'Elastic N.V.'}, {'symbol': 'ESTE', 'name': 'Earthstone Energy Inc. Class A'}, {'symbol': 'ESTR', 'name': 'Estre Ambiental Inc.'}, {'symbol': 'ESV', 'name': 'Ensco plc Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2266'}, {'symbol': 'ESXB', 'name': 'Community Bankers Trust Corporation.'}, {'symbol': 'ET', 'name': 'Energy Transfer LP'}, {'symbol': 'ETB', 'name': 'Eaton Vance Tax-Managed Buy-Write Income Fund of Beneficial Interest'}, {'symbol': 'ETFC', 'name': 'E*TRADE Financial Corporation'}, {'symbol': 'ETG', 'name': 'Eaton Vance Tax-Advantaged Global Dividend Income Fund of Beneficial Interest'}, {'symbol': 'ETH', 'name': 'Ethan Allen Interiors Inc.'}, {'symbol': 'ETJ', 'name': 'Eaton Vance Risk-Managed Diversified Equity Income Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2276'}, {'symbol': 'ETM', 'name': 'Entercom Communications Corp.'}, {'symbol': 'ETN', 'name': 'Eaton Corporation PLC'}, {'symbol': 'ETO', 'name': 'Eaton Vance Tax-Advantage Global Dividend Opp'}, {'symbol': 'ETON', 'name': 'Eton Pharmaceutcials Inc.'}, {'symbol': 'ETP-D', 'name': 'Energy Transfer Operating L.P. 7.625% Series D Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14868'}, {'symbol': 'ETR', 'name': 'Entergy Corporation'}, {'symbol': 'ETRN', 'name': 'Equitrans Midstream Corporation'}, {'symbol': 'ETSY', 'name': 'Etsy Inc.'}, {'symbol': 'ETTX', 'name': 'Entasis Therapeutics Holdings Inc.'}, {'symbol': 'ETV', 'name': 'Eaton Vance Corporation Tax-Managed Buy-Write Opportunities Fund of Beneficial Interest'}, {'symbol': 'ETW', 'name': 'Eaton Vance Corporation Tax-Managed Global Buy-Write Opportunites Fund of Beneficial Interest'}, {'symbol': 'ETX', 'name': 'Eaton Vance Municipal Income 2028 Term Trust of Beneficial Interest'}, {'symbol': 'ETY', 'name': 'Eaton Vance Tax-Managed Diversified Equity Income Fund of Beneficial Interest'}, {'symbol': 'EUDV', 'name': 'ProShares MSCI Europe Dividend Growers', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10491'}, {'symbol': 'EUFN', 'name': 'iShares MSCI Europe Financial Sector Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2290'}, {'symbol': 'EUM', 'name': 'ProShares Short MSCI Emerging Markets', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2292'}, {'symbol': 'EUO', 'name': 'ProShares UltraShort Euro', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2293'}, {'symbol': 'EURN', 'name': 'Euronav NV', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9688'}, {'symbol': 'EUSA', 'name': 'iShares MSCI USA Equal Weighted', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2294'}, {'symbol': 'EUXL', 'name': 'Direxion Daily EURO STOXX 50? Bull 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13109'}, {'symbol': 'EV', 'name': 'Eaton Vance Corporation'}, {'symbol': 'EVA', 'name': 'Enviva Partners LP representing limited partner interests'}, {'symbol': 'EVBG', 'name': 'Everbridge Inc.'}, {'symbol': 'EVBN', 'name': 'Evans Bancorp Inc.'}, {'symbol': 'EVC', 'name': 'Entravision Communications Corporation'}, {'symbol': 'EVER', 'name': 'EverQuote Inc.'}, {'symbol': 'EVF', 'name': 'Eaton Vance Senior Income Trust'}, {'symbol': 'EVFM', 'name': 'Evofem Biosciences Inc.'}, {'symbol': 'EVG', 'name': 'Eaton Vance Short Diversified Income Fund Duration Diversified Income Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2305'}, {'symbol': 'EVGN', 'name': 'Evogene Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8132'}, {'symbol': 'EVH', 'name': 'Evolent Health Inc Class A'}, {'symbol': 'EVI', 'name': 'EVI Industries Inc.'}, {'symbol': 'EVJ', 'name': 'Eaton Vance New Jersey Municipal Income Trust Shares of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2307'}, {'symbol': 'EVK', 'name': 'Ever-Glory International Group Inc.'}, {'symbol': 'EVLO', 'name': 'Evelo Biosciences Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14448'}, {'symbol': 'EVLV', 'name': 'EVINE Live Inc.'}, {'symbol': 'EVM', 'name': 'Eaton Vance California Municipal Bond Fund of Beneficial Interest $.01 par value'}, {'symbol': 'EVN', 'name': 'Eaton Vance Municipal Income Trust'}, {'symbol': 'EVOK', 'name': 'Evoke Pharma Inc.'}, {'symbol': 'EVOL', 'name': 'Evolving Systems Inc.'}, {'symbol': 'EVOP', 'name': 'EVO Payments Inc.'}, {'symbol': 'EVR', 'name': 'Evercore Inc. Class A'}, {'symbol': 'EVRG', 'name': 'Evergy Inc.'}, {'symbol': 'EVRI', 'name': 'Everi Holdings Inc.'}, {'symbol': 'EVT', 'name': 'Eaton Vance Tax Advantaged Dividend Income Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2317'}, {'symbol': 'EVTC', 'name': 'Evertec Inc.'}, {'symbol': 'EVV', 'name': 'Eaton Vance Limited Duration Income Fund of Beneficial Interest'}, {'symbol': 'EVY', 'name': 'Eaton Vance New York Municipal Income Trust Shares of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2321'}, {'symbol': 'EW', 'name': 'Edwards Lifesciences Corporation'}, {'symbol': 'EWBC', 'name': 'East West Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2325'}, {'symbol': 'EWCO', 'name': 'Invesco S&P 500 Equal Weight Communication Services', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15210'}, {'symbol': 'EWEM', 'name': 'Invesco MSCI Emerging Markets Equal Country Weight', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14385'}, {'symbol': 'EWGS', 'name': 'Ishares MSCI Germany Small Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2331'}, {'symbol': 'EWI', 'name': 'iShares Inc MSCI Italy', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2334'}, {'symbol': 'EWK', 'name': 'iShares Inc MSCI Belgium', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2336'}, {'symbol': 'EWM', 'name': 'iShares MSCI Malaysia Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2338'}, {'symbol': 'EWN', 'name': 'iShares MSCI Netherlands Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2339'}, {'symbol': 'EWP', 'name': 'iShares Inc MSCI Spain', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2341'}, {'symbol': 'EWRE', 'name': 'Invesco S&P 500 Equal Weight Real Estate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14387'}, {'symbol': 'EWSC', 'name': 'Invesco S&P SmallCap 600 Equal Weight', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14388'}, {'symbol': 'EWU', 'name': 'iShares MSCI United Kingdom', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2349'}, {'symbol': 'EWV', 'name': 'ProShares UltraShort MSCI Japan', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2351'}, {'symbol': 'EWX', 'name': 'SPDR S&P Emerging Markets Small Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2353'}, {'symbol': 'EWZ', 'name': 'iShares Inc MSCI Brazil', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2355'}, {'symbol': 'EXAS', 'name': 'Exact Sciences Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2361'}, {'symbol': 'EXC', 'name': 'Exelon Corporation'}, {'symbol': 'EXD', 'name': 'Eaton Vance Tax-Advantaged Bond of Beneficial Interest'}, {'symbol': 'EXEL', 'name': 'Exelixis Inc.'}, {'symbol': 'EXFO', 'name': 'EXFO Inc'}, {'symbol': 'EXG', 'name': 'Eaton Vance Tax-Managed Global Diversified Equity Income Fund of Beneficial Interest'}, {'symbol': 'EXIV', 'name': 'VelocityShares 1x Daily Inverse VSTOXX Futures ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12859'}, {'symbol': 'EXK', 'name': 'Endeavour Silver Corporation (Canada)'}, {'symbol': 'EXLS', 'name': 'ExlService Holdings Inc.'}, {'symbol': 'EXP', 'name': 'Eagle Materials Inc'}, {'symbol': 'EXPD', 'name': 'Expeditors International of Washington Inc.'}, {'symbol': 'EXPE', 'name': 'Expedia Group Inc.'}, {'symbol': 'EXPI', 'name': 'eXp World Holdings Inc.'}, {'symbol': 'EXPO', 'name': 'Exponent Inc.'}, {'symbol': 'EXPR', 'name': 'Express Inc.'}, {'symbol': 'EXR', 'name': 'Extra Space Storage Inc'}, {'symbol': 'EXTN', 'name': 'Exterran Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10302'}, {'symbol': 'EXTR', 'name': 'Extreme Networks Inc.'}, {'symbol': 'EYE', 'name': 'National Vision Holdings Inc.'}, {'symbol': 'EYEG', 'name': 'Eyegate Pharmaceuticals Inc.'}, {'symbol': 'EYEN', 'name': 'Eyenovia Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13934'}, {'symbol': 'EYES', 'name': 'Second Sight Medical Products Inc.'}, {'symbol': 'EYLD', 'name': 'Cambria ETF Trust Emerging Shareholder Yield', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11603'}, {'symbol': 'EYPT', 'name': 'EyePoint Pharmaceuticals Inc.'}, {'symbol': 'EZJ', 'name': 'ProShares Ultra MSCI Japan', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2386'}, {'symbol': 'EZPW', 'name': 'EZCORP Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2388'}, {'symbol': 'EZU', 'name': 'iShares MSCI Eurozone', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2389'}, {'symbol': 'F', 'name': 'Ford Motor Company'}, {'symbol': 'FAB', 'name': 'First Trust Multi Cap Value AlphaDEX Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2392'}, {'symbol': 'FAF', 'name': 'First American Corporation (New)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2395'}, {'symbol': 'FAM', 'name': 'First Trust/Aberdeen Global Opportunity Income Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2397'}, {'symbol': 'FAMI', 'name': 'Farmmi INC.'}, {'symbol': 'FANG', 'name': 'Diamondback Energy Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2399'}, {'symbol': 'FANH', 'name': 'Fanhua Inc.'}, {'symbol': 'FARM', 'name': 'Farmer Brothers Company'}, {'symbol': 'FARO', 'name': 'FARO Technologies Inc.'}, {'symbol': 'FAST', 'name': 'Fastenal Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2403'}, {'symbol': 'FAT', 'name': 'FAT Brands Inc.'}, {'symbol': 'FATE', 'name': 'Fate Therapeutics Inc.'}, {'symbol': 'FAX', 'name': 'Aberdeen Asia-Pacific Income Fund Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2406'}, {'symbol': 'FB', 'name': 'Facebook Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2408'}, {'symbol': 'FBC', 'name': 'Flagstar Bancorp Inc.'}, {'symbol': 'FBHS', 'name': 'Fortune Brands Home & Security Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2411'}, {'symbol': 'FBIO', 'name': 'Fortress Biotech Inc.'}, {'symbol': 'FBIZ', 'name': 'First Business Financial Services Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2412'}, {'symbol': 'FBK', 'name': 'FB Financial Corporation'}, {'symbol': 'FBM', 'name': 'Foundation Building Materials Inc.'}, {'symbol': 'FBMS', 'name': 'The First Bancshares Inc.'}, {'symbol': 'FBNC', 'name': 'First Bancorp'}, {'symbol': 'FBP', 'name': 'First BanCorp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2418'}, {'symbol': 'FBSS', 'name': 'Fauquier Bankshares Inc.'}, {'symbol': 'FBZ', 'name': 'First Trust Brazil AlphaDEX Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2424'}, {'symbol': 'FC', 'name': 'Franklin Covey Company'}, {'symbol': 'FCAL', 'name': 'First Trust California Municipal High income ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13031'}, {'symbol': 'FCAP', 'name': 'First Capital Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2428'}, {'symbol': 'FCAU', 'name': 'Fiat Chrysler Automobiles N.V.'}, {'symbol': 'FCBC', 'name': 'First Community Bankshares Inc.'}, {'symbol': 'FCBP', 'name': 'First Choice Bancorp'}, {'symbol': 'FCCO', 'name': 'First Community Corporation'}, {'symbol': 'FCCY', 'name': '1st Constitution Bancorp (NJ)'}, {'symbol': 'FCEL', 'name': 'FuelCell Energy Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2434'}, {'symbol': 'FCF', 'name': 'First Commonwealth Financial Corporation'}, {'symbol': 'FCFS', 'name': 'FirstCash Inc.'}, {'symbol': 'FCN', 'name': 'FTI Consulting Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2443'}, {'symbol': 'FCNCA', 'name': 'First Citizens BancShares Inc. Class A Common Stock'}, {'symbol': 'FCO', 'name': 'Aberdeen Global Income Fund Inc.'}, {'symbol': 'FCOR', 'name': 'Fidelity Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9356'}, {'symbol': 'FCPT', 'name': 'Four Corners Property Trust Inc.'}, {'symbol': 'FCSC', 'name': 'Fibrocell Science Inc.'}, {'symbol': 'FCT', 'name': 'First Trust Senior Floating Rate Income Fund II of Beneficial Interest'}, {'symbol': 'FCVT', 'name': 'First Trust SSI Strategic Convertible Securities E', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10792'}, {'symbol': 'FCX', 'name': 'Freeport-McMoRan Inc.'}, {'symbol': 'FDBC', 'name': 'Fidelity D & D Bancorp Inc.'}, {'symbol': 'FDC', 'name': 'First Data Corporation Class A'}, {'symbol': 'FDEF', 'name': 'First Defiance Financial Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2455'}, {'symbol': 'FDEU', 'name': 'First Trust Dynamic Europe Equity Income Fund of Beneficial Interest'}, {'symbol': 'FDIS', 'name': 'Fidelity MSCI Consumer Discretionary Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8027'}, {'symbol': 'FDL', 'name': 'First Trust Morningstar', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2457'}, {'symbol': 'FDM', 'name': 'First Trust DJ Select MicroCap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2458'}, {'symbol': 'FDN', 'name': 'First Trust DJ Internet Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2460'}, {'symbol': 'FDP', 'name': 'Fresh Del Monte Produce Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2462'}, {'symbol': 'FDS', 'name': 'FactSet Research Systems Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2463'}, {'symbol': 'FDTS', 'name': 'First Trust Developed Markets ex-US Small Cap AlphaDEX Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2465'}, {'symbol': 'FDUS', 'name': 'Fidus Investment Corporation'}, {'symbol': 'FDVV', 'name': 'Fidelity High Dividend', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11822'}, {'symbol': 'FDX', 'name': 'FedEx Corporation'}, {'symbol': 'FE', 'name': 'FirstEnergy Corp.'}, {'symbol': 'FEDU', 'name': 'Four Seasons Education (Cayman) Inc. American Depositary Shares each two ADSs representing one'}, {'symbol': 'FEI', 'name': 'First Trust MLP and Energy Income Fund of Beneficial Interest'}, {'symbol': 'FEIM', 'name': 'Frequency Electronics Inc.'}, {'symbol': 'FELE', 'name': 'Franklin Electric Co. Inc.'}, {'symbol': 'FELP', 'name': 'Foresight Energy LP representing Limited Partner Interests'}, {'symbol': 'FEMB', 'name': 'First Trust Emerging Markets Local Currency Bond E', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9464'}, {'symbol': 'FEN', 'name': 'First Trust Energy Income and Growth Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2477'}, {'symbol': 'FENC', 'name': 'Fennec Pharmaceuticals Inc.'}, {'symbol': 'FENG', 'name': 'Phoenix New Media Limited American Depositary Shares each representing 8 Class A.'}, {'symbol': 'FEO', 'name': 'First Trust/Aberdeen Emerging Opportunity Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2479'}, {'symbol': 'FET', 'name': 'Forum Energy Technologies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2482'}, {'symbol': 'FEUL', 'name': 'Credit Suisse FI Enhanced Europe 50 ETNs', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14536'}, {'symbol': 'FEX', 'name': 'First Trust Large Cap Core AlphaDEX Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2484'}, {'symbol': 'FEYE', 'name': 'FireEye Inc.'}, {'symbol': 'FF', 'name': 'FutureFuel Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2486'}, {'symbol': 'FFA', 'name': 'First Trust Enhanced Equity Income Fund'}, {'symbol': 'FFBC', 'name': 'First Financial Bancorp.'}, {'symbol': 'FFBW', 'name': 'FFBW Inc.'}, {'symbol': 'FFC', 'name': 'Flaherty & Crumrine Preferred Securities Income Fund Incorporated'}, {'symbol': 'FFG', 'name': 'FBL Financial Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2493'}, {'symbol': 'FFHL', 'name': 'Fuwei Films (Holdings) Co. Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2494'}, {'symbol': 'FFIC', 'name': 'Flushing Financial Corporation'}, {'symbol': 'FFIN', 'name': 'First Financial Bankshares Inc.'}, {'symbol': 'FFIV', 'name': 'F5 Networks Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2497'}, {'symbol': 'FFNW', 'name': 'First Financial Northwest Inc.'}, {'symbol': 'FFSG', 'name': 'FormulaFolios Smart Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13675'}, {'symbol': 'FFTI', 'name': 'FormulaFolios Tactical Income', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12992'}, {'symbol': 'FFWM', 'name': 'First Foundation Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8565'}, {'symbol': 'FG', 'name': 'FGL Holdings'}, {'symbol': 'FGB', 'name': 'First Trust Specialty Finance and Financial Opportunities Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2504'}, {'symbol': 'FGBI', 'name': 'First Guaranty Bancshares Inc.'}, {'symbol': 'FGEN', 'name': 'FibroGen Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9453'}, {'symbol': 'FGP', 'name': 'Ferrellgas Partners L.P.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2508'}, {'symbol': 'FHB', 'name': 'First Hawaiian Inc.'}, {'symbol': 'FHLC', 'name': 'Fidelity MSCI Health Care Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8029'}, {'symbol': 'FHN', 'name': 'First Horizon National Corporation'}, {'symbol': 'FI', 'name': "Frank's International N.V.", 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7717'}, {'symbol': 'FIBK', 'name': 'First Interstate BancSystem Inc.'}, {'symbol': 'FICO', 'name': 'Fair Isaac Corproation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2515'}, {'symbol': 'FIDI', 'name': 'Fidelity International High Dividend', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14028'}, {'symbol': 'FIEE', 'name': 'UBS AG FI Enhanced Europe 50 ETN due February 12 2026', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11070'}, {'symbol': 'FIF', 'name': 'First Trust Energy Infrastructure Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2516'}, {'symbol': 'FII', 'name': 'Federated Investors Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2519'}, {'symbol': 'FINU', 'name': 'ProShares UltraPro Financial Select Sector', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2523'}, {'symbol': 'FINZ', 'name': 'ProShares UltraPro Short Financial Select Sector', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2524'}, {'symbol': 'FIS', 'name': 'Fidelity National Information Services Inc.'}, {'symbol': 'FISI', 'name': 'Financial Institutions Inc.'}, {'symbol': 'FISK', 'name': 'Empire State Realty OP L.P. Series 250 Operating Partnership Units Representing Limited Partnership Interests'}, {'symbol': 'FISV', 'name': 'Fiserv Inc.'}, {'symbol': 'FIT', 'name': 'Fitbit Inc. Class A'}, {'symbol': 'FITB', 'name': 'Fifth Third Bancorp'}, {'symbol': 'FIV', 'name': 'First Trust Senior Floating Rate 2022 Target Term Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12211'}, {'symbol': 'FIVE', 'name': 'Five Below Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2532'}, {'symbol': 'FIVN', 'name': 'Five9 Inc.'}, {'symbol': 'FIX', 'name': 'Comfort Systems USA Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2535'}, {'symbol': 'FIXX', 'name': 'Homology Medicines Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14221'}, {'symbol': 'FIZZ', 'name': 'National Beverage Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2536'}, {'symbol': 'FKO', 'name': 'First Trust South Korea AlphaDEX Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2538'}, {'symbol': 'FL', 'name': 'Foot Locker Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2540'}, {'symbol': 'FLAT', 'name': 'iPath US Treasury Flattener ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2542'}, {'symbol': 'FLAX', 'name': 'Franklin FTSE Asia ex Japan', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14127'}, {'symbol': 'FLBR', 'name': 'Franklin FTSE Brazil', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13705'}, {'symbol': 'FLC', 'name': 'Flaherty & Crumrine Total Return Fund Inc'}, {'symbol': 'FLCH', 'name': 'Franklin FTSE China', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13707'}, {'symbol': 'FLDM', 'name': 'Fluidigm Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2544'}, {'symbol': 'FLEE', 'name': 'Franklin FTSE Europe', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13708'}, {'symbol': 'FLEU', 'name': 'Barclays ETN FI Enhanced Europe 50 ETN Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12048'}, {'symbol': 'FLEX', 'name': 'Flex Ltd.'}, {'symbol': 'FLF', 'name': 'Federal Life Group Inc.'}, {'symbol': 'FLGB', 'name': 'Franklin FTSE United Kingdom', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13711'}, {'symbol': 'FLGR', 'name': 'Franklin FTSE Germany', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13712'}, {'symbol': 'FLGT', 'name': 'Fulgent Genetics Inc.'}, {'symbol': 'FLHY', 'name': 'Franklin Liberty High Yield Corporate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14694'}, {'symbol': 'FLIC', 'name': 'The First of Long Island Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2546'}, {'symbol': 'FLIO', 'name': 'Franklin Liberty International Opportunities', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12328'}, {'symbol': 'FLIR', 'name': 'FLIR Systems Inc.'}, {'symbol': 'FLJH', 'name': 'Franklin FTSE Japan Hedged', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13715'}, {'symbol': 'FLKR', 'name': 'Franklin FTSE South Korea', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13717'}, {'symbol': 'FLKS', 'name': 'Flex Pharma Inc.'}, {'symbol': 'FLL', 'name': 'Full House Resorts Inc.'}, {'symbol': 'FLLV', 'name': 'Franklin Liberty U.S. Low Volatility', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11865'}, {'symbol': 'FLMB', 'name': 'Franklin Templeton ETF Trust Liberty Municipal Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13340'}, {'symbol': 'FLMN', 'name': 'Falcon Minerals Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13257'}, {'symbol': 'FLMX', 'name': 'Franklin FTSE Mexico', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13718'}, {'symbol': 'FLNT', 'name': 'Fluent Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3415'}, {'symbol': 'FLO', 'name': 'Flowers Foods Inc.'}, {'symbol': 'FLOW', 'name': 'SPX FLOW Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10517'}, {'symbol': 'FLQE', 'name': 'Franklin LibertyQ Emerging Markets', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11432'}, {'symbol': 'FLQH', 'name': 'Franklin LibertyQ International Equity Hedged', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11434'}, {'symbol': 'FLQM', 'name': 'Franklin LibertyQ U.S. Mid Cap Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12821'}, {'symbol': 'FLR', 'name': 'Fluor Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2555'}, {'symbol': 'FLRT', 'name': 'AdvisorShares Pacific Asset Enhanced Floating Rate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9754'}, {'symbol': 'FLS', 'name': 'Flowserve Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2557'}, {'symbol': 'FLSW', 'name': 'Franklin FTSE Switzerland', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14130'}, {'symbol': 'FLT', 'name': 'FleetCor Technologies Inc.'}, {'symbol': 'FLTR', 'name': 'VanEck Vectors Investment Grade Floating Rate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2559'}, {'symbol': 'FLWS', 'name': '1-800 FLOWERS.COM Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2561'}, {'symbol': 'FLXN', 'name': 'Flexion Therapeutics Inc.'}, {'symbol': 'FLXS', 'name': 'Flexsteel Industries Inc.'}, {'symbol': 'FLY', 'name': 'Fly Leasing Limited'}, {'symbol': 'FM', 'name': 'iShares MSCI Frontier 100 Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2564'}, {'symbol': 'FMAO', 'name': 'Farmers & Merchants Bancorp Inc.'}, {'symbol': 'FMB', 'name': 'First Trust Managed Municipal ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8626'}, {'symbol': 'FMBH', 'name': 'First Mid-Illinois Bancshares Inc.'}, {'symbol': 'FMBI', 'name': 'First Midwest Bancorp Inc.'}, {'symbol': 'FMC', 'name': 'FMC Corporation'}, {'symbol': 'FMCI', 'name': 'Forum Merger II Corporation'}, {'symbol': 'FMCIW', 'name': 'Forum Merger II Corporation Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15014'}, {'symbol': 'FMHI', 'name': 'First Trust Municipal High Income ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13685'}, {'symbol': 'FMN', 'name': 'Federated Premier Municipal Income Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2573'}, {'symbol': 'FMNB', 'name': 'Farmers National Banc Corp.'}, {'symbol': 'FMO', 'name': 'Fiduciary/Claymore Energy Infrastructure Fund of Beneficial Interest'}, {'symbol': 'FMS', 'name': 'Fresenius Medical Care AG'}, {'symbol': 'FMX', 'name': 'Fomento Economico Mexicano S.A.B. de C.V.'}, {'symbol': 'FMY', 'name': 'First Trust Motgage Income Fund of Beneficial Interest'}, {'symbol': 'FN', 'name': 'Fabrinet'}, {'symbol': 'FNB', 'name': 'F.N.B. Corporation'}, {'symbol': 'FNCB', 'name': 'FNCB Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14227'}, {'symbol': 'FND', 'name': 'Floor & Decor Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9486'}, {'symbol': 'FNDB', 'name': 'Schwab Fundamental U.S. Broad Market Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7729'}, {'symbol': 'FNDE', 'name': 'Schwab Fundamental Emerging Markets Large Company Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7731'}, {'symbol': 'FNDX', 'name': 'Schwab Fundamental U.S. Large Company Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7733'}, {'symbol': 'FNF', 'name': 'FNF Group of Fidelity National Financial Inc.'}, {'symbol': 'FNGD', 'name': 'MicroSectors FANG Index -3X Inverse Leveraged ETNs due January 8 2038', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14072'}, {'symbol': 'FNGU', 'name': 'MicroSectors FANG Index 3X Leveraged ETNs due January 8 2038', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14073'}, {'symbol': 'FNHC', 'name': 'FedNat Holding Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2586'}, {'symbol': 'FNJN', 'name': 'Finjan Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8620'}, {'symbol': 'FNKO', 'name': 'Funko Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13521'}, {'symbol': 'FNLC', 'name': 'First Bancorp Inc (ME)'}, {'symbol': 'FNSR', 'name': 'Finisar Corporation'}, {'symbol': 'FNV', 'name': 'Franco-Nevada Corporation'}, {'symbol': 'FNWB', 'name': 'First Northwest Bancorp'}, {'symbol': 'FNY', 'name': 'First Trust Mid Cap Growth AlphaDEX Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2595'}, {'symbol': 'FOCS', 'name': 'Focus Financial Partners Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14832'}, {'symbol': 'FOE', 'name': 'Ferro Corporation'}, {'symbol': 'FOF', 'name': 'Cohen & Steers Closed-End Opportunity Fund Inc.'}, {'symbol': 'FOLD', 'name': 'Amicus Therapeutics Inc.'}, {'symbol': 'FOMX', 'name': 'Foamix Pharmaceuticals Ltd.'}, {'symbol': 'FONR', 'name': 'Fonar Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2602'}, {'symbol': 'FOR', 'name': 'Forestar Group Inc'}, {'symbol': 'FORD', 'name': 'Forward Industries Inc.'}, {'symbol': 'FORK', 'name': 'Fuling Global Inc.'}, {'symbol': 'FORM', 'name': 'FormFactor Inc.'}, {'symbol': 'FORR', 'name': 'Forrester Research Inc.'}, {'symbol': 'FORTY', 'name': 'Formula Systems (1985) Ltd. ADS represents 1 ordinary shares'}, {'symbol': 'FOSL', 'name': 'Fossil Group Inc.'}, {'symbol': 'FOX', 'name': 'Twenty-First Century Fox Inc.'}, {'symbol': 'FOXA', 'name': 'Twenty-First Century Fox Inc.'}, {'symbol': 'FOXF', 'name': 'Fox Factory Holding Corp.'}, {'symbol': 'FPAC', 'name': 'Far Point Acquisition Corporation Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14774'}, {'symbol': 'FPAC=', 'name': 'Far Point Acquisition Corporation Units each consisting of one share of Class A common stock $0.0001 par value and one-third of one redeemable warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14665'}, {'symbol': 'FPAY', 'name': 'FlexShopper Inc.'}, {'symbol': 'FPE', 'name': 'First Trust Preferred Securities and Income ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2613'}, {'symbol': 'FPF', 'name': 'First Trust Intermediate Duration Preferred & Income Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2614'}, {'symbol': 'FPH', 'name': 'Five Point Holdings LLC Class A'}, {'symbol': 'FPI', 'name': 'Farmland Partners Inc.'}, {'symbol': 'FPI-B', 'name': 'Farmland Partners Inc. Series B Participating Preferred Stock'}, {'symbol': 'FPL', 'name': 'First Trust New Opportunities MLP & Energy Fund of Beneficial Interest'}, {'symbol': 'FPRX', 'name': 'Five Prime Therapeutics Inc.'}, {'symbol': 'FPXE', 'name': 'First Trust IPOX Europe Equity Opportunities ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15108'}, {'symbol': 'FQAL', 'name': 'Fidelity Quality Factor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11823'}, {'symbol': 'FR', 'name': 'First Industrial Realty Trust Inc.'}, {'symbol': 'FRA', 'name': 'Blackrock Floating Rate Income Strategies Fund Inc'}, {'symbol': 'FRAC', 'name': 'Keane Group Inc.'}, {'symbol': 'FRAN', 'name': "Francesca's Holdings Corporation", 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2623'}, {'symbol': 'FRBA', 'name': 'First Bank'}, {'symbol': 'FRBK', 'name': 'Republic First Bancorp Inc.'}, {'symbol': 'FRC', 'name': 'FIRST REPUBLIC BANK'}, {'symbol': 'FRC-F', 'name': 'FIRST REPUBLIC BANK Depositary Shares Series F', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '10049'}, {'symbol': 'FRC-H', 'name': 'FIRST REPUBLIC BANK Depositary Shares Series H', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13018'}, {'symbol': 'FRD', 'name': 'Friedman Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2630'}, {'symbol': 'FRED', 'name': "Fred's Inc."}, {'symbol': 'FRGI', 'name': 'Fiesta Restaurant Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2634'}, {'symbol': 'FRLG', 'name': 'Large Cap Growth Index-Linked Exchange Traded Notes due 2028', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14331'}, {'symbol': 'FRME', 'name': 'First Merchants Corporation'}, {'symbol': 'FRO', 'name': 'Frontline Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2640'}, {'symbol': 'FRPH', 'name': 'FRP Holdings Inc.'}, {'symbol': 'FRPT', 'name': 'Freshpet Inc.'}, {'symbol': 'FRSH', 'name': "Papa Murphy's Holdings Inc."}, {'symbol': 'FRSX', 'name': 'Foresight Autonomous Holdings Ltd.'}, {'symbol': 'FRT', 'name': 'Federal Realty Investment Trust'}, {'symbol': 'FRTA', 'name': 'Forterra Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11714'}, {'symbol': 'FSB', 'name': 'Franklin Financial Network Inc.'}, {'symbol': 'FSBC', 'name': 'FSB Bancorp Inc.'}, {'symbol': 'FSBW', 'name': 'FS Bancorp Inc.'}, {'symbol': 'FSCT', 'name': 'ForeScout Technologies Inc.'}, {'symbol': 'FSD', 'name': 'First Trust High Income Long Short Fund of Beneficial Interest'}, {'symbol': 'FSFG', 'name': 'First Savings Financial Group Inc.'}, {'symbol': 'FSI', 'name': 'Flexible Solutions International Inc. (CDA)'}, {'symbol': 'FSK', 'name': 'FS KKR Capital Corp.'}, {'symbol': 'FSLR', 'name': 'First Solar Inc.'}, {'symbol': 'FSM', 'name': 'Fortuna Silver Mines Inc (Canada)'}, {'symbol': 'FSNN', 'name': 'Fusion Connect Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8703'}, {'symbol': 'FSP', 'name': 'Franklin Street Properties Corp.'}, {'symbol': 'FSS', 'name': 'Federal Signal Corporation'}, {'symbol': 'FSTR', 'name': 'L.B. Foster Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2666'}, {'symbol': 'FSV', 'name': 'FirstService Corporation'}, {'symbol': 'FT', 'name': 'Franklin Universal Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2670'}, {'symbol': 'FTAC', 'name': 'FinTech Acquisition Corp. III', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15354'}, {'symbol': 'FTACW', 'name': 'FinTech Acquisition Corp. III Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15363'}, {'symbol': 'FTAI', 'name': 'Fortress Transportation and Infrastructure Investors LLC', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9963'}, {'symbol': 'FTCH', 'name': 'Farfetch Limited Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14995'}, {'symbol': 'FTD', 'name': 'FTD Companies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7999'}, {'symbol': 'FTDR', 'name': 'frontdoor inc.'}, {'symbol': 'FTEK', 'name': 'Fuel Tech Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2674'}, {'symbol': 'FTEO', 'name': 'FRONTEO Inc.'}, {'symbol': 'FTF', 'name': 'Franklin Limited Duration Income Trust of Beneficial Interest'}, {'symbol': 'FTFT', 'name': 'Future FinTech Group Inc.'}, {'symbol': 'FTHI', 'name': 'First Trust BuyWrite Income ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8191'}, {'symbol': 'FTI', 'name': 'TechnipFMC plc'}, {'symbol': 'FTK', 'name': 'Flotek Industries Inc.'}, {'symbol': 'FTLS', 'name': 'First Trust Long/Short Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9230'}, {'symbol': 'FTNT', 'name': 'Fortinet Inc.'}, {'symbol': 'FTNW', 'name': 'FTE Networks Inc.'}, {'symbol': 'FTR', 'name': 'Frontier Communications Corporation'}, {'symbol': 'FTS', 'name': 'Fortis Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11965'}, {'symbol': 'FTSI', 'name': 'FTS International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13677'}, {'symbol': 'FTSM', 'name': 'First Trust Enhanced Short Maturity ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9119'}, {'symbol': 'FTSV', 'name': 'Forty Seven Inc.'}, {'symbol': 'FTV', 'name': 'Fortive Corporation'}, {'symbol': 'FTVA', 'name': 'Aptus Fortified Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13678'}, {'symbol': 'FTXG', 'name': 'First Trust Nasdaq Food & Beverage ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11850'}, {'symbol': 'FTXL', 'name': 'First Trust Nasdaq Semiconductor ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11852'}, {'symbol': 'FTXO', 'name': 'First Trust Nasdaq Bank ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11854'}, {'symbol': 'FUD', 'name': 'E-TRACS USB Bloomberg Commodity Index Exchange Traded Notes UBS Bloomberg CMCI Food ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2686'}, {'symbol': 'FUL', 'name': 'H. B. Fuller Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2688'}, {'symbol': 'FULT', 'name': 'Fulton Financial Corporation'}, {'symbol': 'FUN', 'name': 'Cedar Fair L.P.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2692'}, {'symbol': 'FUNC', 'name': 'First United Corporation'}, {'symbol': 'FUND', 'name': 'Sprott Focus Trust Inc.'}, {'symbol': 'FUSB', 'name': 'First US Bancshares Inc.'}, {'symbol': 'FUTY', 'name': 'Fidelity MSCI Utilities Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8033'}, {'symbol': 'FUV', 'name': 'Arcimoto Inc.'}, {'symbol': 'FVAL', 'name': 'Fidelity Value Factor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11824'}, {'symbol': 'FVCB', 'name': 'FVCBankcorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15021'}, {'symbol': 'FVE', 'name': 'Five Star Senior Living Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2699'}, {'symbol': 'FWDB', 'name': 'Madrona Global Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2702'}, {'symbol': 'FWDI', 'name': 'Madrona International', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2704'}, {'symbol': 'FWONA', 'name': 'Liberty Media Corporation Series A'}, {'symbol': 'FWONK', 'name': 'Liberty Media Corporation Series C'}, {'symbol': 'FWP', 'name': 'Forward Pharma A/S'}, {'symbol': 'FWRD', 'name': 'Forward Air Corporation'}, {'symbol': 'FXB', 'name': 'Invesco CurrencyShares British Pound Sterling Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2710'}, {'symbol': 'FXCH', 'name': 'Invesco CurrencyShares Chinese Renminbi Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2713'}, {'symbol': 'FXE', 'name': 'Invesco CurrencyShares Euro Currency Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2716'}, {'symbol': 'FXG', 'name': 'First Trust Cons. Staples AlphaDEX', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2719'}, {'symbol': 'FXI', 'name': 'iShares China Large-Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2721'}, {'symbol': 'FXN', 'name': 'First Trust Energy AlphaDEX Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2723'}, {'symbol': 'FXP', 'name': 'ProShares Ultrashort FTSE China 50', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2725'}, {'symbol': 'FXS', 'name': 'Invesco CurrencyShares Swedish Krona Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2727'}, {'symbol': 'FXU', 'name': 'First Trust Utilities AlphaDEX Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2729'}, {'symbol': 'FXZ', 'name': 'First Trust Materials AlphaDEX Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2731'}, {'symbol': 'FYLD', 'name': 'Cambria Foreign Shareholder Yield', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8141'}, {'symbol': 'FYX', 'name': 'First Trust Small Cap Core AlphaDEX Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2734'}, {'symbol': 'G', 'name': 'Genpact Limited'}, {'symbol': 'GAB', 'name': 'Gabelli Equity Trust Inc. (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2737'}, {'symbol': 'GAB-G', 'name': 'Gabelli Equity Trust Inc. (The) Series G Cumulative Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '2739'}, {'symbol': 'GAB-J', 'name': 'Gabelli Equity Trust Inc. (The) 5.45% Series J Cumulative Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11207'}, {'symbol': 'GABC', 'name': 'German American Bancorp Inc.'}, {'symbol': 'GAIA', 'name': 'Gaia Inc.'}, {'symbol': 'GAIN', 'name': 'Gladstone Investment Corporation'}, {'symbol': 'GAINM', 'name': 'Gladstone Investment Corporation 6.25% Series D Cumulative Term Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11898'}, {'symbol': 'GALT', 'name': 'Galectin Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2750'}, {'symbol': 'GAM', 'name': 'General American Investors Inc.'}, {'symbol': 'GAMR', 'name': 'ETFMG Video Game Tech', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11128'}, {'symbol': 'GARS', 'name': 'Garrison Capital Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2755'}, {'symbol': 'GASS', 'name': 'StealthGas Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2758'}, {'symbol': 'GATX', 'name': 'GATX Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2929'}, {'symbol': 'GBAB', 'name': 'Guggenheim Taxable Municipal Managed Duration Trust of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2764'}, {'symbol': 'GBCI', 'name': 'Glacier Bancorp Inc.'}, {'symbol': 'GBDC', 'name': 'Golub Capital BDC Inc.'}, {'symbol': 'GBIL', 'name': 'Goldman Sachs Access Treasury 0-1 Year', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11796'}, {'symbol': 'GBL', 'name': 'Gamco Investors Inc.'}, {'symbol': 'GBLI', 'name': 'Global Indemnity Limited'}, {'symbol': 'GBLIZ', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14594'}, {'symbol': 'GBR', 'name': 'New Concept Energy Inc'}, {'symbol': 'GBT', 'name': 'Global Blood Therapeutics Inc.'}, {'symbol': 'GBX', 'name': 'Greenbrier Companies Inc. (The)'}, {'symbol': 'GCAP', 'name': 'GAIN Capital Holdings Inc.'}, {'symbol': 'GCBC', 'name': 'Greene County Bancorp Inc.'}, {'symbol': 'GCE', 'name': 'Clarymore CEF GS Connect ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2779'}, {'symbol': 'GCI', 'name': 'Gannett Co. Inc.'}, {'symbol': 'GCO', 'name': 'Genesco Inc.'}, {'symbol': 'GCP', 'name': 'GCP Applied Technologies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11033'}, {'symbol': 'GCV', 'name': 'Gabelli Convertible and Income Securities Fund Inc. (The)'}, {'symbol': 'GCVRZ', 'name': 'Sanofi Contingent Value Right (Expiring 12/31/2020)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2786'}, {'symbol': 'GD', 'name': 'General Dynamics Corporation'}, {'symbol': 'GDDY', 'name': 'GoDaddy Inc. Class A'}, {'symbol': 'GDEN', 'name': 'Golden Entertainment Inc.'}, {'symbol': 'GDI', 'name': 'Gardner Denver Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12896'}, {'symbol': 'GDL', 'name': 'GDL Fund The of Beneficial Interest'}, {'symbol': 'GDMA', 'name': 'GadsdenA DynamicA Multi-AssetA', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15226'}, {'symbol': 'GDO', 'name': 'Western Asset Global Corporate Defined Opportunity Fund Inc.'}, {'symbol': 'GDOT', 'name': 'Green Dot Corporation Class A $0.001 par value'}, {'symbol': 'GDP', 'name': 'Goodrich Petroleum Corporation'}, {'symbol': 'GDS', 'name': 'GDS Holdings Limited'}, {'symbol': 'GDV', 'name': 'Gabelli Dividend & Income Trust of Beneficial Interest'}, {'symbol': 'GDV-D', 'name': 'Gabelli Dividend Pfd Series D', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '2799'}, {'symbol': 'GDVD', 'name': 'Principal Active Global Dividend Income', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12892'}, {'symbol': 'GDXJ', 'name': 'VanEck Vectors Junior Gold Miners', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2801'}, {'symbol': 'GDXX', 'name': 'ProShares Ultra Gold Miners', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9745'}, {'symbol': 'GE', 'name': 'General Electric Company'}, {'symbol': 'GEC', 'name': 'Great Elm Capital Group Inc.'}, {'symbol': 'GECC', 'name': 'Great Elm Capital Corp.'}, {'symbol': 'GECCM', 'name': 'Great Elm Capital Corp. 6.75% Notes Due 2025', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14075'}, {'symbol': 'GEF', 'name': 'Greif Inc. Class A'}, {'symbol': 'GEF.B', 'name': 'Greif Inc. Corporation Class B'}, {'symbol': 'GEL', 'name': 'Genesis Energy L.P.'}, {'symbol': 'GEMP', 'name': 'Gemphire Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11261'}, {'symbol': 'GEN', 'name': 'Genesis Healthcare Inc.'}, {'symbol': 'GENC', 'name': 'Gencor Industries Inc.'}, {'symbol': 'GENE', 'name': 'Genetic Technologies Ltd'}, {'symbol': 'GEO', 'name': 'Geo Group Inc (The) REIT', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2814'}, {'symbol': 'GEOS', 'name': 'Geospace Technologies Corporation'}, {'symbol': 'GER', 'name': 'Goldman Sachs MLP Energy Renaissance Fund'}, {'symbol': 'GERN', 'name': 'Geron Corporation'}, {'symbol': 'GES', 'name': 'Guess? Inc.'}, {'symbol': 'GEVO', 'name': 'Gevo Inc.'}, {'symbol': 'GF', 'name': 'New Germany Fund Inc. (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2823'}, {'symbol': 'GFED', 'name': 'Guaranty Federal Bancshares Inc.'}, {'symbol': 'GFF', 'name': 'Griffon Corporation'}, {'symbol': 'GFI', 'name': 'Gold Fields Limited American Depositary Shares'}, {'symbol': 'GFN', 'name': 'General Finance Corporation'}, {'symbol': 'GFNSL', 'name': 'General Finance Corporation Senior Notes due 2021', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8746'}, {'symbol': 'GFY', 'name': 'Western Asset Variable Rate Strategic Fund Inc.'}, {'symbol': 'GG', 'name': 'Goldcorp Inc.'}, {'symbol': 'GGAL', 'name': 'Grupo Financiero Galicia S.A.'}, {'symbol': 'GGB', 'name': 'Gerdau S.A.'}, {'symbol': 'GGG', 'name': 'Graco Inc.'}, {'symbol': 'GGM', 'name': 'Guggenheim Credit Allocation Fund of Beneficial Interest'}, {'symbol': 'GGN', 'name': 'GAMCO Global Gold Natural Resources & Income Trust'}, {'symbol': 'GGO', 'name': 'The Gabelli Go Anywhere Trust of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12025'}, {'symbol': 'GGT', 'name': 'Gabelli Multi-Media Trust Inc. (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2846'}, {'symbol': 'GGT-E', 'name': 'Gabelli Multi-Media Trust Inc. (The) 5.125% Series E Cumulative Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13469'}, {'symbol': 'GGZ', 'name': 'Gabelli Global Small and Mid Cap Value Trust (The) of Beneficial Interest'}, {'symbol': 'GH', 'name': 'Guardant Health Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14992'}, {'symbol': 'GHC', 'name': 'Graham Holdings Company'}, {'symbol': 'GHDX', 'name': 'Genomic Health Inc.'}, {'symbol': 'GHG', 'name': 'GreenTree Hospitality Group Ltd. American depositary shares each representing one Class A'}, {'symbol': 'GHL', 'name': 'Greenhill & Co. Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2850'}, {'symbol': 'GHM', 'name': 'Graham Corporation'}, {'symbol': 'GHY', 'name': 'PGIM Global Short Duration High Yield Fund Inc.'}, {'symbol': 'GHYG', 'name': 'iShares US & Intl High Yield Corp Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2853'}, {'symbol': 'GIB', 'name': 'CGI Inc.'}, {'symbol': 'GIFI', 'name': 'Gulf Island Fabrication Inc.'}, {'symbol': 'GIG', 'name': 'GigCapital Inc.'}, {'symbol': 'GIG=', 'name': 'GigCapital Inc. Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '13890'}, {'symbol': 'GIGM', 'name': 'GigaMedia Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2858'}, {'symbol': 'GII', 'name': 'SPDR S&P Global Infrastructure', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2859'}, {'symbol': 'GIII', 'name': 'G-III Apparel Group LTD.'}, {'symbol': 'GIL', 'name': 'Gildan Activewear Inc. Class A Sub. Vot.'}, {'symbol': 'GILD', 'name': 'Gilead Sciences Inc.'}, {'symbol': 'GILT', 'name': 'Gilat Satellite Networks Ltd.'}, {'symbol': 'GIM', 'name': 'Templeton Global Income Fund Inc.'}, {'symbol': 'GIS', 'name': 'General Mills Inc.'}, {'symbol': 'GJO', 'name': 'Synthetic Fixed-Income Securities Inc. on behalf of STRATS(SM) Trust for Wal-Mart Stores Inc. Securities Series 2004-5', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2876'}, {'symbol': 'GJR', 'name': 'Synthetic Fixed-Income Securities Inc. STRATS Trust for Procter&Gamble Securities Series 2006-1', 'date': '2019-02-08', 'isEnabled': True, 'type': 'bo', 'iexId': '2878'}, {'symbol': 'GJT', 'name': 'Synthetic Fixed-Income Securities Inc. Floating Rate Structured Repackaged Asset-Backed Trust Securities Certificates Series 2006-3', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '2880'}, {'symbol': 'GKOS', 'name': 'Glaukos Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9989'}, {'symbol': 'GLAC', 'name': 'Greenland Acquisition Corporation'}, {'symbol': 'GLACU', 'name': 'Greenland Acquisition Corporation Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14796'}, {'symbol': 'GLAD', 'name': 'Gladstone Capital Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2885'}, {'symbol': 'GLADN', 'name': 'Gladstone Capital Corporation 6.00% Series 2024 Term Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13465'}, {'symbol': 'GLBS', 'name': 'Globus Maritime Limited'}, {'symbol': 'GLBZ', 'name': 'Glen Burnie Bancorp', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2888'}, {'symbol': 'GLDD', 'name': 'Great Lakes Dredge & Dock Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2893'}, {'symbol': 'GLDM', 'name': 'SPDR Gold MiniShares Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14765'}, {'symbol': 'GLG', 'name': 'China Bat Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7738'}, {'symbol': 'GLIBA', 'name': 'GCI Liberty Inc. Class A Common Stock'}, {'symbol': 'GLL', 'name': 'ProShares UltraShort Gold', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2897'}, {'symbol': 'GLMD', 'name': 'Galmed Pharmaceuticals Ltd.'}, {'symbol': 'GLNG', 'name': 'Golar LNG Limited'}, {'symbol': 'GLO', 'name': 'Clough Global Opportunities Fund'}, {'symbol': 'GLOB', 'name': 'Globant S.A.'}, {'symbol': 'GLOG', 'name': 'GasLog Ltd.'}, {'symbol': 'GLOP', 'name': 'GasLog Partners LP representing limited partnership interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8537'}, {'symbol': 'GLOP-B', 'name': 'GasLog Partners LP 8.200% Series B Cumulative Redeemable Perpetual Fixed to Floating Rate Preference Units', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14597'}, {'symbol': 'GLOW', 'name': 'Glowpoint Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2901'}, {'symbol': 'GLP', 'name': 'Global Partners LP representing Limited Partner Interests'}, {'symbol': 'GLPG', 'name': 'Galapagos NV', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9994'}, {'symbol': 'GLPI', 'name': 'Gaming and Leisure Properties Inc.'}, {'symbol': 'GLQ', 'name': 'Clough Global Equity Fund of Beneficial Interest'}, {'symbol': 'GLRE', 'name': 'Greenlight Reinsurance Ltd.'}, {'symbol': 'GLT', 'name': 'Glatfelter'}, {'symbol': 'GLU', 'name': 'Gabelli Global Utility of Beneficial Ownership', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2908'}, {'symbol': 'GLU-B', 'name': 'The Gabelli Global Utility and Income Trust Series B Cumulative Puttable and Callable Preferred Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '15325'}, {'symbol': 'GLUU', 'name': 'Glu Mobile Inc.'}, {'symbol': 'GLV', 'name': 'Clough Global Dividend and Income Fund of beneficial interest'}, {'symbol': 'GLW', 'name': 'Corning Incorporated'}, {'symbol': 'GLYC', 'name': 'GlycoMimetics Inc.'}, {'symbol': 'GM', 'name': 'General Motors Company'}, {'symbol': 'GM+B', 'name': 'General Motors Company Warrant (Expires 07/10/2019)'}, {'symbol': 'GMDA', 'name': 'Gamida Cell Ltd.'}, {'symbol': 'GME', 'name': 'GameStop Corporation'}, {'symbol': 'GMED', 'name': 'Globus Medical Inc. Class A'}, {'symbol': 'GMFL', 'name': 'Invesco Multi-Factor Large Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14390'}, {'symbol': 'GMLP', 'name': 'Golar LNG Partners LP', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2925'}, {'symbol': 'GMO', 'name': 'General Moly Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2928'}, {'symbol': 'GMRE', 'name': 'Global Medical REIT Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11551'}, {'symbol': 'GMS', 'name': 'GMS Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10662'}, {'symbol': 'GMZ', 'name': 'Goldman Sachs MLP Income Opportunities Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8136'}, {'symbol': 'GNC', 'name': 'GNC Holdings Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2932'}, {'symbol': 'GNCA', 'name': 'Genocea Biosciences Inc.'}, {'symbol': 'GNE', 'name': 'Genie Energy Ltd. Class B Stock'}, {'symbol': 'GNK', 'name': 'Genco Shipping & Trading Limited New (Marshall Islands)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10317'}, {'symbol': 'GNL', 'name': 'Global Net Lease Inc.'}, {'symbol': 'GNMA', 'name': 'iShares Barclays GNMA Bond Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2938'}, {'symbol': 'GNMK', 'name': 'GenMark Diagnostics Inc.'}, {'symbol': 'GNMX', 'name': 'Aevi Genomic Medicine Inc.'}, {'symbol': 'GNPX', 'name': 'Genprex Inc.'}, {'symbol': 'GNR', 'name': 'SPDR S&P Global Natural Resources'}, {'symbol': 'GNRC', 'name': 'Generac Holdlings Inc.'}, {'symbol': 'GNT', 'name': 'GAMCO Natural Resources Gold & Income Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2942'}, {'symbol': 'GNTX', 'name': 'Gentex Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2943'}, {'symbol': 'GNTY', 'name': 'Guaranty Bancshares Inc.'}, {'symbol': 'GNUS', 'name': 'Genius Brands International Inc.'}, {'symbol': 'GNW', 'name': 'Genworth Financial Inc'}, {'symbol': 'GOAU', 'name': 'US Global GO Gold and Precious Metal Miners', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13076'}, {'symbol': 'GOF', 'name': 'Guggenheim Strategic Opportunities Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2946'}, {'symbol': 'GOGL', 'name': 'Golden Ocean Group Limited'}, {'symbol': 'GOGO', 'name': 'Gogo Inc.'}, {'symbol': 'GOL', 'name': 'Gol Linhas Aereas Inteligentes S.A. Sponsored ADR representing 2 Pfd Shares'}, {'symbol': 'GOLD', 'name': 'Barrick Gold Corporation (BC)'}, {'symbol': 'GOLF', 'name': 'Acushnet Holdings Corp.'}, {'symbol': 'GOOD', 'name': 'Gladstone Commercial Corporation'}, {'symbol': 'GOODO', 'name': 'Gladstone Commercial Corporation 7.50% Series B Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '2953'}, {'symbol': 'GOOG', 'name': 'Alphabet Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10656'}, {'symbol': 'GOOGL', 'name': 'Alphabet Inc.'}, {'symbol': 'GOOS', 'name': 'Canada Goose Holdings Inc. Subordinate'}, {'symbol': 'GORO', 'name': 'Gold Resource Corporation'}, {'symbol': 'GOVT', 'name': 'iShares U.S. Treasury Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2958'}, {'symbol': 'GPAQ', 'name': 'Gordon Pointe Acquisition Corp.'}, {'symbol': 'GPAQW', 'name': 'Gordon Pointe Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14242'}, {'symbol': 'GPC', 'name': 'Genuine Parts Company'}, {'symbol': 'GPI', 'name': 'Group 1 Automotive Inc.'}, {'symbol': 'GPIC', 'name': 'Gaming Partners International Corporation'}, {'symbol': 'GPK', 'name': 'Graphic Packaging Holding Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2963'}, {'symbol': 'GPL', 'name': 'Great Panther Silver Limited (Canada)'}, {'symbol': 'GPM', 'name': 'Guggenheim Enhanced Equity Income Fund'}, {'symbol': 'GPMT', 'name': 'Granite Point Mortgage Trust Inc.'}, {'symbol': 'GPN', 'name': 'Global Payments Inc.'}, {'symbol': 'GPOR', 'name': 'Gulfport Energy Corporation'}, {'symbol': 'GPP', 'name': 'Green Plains Partners LP'}, {'symbol': 'GPRE', 'name': 'Green Plains Inc.'}, {'symbol': 'GPRK', 'name': 'Geopark Ltd'}, {'symbol': 'GPRO', 'name': 'GoPro Inc.'}, {'symbol': 'GPS', 'name': 'Gap Inc. (The)'}, {'symbol': 'GPX', 'name': 'GP Strategies Corporation'}, {'symbol': 'GRA', 'name': 'W.R. Grace & Co.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2975'}, {'symbol': 'GRAF', 'name': 'Graf Industrial Corp.'}, {'symbol': 'GRAF=', 'name': 'Graf Industrial Corp. Units each consisting of One share of Common Stock and One redeemable Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '15039'}, {'symbol': 'GRAM', 'name': 'Grana y Montero S.A.A. American Depositary Shares each representing five'}, {'symbol': 'GRBK', 'name': 'Green Brick Partners Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '753'}, {'symbol': 'GRC', 'name': 'Gorman-Rupp Company (The)'}, {'symbol': 'GRES', 'name': 'IQ ARB Global Resources', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2979'}, {'symbol': 'GRF', 'name': 'Eagle Capital Growth Fund Inc.'}, {'symbol': 'GRFS', 'name': 'Grifols S.A.'}, {'symbol': 'GRID', 'name': 'First Trust NASDAQ Clean Edge Smart Grid Infrastructure Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2986'}, {'symbol': 'GRIF', 'name': 'Griffin Industrial Realty Inc.'}, {'symbol': 'GRIN', 'name': 'Grindrod Shipping Holdings Ltd.'}, {'symbol': 'GRMN', 'name': 'Garmin Ltd.'}, {'symbol': 'GRNB', 'name': 'VanEck Vectors Green Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12428'}, {'symbol': 'GRNQ', 'name': 'Greenpro Capital Corp.'}, {'symbol': 'GROW', 'name': 'U.S. Global Investors Inc.'}, {'symbol': 'GRP=', 'name': 'Granite Real Estate Inc. Stapled Units each consisting of one unit of Trust and one common share of Granite REIT Inc.'}, {'symbol': 'GRPN', 'name': 'Groupon Inc.'}, {'symbol': 'GRSH', 'name': 'Gores Holdings III Inc.'}, {'symbol': 'GRSHW', 'name': 'Gores Holdings III Inc. Warrants', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15184'}, {'symbol': 'GRTS', 'name': 'Gritstone Oncology Inc.'}, {'symbol': 'GRUB', 'name': 'GrubHub Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8315'}, {'symbol': 'GRVY', 'name': 'GRAVITY Co. Ltd.'}, {'symbol': 'GRX', 'name': 'The Gabelli Healthcare & Wellness Trust of Beneficial Interest'}, {'symbol': 'GRX-B', 'name': 'Gabelli Healthcare Preferred Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '9332'}, {'symbol': 'GS', 'name': 'Goldman Sachs Group Inc. (The)'}, {'symbol': 'GS-B', 'name': 'Goldman Sachs Group Inc. (The) Depositary Share repstg 1/1000th Preferred Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '3006'}, {'symbol': 'GS-D', 'name': 'Goldman Sachs Group Inc. (The) Dep Shs repstg 1/1000 Pfd Ser D Fltg', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '3008'}, {'symbol': 'GS-K', 'name': 'Goldman Sachs Group Inc. (The) Dep Shs Repstg 1/1000 Int Sh Fxd/Fltg Non Cum Pfd Stk Ser K', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '8593'}, {'symbol': 'GSAH', 'name': 'GS Acquisition Holdings Corp. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14696'}, {'symbol': 'GSAH=', 'name': 'GS Acquisition Holdings Corp. Units each consisting of one share of Class A common stock and one-third of one redeemable warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14697'}, {'symbol': 'GSAT', 'name': 'Globalstar Inc.'}, {'symbol': 'GSB', 'name': 'GlobalSCAPE Inc.'}, {'symbol': 'GSBC', 'name': 'Great Southern Bancorp Inc.'}, {'symbol': 'GSBD', 'name': 'Goldman Sachs BDC Inc.'}, {'symbol': 'GSD', 'name': 'WisdomTree Global SmallCap Dividend Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10840'}, {'symbol': 'GSEW', 'name': 'Goldman Sachs Equal Weight U.S. Large Cap Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13374'}, {'symbol': 'GSH', 'name': 'Guangshen Railway Company Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3019'}, {'symbol': 'GSHD', 'name': 'Goosehead Insurance Inc.'}, {'symbol': 'GSIT', 'name': 'GSI Technology Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3022'}, {'symbol': 'GSK', 'name': 'GlaxoSmithKline PLC', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3025'}, {'symbol': 'GSKY', 'name': 'GreenSky Inc.'}, {'symbol': 'GSL', 'name': 'Global Ship Lease Inc New Class A'}, {'symbol': 'GSLC', 'name': 'Goldman Sachs ActiveBeta U.S. Large Cap Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10547'}, {'symbol': 'GSM', 'name': 'Ferroglobe PLC'}, {'symbol': 'GSS', 'name': 'Golden Star Resources Ltd', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3032'}, {'symbol': 'GSUM', 'name': 'Gridsum Holding Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11765'}, {'symbol': 'GSV', 'name': 'Gold Standard Ventures Corporation (Canada)'}, {'symbol': 'GSVC', 'name': 'GSV Capital Corp'}, {'symbol': 'GT', 'name': 'The Goodyear Tire & Rubber Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3038'}, {'symbol': 'GTE', 'name': 'Gran Tierra Energy Inc.'}, {'symbol': 'GTES', 'name': 'Gates Industrial Corporation plc'}, {'symbol': 'GTHX', 'name': 'G1 Therapeutics Inc.'}, {'symbol': 'GTIM', 'name': 'Good Times Restaurants Inc.'}, {'symbol': 'GTLS', 'name': 'Chart Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3046'}, {'symbol': 'GTN', 'name': 'Gray Television Inc.'}, {'symbol': 'GTN.A', 'name': 'Gray Television Inc. CLass A'}, {'symbol': 'GTS', 'name': 'Triple-S Management Corporation Class B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3050'}, {'symbol': 'GTT', 'name': 'GTT Communications Inc.'}, {'symbol': 'GTX', 'name': 'Garrett Motion Inc.'}, {'symbol': 'GTXI', 'name': 'GTx Inc.'}, {'symbol': 'GTY', 'name': 'Getty Realty Corporation'}, {'symbol': 'GTYH', 'name': 'GTY Technology Holdings Inc.'}, {'symbol': 'GTYHW', 'name': 'GTY Technology Holdings Inc. Warrants', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12087'}, {'symbol': 'GULF', 'name': 'WisdomTree Middle East Dividend Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3058'}, {'symbol': 'GURE', 'name': 'Gulf Resources Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3061'}, {'symbol': 'GUSH', 'name': 'Direxion Daily S&P Oil & Gas Exp. & Prod. Bull 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10030'}, {'symbol': 'GUT', 'name': 'Gabelli Utility Trust (The)'}, {'symbol': 'GUT-C', 'name': 'Gabelli Utility Trust (The) 5.375% Series C Cumulative Preferred Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11435'}, {'symbol': 'GV', 'name': 'Goldfield Corporation (The)'}, {'symbol': 'GVA', 'name': 'Granite Construction Incorporated'}, {'symbol': 'GVI', 'name': 'iShares Intermediate Government/Credit Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3067'}, {'symbol': 'GVP', 'name': 'GSE Systems Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3068'}, {'symbol': 'GWB', 'name': 'Great Western Bancorp Inc.'}, {'symbol': 'GWGH', 'name': 'GWG Holdings Inc'}, {'symbol': 'GWPH', 'name': 'GW Pharmaceuticals Plc'}, {'symbol': 'GWR', 'name': 'Genesee & Wyoming Inc. Class A'}, {'symbol': 'GWRE', 'name': 'Guidewire Software Inc.'}, {'symbol': 'GWRS', 'name': 'Global Water Resources Inc.'}, {'symbol': 'GWW', 'name': 'W.W. Grainger Inc.'}, {'symbol': 'GXC', 'name': 'SPDR S&P China', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3078'}, {'symbol': 'GXG', 'name': 'Global X MSCI Colombia', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3080'}, {'symbol': 'GYC', 'name': 'Corporate Asset Backed Corp CABCOoration CABCO Series 2004-102 Trust (SBC Communications Inc.) Collared Floating Rate Cllable Certificates', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3087'}, {'symbol': 'GYRO', 'name': 'Gyrodyne  LLC', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10473'}, {'symbol': 'GZT', 'name': 'Gazit-Globe Ltd.'}, {'symbol': 'H', 'name': 'Hyatt Hotels Corporation Class A'}, {'symbol': 'HA', 'name': 'Hawaiian Holdings Inc.'}, {'symbol': 'HABT', 'name': 'The Habit Restaurants Inc.'}, {'symbol': 'HAE', 'name': 'Haemonetics Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3093'}, {'symbol': 'HAFC', 'name': 'Hanmi Financial Corporation'}, {'symbol': 'HAIN', 'name': 'The Hain Celestial Group Inc.'}, {'symbol': 'HAIR', 'name': 'Restoration Robotics Inc.'}, {'symbol': 'HAL', 'name': 'Halliburton Company'}, {'symbol': 'HALL', 'name': 'Hallmark Financial Services Inc.'}, {'symbol': 'HALO', 'name': 'Halozyme Therapeutics Inc.'}, {'symbol': 'HAP', 'name': 'VanEck Vectors Natural Resources', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3100'}, {'symbol': 'HAS', 'name': 'Hasbro Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3103'}, {'symbol': 'HASI', 'name': 'Hannon Armstrong Sustainable Infrastructure Capital Inc.'}, {'symbol': 'HAWX', 'name': 'iShares Currency Hedged MSCI ACWI ex U.S.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10244'}, {'symbol': 'HAYN', 'name': 'Haynes International Inc.'}, {'symbol': 'HBAN', 'name': 'Huntington Bancshares Incorporated'}, {'symbol': 'HBANO', 'name': 'Huntington Bancshares Incorporated Depositary Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11192'}, {'symbol': 'HBB', 'name': 'Hamilton Beach Brands Holding Company Class A'}, {'symbol': 'HBCP', 'name': 'Home Bancorp Inc.'}, {'symbol': 'HBI', 'name': 'Hanesbrands Inc.'}, {'symbol': 'HBIO', 'name': 'Harvard Bioscience Inc.'}, {'symbol': 'HBK', 'name': 'Hamilton Bancorp Inc.'}, {'symbol': 'HBM', 'name': 'Hudbay Minerals Inc. (Canada)'}, {'symbol': 'HBMD', 'name': 'Howard Bancorp Inc.'}, {'symbol': 'HBNC', 'name': 'Horizon Bancorp Inc.'}, {'symbol': 'HBP', 'name': 'Huttig Building Products Inc.'}, {'symbol': 'HCA', 'name': 'HCA Healthcare Inc.'}, {'symbol': 'HCAP', 'name': 'Harvest Capital Credit Corporation'}, {'symbol': 'HCC', 'name': 'Warrior Met Coal Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12757'}, {'symbol': 'HCCH', 'name': 'HL Acquisitions Corp.'}, {'symbol': 'HCCHU', 'name': 'HL Acquisitions Corp. Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14720'}, {'symbol': 'HCCI', 'name': 'Heritage-Crystal Clean Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3132'}, {'symbol': 'HCFT', 'name': 'Hunt Companies Finance Trust Inc.'}, {'symbol': 'HCHC', 'name': 'HC2 Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5644'}, {'symbol': 'HCI', 'name': 'HCI Group Inc.'}, {'symbol': 'HCKT', 'name': 'The Hackett Group Inc.'}, {'symbol': 'HCLP', 'name': 'Hi-Crush Partners LP representing limited partner interests'}, {'symbol': 'HCM', 'name': 'Hutchison China MediTech Limited'}, {'symbol': 'HCP', 'name': 'HCP Inc.'}, {'symbol': 'HCSG', 'name': 'Healthcare Services Group Inc.'}, {'symbol': 'HCXZ', 'name': 'Hercules Capital Inc. 5.25% Notes due 2025', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14518'}, {'symbol': 'HD', 'name': 'Home Depot Inc. (The)'}, {'symbol': 'HDB', 'name': 'HDFC Bank Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3145'}, {'symbol': 'HDG', 'name': 'ProShares Hedge Replication', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3146'}, {'symbol': 'HDLV', 'name': 'ETRACS Montly Pay 2xLeveraged US High Dividend Low Volatility ETN due September 30 2044', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9340'}, {'symbol': 'HDS', 'name': 'HD Supply Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3150'}, {'symbol': 'HDSN', 'name': 'Hudson Technologies Inc.'}, {'symbol': 'HE', 'name': 'Hawaiian Electric Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3154'}, {'symbol': 'HEAR', 'name': 'Turtle Beach Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5244'}, {'symbol': 'HEB', 'name': 'Hemispherx BioPharma Inc.'}, {'symbol': 'HEBT', 'name': 'Hebron Technology Co. Ltd.'}, {'symbol': 'HEDJ', 'name': 'WisdomTree Europe Hedged Equity Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3158'}, {'symbol': 'HEES', 'name': 'H&E Equipment Services Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3159'}, {'symbol': 'HEI', 'name': 'Heico Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3160'}, {'symbol': 'HEI.A', 'name': 'Heico Corporation'}, {'symbol': 'HELE', 'name': 'Helen of Troy Limited'}, {'symbol': 'HEP', 'name': 'Holly Energy Partners L.P.'}, {'symbol': 'HEQ', 'name': 'John Hancock Hedged Equity & Income Fund of Beneficial Interest'}, {'symbol': 'HES', 'name': 'Hess Corporation'}, {'symbol': 'HESM', 'name': 'Hess Midstream Partners LP Representing Limited Partner Interests'}, {'symbol': 'HEWG', 'name': 'iShares Currency Hedged MSCI Germany ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8293'}, {'symbol': 'HEWJ', 'name': 'iShares Currency Hedged MSCI Japan', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8271'}, {'symbol': 'HEWP', 'name': 'iShares Currency Hedged MSCI Spain', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10248'}, {'symbol': 'HEWW', 'name': 'iShares Currency Hedged MSCI Mexico', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10250'}, {'symbol': 'HEXO', 'name': 'HEXO Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15405'}, {'symbol': 'HF', 'name': 'HFF Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3169'}, {'symbol': 'HFBC', 'name': 'HopFed Bancorp Inc.'}, {'symbol': 'HFBL', 'name': 'Home Federal Bancorp Inc. of Louisiana'}, {'symbol': 'HFC', 'name': 'HollyFrontier Corporation'}, {'symbol': 'HFFG', 'name': 'HF Foods Group Inc.'}, {'symbol': 'HFRO', 'name': 'Highland Floating Rate Opportunities Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13727'}, {'symbol': 'HFWA', 'name': 'Heritage Financial Corporation'}, {'symbol': 'HFXI', 'name': 'IQ 50 Percent Hedged FTSE International', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10319'}, {'symbol': 'HGH', 'name': 'Hartford Financial Services Group Inc. (The) 7.875% Fixed to Floating Rate Junior Subordinated Debentures due 2042', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3177'}, {'symbol': 'HGSD', 'name': 'WisdomTree Global Hedged SmallCap Dividend Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10865'}, {'symbol': 'HGSH', 'name': 'China HGS Real Estate Inc.'}, {'symbol': 'HGV', 'name': 'Hilton Grand Vacations Inc.'}, {'symbol': 'HHC', 'name': 'The Howard Hughes Corporation'}, {'symbol': 'HHS', 'name': 'Harte-Hanks Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3184'}, {'symbol': 'HI', 'name': 'Hillenbrand Inc'}, {'symbol': 'HIBB', 'name': 'Hibbett Sports Inc.'}, {'symbol': 'HIE', 'name': 'Miller/Howard High Income Equity Fund of Beneficial Interest'}, {'symbol': 'HIFR', 'name': 'InfraREIT Inc.'}, {'symbol': 'HIFS', 'name': 'Hingham Institution for Savings'}, {'symbol': 'HIG', 'name': 'Hartford Financial Services Group Inc. (The)'}, {'symbol': 'HIG-G', 'name': 'Hartford Financial Services Group Inc. (The) Depositary Shares Series G', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '15223'}, {'symbol': 'HIHO', 'name': 'Highway Holdings Limited'}, {'symbol': 'HII', 'name': 'Huntington Ingalls Industries Inc.'}, {'symbol': 'HIIQ', 'name': 'Health Insurance Innovations Inc.'}, {'symbol': 'HIL', 'name': 'Hill International Inc.'}, {'symbol': 'HIMX', 'name': 'Himax Technologies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3197'}, {'symbol': 'HIO', 'name': 'Western Asset High Income Opportunity Fund Inc.'}, {'symbol': 'HIVE', 'name': 'Aerohive Networks Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8294'}, {'symbol': 'HIW', 'name': 'Highwoods Properties Inc.'}, {'symbol': 'HIX', 'name': 'Western Asset High Income Fund II Inc.'}, {'symbol': 'HJLI', 'name': 'Hancock Jaffe Laboratories Inc.'}, {'symbol': 'HJPX', 'name': 'iShares Currency Hedged JPX-Nikkei 400', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10626'}, {'symbol': 'HK', 'name': 'Halcon Resources Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3208'}, {'symbol': 'HL', 'name': 'Hecla Mining Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3210'}, {'symbol': 'HLF', 'name': 'Herbalife Nutrition Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3212'}, {'symbol': 'HLG', 'name': 'Hailiang Education Group Inc.'}, {'symbol': 'HLI', 'name': 'Houlihan Lokey Inc. Class A'}, {'symbol': 'HLIT', 'name': 'Harmonic Inc.'}, {'symbol': 'HLNE', 'name': 'Hamilton Lane Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12414'}, {'symbol': 'HLT', 'name': 'Hilton Worldwide Holdings Inc.'}, {'symbol': 'HLTH', 'name': 'Nobilis Health Corp.'}, {'symbol': 'HLX', 'name': 'Helix Energy Solutions Group Inc.'}, {'symbol': 'HMC', 'name': 'Honda Motor Company Ltd.'}, {'symbol': 'HMG', 'name': 'HMG/Courtland Properties Inc.'}, {'symbol': 'HMHC', 'name': 'Houghton Mifflin Harcourt Company'}, {'symbol': 'HMI', 'name': 'Huami Corporation American Depositary Shares each representing four Class A'}, {'symbol': 'HMLP', 'name': 'Hoegh LNG Partners LP representing Limited Partner Interests'}, {'symbol': 'HMN', 'name': 'Horace Mann Educators Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3224'}, {'symbol': 'HMNF', 'name': 'HMN Financial Inc.'}, {'symbol': 'HMNY', 'name': 'Helios and Matheson Analytics Inc'}, {'symbol': 'HMST', 'name': 'HomeStreet Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3228'}, {'symbol': 'HMSY', 'name': 'HMS Holdings Corp'}, {'symbol': 'HMTA', 'name': 'HomeTown Bankshares Corporation'}, {'symbol': 'HMTV', 'name': 'Hemisphere Media Group Inc.'}, {'symbol': 'HMY', 'name': 'Harmony Gold Mining Company Limited'}, {'symbol': 'HNGR', 'name': 'Hanger Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3179'}, {'symbol': 'HNI', 'name': 'HNI Corporation'}, {'symbol': 'HNNA', 'name': 'Hennessy Advisors Inc.'}, {'symbol': 'HNP', 'name': 'Huaneng Power Intl'}, {'symbol': 'HNRG', 'name': 'Hallador Energy Company'}, {'symbol': 'HNW', 'name': 'Pioneer Diversified High Income Trust of Beneficial Interest'}, {'symbol': 'HOFT', 'name': 'Hooker Furniture Corporation'}, {'symbol': 'HOG', 'name': 'Harley-Davidson Inc.'}, {'symbol': 'HOLI', 'name': 'Hollysys Automation Technologies Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3242'}, {'symbol': 'HOLX', 'name': 'Hologic Inc.'}, {'symbol': 'HOMB', 'name': 'Home BancShares Inc.'}, {'symbol': 'HOME', 'name': 'At Home Group Inc.'}, {'symbol': 'HON', 'name': 'Honeywell International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3247'}, {'symbol': 'HONE', 'name': 'HarborOne Bancorp Inc.'}, {'symbol': 'HOPE', 'name': 'Hope Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '620'}, {'symbol': 'HOS', 'name': 'Hornbeck Offshore Services'}, {'symbol': 'HOV', 'name': 'Hovnanian Enterprises Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3251'}, {'symbol': 'HP', 'name': 'Helmerich & Payne Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3254'}, {'symbol': 'HPE', 'name': 'Hewlett Packard Enterprise Company'}, {'symbol': 'HPF', 'name': 'John Hancock Pfd Income Fund II Pfd Income Fund II'}, {'symbol': 'HPI', 'name': 'John Hancock Preferred Income Fund of Beneficial Interest'}, {'symbol': 'HPJ', 'name': 'Highpower International Inc'}, {'symbol': 'HPP', 'name': 'Hudson Pacific Properties Inc.'}, {'symbol': 'HPQ', 'name': 'HP Inc.'}, {'symbol': 'HPS', 'name': 'John Hancock Preferred Income Fund III Preferred Income Fund III', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3264'}, {'symbol': 'HPT', 'name': 'Hospitality Properties Trust'}, {'symbol': 'HQH', 'name': 'Tekla Healthcare Investors'}, {'symbol': 'HQL', 'name': 'TeklaLife Sciences Investors'}, {'symbol': 'HQY', 'name': 'HealthEquity Inc.'}, {'symbol': 'HR', 'name': 'Healthcare Realty Trust Incorporated'}, {'symbol': 'HRB', 'name': 'H&R Block Inc.'}, {'symbol': 'HRC', 'name': 'Hill-Rom Holdings Inc'}, {'symbol': 'HRI', 'name': 'Herc Holdings Inc.'}, {'symbol': 'HRL', 'name': 'Hormel Foods Corporation'}, {'symbol': 'HROW', 'name': 'Harrow Health Inc.'}, {'symbol': 'HRS', 'name': 'Harris Corporation'}, {'symbol': 'HRTG', 'name': 'Heritage Insurance Holdings Inc.'}, {'symbol': 'HRTX', 'name': 'Heron Therapeutics Inc.'}, {'symbol': 'HRZN', 'name': 'Horizon Technology Finance Corporation'}, {'symbol': 'HSBC', 'name': 'HSBC Holdings plc.'}, {'symbol': 'HSC', 'name': 'Harsco Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3281'}, {'symbol': 'HSDT', 'name': 'Helius Medical Technologies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14435'}, {'symbol': 'HSGX', 'name': 'Histogenics Corporation'}, {'symbol': 'HSIC', 'name': 'Henry Schein Inc.'}, {'symbol': 'HSII', 'name': 'Heidrick & Struggles International Inc.'}, {'symbol': 'HSKA', 'name': 'Heska Corporation'}, {'symbol': 'HSON', 'name': 'Hudson Global Inc.'}, {'symbol': 'HSRT', 'name': 'Hartford Short Duration', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14685'}, {'symbol': 'HST', 'name': 'Host Hotels & Resorts Inc.'}, {'symbol': 'HSTM', 'name': 'HealthStream Inc.'}, {'symbol': 'HSY', 'name': 'The Hershey Company'}, {'symbol': 'HT', 'name': 'Hersha Hospitality Trust Class A of Beneficial Interest'}, {'symbol': 'HT-D', 'name': 'Hersha Hospitality Trust 6.50% Series D Cumulative Redeemable Preferred Shares of Beneficial Interest $0.01 par value per share', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11436'}, {'symbol': 'HTA', 'name': 'Healthcare Trust of America Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3297'}, {'symbol': 'HTBI', 'name': 'HomeTrust Bancshares Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3298'}, {'symbol': 'HTBK', 'name': 'Heritage Commerce Corp'}, {'symbol': 'HTBX', 'name': 'Heat Biologics Inc.'}, {'symbol': 'HTD', 'name': 'John Hancock Tax Advantaged Dividend Income Fund of Beneficial Interest'}, {'symbol': 'HTGC', 'name': 'Hercules Capital Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3305'}, {'symbol': 'HTGM', 'name': 'HTG Molecular Diagnostics Inc.'}, {'symbol': 'HTH', 'name': 'Hilltop Holdings Inc.'}, {'symbol': 'HTHT', 'name': 'Huazhu Group Limited'}, {'symbol': 'HTLD', 'name': 'Heartland Express Inc.'}, {'symbol': 'HTLF', 'name': 'Heartland Financial USA Inc.'}, {'symbol': 'HTUS', 'name': 'Hull Tactical US', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10228'}, {'symbol': 'HTY', 'name': 'John Hancock Tax-Advantaged Global Shareholder Yield Fund of Beneficial Interest'}, {'symbol': 'HTZ', 'name': 'Hertz Global Holdings Inc'}, {'symbol': 'HUBB', 'name': 'Hubbell Inc'}, {'symbol': 'HUBG', 'name': 'Hub Group Inc.'}, {'symbol': 'HUBS', 'name': 'HubSpot Inc.'}, {'symbol': 'HUD', 'name': 'Hudson Ltd. Class A'}, {'symbol': 'HUM', 'name': 'Humana Inc.'}, {'symbol': 'HUN', 'name': 'Huntsman Corporation'}, {'symbol': 'HUNT', 'name': 'Hunter Maritime Acquisition Corp.'}, {'symbol': 'HUNTW', 'name': 'Hunter Maritime Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12274'}, {'symbol': 'HURC', 'name': 'Hurco Companies Inc.'}, {'symbol': 'HURN', 'name': 'Huron Consulting Group Inc.'}, {'symbol': 'HUSA', 'name': 'Houston American Energy Corporation'}, {'symbol': 'HUSV', 'name': 'First Trust Exchange-Traded Fund III Horizon Managed Volatility Domestic', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11756'}, {'symbol': 'HUYA', 'name': 'HUYA Inc. American depositary shares each representing one Class A'}, {'symbol': 'HVBC', 'name': 'HV Bancorp Inc.'}, {'symbol': 'HVT', 'name': 'Haverty Furniture Companies Inc.'}, {'symbol': 'HVT.A', 'name': 'Haverty Furniture Companies Inc.'}, {'symbol': 'HWBK', 'name': 'Hawthorn Bancshares Inc.'}, {'symbol': 'HWC', 'name': 'Hancock Whitney Corporation'}, {'symbol': 'HWCC', 'name': 'Houston Wire & Cable Company'}, {'symbol': 'HWKN', 'name': 'Hawkins Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3339'}, {'symbol': 'HX', 'name': 'Hexindai Inc.'}, {'symbol': 'HXL', 'name': 'Hexcel Corporation'}, {'symbol': 'HY', 'name': 'Hyster-Yale Materials Handling Inc. Class A'}, {'symbol': 'HYAC', 'name': 'Haymaker Acquisition Corp.'}, {'symbol': 'HYACW', 'name': 'Haymaker Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13801'}, {'symbol': 'HYB', 'name': 'New America High Income Fund Inc. (The)'}, {'symbol': 'HYDB', 'name': 'iShares Edge High Yield Defensive Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13116'}, {'symbol': 'HYDW', 'name': 'Xtrackers Low Beta High Yield Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14008'}, {'symbol': 'HYG', 'name': 'iShares iBoxx $ High Yield Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3347'}, {'symbol': 'HYGS', 'name': 'Hydrogenics Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3348'}, {'symbol': 'HYHG', 'name': 'ProShares High Yield Interest Rate Hedged', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3349'}, {'symbol': 'HYI', 'name': 'Western Asset High Yield Defined Opportunity Fund Inc.'}, {'symbol': 'HYLB', 'name': 'Xtrackers USD High Yield Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12156'}, {'symbol': 'HYLS', 'name': 'First Trust High Yield Long/Short ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3353'}, {'symbol': 'HYMB', 'name': 'SPDR Nuveen S&P High Yield Municipal Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3354'}, {'symbol': 'HYRE', 'name': 'HyreCar Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14668'}, {'symbol': 'HYT', 'name': 'Blackrock Corporate High Yield Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3356'}, {'symbol': 'HYXE', 'name': 'iShares iBoxx $ High Yield ex Oil & Gas Corporate Bond ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11486'}, {'symbol': 'HYZD', 'name': 'WisdomTree Interest Rate Hedged High Yield Bond Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8172'}, {'symbol': 'HZN', 'name': 'Horizon Global Corporation'}, {'symbol': 'HZNP', 'name': 'Horizon Pharma plc'}, {'symbol': 'HZO', 'name': 'MarineMax Inc. (FL)'}, {'symbol': 'I', 'name': 'Intelsat S.A.'}, {'symbol': 'IAC', 'name': 'IAC/InterActiveCorp'}, {'symbol': 'IAE', 'name': 'Voya Asia Pacific High Dividend Equity Income Fund ING Asia Pacific High Dividend Equity Income Fund of Beneficial Interest'}, {'symbol': 'IAF', 'name': 'Aberdeen Australia Equity Fund Inc'}, {'symbol': 'IAG', 'name': 'Iamgold Corporation'}, {'symbol': 'IAI', 'name': 'iShares U.S. Broker-Dealers & Securities Exchanges', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3366'}, {'symbol': 'IART', 'name': 'Integra LifeSciences Holdings Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3368'}, {'symbol': 'IAU', 'name': 'ishares Gold Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3370'}, {'symbol': 'IBA', 'name': 'Industrias Bachoco S.A.B. de C.V.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3371'}, {'symbol': 'IBCD', 'name': 'iShares iBonds Mar 2020 Term Corporate ex-Financials Term', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3376'}, {'symbol': 'IBCP', 'name': 'Independent Bank Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3378'}, {'symbol': 'IBDC', 'name': 'iShares iBonds Mar 2020 Term Corporate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3382'}, {'symbol': 'IBDK', 'name': 'iShares iBonds Dec 2019 Term Corporate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9815'}, {'symbol': 'IBDM', 'name': 'iShares iBonds Dec 2021 Term Corporate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9816'}, {'symbol': 'IBDO', 'name': 'iShares iBonds Dec 2023 Term Corporate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9818'}, {'symbol': 'IBDQ', 'name': 'iShares iBonds Dec 2025 Term Corporate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9820'}, {'symbol': 'IBDS', 'name': 'iShares iBonds Dec 2027 Term Corporate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13385'}, {'symbol': 'IBIO', 'name': 'iBio Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3384'}, {'symbol': 'IBKC', 'name': 'IBERIABANK Corporation'}, {'symbol': 'IBKCP', 'name': 'IBERIABANK Corporation Depositary Shares Representing Series B Fixed to Floating', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '10465'}, {'symbol': 'IBKR', 'name': 'Interactive Brokers Group, Inc.'}, {'symbol': 'IBM', 'name': 'International Business Machines Corporation'}, {'symbol': 'IBMI', 'name': 'iShares iBonds Sep 2020 Term Muni Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9128'}, {'symbol': 'IBMK', 'name': 'iShares iBonds Dec 2022 Term Muni Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10475'}, {'symbol': 'IBMM', 'name': 'iShares iBonds Dec 2024 Term Muni Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14267'}, {'symbol': 'IBN', 'name': 'ICICI Bank Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3388'}, {'symbol': 'IBOC', 'name': 'International Bancshares Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3390'}, {'symbol': 'IBP', 'name': 'Installed Building Products Inc.'}, {'symbol': 'IBTX', 'name': 'Independent Bank Group Inc'}, {'symbol': 'ICAD', 'name': 'iCad Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3393'}, {'symbol': 'ICBK', 'name': 'County Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9516'}, {'symbol': 'ICCC', 'name': 'ImmuCell Corporation'}, {'symbol': 'ICCH', 'name': 'ICC Holdings Inc.'}, {'symbol': 'ICD', 'name': 'Independence Contract Drilling Inc.'}, {'symbol': 'ICE', 'name': 'Intercontinental Exchange Inc.'}, {'symbol': 'ICFI', 'name': 'ICF International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3399'}, {'symbol': 'ICHR', 'name': 'Ichor Holdings'}, {'symbol': 'ICL', 'name': 'Israel Chemicals Limited'}, {'symbol': 'ICLK', 'name': 'iClick Interactive Asia Group Limited'}, {'symbol': 'ICLR', 'name': 'ICON plc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3404'}, {'symbol': 'ICON', 'name': 'Iconix Brand Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3407'}, {'symbol': 'ICPT', 'name': 'Intercept Pharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3408'}, {'symbol': 'ICUI', 'name': 'ICU Medical Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3409'}, {'symbol': 'IDA', 'name': 'IDACORP Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3410'}, {'symbol': 'IDCC', 'name': 'InterDigital Inc.'}, {'symbol': 'IDE', 'name': 'Voya Infrastructure Industrials and Materials Fund of Beneficial Interest'}, {'symbol': 'IDEX', 'name': 'Ideanomics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7658'}, {'symbol': 'IDHQ', 'name': 'Invesco S&P International Developed Quality', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3414'}, {'symbol': 'IDLB', 'name': 'Invesco FTSE International Low Beta Equal Weight ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10808'}, {'symbol': 'IDMO', 'name': 'Invesco S&P International Developed Momentum', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3413'}, {'symbol': 'IDN', 'name': 'Intellicheck Inc.'}, {'symbol': 'IDRA', 'name': 'Idera Pharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3420'}, {'symbol': 'IDSA', 'name': 'Industrial Services of America Inc.'}, {'symbol': 'IDSY', 'name': 'I.D. Systems Inc.'}, {'symbol': 'IDT', 'name': 'IDT Corporation Class B'}, {'symbol': 'IDTI', 'name': 'Integrated Device Technology Inc.'}, {'symbol': 'IDV', 'name': 'iShares International Select Dividend', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3426'}, {'symbol': 'IDXG', 'name': 'Interpace Diagnostics Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5319'}, {'symbol': 'IDXX', 'name': 'IDEXX Laboratories Inc.'}, {'symbol': 'IEA', 'name': 'Infrastructure and Energy Alternatives Inc.'}, {'symbol': 'IEC', 'name': 'IEC Electronics Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3430'}, {'symbol': 'IEDI', 'name': 'iShares Evolved U.S. Discretionary Spending', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14272'}, {'symbol': 'IEFA', 'name': 'iShares Core MSCI EAFE', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3432'}, {'symbol': 'IEHS', 'name': 'iShares Evolved U.S. Healthcare Staples', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14274'}, {'symbol': 'IEIH', 'name': 'iShares Evolved U.S. Innovative Healthcare', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14275'}, {'symbol': 'IEME', 'name': 'iShares Evolved U.S. Media and Entertainment', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14276'}, {'symbol': 'IEMV', 'name': 'Invesco Emerging Markets Debt Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14851'}, {'symbol': 'IEP', 'name': 'Icahn Enterprises L.P.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3437'}, {'symbol': 'IESC', 'name': 'IES Holdings Inc.'}, {'symbol': 'IEUR', 'name': 'iShares Core MSCI Europe', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8711'}, {'symbol': 'IEV', 'name': 'iShares Europe', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3440'}, {'symbol': 'IEX', 'name': 'IDEX Corporation'}, {'symbol': 'IFEU', 'name': 'iShares FTSE EPRA/NAREIT Europe Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3445'}, {'symbol': 'IFF', 'name': 'Internationa Flavors & Fragrances Inc.'}, {'symbol': 'IFGL', 'name': 'iShares FTSE EPRA/NAREIT Global Real Estate ex-U.S. Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3447'}, {'symbol': 'IFLY', 'name': 'ETFMG Drone Economy Strategy', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11131'}, {'symbol': 'IFMK', 'name': 'iFresh Inc.'}, {'symbol': 'IFN', 'name': 'India Fund Inc. (The)'}, {'symbol': 'IFRX', 'name': 'InflaRx N.V.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13694'}, {'symbol': 'IG', 'name': 'Principal Investment Grade Corporate Active', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14452'}, {'symbol': 'IGA', 'name': 'Voya Global Advantage and Premium Opportunity Fund of Beneficial Interest'}, {'symbol': 'IGD', 'name': 'Voya Global Equity Dividend and Premium Opportunity Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3457'}, {'symbol': 'IGEB', 'name': 'iShares Edge Investment Grade Enhanced Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13117'}, {'symbol': 'IGHG', 'name': 'ProShares Investment Grade-Interest Rate Hedged', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8091'}, {'symbol': 'IGI', 'name': 'Western Asset Investment Grade Defined Opportunity Trust Inc.'}, {'symbol': 'IGIH', 'name': 'Xtrackers Investment Grade Bond - Interest Rate Hedged', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9784'}, {'symbol': 'IGLD', 'name': 'Internet Gold Golden Lines Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3462'}, {'symbol': 'IGN', 'name': 'iShares North American Tech-Multimedia Networking', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3464'}, {'symbol': 'IGR', 'name': 'CBRE Clarion Global Real Estate Income Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3467'}, {'symbol': 'IGSB', 'name': 'iShares Short-Term Corporate Bond ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1513'}, {'symbol': 'IGT', 'name': 'International Game Technology'}, {'symbol': 'IGVT', 'name': 'Xtrackers Barclays International Treasury Bond Hedged', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12007'}, {'symbol': 'IHC', 'name': 'Independence Holding Company'}, {'symbol': 'IHD', 'name': 'Voya Emerging Markets High Income Dividend Equity Fund'}, {'symbol': 'IHE', 'name': 'iShares U.S. Pharmaceutical', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3475'}, {'symbol': 'IHG', 'name': 'Intercontinental Hotels Group American Depositary Shares (Each representing one)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3477'}, {'symbol': 'IHIT', 'name': 'Invesco High Income 2023 Target Term Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12008'}, {'symbol': 'IHT', 'name': 'InnSuites Hospitality Trust Shares of Beneficial Interest'}, {'symbol': 'IHTA', 'name': 'Invesco High Income 2024 Target Term Fund of Beneficial Interest No par value per share'}, {'symbol': 'IHYD', 'name': 'Invesco Corporate Income Defensive', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14852'}, {'symbol': 'IID', 'name': 'Voya International High Dividend Equity Income Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3482'}, {'symbol': 'IIF', 'name': 'Morgan Stanley India Investment Fund Inc.'}, {'symbol': 'IIGV', 'name': 'Invesco Investment Grade Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14855'}, {'symbol': 'III', 'name': 'Information Services Group Inc.'}, {'symbol': 'IIIN', 'name': 'Insteel Industries Inc.'}, {'symbol': 'IIIV', 'name': 'i3 Verticals Inc.'}, {'symbol': 'IIJI', 'name': 'Internet Initiative Japan Inc.'}, {'symbol': 'IIM', 'name': 'Invesco Value Municipal Income Trust'}, {'symbol': 'IIN', 'name': 'IntriCon Corporation'}, {'symbol': 'IIPR', 'name': 'Innovative Industrial Properties Inc.'}, {'symbol': 'IIVI', 'name': 'II-VI Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3490'}, {'symbol': 'IJJ', 'name': 'iShares S&P Mid-Cap 400 Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3492'}, {'symbol': 'IJR', 'name': 'iShares Core S&P Small-Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3494'}, {'symbol': 'IJT', 'name': 'iShares S&P Small-Cap 600 Growth ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3496'}, {'symbol': 'IKNX', 'name': 'Ikonics Corporation'}, {'symbol': 'ILMN', 'name': 'Illumina Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3502'}, {'symbol': 'ILPT', 'name': 'Industrial Logistics Properties Trust'}, {'symbol': 'IMAC', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15040'}, {'symbol': 'IMAX', 'name': 'Imax Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3505'}, {'symbol': 'IMDZ', 'name': 'Immune Design Corp.'}, {'symbol': 'IMFD', 'name': 'Invesco Multi-Factor Defensive Core Fixed Income', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15275'}, {'symbol': 'IMFP', 'name': 'Invesco Multi-Factor Core Plus Fixed Income', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14857'}, {'symbol': 'IMGN', 'name': 'ImmunoGen Inc.'}, {'symbol': 'IMH', 'name': 'Impac Mortgage Holdings Inc.'}, {'symbol': 'IMI', 'name': 'Intermolecular Inc.'}, {'symbol': 'IMKTA', 'name': 'Ingles Markets Incorporated Class A Common Stock'}, {'symbol': 'IMMP', 'name': 'Immutep Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5268'}, {'symbol': 'IMMR', 'name': 'Immersion Corporation'}, {'symbol': 'IMMU', 'name': 'Immunomedics Inc.'}, {'symbol': 'IMO', 'name': 'Imperial Oil Limited'}, {'symbol': 'IMOS', 'name': 'ChipMOS TECHNOLOGIES INC.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12035'}, {'symbol': 'IMRN', 'name': 'Immuron Limited'}, {'symbol': 'IMTB', 'name': 'iShares Core 5-10 Year USD Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12052'}, {'symbol': 'IMTE', 'name': 'Integrated Media Technology Limited'}, {'symbol': 'IMV', 'name': 'IMV Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14699'}, {'symbol': 'IMXI', 'name': 'International Money Express Inc.'}, {'symbol': 'INAP', 'name': 'Internap Corporation'}, {'symbol': 'INB', 'name': 'Cohen & Steers Global Income Builder Inc. of Beneficial Interest'}, {'symbol': 'INBK', 'name': 'First Internet Bancorp'}, {'symbol': 'INCO', 'name': 'Columbia India Consumer', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3526'}, {'symbol': 'INCY', 'name': 'Incyte Corporation'}, {'symbol': 'INDB', 'name': 'Independent Bank Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3529'}, {'symbol': 'INDS', 'name': 'Pacer Benchmark Industrial Real Estate SCTR', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14542'}, {'symbol': 'INF', 'name': 'Brookfield Global Listed Infrastructure Income Fund Closed End Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3532'}, {'symbol': 'INFI', 'name': 'Infinity Pharmaceuticals Inc.'}, {'symbol': 'INFN', 'name': 'Infinera Corporation'}, {'symbol': 'INFO', 'name': 'IHS Markit Ltd.'}, {'symbol': 'INFU', 'name': 'InfuSystems Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3537'}, {'symbol': 'INFY', 'name': 'Infosys Limited American Depositary Shares'}, {'symbol': 'ING', 'name': 'ING Group N.V.'}, {'symbol': 'INGN', 'name': 'Inogen Inc'}, {'symbol': 'INGR', 'name': 'Ingredion Incorporated'}, {'symbol': 'INMB', 'name': 'INmune Bio Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14975'}, {'symbol': 'INN', 'name': 'Summit Hotel Properties Inc.'}, {'symbol': 'INN-E', 'name': 'Summit Hotel Properties Inc. 6.250% Series E Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13784'}, {'symbol': 'INNT', 'name': 'Innovate Biopharmaceuticals Inc.'}, {'symbol': 'INO', 'name': 'Inovio Pharmaceuticals Inc.'}, {'symbol': 'INOD', 'name': 'Innodata Inc.'}, {'symbol': 'INOV', 'name': 'Inovalon Holdings Inc.'}, {'symbol': 'INPX', 'name': 'Inpixon'}, {'symbol': 'INS', 'name': 'Intelligent Systems Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3553'}, {'symbol': 'INSE', 'name': 'Inspired Entertainment Inc.'}, {'symbol': 'INSG', 'name': 'Inseego Corp.'}, {'symbol': 'INSI', 'name': 'Insight Select Income Fund'}, {'symbol': 'INSM', 'name': 'Insmed Inc.'}, {'symbol': 'INSP', 'name': 'Inspire Medical Systems Inc.'}, {'symbol': 'INST', 'name': 'Instructure Inc.'}, {'symbol': 'INSW', 'name': 'International Seaways Inc.'}, {'symbol': 'INSY', 'name': 'Insys Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3555'}, {'symbol': 'INT', 'name': 'World Fuel Services Corporation'}, {'symbol': 'INTC', 'name': 'Intel Corporation'}, {'symbol': 'INTG', 'name': 'The Intergroup Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3558'}, {'symbol': 'INTL', 'name': 'INTL FCStone Inc.'}, {'symbol': 'INTT', 'name': 'inTest Corporation'}, {'symbol': 'INTU', 'name': 'Intuit Inc.'}, {'symbol': 'INUV', 'name': 'Inuvo Inc.'}, {'symbol': 'INVA', 'name': 'Innoviva Inc.'}, {'symbol': 'INVE', 'name': 'Identiv Inc.'}, {'symbol': 'INVH', 'name': 'Invitation Homes Inc.'}, {'symbol': 'INWK', 'name': 'InnerWorkings Inc.'}, {'symbol': 'INXN', 'name': 'InterXion Holding N.V. (0.01 nominal value)'}, {'symbol': 'IO', 'name': 'Ion Geophysical Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3573'}, {'symbol': 'IONS', 'name': 'Ionis Pharmaceuticals Inc.'}, {'symbol': 'IOR', 'name': 'Income Opportunity Realty Investors Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3578'}, {'symbol': 'IOSP', 'name': 'Innospec Inc.'}, {'symbol': 'IOTS', 'name': 'Adesto Technologies Corporation'}, {'symbol': 'IOVA', 'name': 'Iovance Biotherapeutics Inc.'}, {'symbol': 'IP', 'name': 'International Paper Company'}, {'symbol': 'IPAR', 'name': 'Inter Parfums Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3580'}, {'symbol': 'IPAS', 'name': 'iPass Inc.'}, {'symbol': 'IPB', 'name': 'Merrill Lynch & Co. Inc. 6.0518% Index Plus Trust Certificates Series 2003-1', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3582'}, {'symbol': 'IPCI', 'name': 'Intellipharmaceutics International Inc.'}, {'symbol': 'IPDN', 'name': 'Professional Diversity Network Inc.'}, {'symbol': 'IPFF', 'name': 'iShares International Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3590'}, {'symbol': 'IPG', 'name': 'Interpublic Group of Companies Inc. (The)'}, {'symbol': 'IPGP', 'name': 'IPG Photonics Corporation'}, {'symbol': 'IPHI', 'name': 'Inphi Corporation $0.001 par value'}, {'symbol': 'IPHS', 'name': 'Innophos Holdings Inc.'}, {'symbol': 'IPI', 'name': 'Intrepid Potash Inc'}, {'symbol': 'IPIC', 'name': 'iPic Entertainment Inc.'}, {'symbol': 'IPLDP', 'name': 'Interstate Power and Light Company Interstate Power & Light Company Perp Preferred 5.10% Series D', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '3597'}, {'symbol': 'IPOA', 'name': 'Social Capital Hedosophia Holdings Corp. Class A par value $0.0001', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13461'}, {'symbol': 'IPOA=', 'name': 'Social Capital Hedosophia Holdings Corp. Units each consisting of one Class A Ordinary Share and one-third of one warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '13395'}, {'symbol': 'IPWR', 'name': 'Ideal Power Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8133'}, {'symbol': 'IQ', 'name': 'iQIYI Inc.'}, {'symbol': 'IQDF', 'name': 'FlexShares International Quality Dividend Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3605'}, {'symbol': 'IQDY', 'name': 'FlexShares International Quality Dividend Dynamic Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3606'}, {'symbol': 'IQI', 'name': 'Invesco Quality Municipal Income Trust'}, {'symbol': 'IQLT', 'name': 'iShares Edge MSCI Intl Quality Factor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9657'}, {'symbol': 'IQV', 'name': 'IQVIA Holdings Inc.'}, {'symbol': 'IR', 'name': 'Ingersoll-Rand plc (Ireland)'}, {'symbol': 'IRBT', 'name': 'iRobot Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3610'}, {'symbol': 'IRCP', 'name': 'IRSA Propiedades Comerciales S.A.'}, {'symbol': 'IRDM', 'name': 'Iridium Communications Inc'}, {'symbol': 'IRET', 'name': 'Investors Real Estate Trust Shares of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3615'}, {'symbol': 'IRIX', 'name': 'IRIDEX Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3620'}, {'symbol': 'IRL', 'name': 'New Ireland Fund Inc (The)'}, {'symbol': 'IRM', 'name': 'Iron Mountain Incorporated (Delaware)Common Stock REIT'}, {'symbol': 'IRMD', 'name': 'iRadimed Corporation'}, {'symbol': 'IROQ', 'name': 'IF Bancorp Inc.'}, {'symbol': 'IRR', 'name': 'Voya Natural Resources Equity Income Fund of Beneficial Interest'}, {'symbol': 'IRS', 'name': 'IRSA Inversiones Y Representaciones S.A.'}, {'symbol': 'IRT', 'name': 'Independence Realty Trust Inc.'}, {'symbol': 'IRTC', 'name': 'iRhythm Technologies Inc.'}, {'symbol': 'IRWD', 'name': 'Ironwood Pharmaceuticals Inc.'}, {'symbol': 'ISBC', 'name': 'Investors Bancorp Inc.'}, {'symbol': 'ISCA', 'name': 'International Speedway Corporation'}, {'symbol': 'ISD', 'name': 'PGIM Short Duration High Yield Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3631'}, {'symbol': 'ISDR', 'name': 'Issuer Direct Corporation'}, {'symbol': 'ISDX', 'name': 'Invesco Strategic Developed ex-US ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15000'}, {'symbol': 'ISF', 'name': 'ING Group N.V. Perp Hybrid Cap Secs (Netherlands)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14604'}, {'symbol': 'ISHG', 'name': 'iShares S&P/Citigroup 1-3 Yr Intl Treasury Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3635'}, {'symbol': 'ISIG', 'name': 'Insignia Systems Inc.'}, {'symbol': 'ISNS', 'name': 'Image Sensing Systems Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3642'}, {'symbol': 'ISR', 'name': 'IsoRay Inc. (DE)'}, {'symbol': 'ISRG', 'name': 'Intuitive Surgical Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3645'}, {'symbol': 'ISRL', 'name': 'Isramco Inc.'}, {'symbol': 'ISSC', 'name': 'Innovative Solutions and Support Inc.'}, {'symbol': 'ISTR', 'name': 'Investar Holding Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8639'}, {'symbol': 'IT', 'name': 'Gartner Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3652'}, {'symbol': 'ITB', 'name': 'iShares U.S. Home Construction', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3654'}, {'symbol': 'ITCB', 'name': 'Itau CorpBanca American Depositary Shares (each representing 1500 shares of no par value)'}, {'symbol': 'ITCI', 'name': 'Intra-Cellular Therapies Inc.'}, {'symbol': 'ITEQ', 'name': 'BlueStar Israel Technology', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10793'}, {'symbol': 'ITG', 'name': 'Investment Technology Group Inc.'}, {'symbol': 'ITGR', 'name': 'Integer Holdings Corporation'}, {'symbol': 'ITI', 'name': 'Iteris Inc.'}, {'symbol': 'ITIC', 'name': 'Investors Title Company'}, {'symbol': 'ITOT', 'name': 'iShares Core S&P Total U.S. Stock Market', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3666'}, {'symbol': 'ITP', 'name': 'IT Tech Packaging Inc.'}, {'symbol': 'ITRI', 'name': 'Itron Inc.'}, {'symbol': 'ITRM', 'name': 'Iterum Therapeutics plc'}, {'symbol': 'ITRN', 'name': 'Ituran Location and Control Ltd.'}, {'symbol': 'ITT', 'name': 'ITT Inc.'}, {'symbol': 'ITUB', 'name': 'Itau Unibanco Banco Holding SA American Depositary Shares (Each repstg 500 Preferred shares)'}, {'symbol': 'ITW', 'name': 'Illinois Tool Works Inc.'}, {'symbol': 'IUSB', 'name': 'iShares Core Total USD Bond Market ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8713'}, {'symbol': 'IUSS', 'name': 'Invesco Strategic US Small Company ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15003'}, {'symbol': 'IVAC', 'name': 'Intevac Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3673'}, {'symbol': 'IVC', 'name': 'Invacare Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3675'}, {'symbol': 'IVENC', 'name': 'Ivy NextShares', 'date': '2019-02-08', 'isEnabled': False, 'type': 'N/A', 'iexId': '11968'}, {'symbol': 'IVFVC', 'name': 'Ivy Focused Value NextShares', 'date': '2019-02-08', 'isEnabled': False, 'type': 'N/A', 'iexId': '11970'}, {'symbol': 'IVH', 'name': 'Ivy High Income Opportunities Fund of Beneficial Interest'}, {'symbol': 'IVOG', 'name': 'Vanguard S&P Mid-Cap 400 Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3678'}, {'symbol': 'IVOV', 'name': 'Vanguard S&P Mid-Cap 400 Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3681'}, {'symbol': 'IVR', 'name': 'INVESCO MORTGAGE CAPITAL INC'}, {'symbol': 'IVR-B', 'name': 'Invesco Mortgage Capital Inc. Preferred Series B Cum Fxd to Fltg', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '9260'}, {'symbol': 'IVV', 'name': 'iShares Core S&P 500', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3684'}, {'symbol': 'IVZ', 'name': 'Invesco Ltd', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3686'}, {'symbol': 'IWC', 'name': 'iShares Microcap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3688'}, {'symbol': 'IWF', 'name': 'iShares Russell 1000 Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3690'}, {'symbol': 'IWM', 'name': 'iShares Russell 2000', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3692'}, {'symbol': 'IWO', 'name': 'iShares Russell 2000 Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3694'}, {'symbol': 'IWR', 'name': 'iShares Russell Mid-Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3696'}, {'symbol': 'IWV', 'name': 'iShares Russell 3000', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3698'}, {'symbol': 'IWY', 'name': 'iShares Russell Top 200 Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3701'}, {'symbol': 'IX', 'name': 'Orix Corp Ads'}, {'symbol': 'IXG', 'name': 'iShares Global Financial', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3705'}, {'symbol': 'IXN', 'name': 'iShares Global Tech', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3707'}, {'symbol': 'IXUS', 'name': 'iShares Core MSCI Total International Stock ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3709'}, {'symbol': 'IYE', 'name': 'iShares U.S. Energy', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3712'}, {'symbol': 'IYG', 'name': 'iShares U.S. Financial Services', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3714'}, {'symbol': 'IYJ', 'name': 'iShares U.S. Industrials', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3716'}, {'symbol': 'IYLD', 'name': 'iShares Morningstar Multi-Asset Income', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3718'}, {'symbol': 'IYR', 'name': 'iShares U.S. Real Estate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3720'}, {'symbol': 'IYW', 'name': 'iShares U.S. Technology', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3722'}, {'symbol': 'IYZ', 'name': 'iShares U.S. Telecommunications', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3724'}, {'symbol': 'IZEA', 'name': 'IZEA Worldwide Inc.'}, {'symbol': 'JACK', 'name': 'Jack In The Box Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3725'}, {'symbol': 'JAG', 'name': 'Jagged Peak Energy Inc.'}, {'symbol': 'JAGX', 'name': 'Jaguar Health Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9204'}, {'symbol': 'JAKK', 'name': 'JAKKS Pacific Inc.'}, {'symbol': 'JASN', 'name': 'Jason Industries Inc.'}, {'symbol': 'JAX', 'name': "J. Alexander's Holdings Inc.", 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9460'}, {'symbol': 'JAZZ', 'name': 'Jazz Pharmaceuticals plc'}, {'symbol': 'JBGS', 'name': 'JBG SMITH Properties'}, {'symbol': 'JBHT', 'name': 'J.B. Hunt Transport Services Inc.'}, {'symbol': 'JBL', 'name': 'Jabil Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3737'}, {'symbol': 'JBLU', 'name': 'JetBlue Airways Corporation'}, {'symbol': 'JBR', 'name': 'Select Asset Inc. Corporate Backed Callable Trust Certificates J.C. Penney Debenture-Backed Series 2006-1 Class A-1', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3741'}, {'symbol': 'JBSS', 'name': 'John B. Sanfilippo & Son Inc.'}, {'symbol': 'JBT', 'name': 'John Bean Technologies Corporation'}, {'symbol': 'JCAP', 'name': 'Jernigan Capital Inc.'}, {'symbol': 'JCE', 'name': 'Nuveen Core Equity Alpha Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3744'}, {'symbol': 'JCI', 'name': 'Johnson Controls International plc'}, {'symbol': 'JCO', 'name': 'Nuveen Credit Opportunities 2022 Target Term Fund of Beneficial Interest'}, {'symbol': 'JCOM', 'name': 'j2 Global Inc.'}, {'symbol': 'JCP', 'name': 'J.C. Penney Company Inc.'}, {'symbol': 'JCS', 'name': 'Communications Systems Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3748'}, {'symbol': 'JCTCF', 'name': 'Jewett-Cameron Trading Company'}, {'symbol': 'JD', 'name': 'JD.com Inc.'}, {'symbol': 'JDD', 'name': 'Nuveen Diversified Dividend and Income Fund Shares of Beneficial Interest'}, {'symbol': 'JDST', 'name': 'Direxion Daily Junior Gold Miners Index Bear 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7891'}, {'symbol': 'JE', 'name': 'Just Energy Group Inc. (Canada)'}, {'symbol': 'JEC', 'name': 'Jacobs Engineering Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3753'}, {'symbol': 'JEF', 'name': 'Jefferies Financial Group Inc.'}, {'symbol': 'JELD', 'name': 'JELD-WEN Holding Inc.'}, {'symbol': 'JEMD', 'name': 'Nuveen Emerging Markets Debt 2022 Target Term Fund of Beneficial Interest $0.01 par value per share'}, {'symbol': 'JEQ', 'name': 'Aberdeen Japan Equity Fund Inc.'}, {'symbol': 'JFR', 'name': 'Nuveen Floating Rate Income Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3758'}, {'symbol': 'JG', 'name': 'Aurora Mobile Limited'}, {'symbol': 'JGH', 'name': 'Nuveen Global High Income Fund of Beneficial Interest'}, {'symbol': 'JHB', 'name': 'Nuveen High Income November 2021 Target Term Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11696'}, {'symbol': 'JHD', 'name': 'Nuveen High Income December 2019 Target Term Fund of Beneficial Interest'}, {'symbol': 'JHEM', 'name': 'John Hancock Multifactor Emerging Markets', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15079'}, {'symbol': 'JHG', 'name': 'Janus Henderson Group plc'}, {'symbol': 'JHI', 'name': 'John Hancock Investors Trust'}, {'symbol': 'JHMC', 'name': 'John Hancock Multifactor Consumer Discretionary', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10598'}, {'symbol': 'JHME', 'name': 'John Hancock Multifactor Energy', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11194'}, {'symbol': 'JHMH', 'name': 'John Hancock Multifactor Healthcare', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10600'}, {'symbol': 'JHML', 'name': 'John Hancock Multifactor Large Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10601'}, {'symbol': 'JHMS', 'name': 'John Hancock Multifactor Consumer Staples', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11196'}, {'symbol': 'JHMU', 'name': 'John Hancock Multifactor Utilities', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11197'}, {'symbol': 'JHS', 'name': 'John Hancock Income Securities Trust'}, {'symbol': 'JHX', 'name': 'James Hardie Industries plc American Depositary Shares (Ireland)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3770'}, {'symbol': 'JHY', 'name': 'Nuveen High Income 2020 Target Term Fund of Beneficial Interest'}, {'symbol': 'JILL', 'name': 'J. Jill Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12377'}, {'symbol': 'JJC', 'name': 'iPathA Series B Bloomberg Copper Subindex Total Return ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14049'}, {'symbol': 'JJG', 'name': 'iPathA Series B Bloomberg Grains Subindex Total Return ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14051'}, {'symbol': 'JJN', 'name': 'iPathA Series B Bloomberg Nickel Subindex Total Return ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14042'}, {'symbol': 'JJS', 'name': 'iPathA Series B Bloomberg Softs Subindex Total Return ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14054'}, {'symbol': 'JJSF', 'name': 'J & J Snack Foods Corp.'}, {'symbol': 'JJU', 'name': 'iPathA Series B Bloomberg Aluminum Subindex Total Return ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14056'}, {'symbol': 'JKE', 'name': 'iShares Morningstar Large-Cap Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3784'}, {'symbol': 'JKG', 'name': 'iShares Morningstar Mid-Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3786'}, {'symbol': 'JKHY', 'name': 'Jack Henry & Associates Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3788'}, {'symbol': 'JKJ', 'name': 'iShares Morningstar Small-Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3790'}, {'symbol': 'JKL', 'name': 'iShares Morningstar Small-Cap Value ETFnd', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3792'}, {'symbol': 'JKS', 'name': 'JinkoSolar Holding Company Limited American Depositary Shares (each representing 4)'}, {'symbol': 'JLL', 'name': 'Jones Lang LaSalle Incorporated'}, {'symbol': 'JLS', 'name': 'Nuveen Mortgage Opportunity Term Fund'}, {'symbol': 'JMEI', 'name': 'Jumei International Holding Limited American Depositary Shares each representing one Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8606'}, {'symbol': 'JMF', 'name': 'Nuveen Energy MLP Total Return Fund of Beneficial Interest'}, {'symbol': 'JMLP', 'name': 'Nuveen All Cap Energy MLP Opportunities Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8394'}, {'symbol': 'JMM', 'name': 'Nuveen Multi-Market Income Fund (MA)'}, {'symbol': 'JMP', 'name': 'JMP Group LLC', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3800'}, {'symbol': 'JMPD', 'name': 'JMP Group LLC 7.25% Senior Notes due 2027', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13832'}, {'symbol': 'JMT', 'name': 'Nuveen Mortgage Opportunity Term Fund 2 of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3802'}, {'symbol': 'JMU', 'name': 'JMU Limited'}, {'symbol': 'JNCE', 'name': 'Jounce Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12321'}, {'symbol': 'JNJ', 'name': 'Johnson & Johnson'}, {'symbol': 'JNPR', 'name': 'Juniper Networks Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3805'}, {'symbol': 'JO', 'name': 'iPathA Series B Bloomberg Coffee Subindex Total Return ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14043'}, {'symbol': 'JOB', 'name': 'GEE Group Inc.'}, {'symbol': 'JOBS', 'name': '51job Inc.'}, {'symbol': 'JOE', 'name': 'St. Joe Company (The)'}, {'symbol': 'JOF', 'name': 'Japan Smaller Capitalization Fund Inc'}, {'symbol': 'JOUT', 'name': 'Johnson Outdoors Inc.'}, {'symbol': 'JP', 'name': 'Jupai Holdings Limited American Depositary Shares each representing six'}, {'symbol': 'JPC', 'name': 'Nuveen Preferred & Income Opportunities Fund'}, {'symbol': 'JPEH', 'name': 'JPMorgan Diversified Return Europe Currency Hedged', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11210'}, {'symbol': 'JPEU', 'name': 'JPMorgan Diversified Return Europe Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10938'}, {'symbol': 'JPGE', 'name': 'JPMorgan Diversified Return Global Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8823'}, {'symbol': 'JPHY', 'name': 'JPMorgan Disciplined HY', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11825'}, {'symbol': 'JPI', 'name': 'Nuveen Preferred and Income Term Fund of Beneficial Interest'}, {'symbol': 'JPIN', 'name': 'JPMorgan Diversified Return International Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9476'}, {'symbol': 'JPM', 'name': 'JP Morgan Chase & Co.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3821'}, {'symbol': 'JPM-B*', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8275'}, {'symbol': 'JPM-D', 'name': 'J P Morgan Chase & Co Depositary Shares Series D', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '15090'}, {'symbol': 'JPM-F', 'name': 'J P Morgan Chase & Co Depositary Shares Series Y', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '9763'}, {'symbol': 'JPM-H', 'name': 'J P Morgan Chase & Co Depositary Shares Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '10391'}, {'symbol': 'JPME', 'name': 'JPMorgan Diversified Return U.S. Mid Cap Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11349'}, {'symbol': 'JPMV', 'name': 'iShares Edge MSCI Min Vol Japan', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8688'}, {'symbol': 'JPNL', 'name': 'Direxion Daily Japan Bull 3X', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3826'}, {'symbol': 'JPS', 'name': 'Nuveen Preferred & Income Securities Fund'}, {'symbol': 'JPST', 'name': 'JPMorgan Ultra-Short Income', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12927'}, {'symbol': 'JPT', 'name': 'Nuveen Preferred and Income 2022 Term Fund of Beneficial Interest'}, {'symbol': 'JPXN', 'name': 'iShares JPX-Nikkei 400', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3657'}, {'symbol': 'JQC', 'name': 'Nuveen Credit Strategies Income Fund Shares of Beneficial Interest'}, {'symbol': 'JRI', 'name': 'Nuveen Real Asset Income and Growth Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3835'}, {'symbol': 'JRJC', 'name': 'China Finance Online Co. Limited'}, {'symbol': 'JRO', 'name': 'Nuveen Floating Rate Income Opportuntiy Fund Shares of Beneficial Interest'}, {'symbol': 'JRS', 'name': 'Nuveen Real Estate Income Fund of Beneficial Interest'}, {'symbol': 'JRSH', 'name': 'Jerash Holdings (US) Inc.'}, {'symbol': 'JRVR', 'name': 'James River Group Holdings Ltd.'}, {'symbol': 'JSD', 'name': 'Nuveen Short Duration Credit Opportunities Fund of Beneficial Interest'}, {'symbol': 'JSMD', 'name': 'Janus Henderson Small/Mid Cap Growth Alpha ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11092'}, {'symbol': 'JSYN', 'name': 'Jensyn Acquistion Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11286'}, {'symbol': 'JSYNU', 'name': 'Jensyn Acquistion Corp. Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '10879'}, {'symbol': 'JT', 'name': 'Jianpu Technology Inc. American depositary shares each two representing five Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13729'}, {'symbol': 'JTA', 'name': 'Nuveen Tax-Advantaged Total Return Strategy Fund of Beneficial Interest'}, {'symbol': 'JTD', 'name': 'Nuveen Tax-Advantaged Dividend Growth Fund of Beneficial Interest'}, {'symbol': 'JVA', 'name': 'Coffee Holding Co. Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3849'}, {'symbol': 'JW.A', 'name': 'John Wiley & Sons Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3850'}, {'symbol': 'JW.B', 'name': 'John Wiley & Sons Inc.'}, {'symbol': 'JWN', 'name': 'Nordstrom Inc.'}, {'symbol': 'JYNT', 'name': 'The Joint Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9367'}, {'symbol': 'K', 'name': 'Kellogg Company'}, {'symbol': 'KAI', 'name': 'Kadant Inc'}, {'symbol': 'KALA', 'name': 'Kala Pharmaceuticals Inc.'}, {'symbol': 'KALU', 'name': 'Kaiser Aluminum Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3864'}, {'symbol': 'KALV', 'name': 'KalVista Pharmaceuticals Inc.'}, {'symbol': 'KAMN', 'name': 'Kaman Corporation'}, {'symbol': 'KAR', 'name': 'KAR Auction Services Inc'}, {'symbol': 'KB', 'name': 'KB Financial Group Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3868'}, {'symbol': 'KBAL', 'name': 'Kimball International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3869'}, {'symbol': 'KBH', 'name': 'KB Home', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3871'}, {'symbol': 'KBLM', 'name': 'KBL Merger Corp. IV'}, {'symbol': 'KBLMU', 'name': 'KBL Merger Corp. IV Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '12978'}, {'symbol': 'KBR', 'name': 'KBR Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3873'}, {'symbol': 'KBSF', 'name': 'KBS Fashion Group Limited'}, {'symbol': 'KBWD', 'name': 'Invesco KBW High Dividend Yield Financial ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3876'}, {'symbol': 'KBWR', 'name': 'Invesco KBW Regional Banking ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3879'}, {'symbol': 'KCAP', 'name': 'KCAP Financial Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3882'}, {'symbol': 'KCCB', 'name': 'KraneShares CCBS China Corporate High Yield Bond USD Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14786'}, {'symbol': 'KCNY', 'name': 'KraneShares E Fund China Commercial Paper', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9545'}, {'symbol': 'KDMN', 'name': 'Kadmon Holdings Inc.'}, {'symbol': 'KDP', 'name': 'Keurig Dr Pepper Inc.'}, {'symbol': 'KE', 'name': 'Kimball Electronics Inc.'}, {'symbol': 'KEG', 'name': 'Key Energy Services Inc.'}, {'symbol': 'KELYA', 'name': 'Kelly Services Inc. Class A Common Stock'}, {'symbol': 'KELYB', 'name': 'Kelly Services Inc. Class B Common Stock'}, {'symbol': 'KEM', 'name': 'KEMET Corporation'}, {'symbol': 'KEN', 'name': 'Kenon Holdings Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9535'}, {'symbol': 'KEP', 'name': 'Korea Electric Power Corporation'}, {'symbol': 'KEQU', 'name': 'Kewaunee Scientific Corporation'}, {'symbol': 'KEX', 'name': 'Kirby Corporation'}, {'symbol': 'KEY', 'name': 'KeyCorp'}, {'symbol': 'KEY-J', 'name': 'KeyCorp Depositary Shares Series F', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14883'}, {'symbol': 'KEYS', 'name': 'Keysight Technologies Inc.'}, {'symbol': 'KEYW', 'name': 'The KEYW Holding Corporation'}, {'symbol': 'KF', 'name': 'Korea Fund Inc. (The)'}, {'symbol': 'KFFB', 'name': 'Kentucky First Federal Bancorp'}, {'symbol': 'KFRC', 'name': 'Kforce Inc.'}, {'symbol': 'KFS', 'name': 'Kingsway Financial Services Inc. (DE)'}, {'symbol': 'KFY', 'name': 'Korn Ferry'}, {'symbol': 'KGC', 'name': 'Kinross Gold Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3912'}, {'symbol': 'KGJI', 'name': 'Kingold Jewelry Inc.'}, {'symbol': 'KHC', 'name': 'The Kraft Heinz Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10253'}, {'symbol': 'KIDS', 'name': 'OrthoPediatrics Corp.'}, {'symbol': 'KIM', 'name': 'Kimco Realty Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3917'}, {'symbol': 'KIM-J', 'name': 'Kimco Realty Corporation Depositary Sh Repstg 1/1000th Pfd CL J %', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '3920'}, {'symbol': 'KIM-L', 'name': 'Kimco Realty Corporation Class L Depositary Shares each of which represents a one-one thousandth fractional interest in a share of 5.125% Class L Cumulative Red', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13282'}, {'symbol': 'KIN', 'name': 'Kindred Biosciences Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8155'}, {'symbol': 'KINS', 'name': 'Kingstone Companies Inc'}, {'symbol': 'KIO', 'name': 'KKR Income Opportunities Fund'}, {'symbol': 'KIQ', 'name': 'Kelso Technologies Inc'}, {'symbol': 'KIRK', 'name': "Kirkland's Inc."}, {'symbol': 'KKR', 'name': 'KKR & Co. Inc. Class A'}, {'symbol': 'KKR-B', 'name': 'KKR & Co. Inc. 6.50% Series B Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11537'}, {'symbol': 'KL', 'name': 'Kirkland Lake Gold Ltd.'}, {'symbol': 'KLAC', 'name': 'KLA-Tencor Corporation'}, {'symbol': 'KLIC', 'name': 'Kulicke and Soffa Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3932'}, {'symbol': 'KLXE', 'name': 'KLX Energy Services Holdings Inc.'}, {'symbol': 'KMB', 'name': 'Kimberly-Clark Corporation'}, {'symbol': 'KMDA', 'name': 'Kamada Ltd.'}, {'symbol': 'KMF', 'name': 'Kayne Anderson Midstream Energy Fund Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3936'}, {'symbol': 'KMI', 'name': 'Kinder Morgan Inc.'}, {'symbol': 'KMPH', 'name': 'KemPharm Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9824'}, {'symbol': 'KMPR', 'name': 'Kemper Corporation'}, {'symbol': 'KMT', 'name': 'Kennametal Inc.'}, {'symbol': 'KMX', 'name': 'CarMax Inc'}, {'symbol': 'KN', 'name': 'Knowles Corporation'}, {'symbol': 'KNDI', 'name': 'Kandi Technologies Group Inc.'}, {'symbol': 'KNL', 'name': 'Knoll Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3947'}, {'symbol': 'KNOP', 'name': 'KNOT Offshore Partners LP representing Limited Partner Interests'}, {'symbol': 'KNSA', 'name': 'Kiniksa Pharmaceuticals Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14489'}, {'symbol': 'KNSL', 'name': 'Kinsale Capital Group Inc.'}, {'symbol': 'KNX', 'name': 'Knight-Swift Transportation Holdings Inc.'}, {'symbol': 'KO', 'name': 'Coca-Cola Company (The)'}, {'symbol': 'KOD', 'name': 'Kodiak Sciences Inc'}, {'symbol': 'KODK', 'name': 'Eastman Kodak Company Common New'}, {'symbol': 'KOF', 'name': 'Coca Cola Femsa S.A.B. de C.V.'}, {'symbol': 'KOL', 'name': 'VanEck Vectors Coal', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '3955'}, {'symbol': 'KOMP', 'name': 'SPDR Kensho New Economies Composite', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15159'}, {'symbol': 'KONA', 'name': 'Kona Grill Inc.'}, {'symbol': 'KOOL', 'name': 'Cesca Therapeutics Inc.'}, {'symbol': 'KOP', 'name': 'Koppers Holdings Inc.'}, {'symbol': 'KOPN', 'name': 'Kopin Corporation'}, {'symbol': 'KORU', 'name': 'Direxion Daily South Korea Bull 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3964'}, {'symbol': 'KOS', 'name': 'Kosmos Energy Ltd. (DE)'}, {'symbol': 'KOSS', 'name': 'Koss Corporation'}, {'symbol': 'KPFS', 'name': 'Pepper Food Service Co. Ltd.'}, {'symbol': 'KPTI', 'name': 'Karyopharm Therapeutics Inc.'}, {'symbol': 'KR', 'name': 'Kroger Company (The)'}, {'symbol': 'KRA', 'name': 'Kraton Corporation'}, {'symbol': 'KRC', 'name': 'Kilroy Realty Corporation'}, {'symbol': 'KREF', 'name': 'KKR Real Estate Finance Trust Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12867'}, {'symbol': 'KRG', 'name': 'Kite Realty Group Trust'}, {'symbol': 'KRNT', 'name': 'Kornit Digital Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9778'}, {'symbol': 'KRNY', 'name': 'Kearny Financial'}, {'symbol': 'KRO', 'name': 'Kronos Worldwide Inc'}, {'symbol': 'KRP', 'name': 'Kimbell Royalty Partners Representing Limited Partner Interests'}, {'symbol': 'KRYS', 'name': 'Krystal Biotech Inc.'}, {'symbol': 'KSM', 'name': 'DWS Strategic Municipal Income Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3983'}, {'symbol': 'KSS', 'name': "Kohl's Corporation"}, {'symbol': 'KSU', 'name': 'Kansas City Southern'}, {'symbol': 'KT', 'name': 'KT Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3988'}, {'symbol': 'KTCC', 'name': 'Key Tronic Corporation'}, {'symbol': 'KTF', 'name': 'DWS Municipal Income Trust'}, {'symbol': 'KTN', 'name': 'Structured Products Corp 8.205% CorTS 8.205% Corporate Backed Trust Securities (CorTS)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3993'}, {'symbol': 'KTOS', 'name': 'Kratos Defense & Security Solutions Inc.'}, {'symbol': 'KTOV', 'name': 'Kitov Pharma Ltd.'}, {'symbol': 'KTP', 'name': 'Corts 7.625 Pfd', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '3995'}, {'symbol': 'KURA', 'name': 'Kura Oncology Inc.'}, {'symbol': 'KVHI', 'name': 'KVH Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3997'}, {'symbol': 'KW', 'name': 'Kennedy-Wilson Holdings Inc.'}, {'symbol': 'KWR', 'name': 'Quaker Chemical Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4002'}, {'symbol': 'KYN', 'name': 'Kayne Anderson MLP/Midstream Investment Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4006'}, {'symbol': 'KZIA', 'name': 'Kazia Therapeutics Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5012'}, {'symbol': 'KZR', 'name': 'Kezar Life Sciences Inc.'}, {'symbol': 'L', 'name': 'Loews Corporation'}, {'symbol': 'LABL', 'name': 'Multi-Color Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4013'}, {'symbol': 'LAC', 'name': 'Lithium Americas Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14083'}, {'symbol': 'LACQ', 'name': 'Leisure Acquisition Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13962'}, {'symbol': 'LACQW', 'name': 'Leisure Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13970'}, {'symbol': 'LAD', 'name': 'Lithia Motors Inc.'}, {'symbol': 'LADR', 'name': 'Ladder Capital Corp Class A'}, {'symbol': 'LAIX', 'name': 'LAIX Inc. American Depositary Shares each representing one Class A'}, {'symbol': 'LAKE', 'name': 'Lakeland Industries Inc.'}, {'symbol': 'LAMR', 'name': 'Lamar Advertising Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4019'}, {'symbol': 'LANC', 'name': 'Lancaster Colony Corporation'}, {'symbol': 'LAND', 'name': 'Gladstone Land Corporation'}, {'symbol': 'LARK', 'name': 'Landmark Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4023'}, {'symbol': 'LASR', 'name': 'nLIGHT Inc.'}, {'symbol': 'LAUR', 'name': 'Laureate Education Inc.'}, {'symbol': 'LAWS', 'name': 'Lawson Products Inc.'}, {'symbol': 'LAZ', 'name': 'Lazard LTD. LTD. Class A'}, {'symbol': 'LAZY', 'name': 'Lazydays Holdings Inc.'}, {'symbol': 'LB', 'name': 'L Brands Inc.'}, {'symbol': 'LBAI', 'name': 'Lakeland Bancorp Inc.'}, {'symbol': 'LBC', 'name': 'Luther Burbank Corporation'}, {'symbol': 'LBJ', 'name': 'Direxion Daily Latin America 3x Bull Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '4032'}, {'symbol': 'LBRDA', 'name': 'Liberty Broadband Corporation Class A Common Stock'}, {'symbol': 'LBRDK', 'name': 'Liberty Broadband Corporation'}, {'symbol': 'LBRT', 'name': 'Liberty Oilfield Services Inc. Class A'}, {'symbol': 'LBTYA', 'name': 'Liberty Global plc Class A Ordinary Shares'}, {'symbol': 'LBTYB', 'name': 'Liberty Global plc Class B Ordinary Shares'}, {'symbol': 'LBTYK', 'name': 'Liberty Global plc'}, {'symbol': 'LBY', 'name': 'Libbey Inc.'}, {'symbol': 'LC', 'name': 'LendingClub Corporation'}, {'symbol': 'LCI', 'name': 'Lannett Co Inc'}, {'symbol': 'LCII', 'name': 'LCI Industries'}, {'symbol': 'LCNB', 'name': 'LCNB Corporation'}, {'symbol': 'LCUT', 'name': 'Lifetime Brands Inc.'}, {'symbol': 'LDL', 'name': 'Lydall Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4047'}, {'symbol': 'LDOS', 'name': 'Leidos Holdings Inc.'}, {'symbol': 'LDP', 'name': 'Cohen & Steers Limited Duration Preferred and Income Fund Inc.'}, {'symbol': 'LDRS', 'name': 'Innovator IBD ETF Leaders', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13941'}, {'symbol': 'LDUR', 'name': 'PIMCO Enhanced Low Duration Active Exchange-Traded Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8216'}, {'symbol': 'LE', 'name': "Lands' End Inc."}, {'symbol': 'LEA', 'name': 'Lear Corporation'}, {'symbol': 'LEAF', 'name': 'Leaf Group Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1826'}, {'symbol': 'LECO', 'name': 'Lincoln Electric Holdings Inc.'}, {'symbol': 'LEDS', 'name': 'SemiLEDS Corporation'}, {'symbol': 'LEE', 'name': 'Lee Enterprises Incorporated'}, {'symbol': 'LEG', 'name': 'Leggett & Platt Incorporated'}, {'symbol': 'LEGH', 'name': 'Legacy Housing Corporation'}, {'symbol': 'LEJU', 'name': 'Leju Holdings Limited American Depositary Shares each representing one', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8549'}, {'symbol': 'LEN', 'name': 'Lennar Corporation Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4060'}, {'symbol': 'LEN.B', 'name': 'Lennar Corporation Class B'}, {'symbol': 'LENS', 'name': 'Presbia PLC'}, {'symbol': 'LEO', 'name': 'Dreyfus Strategic Municipals Inc.'}, {'symbol': 'LEU', 'name': 'Centrus Energy Corp. Class A'}, {'symbol': 'LEVB', 'name': 'Level Brands Inc.'}, {'symbol': 'LEVL', 'name': 'Level One Bancorp Inc.'}, {'symbol': 'LEXEA', 'name': 'Liberty Expedia Holdings Inc. Series A Common Stock'}, {'symbol': 'LEXEB', 'name': 'Liberty Expedia Holdings Inc. Series B Common Stock'}, {'symbol': 'LFAC', 'name': 'LF Capital Acquistion Corp.'}, {'symbol': 'LFACW', 'name': 'LF Capital Acquistion Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14781'}, {'symbol': 'LFC', 'name': 'China Life Insurance Company Limited American Depositary Shares'}, {'symbol': 'LFUS', 'name': 'Littelfuse Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4066'}, {'symbol': 'LFVN', 'name': 'Lifevantage Corporation'}, {'symbol': 'LGC', 'name': 'Legacy Acquisition Corp. Class A par value $0.0001 per share'}, {'symbol': 'LGC=', 'name': 'Legacy Acquisition Corp. Units each consisting of one share of Class A Common Stock and one Warrant to purchase one-half of one share of Class A Common Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '13660'}, {'symbol': 'LGCY', 'name': 'Legacy Reserves Inc.'}, {'symbol': 'LGF.A', 'name': 'Lions Gate Entertainment Corporation Class A'}, {'symbol': 'LGF.B', 'name': 'Lions Gate Entertainment Corporation Class B Non-Voting Shares'}, {'symbol': 'LGI', 'name': 'Lazard Global Total Return and Income Fund'}, {'symbol': 'LGIH', 'name': 'LGI Homes Inc.'}, {'symbol': 'LGL', 'name': 'LGL Group Inc. (The)'}, {'symbol': 'LGND', 'name': 'Ligand Pharmaceuticals Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4075'}, {'symbol': 'LH', 'name': 'Laboratory Corporation of America Holdings', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4077'}, {'symbol': 'LHC', 'name': 'Leo Holdings Corp. Class A'}, {'symbol': 'LHC=', 'name': 'Leo Holdings Corp. Units each consisting of one Class A ordinary share and one-third of one redeemable warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14144'}, {'symbol': 'LHCG', 'name': 'LHC Group'}, {'symbol': 'LIFE', 'name': 'aTyr Pharma Inc.'}, {'symbol': 'LII', 'name': 'Lennox International Inc.'}, {'symbol': 'LILA', 'name': 'Liberty Latin America Ltd.'}, {'symbol': 'LILAK', 'name': 'Liberty Latin America Ltd.'}, {'symbol': 'LIN', 'name': 'Linde plc'}, {'symbol': 'LINC', 'name': 'Lincoln Educational Services Corporation'}, {'symbol': 'LIND', 'name': 'Lindblad Expeditions Holdings Inc.'}, {'symbol': 'LINK', 'name': 'Interlink Electronics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11288'}, {'symbol': 'LION', 'name': 'Fidelity Southern Corporation'}, {'symbol': 'LIQT', 'name': 'LiqTech International Inc.'}, {'symbol': 'LITB', 'name': 'LightInTheBox Holding Co. Ltd. American Depositary Shares each representing 2', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4095'}, {'symbol': 'LITE', 'name': 'Lumentum Holdings Inc.'}, {'symbol': 'LIVE', 'name': 'Live Ventures Incorporated'}, {'symbol': 'LIVN', 'name': 'LivaNova PLC'}, {'symbol': 'LIVX', 'name': 'LiveXLive Media Inc.'}, {'symbol': 'LJPC', 'name': 'La Jolla Pharmaceutical Company'}, {'symbol': 'LKCO', 'name': 'Luokung Technology Corp'}, {'symbol': 'LKFN', 'name': 'Lakeland Financial Corporation'}, {'symbol': 'LKQ', 'name': 'LKQ Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4099'}, {'symbol': 'LKSD', 'name': 'LSC Communications Inc.'}, {'symbol': 'LL', 'name': 'Lumber Liquidators Holdings Inc'}, {'symbol': 'LLEX', 'name': 'Lilis Energy Inc.'}, {'symbol': 'LLIT', 'name': 'Lianluo Smart Limited'}, {'symbol': 'LLL', 'name': 'L3 Technologies Inc.'}, {'symbol': 'LLNW', 'name': 'Limelight Networks Inc.'}, {'symbol': 'LLY', 'name': 'Eli Lilly and Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4105'}, {'symbol': 'LM', 'name': 'Legg Mason Inc.'}, {'symbol': 'LMAT', 'name': 'LeMaitre Vascular Inc.'}, {'symbol': 'LMB', 'name': 'Limbach Holdings Inc.'}, {'symbol': 'LMFA', 'name': 'LM Funding America Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10910'}, {'symbol': 'LMHA', 'name': 'Legg Mason Inc. 6.375% Junior Subordinated Notes due 2056', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11182'}, {'symbol': 'LMLP', 'name': 'ETRACS Monthly Pay 2xLeveraged Wells Fargo MLP Ex-Energy ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8870'}, {'symbol': 'LMNR', 'name': 'Limoneira Co'}, {'symbol': 'LMNX', 'name': 'Luminex Corporation'}, {'symbol': 'LMRK', 'name': 'Landmark Infrastructure Partners LP'}, {'symbol': 'LMRKO', 'name': 'Landmark Infrastructure Partners LP Preferred Units', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11782'}, {'symbol': 'LMST', 'name': 'Limestone Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5264'}, {'symbol': 'LMT', 'name': 'Lockheed Martin Corporation'}, {'symbol': 'LN', 'name': 'LINE Corporation American Depositary Shares (each representing one share of)'}, {'symbol': 'LNC', 'name': 'Lincoln National Corporation'}, {'symbol': 'LND', 'name': 'Brasilagro Brazilian Agric Real Estate Co Sponsored ADR (Brazil)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4119'}, {'symbol': 'LNDC', 'name': 'Landec Corporation'}, {'symbol': 'LNG', 'name': 'Cheniere Energy Inc.'}, {'symbol': 'LNN', 'name': 'Lindsay Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4123'}, {'symbol': 'LNT', 'name': 'Alliant Energy Corporation'}, {'symbol': 'LNTH', 'name': 'Lantheus Holdings Inc.'}, {'symbol': 'LOAC', 'name': 'Longevity Acquisition Corporation'}, {'symbol': 'LOACU', 'name': 'Longevity Acquisition Corporation Units', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14932'}, {'symbol': 'LOAN', 'name': 'Manhattan Bridge Capital Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4126'}, {'symbol': 'LOB', 'name': 'Live Oak Bancshares Inc.'}, {'symbol': 'LOCO', 'name': 'El Pollo Loco Holdings Inc.'}, {'symbol': 'LODE', 'name': 'Comstock Mining Inc.'}, {'symbol': 'LOGC', 'name': 'LogicBio Therapeutics Inc.'}, {'symbol': 'LOGI', 'name': 'Logitech International S.A.'}, {'symbol': 'LOGM', 'name': 'LogMeIn Inc.'}, {'symbol': 'LOMA', 'name': 'Loma Negra Compania Industrial Argentina Sociedad Anonima ADS'}, {'symbol': 'LONE', 'name': 'Lonestar Resources US Inc.'}, {'symbol': 'LOOP', 'name': 'Loop Industries Inc.'}, {'symbol': 'LOPE', 'name': 'Grand Canyon Education Inc.'}, {'symbol': 'LOR', 'name': 'Lazard World Dividend & Income Fund Inc.'}, {'symbol': 'LORL', 'name': 'Loral Space and Communications Inc.'}, {'symbol': 'LOV', 'name': 'Spark Networks Inc. American Depositary Shares (each representing one-tenth of an)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13740'}, {'symbol': 'LOVE', 'name': 'The Lovesac Company'}, {'symbol': 'LOW', 'name': "Lowe's Companies Inc."}, {'symbol': 'LOXO', 'name': 'Loxo Oncology Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8912'}, {'symbol': 'LPCN', 'name': 'Lipocine Inc.'}, {'symbol': 'LPG', 'name': 'Dorian LPG Ltd.'}, {'symbol': 'LPI', 'name': 'Laredo Petroleum Inc.'}, {'symbol': 'LPL', 'name': 'LG Display Co Ltd AMERICAN DEPOSITORY SHARES'}, {'symbol': 'LPLA', 'name': 'LPL Financial Holdings Inc.'}, {'symbol': 'LPSN', 'name': 'LivePerson Inc.'}, {'symbol': 'LPT', 'name': 'Liberty Property Trust'}, {'symbol': 'LPTH', 'name': 'LightPath Technologies Inc.'}, {'symbol': 'LPTX', 'name': 'Leap Therapeutics Inc.'}, {'symbol': 'LPX', 'name': 'Louisiana-Pacific Corporation'}, {'symbol': 'LQDA', 'name': 'Liquidia Technologies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14789'}, {'symbol': 'LQDI', 'name': 'iShares Inflation Hedged Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14534'}, {'symbol': 'LQDT', 'name': 'Liquidity Services Inc.'}, {'symbol': 'LRAD', 'name': 'LRAD Corporation'}, {'symbol': 'LRCX', 'name': 'Lam Research Corporation'}, {'symbol': 'LRGE', 'name': 'ClearBridge Large Cap Growth ESG ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12945'}, {'symbol': 'LRN', 'name': 'K12 Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4160'}, {'symbol': 'LSBK', 'name': 'Lake Shore Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4164'}, {'symbol': 'LSCC', 'name': 'Lattice Semiconductor Corporation'}, {'symbol': 'LSI', 'name': 'Life Storage Inc.'}, {'symbol': 'LSTR', 'name': 'Landstar System Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4174'}, {'symbol': 'LSXMA', 'name': 'Liberty Media Corporation Series A Liberty SiriusXM Common Stock'}, {'symbol': 'LSXMB', 'name': 'Liberty Media Corporation Series B Liberty SiriusXM Common Stock'}, {'symbol': 'LSXMK', 'name': 'Liberty Media Corporation Series C Liberty SiriusXM Common Stock'}, {'symbol': 'LTBR', 'name': 'Lightbridge Corporation'}, {'symbol': 'LTC', 'name': 'LTC Properties Inc.'}, {'symbol': 'LTHM', 'name': 'Livent Corporation'}, {'symbol': 'LTM', 'name': 'LATAM Airlines Group S.A.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4065'}, {'symbol': 'LTN', 'name': 'Union Acquisition Corp.'}, {'symbol': 'LTN=', 'name': 'Union Acquisition Corp. Units each consisting of one ordinary share and one redeemable warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14208'}, {'symbol': 'LTN^', 'name': 'LiveXLive Media'}, {'symbol': 'LTRPA', 'name': 'Liberty TripAdvisor Holdings Inc. Series A Common Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9147'}, {'symbol': 'LTRPB', 'name': 'Liberty TripAdvisor Holdings Inc. Series B Common Stock'}, {'symbol': 'LTRX', 'name': 'Lantronix Inc.'}, {'symbol': 'LTS', 'name': 'Ladenburg Thalmann Financial Services Inc'}, {'symbol': 'LTSF', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14713'}, {'symbol': 'LTSL', 'name': 'Ladenburg Thalmann Financial Services Inc 6.50% Senior Notes due 2027', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13824'}, {'symbol': 'LTXB', 'name': 'LegacyTexas Financial Group Inc.'}, {'symbol': 'LUB', 'name': "Luby's Inc."}, {'symbol': 'LULU', 'name': 'lululemon athletica inc.'}, {'symbol': 'LUNA', 'name': 'Luna Innovations Incorporated'}, {'symbol': 'LUV', 'name': 'Southwest Airlines Company'}, {'symbol': 'LVHD', 'name': 'Legg Mason Low Volatility High Dividend ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10972'}, {'symbol': 'LVHI', 'name': 'Legg Mason International Low Volatility High Dividend', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11658'}, {'symbol': 'LVL', 'name': 'Invesco S&P Global Dividend Opportunities Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14396'}, {'symbol': 'LVS', 'name': 'Las Vegas Sands Corp.'}, {'symbol': 'LW', 'name': 'Lamb Weston Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12036'}, {'symbol': 'LWAY', 'name': 'Lifeway Foods Inc.'}, {'symbol': 'LX', 'name': 'LexinFintech Holdings Ltd.'}, {'symbol': 'LXFR', 'name': 'Luxfer Holdings PLC'}, {'symbol': 'LXFT', 'name': 'Luxoft Holding Inc. Class A'}, {'symbol': 'LXP', 'name': 'Lexington Realty Trust'}, {'symbol': 'LXRX', 'name': 'Lexicon Pharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4206'}, {'symbol': 'LXU', 'name': 'LSB Industries Inc.'}, {'symbol': 'LYB', 'name': 'LyondellBasell Industries NV Class A (Netherlands)'}, {'symbol': 'LYG', 'name': 'Lloyds Banking Group Plc American Depositary Shares'}, {'symbol': 'LYL', 'name': 'Dragon Victory International Limited'}, {'symbol': 'LYTS', 'name': 'LSI Industries Inc.'}, {'symbol': 'LYV', 'name': 'Live Nation Entertainment Inc.'}, {'symbol': 'LZB', 'name': 'La-Z-Boy Incorporated'}, {'symbol': 'M', 'name': "Macy's Inc"}, {'symbol': 'MA', 'name': 'Mastercard Incorporated'}, {'symbol': 'MAA', 'name': 'Mid-America Apartment Communities Inc.'}, {'symbol': 'MAC', 'name': 'Macerich Company (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4217'}, {'symbol': 'MACK', 'name': 'Merrimack Pharmaceuticals Inc.'}, {'symbol': 'MAG', 'name': 'MAG Silver Corporation'}, {'symbol': 'MAGS', 'name': 'Magal Security Systems Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4220'}, {'symbol': 'MAIN', 'name': 'Main Street Capital Corporation'}, {'symbol': 'MAMS', 'name': 'MAM Software Group Inc.'}, {'symbol': 'MAN', 'name': 'ManpowerGroup'}, {'symbol': 'MANH', 'name': 'Manhattan Associates Inc.'}, {'symbol': 'MANT', 'name': 'ManTech International Corporation'}, {'symbol': 'MANU', 'name': 'Manchester United Ltd. Class A'}, {'symbol': 'MAR', 'name': 'Marriott International'}, {'symbol': 'MARA', 'name': 'Marathon Patent Group Inc.'}, {'symbol': 'MARK', 'name': 'Remark Holdings Inc.'}, {'symbol': 'MARPS', 'name': 'Marine Petroleum Trust Units of Beneficial Interest'}, {'symbol': 'MAS', 'name': 'Masco Corporation'}, {'symbol': 'MASI', 'name': 'Masimo Corporation'}, {'symbol': 'MAT', 'name': 'Mattel Inc.'}, {'symbol': 'MATW', 'name': 'Matthews International Corporation'}, {'symbol': 'MATX', 'name': 'Matson Inc.'}, {'symbol': 'MAV', 'name': 'Pioneer Municipal High Income Advantage Trust of Beneficial Interest'}, {'symbol': 'MAXR', 'name': 'Maxar Technologies Inc.'}, {'symbol': 'MAYS', 'name': 'J. W. Mays Inc.'}, {'symbol': 'MB', 'name': 'MINDBODY Inc.'}, {'symbol': 'MBCN', 'name': 'Middlefield Banc Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9243'}, {'symbol': 'MBFI', 'name': 'MB Financial Inc.'}, {'symbol': 'MBG', 'name': 'SPDR Bloomberg Barclays Mortgage Backed Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '4247'}, {'symbol': 'MBI', 'name': 'MBIA Inc.'}, {'symbol': 'MBII', 'name': 'Marrone Bio Innovations Inc.'}, {'symbol': 'MBIN', 'name': 'Merchants Bancorp'}, {'symbol': 'MBIO', 'name': 'Mustang Bio Inc.'}, {'symbol': 'MBOT', 'name': 'Microbot Medical Inc.'}, {'symbol': 'MBRX', 'name': 'Moleculin Biotech Inc.'}, {'symbol': 'MBT', 'name': 'Mobile TeleSystems PJSC', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4254'}, {'symbol': 'MBTF', 'name': 'M B T Financial Corp'}, {'symbol': 'MBUU', 'name': 'Malibu Boats Inc.'}, {'symbol': 'MBWM', 'name': 'Mercantile Bank Corporation'}, {'symbol': 'MC', 'name': 'Moelis & Company Class A'}, {'symbol': 'MCA', 'name': 'Blackrock MuniYield California Quality Fund Inc.'}, {'symbol': 'MCB', 'name': 'Metropolitan Bank Holding Corp.'}, {'symbol': 'MCBC', 'name': 'Macatawa Bank Corporation'}, {'symbol': 'MCC', 'name': 'Medley Capital Corporation'}, {'symbol': 'MCD', 'name': "McDonald's Corporation"}, {'symbol': 'MCEP', 'name': 'Mid-Con Energy Partners LP', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4264'}, {'symbol': 'MCF', 'name': 'Contango Oil & Gas Company'}, {'symbol': 'MCFT', 'name': 'MasterCraft Boat Holdings Inc.'}, {'symbol': 'MCHP', 'name': 'Microchip Technology Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4268'}, {'symbol': 'MCHX', 'name': 'Marchex Inc.'}, {'symbol': 'MCI', 'name': 'Barings Corporate Investors'}, {'symbol': 'MCK', 'name': 'McKesson Corporation'}, {'symbol': 'MCN', 'name': 'Madison Covered Call & Equity Strategy Fund'}, {'symbol': 'MCO', 'name': "Moody's Corporation"}, {'symbol': 'MCR', 'name': 'MFS Charter Income Trust'}, {'symbol': 'MCRB', 'name': 'Seres Therapeutics Inc.'}, {'symbol': 'MCRI', 'name': 'Monarch Casino & Resort Inc.'}, {'symbol': 'MCRN', 'name': 'Milacron Holdings Corp.'}, {'symbol': 'MCS', 'name': 'Marcus Corporation (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4283'}, {'symbol': 'MCX', 'name': 'Medley Capital Corporation 6.50% Notes due 2021', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10925'}, {'symbol': 'MCY', 'name': 'Mercury General Corporation'}, {'symbol': 'MD', 'name': 'Mednax Inc.'}, {'symbol': 'MDB', 'name': 'MongoDB Inc.'}, {'symbol': 'MDC', 'name': 'M.D.C. Holdings Inc.'}, {'symbol': 'MDCA', 'name': 'MDC Partners Inc.'}, {'symbol': 'MDCO', 'name': 'The Medicines Company'}, {'symbol': 'MDGL', 'name': 'Madrigal Pharmaceuticals Inc.'}, {'symbol': 'MDGS', 'name': 'Medigus Ltd.'}, {'symbol': 'MDIV', 'name': 'First Trust Multi-Asset Diversified Income Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '4295'}, {'symbol': 'MDJH', 'name': 'MDJM LTD'}, {'symbol': 'MDLX', 'name': 'Medley LLC 6.875% Senior Notes due 2026', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11741'}, {'symbol': 'MDLY', 'name': 'Medley Management Inc. Class A'}, {'symbol': 'MDLZ', 'name': 'Mondelez International Inc.'}, {'symbol': 'MDP', 'name': 'Meredith Corporation'}, {'symbol': 'MDR', 'name': 'McDermott International Inc.'}, {'symbol': 'MDRR', 'name': 'Medalist Diversified REIT Inc.'}, {'symbol': 'MDRX', 'name': 'Allscripts Healthcare Solutions Inc.'}, {'symbol': 'MDSO', 'name': 'Medidata Solutions Inc.'}, {'symbol': 'MDT', 'name': 'Medtronic plc.'}, {'symbol': 'MDU', 'name': 'MDU Resources Group Inc. (Holding Company)'}, {'symbol': 'MDWD', 'name': 'MediWound Ltd.'}, {'symbol': 'MDYG', 'name': 'SPDR S&P 400 Mid Cap Growth ETF (based on S&P MidCap 400 Growth Index--symbol: MUV)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '4308'}, {'symbol': 'MEAR', 'name': 'iShares Short Maturity Municipal Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9789'}, {'symbol': 'MED', 'name': 'MEDIFAST INC'}, {'symbol': 'MEDP', 'name': 'Medpace Holdings Inc.'}, {'symbol': 'MEET', 'name': 'The Meet Group Inc.'}, {'symbol': 'MEI', 'name': 'Methode Electronics Inc.'}, {'symbol': 'MEIP', 'name': 'MEI Pharma Inc.'}, {'symbol': 'MELI', 'name': 'MercadoLibre Inc.'}, {'symbol': 'MELR', 'name': 'Melrose Bancorp Inc.'}, {'symbol': 'MEN', 'name': 'Blackrock MuniEnhanced Fund Inc'}, {'symbol': 'MEOH', 'name': 'Methanex Corporation'}, {'symbol': 'MERC', 'name': 'Mercer International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4333'}, {'symbol': 'MESA', 'name': 'Mesa Air Group Inc.'}, {'symbol': 'MESO', 'name': 'Mesoblast Limited'}, {'symbol': 'MET', 'name': 'MetLife Inc.'}, {'symbol': 'MET-E', 'name': 'MetLife Inc. Depositary shares Series E', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14721'}, {'symbol': 'METC', 'name': 'Ramaco Resources Inc.'}, {'symbol': 'MFA', 'name': 'MFA Financial Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4340'}, {'symbol': 'MFAC', 'name': 'Megalith Financial Acquisition Corp. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15050'}, {'symbol': 'MFAC=', 'name': 'Megalith Financial Acquisition Corp. Units each consisting of one share of Class A common stock $0.0001 par value and one redeemable warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14847'}, {'symbol': 'MFC', 'name': 'Manulife Financial Corporation'}, {'symbol': 'MFCB', 'name': 'MFC Bancorp Ltd.'}, {'symbol': 'MFD', 'name': 'Macquarie First Trust Global'}, {'symbol': 'MFEM', 'name': 'PIMCO Equitiy Series RAFI Dynamic Multi-Factor Emerging Markets Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13343'}, {'symbol': 'MFG', 'name': 'Mizuho Financial Group Inc. Sponosred ADR (Japan)'}, {'symbol': 'MFGP', 'name': 'Micro Focus Intl PLC ADS each representing One Ord Sh'}, {'symbol': 'MFIN', 'name': 'Medallion Financial Corp.'}, {'symbol': 'MFL', 'name': 'Blackrock MuniHoldings Investment Quality Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4347'}, {'symbol': 'MFM', 'name': 'MFS Municipal Income Trust'}, {'symbol': 'MFNC', 'name': 'Mackinac Financial Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4352'}, {'symbol': 'MFSF', 'name': 'MutualFirst Financial Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4357'}, {'symbol': 'MFT', 'name': 'Blackrock MuniYield Investment Quality Fund of Beneficial Interest'}, {'symbol': 'MFV', 'name': 'MFS Special Value Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4359'}, {'symbol': 'MG', 'name': 'Mistras Group Inc'}, {'symbol': 'MGA', 'name': 'Magna International Inc.'}, {'symbol': 'MGEE', 'name': 'MGE Energy Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4365'}, {'symbol': 'MGEN', 'name': 'Miragen Therapeutics Inc.'}, {'symbol': 'MGF', 'name': 'MFS Government Markets Income Trust'}, {'symbol': 'MGI', 'name': 'Moneygram International Inc.'}, {'symbol': 'MGIC', 'name': 'Magic Software Enterprises Ltd.'}, {'symbol': 'MGLN', 'name': 'Magellan Health Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4371'}, {'symbol': 'MGM', 'name': 'MGM Resorts International'}, {'symbol': 'MGNX', 'name': 'MacroGenics Inc.'}, {'symbol': 'MGP', 'name': 'MGM Growth Properties LLC Class A representing limited liability company interests'}, {'symbol': 'MGPI', 'name': 'MGP Ingredients Inc.'}, {'symbol': 'MGRC', 'name': 'McGrath RentCorp'}, {'symbol': 'MGTA', 'name': 'Magenta Therapeutics Inc.'}, {'symbol': 'MGTX', 'name': 'MeiraGTx Holdings plc'}, {'symbol': 'MGU', 'name': 'Macquarie Global Infrastructure Total Return Fund Inc.'}, {'symbol': 'MGY', 'name': 'Magnolia Oil & Gas Corporation Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13051'}, {'symbol': 'MGYR', 'name': 'Magyar Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4380'}, {'symbol': 'MH-C', 'name': 'Maiden Holdings North America Ltd. 7.125% Non-Cumulative Preference Shares Series C', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14607'}, {'symbol': 'MHD', 'name': 'Blackrock MuniHoldings Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4382'}, {'symbol': 'MHE', 'name': 'BlackRock Massachusetts Tax-Exempt Trust'}, {'symbol': 'MHF', 'name': 'Western Asset Municipal High Income Fund Inc.'}, {'symbol': 'MHH', 'name': 'Mastech Digital Inc'}, {'symbol': 'MHI', 'name': 'Pioneer Municipal High Income Trust of Beneficial Interest'}, {'symbol': 'MHK', 'name': 'Mohawk Industries Inc.'}, {'symbol': 'MHLD', 'name': 'Maiden Holdings Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4390'}, {'symbol': 'MHN', 'name': 'Blackrock MuniHoldings New York Quality Fund Inc.'}, {'symbol': 'MHO', 'name': 'M/I Homes Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4394'}, {'symbol': 'MIC', 'name': 'Macquarie Infrastructure Corporation'}, {'symbol': 'MICR', 'name': 'Micron Solutions Inc.'}, {'symbol': 'MICT', 'name': 'MICT Inc.'}, {'symbol': 'MIDD', 'name': 'The Middleby Corporation'}, {'symbol': 'MIDZ', 'name': 'Direxion Mid Cap Bear 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '4405'}, {'symbol': 'MIE', 'name': 'Cohen & Steers MLP Income and Energy Opportunity Fund Inc.'}, {'symbol': 'MIK', 'name': 'The Michaels Companies Inc.'}, {'symbol': 'MIME', 'name': 'Mimecast Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10866'}, {'symbol': 'MIN', 'name': 'MFS Intermediate Income Trust'}, {'symbol': 'MIND', 'name': 'Mitcham Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4413'}, {'symbol': 'MINI', 'name': 'Mobile Mini Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4414'}, {'symbol': 'MITK', 'name': 'Mitek Systems Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4416'}, {'symbol': 'MITT', 'name': 'AG Mortgage Investment Trust Inc.'}, {'symbol': 'MITT-B', 'name': 'AG Mortgage Investment Trust Inc. Preferred Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '4420'}, {'symbol': 'MIXT', 'name': 'MiX Telematics Limited American Depositary Shares each representing 25'}, {'symbol': 'MIY', 'name': 'Blackrock MuniYield Michigan Quality Fund Inc.'}, {'symbol': 'MJCO', 'name': 'Majesco', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10224'}, {'symbol': 'MKC', 'name': 'McCormick & Company Incorporated'}, {'symbol': 'MKC.V', 'name': 'McCormick & Company Incorporated'}, {'symbol': 'MKGI', 'name': 'Monaker Group Inc.'}, {'symbol': 'MKL', 'name': 'Markel Corporation'}, {'symbol': 'MKSI', 'name': 'MKS Instruments Inc.'}, {'symbol': 'MKTX', 'name': 'MarketAxess Holdings Inc.'}, {'symbol': 'MLAB', 'name': 'Mesa Laboratories Inc.'}, {'symbol': 'MLCO', 'name': 'Melco Resorts & Entertainment Limited'}, {'symbol': 'MLHR', 'name': 'Herman Miller Inc.'}, {'symbol': 'MLI', 'name': 'Mueller Industries Inc.'}, {'symbol': 'MLM', 'name': 'Martin Marietta Materials Inc.'}, {'symbol': 'MLND', 'name': 'Millendo Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5210'}, {'symbol': 'MLNT', 'name': 'Melinta Therapeutics Inc.'}, {'symbol': 'MLNX', 'name': 'Mellanox Technologies Ltd.'}, {'symbol': 'MLP', 'name': 'Maui Land & Pineapple Company Inc.'}, {'symbol': 'MLPB', 'name': 'ETRACS Alerian MLP Infrastructure Index ETN Series B due April 2 2040', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10665'}, {'symbol': 'MLPE', 'name': 'C-Tracks ETN on Miller/Howard Fundamental MLP Index Series B Due July 13 2026', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11697'}, {'symbol': 'MLPI', 'name': 'UBS AG ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '4447'}, {'symbol': 'MLPQ', 'name': 'UBS AG ETRACS 2xMonthly Leveraged Alerian MLP Infrastructure Index ETN Series B due February 12 2046', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11056'}, {'symbol': 'MLPY', 'name': 'Morgan Stanley Cushing MLP High Income Index ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '4453'}, {'symbol': 'MLQD', 'name': 'iShares 5-10 Year Investment Grade Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13376'}, {'symbol': 'MLR', 'name': 'Miller Industries Inc.'}, {'symbol': 'MLSS', 'name': 'Milestone Scientific Inc.'}, {'symbol': 'MLVF', 'name': 'Malvern Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4456'}, {'symbol': 'MMAC', 'name': 'MMA Capital Holdings Inc.'}, {'symbol': 'MMC', 'name': 'Marsh & McLennan Companies Inc.'}, {'symbol': 'MMD', 'name': 'MainStay MacKay DefinedTerm Municipal Opportunities Fund'}, {'symbol': 'MMDM', 'name': 'Modern Media Acquisition Corp.'}, {'symbol': 'MMDMU', 'name': 'Modern Media Acquisition Corp. Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '12450'}, {'symbol': 'MMI', 'name': 'Marcus & Millichap Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8051'}, {'symbol': 'MMIT', 'name': 'IQ MacKay Municipal Intermediate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13596'}, {'symbol': 'MMLP', 'name': 'Martin Midstream Partners L.P.'}, {'symbol': 'MMM', 'name': '3M Company'}, {'symbol': 'MMP', 'name': 'Magellan Midstream Partners L.P. Limited Partnership'}, {'symbol': 'MMS', 'name': 'Maximus Inc.'}, {'symbol': 'MMSI', 'name': 'Merit Medical Systems Inc.'}, {'symbol': 'MMT', 'name': 'MFS Multimarket Income Trust'}, {'symbol': 'MMU', 'name': 'Western Asset Managed Municipals Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4467'}, {'symbol': 'MMYT', 'name': 'MakeMyTrip Limited'}, {'symbol': 'MN', 'name': 'Manning & Napier Inc. Class A'}, {'symbol': 'MNCLU', 'name': 'Monocle Acquisition Corporation Units', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15249'}, {'symbol': 'MNDO', 'name': 'MIND C.T.I. Ltd.'}, {'symbol': 'MNE', 'name': 'Blackrock Muni New York Intermediate Duration Fund Inc'}, {'symbol': 'MNGA', 'name': 'Taronis Technologies Inc.'}, {'symbol': 'MNI', 'name': 'McClatchy Company (The)'}, {'symbol': 'MNK', 'name': 'Mallinckrodt plc'}, {'symbol': 'MNKD', 'name': 'MannKind Corporation'}, {'symbol': 'MNLO', 'name': 'Menlo Therapeutics Inc.'}, {'symbol': 'MNOV', 'name': 'MediciNova Inc.'}, {'symbol': 'MNP', 'name': 'Western Asset Municipal Partners Fund Inc.'}, {'symbol': 'MNR', 'name': 'Monmouth Real Estate Investment Corporation Class A'}, {'symbol': 'MNRO', 'name': 'Monro Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4485'}, {'symbol': 'MNST', 'name': 'Monster Beverage Corporation'}, {'symbol': 'MNTA', 'name': 'Momenta Pharmaceuticals Inc.'}, {'symbol': 'MNTX', 'name': 'Manitex International Inc.'}, {'symbol': 'MO', 'name': 'Altria Group Inc.'}, {'symbol': 'MOBL', 'name': 'MobileIron Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8610'}, {'symbol': 'MOC', 'name': 'Command Security Corporation'}, {'symbol': 'MOD', 'name': 'Modine Manufacturing Company'}, {'symbol': 'MODN', 'name': 'Model N Inc.'}, {'symbol': 'MOFG', 'name': 'MidWestOne Financial Group Inc.'}, {'symbol': 'MOG.A', 'name': 'Moog Inc. Class A'}, {'symbol': 'MOG.B', 'name': 'Moog Inc. Class B'}, {'symbol': 'MOGO', 'name': 'Mogo Finance Technology Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14462'}, {'symbol': 'MOGU', 'name': 'MOGU Inc. American Depositary Shares (each representing 25 Class A)'}, {'symbol': 'MOH', 'name': 'Molina Healthcare Inc'}, {'symbol': 'MOMO', 'name': 'Momo Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9493'}, {'symbol': 'MOR', 'name': 'MorphoSys AG', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14454'}, {'symbol': 'MORN', 'name': 'Morningstar Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4509'}, {'symbol': 'MOS', 'name': 'Mosaic Company (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4511'}, {'symbol': 'MOSC', 'name': 'Mosaic Acquisition Corp. Class A'}, {'symbol': 'MOSC=', 'name': 'Mosaic Acquisition Corp. Units each consisting of one Class A Common Stock and one-third of one Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '13618'}, {'symbol': 'MOSY', 'name': 'MoSys Inc.'}, {'symbol': 'MOTS', 'name': 'Motus GI Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13993'}, {'symbol': 'MOV', 'name': 'Movado Group Inc.'}, {'symbol': 'MOXC', 'name': 'Moxian Inc.'}, {'symbol': 'MPA', 'name': 'Blackrock MuniYield Pennsylvania Quality Fund'}, {'symbol': 'MPAA', 'name': 'Motorcar Parts of America Inc.'}, {'symbol': 'MPB', 'name': 'Mid Penn Bancorp'}, {'symbol': 'MPC', 'name': 'Marathon Petroleum Corporation'}, {'symbol': 'MPLX', 'name': 'MPLX LP Representing Limited Partner Interests'}, {'symbol': 'MPO', 'name': 'Midstates Petroleum Company Inc.'}, {'symbol': 'MPV', 'name': 'Barings Participation Investors'}, {'symbol': 'MPVD', 'name': 'Mountain Province Diamonds Inc.'}, {'symbol': 'MPW', 'name': 'Medical Properties Trust Inc.'}, {'symbol': 'MPWR', 'name': 'Monolithic Power Systems Inc.'}, {'symbol': 'MPX', 'name': 'Marine Products Corporation'}, {'symbol': 'MQT', 'name': 'Blackrock MuniYield Quality Fund II Inc.'}, {'symbol': 'MQY', 'name': 'Blackrock MuniYield Quality Fund Inc.'}, {'symbol': 'MRAM', 'name': 'Everspin Technologies Inc.'}, {'symbol': 'MRBK', 'name': 'Meridian Corporation'}, {'symbol': 'MRC', 'name': 'MRC Global Inc.'}, {'symbol': 'MRCC', 'name': 'Monroe Capital Corporation'}, {'symbol': 'MRCY', 'name': 'Mercury Systems Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4538'}, {'symbol': 'MRIN', 'name': 'Marin Software Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4543'}, {'symbol': 'MRK', 'name': 'Merck & Company Inc. (new)'}, {'symbol': 'MRKR', 'name': 'Marker Therapeutics Inc.'}, {'symbol': 'MRLN', 'name': 'Marlin Business Services Corp.'}, {'symbol': 'MRNA', 'name': 'Moderna Inc.'}, {'symbol': 'MRNS', 'name': 'Marinus Pharmaceuticals Inc.'}, {'symbol': 'MRO', 'name': 'Marathon Oil Corporation'}, {'symbol': 'MRSN', 'name': 'Mersana Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12985'}, {'symbol': 'MRT', 'name': 'MedEquities Realty Trust Inc.'}, {'symbol': 'MRTN', 'name': 'Marten Transport Ltd.'}, {'symbol': 'MRTX', 'name': 'Mirati Therapeutics Inc.'}, {'symbol': 'MRUS', 'name': 'Merus N.V.'}, {'symbol': 'MRVL', 'name': 'Marvell Technology Group Ltd.'}, {'symbol': 'MS', 'name': 'Morgan Stanley'}, {'symbol': 'MS-E', 'name': 'Morgan Stanley DEPOSITARY SHARES SERIES E', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '7888'}, {'symbol': 'MS-G', 'name': 'Morgan Stanley Depositary Shares Series G', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '8594'}, {'symbol': 'MS-K', 'name': 'Morgan Stanley Depositary Shares Series K', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '12364'}, {'symbol': 'MSA', 'name': 'MSA Safety Incorporated'}, {'symbol': 'MSB', 'name': 'Mesabi Trust'}, {'symbol': 'MSBF', 'name': 'MSB Financial Corp.'}, {'symbol': 'MSBI', 'name': 'Midland States Bancorp Inc.'}, {'symbol': 'MSC', 'name': 'Studio City International Holdings Limited American depositary shares each representing four Class A'}, {'symbol': 'MSCI', 'name': 'MSCI Inc'}, {'symbol': 'MSD', 'name': 'Morgan Stanley Emerging Markets Debt Fund Inc.'}, {'symbol': 'MSEX', 'name': 'Middlesex Water Company'}, {'symbol': 'MSF', 'name': 'Morgan Stanley Emerging Markets Fund Inc.'}, {'symbol': 'MSFT', 'name': 'Microsoft Corporation'}, {'symbol': 'MSG', 'name': 'The Madison Square Garden Company Class A (New)'}, {'symbol': 'MSGN', 'name': 'MSG Networks Inc.'}, {'symbol': 'MSI', 'name': 'Motorola Solutions Inc.'}, {'symbol': 'MSL', 'name': 'MidSouth Bancorp'}, {'symbol': 'MSM', 'name': 'MSC Industrial Direct Company Inc.'}, {'symbol': 'MSN', 'name': 'Emerson Radio Corporation'}, {'symbol': 'MSON', 'name': 'MISONIX Inc.'}, {'symbol': 'MSTR', 'name': 'MicroStrategy Incorporated'}, {'symbol': 'MSVB', 'name': 'Mid-Southern Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14820'}, {'symbol': 'MT', 'name': 'Arcelor Mittal NY Registry Shares NEW'}, {'symbol': 'MTB', 'name': 'M&T Bank Corporation'}, {'symbol': 'MTB-C', 'name': 'M&T Bank Corporation Fixed Rate Cumulative Perpetual Preferred Stock Series C', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '4584'}, {'symbol': 'MTBC', 'name': 'Medical Transcription Billing Corp.'}, {'symbol': 'MTC', 'name': 'MMTec Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15335'}, {'symbol': 'MTCH', 'name': 'Match Group Inc.'}, {'symbol': 'MTD', 'name': 'Mettler-Toledo International Inc.'}, {'symbol': 'MTDR', 'name': 'Matador Resources Company'}, {'symbol': 'MTEC', 'name': 'MTech Acquisition Corp.'}, {'symbol': 'MTECW', 'name': 'MTech Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14179'}, {'symbol': 'MTEM', 'name': 'Molecular Templates Inc.'}, {'symbol': 'MTEX', 'name': 'Mannatech Incorporated'}, {'symbol': 'MTFB', 'name': 'Motif Bio plc'}, {'symbol': 'MTG', 'name': 'MGIC Investment Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4588'}, {'symbol': 'MTH', 'name': 'Meritage Homes Corporation'}, {'symbol': 'MTL', 'name': 'Mechel PAO American Depositary Shares (Each rep. 1)'}, {'symbol': 'MTLS', 'name': 'Materialise NV', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8573'}, {'symbol': 'MTN', 'name': 'Vail Resorts Inc.'}, {'symbol': 'MTNB', 'name': 'Matinas Biopharma Holdings Inc.'}, {'symbol': 'MTOR', 'name': 'Meritor Inc.'}, {'symbol': 'MTP', 'name': 'Midatech Pharma PLC'}, {'symbol': 'MTR', 'name': 'Mesa Royalty Trust'}, {'symbol': 'MTRN', 'name': 'Materion Corporation'}, {'symbol': 'MTRX', 'name': 'Matrix Service Company'}, {'symbol': 'MTSC', 'name': 'MTS Systems Corporation'}, {'symbol': 'MTSI', 'name': 'MACOM Technology Solutions Holdings Inc.'}, {'symbol': 'MTSL', 'name': 'MER Telemanagement Solutions Ltd.'}, {'symbol': 'MTT', 'name': 'Western Asset Municipal Defined Opportunity Trust Inc'}, {'symbol': 'MTW', 'name': 'Manitowoc Company Inc. (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4607'}, {'symbol': 'MTX', 'name': 'Minerals Technologies Inc.'}, {'symbol': 'MTZ', 'name': 'MasTec Inc.'}, {'symbol': 'MU', 'name': 'Micron Technology Inc.'}, {'symbol': 'MUA', 'name': 'Blackrock MuniAssets Fund Inc'}, {'symbol': 'MUC', 'name': 'Blackrock MuniHoldings California Quality Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4620'}, {'symbol': 'MUDS', 'name': 'Mudrick Capital Acquisition Corporation'}, {'symbol': 'MUDSW', 'name': 'Mudrick Capital Acquisition Corporation Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14244'}, {'symbol': 'MUE', 'name': 'Blackrock MuniHoldings Quality Fund II Inc.'}, {'symbol': 'MUFG', 'name': 'Mitsubishi UFJ Financial Group Inc.'}, {'symbol': 'MUH', 'name': 'Blackrock MuniHoldings Fund II Inc.'}, {'symbol': 'MUI', 'name': 'Blackrock Muni Intermediate Duration Fund Inc'}, {'symbol': 'MUJ', 'name': 'Blackrock MuniHoldings New Jersey Quality Fund Inc.'}, {'symbol': 'MUR', 'name': 'Murphy Oil Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4627'}, {'symbol': 'MUS', 'name': 'Blackrock MuniHoldings Quality Fund Inc'}, {'symbol': 'MUSA', 'name': 'Murphy USA Inc.'}, {'symbol': 'MUTE', 'name': 'Direxion Daily Communication Services Index Bear 3X Shares', 'date': '2019-02-08', 'isEnabled': False, 'type': 'N/A', 'iexId': '15377'}, {'symbol': 'MUX', 'name': 'McEwen Mining Inc.'}, {'symbol': 'MVBF', 'name': 'MVB Financial Corp.'}, {'symbol': 'MVC', 'name': 'MVC Capital Inc.'}, {'symbol': 'MVF', 'name': 'Blackrock MuniVest Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4632'}, {'symbol': 'MVIS', 'name': 'MicroVision Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4634'}, {'symbol': 'MVO', 'name': 'MV Oil Trust'}, {'symbol': 'MVT', 'name': 'Blackrock MuniVest Fund II Inc.'}, {'symbol': 'MWA', 'name': 'MUELLER WATER PRODUCTS', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4639'}, {'symbol': 'MX', 'name': 'MagnaChip Semiconductor Corporation'}, {'symbol': 'MXC', 'name': 'Mexco Energy Corporation'}, {'symbol': 'MXDU', 'name': 'Nationwide Maximum Diversification U.S. Core Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13400'}, {'symbol': 'MXE', 'name': 'Mexico Equity and Income Fund Inc. (The)'}, {'symbol': 'MXF', 'name': 'Mexico Fund Inc. (The)'}, {'symbol': 'MXIM', 'name': 'Maxim Integrated Products Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4655'}, {'symbol': 'MXL', 'name': 'MaxLinear Inc.'}, {'symbol': 'MXWL', 'name': 'Maxwell Technologies Inc.'}, {'symbol': 'MYC', 'name': 'Blackrock MuniYield California Fund Inc.'}, {'symbol': 'MYD', 'name': 'Blackrock MuniYield Fund Inc.'}, {'symbol': 'MYE', 'name': 'Myers Industries Inc.'}, {'symbol': 'MYF', 'name': 'Blackrock MuniYield Investment Fund'}, {'symbol': 'MYFW', 'name': 'First Western Financial Inc.'}, {'symbol': 'MYGN', 'name': 'Myriad Genetics Inc.'}, {'symbol': 'MYI', 'name': 'Blackrock MuniYield Quality Fund III Inc'}, {'symbol': 'MYJ', 'name': 'Blackrock MuniYield New Jersey Fund Inc'}, {'symbol': 'MYL', 'name': 'Mylan N.V.'}, {'symbol': 'MYN', 'name': 'Blackrock MuniYield New York Quality Fund Inc.Common Stock'}, {'symbol': 'MYND', 'name': 'MYnd Analytics Inc.'}, {'symbol': 'MYO', 'name': 'Myomo Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13008'}, {'symbol': 'MYOK', 'name': 'MyoKardia Inc.'}, {'symbol': 'MYOS', 'name': 'MYOS RENS Technology Inc.'}, {'symbol': 'MYOV', 'name': 'Myovant Sciences Ltd.'}, {'symbol': 'MYRG', 'name': 'MYR Group Inc.'}, {'symbol': 'MYSZ', 'name': 'My Size Inc.'}, {'symbol': 'MZA', 'name': 'Blackrock MuniYield Arizona Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4674'}, {'symbol': 'NAC', 'name': 'Nuveen California Quality Municipal Income Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4679'}, {'symbol': 'NAD', 'name': 'Nuveen Quality Municipal Income Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4680'}, {'symbol': 'NAII', 'name': 'Natural Alternatives International Inc.'}, {'symbol': 'NAK', 'name': 'Northern Dynasty Minerals Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4686'}, {'symbol': 'NAKD', 'name': 'Naked Brand Group Limited'}, {'symbol': 'NAN', 'name': 'Nuveen New York Quality Municipal Income Fund'}, {'symbol': 'NANO', 'name': 'Nanometrics Incorporated'}, {'symbol': 'NAO', 'name': 'Nordic Amern Offshore Ltd. (Bermuda)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8810'}, {'symbol': 'NAOV', 'name': 'NanoVibronix Inc.'}, {'symbol': 'NAT', 'name': 'Nordic American Tankers Limited'}, {'symbol': 'NATH', 'name': "Nathan's Famous Inc."}, {'symbol': 'NATI', 'name': 'National Instruments Corporation'}, {'symbol': 'NATR', 'name': "Nature's Sunshine Products Inc."}, {'symbol': 'NAV', 'name': 'Navistar International Corporation'}, {'symbol': 'NAVB', 'name': 'Navidea Biopharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4701'}, {'symbol': 'NAVG', 'name': 'The Navigators Group Inc.'}, {'symbol': 'NAVI', 'name': 'Navient Corporation'}, {'symbol': 'NAZ', 'name': 'Nuveen Arizona Quality Municipal Income Fund'}, {'symbol': 'NBB', 'name': 'Nuveen Taxable Municipal Income Fund of Beneficial Interest'}, {'symbol': 'NBEV', 'name': 'New Age Beverages Corporation'}, {'symbol': 'NBH', 'name': 'Neuberger Berman Municipal Fund Inc.'}, {'symbol': 'NBHC', 'name': 'National Bank Holdings Corporation'}, {'symbol': 'NBIX', 'name': 'Neurocrine Biosciences Inc.'}, {'symbol': 'NBL', 'name': 'Noble Energy Inc.'}, {'symbol': 'NBLX', 'name': 'Noble Midstream Partners LP Representing Limited Partner Interests'}, {'symbol': 'NBN', 'name': 'Northeast Bancorp'}, {'symbol': 'NBO', 'name': 'Neuberger Berman New York Municipal Fund Inc.'}, {'symbol': 'NBR', 'name': 'Nabors Industries Ltd.'}, {'symbol': 'NBRV', 'name': 'Nabriva Therapeutics plc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13069'}, {'symbol': 'NBTB', 'name': 'NBT Bancorp Inc.'}, {'symbol': 'NBW', 'name': 'Neuberger Berman California Municipal Fund Inc'}, {'symbol': 'NBY', 'name': 'NovaBay Pharmaceuticals Inc.'}, {'symbol': 'NC', 'name': 'NACCO Industries Inc.'}, {'symbol': 'NCA', 'name': 'Nuveen California Municipal Value Fund Inc.'}, {'symbol': 'NCB', 'name': 'Nuveen California Municipal Value Fund 2 of Beneficial Interest'}, {'symbol': 'NCBS', 'name': 'Nicolet Bankshares Inc.'}, {'symbol': 'NCI', 'name': 'Navigant Consulting Inc.'}, {'symbol': 'NCLH', 'name': 'Norwegian Cruise Line Holdings Ltd.'}, {'symbol': 'NCMI', 'name': 'National CineMedia Inc.'}, {'symbol': 'NCNA', 'name': 'NuCana plc'}, {'symbol': 'NCOM', 'name': 'National Commerce Corporation'}, {'symbol': 'NCR', 'name': 'NCR Corporation'}, {'symbol': 'NCS', 'name': 'NCI Building Systems Inc.'}, {'symbol': 'NCSM', 'name': 'NCS Multistage Holdings Inc.'}, {'symbol': 'NCTY', 'name': 'The9 Limited'}, {'symbol': 'NCV', 'name': 'AllianzGI Convertible & Income Fund'}, {'symbol': 'NCZ', 'name': 'AllianzGI Convertible & Income Fund II of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4745'}, {'symbol': 'NDAQ', 'name': 'Nasdaq Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4746'}, {'symbol': 'NDLS', 'name': 'Noodles & Company'}, {'symbol': 'NDP', 'name': 'Tortoise Energy Independence Fund Inc.'}, {'symbol': 'NDRA', 'name': 'ENDRA Life Sciences Inc.'}, {'symbol': 'NDSN', 'name': 'Nordson Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4750'}, {'symbol': 'NE', 'name': 'Noble Corporation (UK)'}, {'symbol': 'NEA', 'name': 'Nuveen AMT-Free Quality Municipal Income Fund of Beneficial Interest Par Value $.01'}, {'symbol': 'NEBU', 'name': 'Nebula Acquisition Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14004'}, {'symbol': 'NEBUW', 'name': 'Nebula Acquisition Corporation Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14222'}, {'symbol': 'NEE', 'name': 'NextEra Energy Inc.'}, {'symbol': 'NEE-J', 'name': 'NextEra Energy Inc. Series J Junior Subordinated Debentures due January 15 2073', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '4763'}, {'symbol': 'NEE-R', 'name': 'NextEra Energy Inc. Corporate Units expiring 09/01/2019', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '11783'}, {'symbol': 'NEM', 'name': 'Newmont Mining Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4765'}, {'symbol': 'NEN', 'name': 'New England Realty Associates Limited Partnership Class A Depositary Receipts Evidencing Units of Limited Partnership'}, {'symbol': 'NEO', 'name': 'NeoGenomics Inc.'}, {'symbol': 'NEOG', 'name': 'Neogen Corporation'}, {'symbol': 'NEON', 'name': 'Neonode Inc.'}, {'symbol': 'NEOS', 'name': 'Neos Therapeutics Inc.'}, {'symbol': 'NEP', 'name': 'NextEra Energy Partners LP representing limited partner interests'}, {'symbol': 'NEPT', 'name': 'Neptune Wellness Solutions Inc.'}, {'symbol': 'NERV', 'name': 'Minerva Neurosciences Inc'}, {'symbol': 'NES', 'name': 'Nuverra Environmental Solutions Inc.'}, {'symbol': 'NESR', 'name': 'National Energy Services Reunited Corp.'}, {'symbol': 'NETE', 'name': 'Net Element Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4773'}, {'symbol': 'NETS', 'name': 'Netshoes (Cayman) Limited'}, {'symbol': 'NEU', 'name': 'NewMarket Corp'}, {'symbol': 'NEV', 'name': 'Nuveen Enhanced Municipal Value Fund of Beneficial Interest'}, {'symbol': 'NEW', 'name': 'Puxin Limited American Depositary Shares each representing two'}, {'symbol': 'NEWA', 'name': 'Newater Technology Inc.'}, {'symbol': 'NEWM', 'name': 'New Media Investment Group Inc.'}, {'symbol': 'NEWR', 'name': 'New Relic Inc.'}, {'symbol': 'NEWT', 'name': 'Newtek Business Services Corp.'}, {'symbol': 'NEWTZ', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10612'}, {'symbol': 'NEXA', 'name': 'Nexa Resources S.A.'}, {'symbol': 'NEXT', 'name': 'NextDecade Corporation'}, {'symbol': 'NFBK', 'name': 'Northfield Bancorp Inc.'}, {'symbol': 'NFC', 'name': 'New Frontier Corporation Class A'}, {'symbol': 'NFC=', 'name': 'New Frontier Corporation Units each consisting of one Class A Ordinary Share and one half of one Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14710'}, {'symbol': 'NFE', 'name': 'New Fortress Energy LLC'}, {'symbol': 'NFG', 'name': 'National Fuel Gas Company'}, {'symbol': 'NFJ', 'name': 'AllianzGI NFJ Dividend Interest & Premium Strategy Fund'}, {'symbol': 'NFLX', 'name': 'Netflix Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4784'}, {'symbol': 'NFRA', 'name': 'FlexShares STOXX Global Broad Infrastructure Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8001'}, {'symbol': 'NFX', 'name': 'Newfield Exploration Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4787'}, {'symbol': 'NG', 'name': 'Novagold Resources Inc.'}, {'symbol': 'NGD', 'name': 'New Gold Inc.'}, {'symbol': 'NGG', 'name': 'National Grid Transco PLC PLC (NEW) American Depositary Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4791'}, {'symbol': 'NGHC', 'name': 'National General Holdings Corp'}, {'symbol': 'NGHCO', 'name': 'National General Holdings Corp Depositary Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '9872'}, {'symbol': 'NGHCZ', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10426'}, {'symbol': 'NGL', 'name': 'NGL ENERGY PARTNERS LP representing Limited Partner Interests'}, {'symbol': 'NGLS-A', 'name': 'Targa Resources Partners LP 9.00% Series A Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units representing preferred equity interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '10729'}, {'symbol': 'NGS', 'name': 'Natural Gas Services Group Inc.'}, {'symbol': 'NGVC', 'name': 'Natural Grocers by Vitamin Cottage Inc.'}, {'symbol': 'NGVT', 'name': 'Ingevity Corporation'}, {'symbol': 'NH', 'name': 'NantHealth Inc.'}, {'symbol': 'NHA', 'name': 'Nuveen Municipal 2021 Target Term Fund Fund'}, {'symbol': 'NHC', 'name': 'National HealthCare Corporation'}, {'symbol': 'NHF', 'name': 'NexPoint Strategic Opportunities Fund'}, {'symbol': 'NHI', 'name': 'National Health Investors Inc.'}, {'symbol': 'NHLD', 'name': 'National Holdings Corporation'}, {'symbol': 'NHS', 'name': 'Neuberger Berman High Yield Strategies Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4804'}, {'symbol': 'NHTC', 'name': 'Natural Health Trends Corp.'}, {'symbol': 'NI', 'name': 'NiSource Inc'}, {'symbol': 'NIB', 'name': 'iPath Bloomberg Cocoa Subindex Total Return SM IndexETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '4807'}, {'symbol': 'NICE', 'name': 'NICE Ltd'}, {'symbol': 'NICK', 'name': 'Nicholas Financial Inc.'}, {'symbol': 'NID', 'name': 'Nuveen Intermediate Duration Municipal Term Fund of Beneficial Interest'}, {'symbol': 'NIE', 'name': 'AllianzGI Equity & Convertible Income Fund'}, {'symbol': 'NIHD', 'name': 'NII Holdings Inc.'}, {'symbol': 'NIM', 'name': 'Nuveen Select Maturities Municipal Fund'}, {'symbol': 'NINE', 'name': 'Nine Energy Service Inc.'}, {'symbol': 'NIO', 'name': 'NIO Inc. American depositary shares each representing one Class A'}, {'symbol': 'NIQ', 'name': 'Nuveenn Intermediate Duration Quality Municipal Term Fund of Beneficial Interest'}, {'symbol': 'NITE', 'name': 'Nightstar Therapeutics plc'}, {'symbol': 'NIU', 'name': 'Niu Technologies'}, {'symbol': 'NJR', 'name': 'NewJersey Resources Corporation'}, {'symbol': 'NJV', 'name': 'Nuveen New Jersey Municipal Value Fund of Beneficial Interest'}, {'symbol': 'NK', 'name': 'NantKwest Inc.'}, {'symbol': 'NKE', 'name': 'Nike Inc.'}, {'symbol': 'NKG', 'name': 'Nuveen Georgia Quality Municipal Income Fund'}, {'symbol': 'NKSH', 'name': 'National Bankshares Inc.'}, {'symbol': 'NKTR', 'name': 'Nektar Therapeutics'}, {'symbol': 'NKX', 'name': 'Nuveen California AMT-Free Quality Municipal Income Fund'}, {'symbol': 'NL', 'name': 'NL Industries Inc.'}, {'symbol': 'NLNK', 'name': 'NewLink Genetics Corporation'}, {'symbol': 'NLS', 'name': 'Nautilus Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4836'}, {'symbol': 'NLSN', 'name': 'Nielsen N.V.'}, {'symbol': 'NLY', 'name': 'Annaly Capital Management Inc'}, {'symbol': 'NLY-D', 'name': 'Annaly Capital Management Inc Preferred Series D', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '4842'}, {'symbol': 'NLY-G', 'name': 'Annaly Capital Management Inc 6.50% Series G Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14058'}, {'symbol': 'NM', 'name': 'Navios Maritime Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4843'}, {'symbol': 'NM-H', 'name': 'Navios Maritime Holdings Inc. Sponsored ADR Representing 1/100th Perp. Preferred Series H%', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14611'}, {'symbol': 'NMCI', 'name': 'Navios Maritime Containers L.P.'}, {'symbol': 'NMFC', 'name': 'New Mountain Finance Corporation'}, {'symbol': 'NMI', 'name': 'Nuveen Municipal Income Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4848'}, {'symbol': 'NMIH', 'name': 'NMI Holdings Inc'}, {'symbol': 'NMK-C', 'name': 'Niagara Mohawk Holdings Inc. Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '4850'}, {'symbol': 'NML', 'name': 'Neuberger Berman MLP Income Fund Inc.'}, {'symbol': 'NMM', 'name': 'Navios Maritime Partners LP Representing Limited Partner Interests'}, {'symbol': 'NMR', 'name': 'Nomura Holdings Inc ADR American Depositary Shares'}, {'symbol': 'NMRD', 'name': 'Nemaura Medical Inc.'}, {'symbol': 'NMRK', 'name': 'Newmark Group Inc.'}, {'symbol': 'NMS', 'name': 'Nuveen Minnesota Quality Municipal Income Fund'}, {'symbol': 'NMT', 'name': 'Nuveen Massachusetts Quality Municipal Income Fund'}, {'symbol': 'NMY', 'name': 'Nuveen Maryland Quality Municipal Income Fund'}, {'symbol': 'NMZ', 'name': 'Nuveen Municipal High Income Opportunity Fund $0.01 par value per share'}, {'symbol': 'NNA', 'name': 'Navios Maritime Acquisition Corporation'}, {'symbol': 'NNBR', 'name': 'NN Inc.'}, {'symbol': 'NNC', 'name': 'Nuveen North Carolina Quality Municipal Income Fund'}, {'symbol': 'NNDM', 'name': 'Nano Dimension Ltd.'}, {'symbol': 'NNI', 'name': 'Nelnet Inc.'}, {'symbol': 'NNN', 'name': 'National Retail Properties'}, {'symbol': 'NNN-F', 'name': 'National Retail Properties Depositary Shares Series F', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11971'}, {'symbol': 'NNVC', 'name': 'NanoViricides Inc.'}, {'symbol': 'NNY', 'name': 'Nuveen New York Municipal Value Fund Inc.'}, {'symbol': 'NOA', 'name': 'North American Construction Group Ltd. (no par)'}, {'symbol': 'NOAH', 'name': 'Noah Holdings Limited'}, {'symbol': 'NOBL', 'name': 'ProShares S&P 500 Dividend Aristocrats'}, {'symbol': 'NOC', 'name': 'Northrop Grumman Corporation'}, {'symbol': 'NODK', 'name': 'NI Holdings Inc.'}, {'symbol': 'NOG', 'name': 'Northern Oil and Gas Inc.'}, {'symbol': 'NOK', 'name': 'Nokia Corporation Sponsored American Depositary Shares'}, {'symbol': 'NOM', 'name': 'Nuveen Missouri Quality Municipal Income Fund'}, {'symbol': 'NOMD', 'name': 'Nomad Foods Limited'}, {'symbol': 'NOV', 'name': 'National Oilwell Varco Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4891'}, {'symbol': 'NOVN', 'name': 'Novan Inc.'}, {'symbol': 'NOVT', 'name': 'Novanta Inc.'}, {'symbol': 'NOW', 'name': 'ServiceNow Inc.'}, {'symbol': 'NP', 'name': 'Neenah Inc.'}, {'symbol': 'NPK', 'name': 'National Presto Industries Inc.'}, {'symbol': 'NPN', 'name': 'Nuveen Pennsylvania Municipal Value Fund of Beneficial Interest'}, {'symbol': 'NPO', 'name': 'EnPro Industries Inc'}, {'symbol': 'NPTN', 'name': 'NeoPhotonics Corporation'}, {'symbol': 'NPV', 'name': 'Nuveen Virginia Quality Municipal Income Fund'}, {'symbol': 'NQP', 'name': 'Nuveen Pennsylvania Quality Municipal Income Fund'}, {'symbol': 'NR', 'name': 'Newpark Resources Inc.'}, {'symbol': 'NRC', 'name': 'National Research Corporation'}, {'symbol': 'NRCG', 'name': 'NRC Group Holdings Corp.'}, {'symbol': 'NRE', 'name': 'NorthStar Realty Europe Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10687'}, {'symbol': 'NRG', 'name': 'NRG Energy Inc.'}, {'symbol': 'NRIM', 'name': 'Northrim BanCorp Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4932'}, {'symbol': 'NRK', 'name': 'Nuveen New York AMT-Free Quality Municipal Income Fund'}, {'symbol': 'NRO', 'name': 'Neuberger Berman Real Estate Securities Income Fund Inc.'}, {'symbol': 'NRP', 'name': 'Natural Resource Partners LP Limited Partnership'}, {'symbol': 'NRT', 'name': 'North European Oil Royality Trust'}, {'symbol': 'NRZ', 'name': 'New Residential Investment Corp.'}, {'symbol': 'NS', 'name': 'Nustar Energy L.P.'}, {'symbol': 'NS-B', 'name': 'Nustar Energy L.P. 7.625% Series B Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units representing limited partner interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '12880'}, {'symbol': 'NSA', 'name': 'National Storage Affiliates Trust of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9750'}, {'symbol': 'NSC', 'name': 'Norfolk Southern Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4940'}, {'symbol': 'NSEC', 'name': 'National Security Group Inc.'}, {'symbol': 'NSIT', 'name': 'Insight Enterprises Inc.'}, {'symbol': 'NSL', 'name': 'Nuveen Senior Income Fund'}, {'symbol': 'NSP', 'name': 'Insperity Inc.'}, {'symbol': 'NSPR', 'name': 'InspireMD Inc.'}, {'symbol': 'NSPR+B', 'name': 'InspireMD Inc. Series B Warrants exercisable for one share of common stock (Expiring March 14 2022)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12779'}, {'symbol': 'NSSC', 'name': 'NAPCO Security Technologies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4952'}, {'symbol': 'NSTG', 'name': 'NanoString Technologies Inc.'}, {'symbol': 'NSU', 'name': 'Nevsun Resources Ltd'}, {'symbol': 'NSYS', 'name': 'Nortech Systems Incorporated'}, {'symbol': 'NTAP', 'name': 'NetApp Inc.'}, {'symbol': 'NTB', 'name': 'Bank of N.T. Butterfield & Son Limited (The) Voting'}, {'symbol': 'NTC', 'name': 'Nuveen Connecticut Quality Municipal Income Fund'}, {'symbol': 'NTCT', 'name': 'NetScout Systems Inc.'}, {'symbol': 'NTEC', 'name': 'Intec Pharma Ltd.'}, {'symbol': 'NTES', 'name': 'NetEase Inc.'}, {'symbol': 'NTEST.A', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11846'}, {'symbol': 'NTEST.C', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11848'}, {'symbol': 'NTG', 'name': 'Tortoise Midstream Energy Fund Inc.'}, {'symbol': 'NTGN', 'name': 'Neon Therapeutics Inc.'}, {'symbol': 'NTGR', 'name': 'NETGEAR Inc.'}, {'symbol': 'NTIC', 'name': 'Northern Technologies International Corporation'}, {'symbol': 'NTIP', 'name': 'Network-1 Technologies Inc.'}, {'symbol': 'NTLA', 'name': 'Intellia Therapeutics Inc.'}, {'symbol': 'NTN', 'name': 'NTN Buzztime Inc.'}, {'symbol': 'NTNX', 'name': 'Nutanix Inc.'}, {'symbol': 'NTP', 'name': 'Nam Tai Property Inc.'}, {'symbol': 'NTR', 'name': 'Nutrien Ltd.'}, {'symbol': 'NTRA', 'name': 'Natera Inc.'}, {'symbol': 'NTRI', 'name': 'NutriSystem Inc'}, {'symbol': 'NTRP', 'name': 'Neurotrope Inc.'}, {'symbol': 'NTRS', 'name': 'Northern Trust Corporation'}, {'symbol': 'NTSX', 'name': 'WisdomTree 90/60 U.S. Balanced Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14880'}, {'symbol': 'NTWK', 'name': 'NETSOL Technologies Inc.'}, {'symbol': 'NTX', 'name': 'Nuveen Texas Quality Municipal Income Fund'}, {'symbol': 'NTZ', 'name': 'Natuzzi S.p.A.'}, {'symbol': 'NUAN', 'name': 'Nuance Communications Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4984'}, {'symbol': 'NUDM', 'name': 'Nuveen ESG International Developed Markets Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12997'}, {'symbol': 'NUE', 'name': 'Nucor Corporation'}, {'symbol': 'NUGT', 'name': 'Direxion Daily Gold Miners Index Bull 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '4988'}, {'symbol': 'NULV', 'name': 'Nuveen ESG Large-Cap Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12177'}, {'symbol': 'NUM', 'name': 'Nuveen Michigan Quality Municipal Income Fund'}, {'symbol': 'NUMV', 'name': 'Nuveen ESG Mid-Cap Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12179'}, {'symbol': 'NUO', 'name': 'Nuveen Ohio Quality Municipal Income Fund'}, {'symbol': 'NURO', 'name': 'NeuroMetrix Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4997'}, {'symbol': 'NUS', 'name': 'Nu Skin Enterprises Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4998'}, {'symbol': 'NUSC', 'name': 'Nuveen ESG Small-Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12180'}, {'symbol': 'NUV', 'name': 'Nuveen Municipal Value Fund Inc.'}, {'symbol': 'NUVA', 'name': 'NuVasive Inc.'}, {'symbol': 'NUW', 'name': 'Nuveen AMT-Free Municipal Value Fund'}, {'symbol': 'NVAX', 'name': 'Novavax Inc.'}, {'symbol': 'NVCN', 'name': 'Neovasc Inc.'}, {'symbol': 'NVCR', 'name': 'NovoCure Limited'}, {'symbol': 'NVDA', 'name': 'NVIDIA Corporation'}, {'symbol': 'NVEC', 'name': 'NVE Corporation'}, {'symbol': 'NVEE', 'name': 'NV5 Global Inc.'}, {'symbol': 'NVFY', 'name': 'Nova Lifestyle Inc'}, {'symbol': 'NVG', 'name': 'Nuveen AMT-Free Municipal Credit Income Fund'}, {'symbol': 'NVGS', 'name': 'Navigator Holdings Ltd. (Marshall Islands)'}, {'symbol': 'NVIV', 'name': 'InVivo Therapeutics Holdings Corp.'}, {'symbol': 'NVLN', 'name': 'Novelion Therapeutics Inc.'}, {'symbol': 'NVMI', 'name': 'Nova Measuring Instruments Ltd.'}, {'symbol': 'NVMM', 'name': 'Novume Solutions Inc.'}, {'symbol': 'NVO', 'name': 'Novo Nordisk A/S'}, {'symbol': 'NVR', 'name': 'NVR Inc.'}, {'symbol': 'NVRO', 'name': 'Nevro Corp.'}, {'symbol': 'NVS', 'name': 'Novartis AG'}, {'symbol': 'NVT', 'name': 'nVent Electric plc'}, {'symbol': 'NVTA', 'name': 'Invitae Corporation'}, {'symbol': 'NVTR', 'name': 'Nuvectra Corporation'}, {'symbol': 'NVUS', 'name': 'Novus Therapeutics Inc.'}, {'symbol': 'NWBI', 'name': 'Northwest Bancshares Inc.'}, {'symbol': 'NWE', 'name': 'NorthWestern Corporation'}, {'symbol': 'NWFL', 'name': 'Norwood Financial Corp.'}, {'symbol': 'NWHM', 'name': 'The New Home Company Inc.'}, {'symbol': 'NWL', 'name': 'Newell Brands Inc.'}, {'symbol': 'NWLI', 'name': 'National Western Life Group Inc.'}, {'symbol': 'NWN', 'name': 'Northwest Natural Holding Company'}, {'symbol': 'NWPX', 'name': 'Northwest Pipe Company'}, {'symbol': 'NWS', 'name': 'News Corporation'}, {'symbol': 'NWSA', 'name': 'News Corporation'}, {'symbol': 'NX', 'name': 'Quanex Building Products Corporation'}, {'symbol': 'NXC', 'name': 'Nuveen California Select Tax-Free Income Portfolio'}, {'symbol': 'NXE', 'name': 'Nexgen Energy Ltd.'}, {'symbol': 'NXEO', 'name': 'Nexeo Solutions Inc.'}, {'symbol': 'NXEOW', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9124'}, {'symbol': 'NXGN', 'name': 'NextGen Healthcare Inc.'}, {'symbol': 'NXJ', 'name': 'Nuveen New Jersey Qualified Municipal Fund'}, {'symbol': 'NXN', 'name': 'Nuveen New York Select Tax-Free Income Portfolio'}, {'symbol': 'NXP', 'name': 'Nuveen Select Tax Free Income Portfolio'}, {'symbol': 'NXPI', 'name': 'NXP Semiconductors N.V.'}, {'symbol': 'NXQ', 'name': 'Nuveen Select Tax Free Income Portfolio II'}, {'symbol': 'NXR', 'name': 'Nuveen Select Tax Free Income Portfolio III'}, {'symbol': 'NXRT', 'name': 'NexPoint Residential Trust Inc.'}, {'symbol': 'NXST', 'name': 'Nexstar Media Group Inc.'}, {'symbol': 'NXTD', 'name': 'NXT-ID Inc.'}, {'symbol': 'NXTM', 'name': 'NxStage Medical Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5049'}, {'symbol': 'NYCB', 'name': 'New York Community Bancorp Inc.'}, {'symbol': 'NYCB-U', 'name': 'New York Community Bancorp Inc. Capital Tr V (BONUSES)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '5054'}, {'symbol': 'NYMT', 'name': 'New York Mortgage Trust Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5058'}, {'symbol': 'NYMTO', 'name': 'New York Mortgage Trust Inc. 7.875% Series C Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '9965'}, {'symbol': 'NYMX', 'name': 'Nymox Pharmaceutical Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5060'}, {'symbol': 'NYNY', 'name': 'Empire Resorts Inc.'}, {'symbol': 'NYT', 'name': 'New York Times Company (The)'}, {'symbol': 'NYV', 'name': 'Nuveen New York Municipal Value Fund 2 of Beneficial Interest'}, {'symbol': 'NZF', 'name': 'Nuveen Municipal Credit Income Fund'}, {'symbol': 'O', 'name': 'Realty Income Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5071'}, {'symbol': 'OAK', 'name': 'Oaktree Capital Group LLC Class A Units Representing Limited Liability Company Interests'}, {'symbol': 'OAK-B', 'name': 'Oaktree Capital Group LLC 6.550% Series B Preferred Units', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14927'}, {'symbol': 'OAS', 'name': 'Oasis Petroleum Inc.'}, {'symbol': 'OASM', 'name': 'Oasmia Pharmaceutical AB'}, {'symbol': 'OBAS', 'name': 'Optibase Ltd.'}, {'symbol': 'OBCI', 'name': 'Ocean Bio-Chem Inc.'}, {'symbol': 'OBE', 'name': 'Obsidian Energy Ltd.'}, {'symbol': 'OBLN', 'name': 'Obalon Therapeutics Inc.'}, {'symbol': 'OBNK', 'name': 'Origin Bancorp Inc.'}, {'symbol': 'OBSV', 'name': 'ObsEva SA', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12323'}, {'symbol': 'OC', 'name': 'Owens Corning Inc New'}, {'symbol': 'OCC', 'name': 'Optical Cable Corporation'}, {'symbol': 'OCFC', 'name': 'OceanFirst Financial Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5085'}, {'symbol': 'OCN', 'name': 'Ocwen Financial Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5088'}, {'symbol': 'OCSI', 'name': 'Oaktree Strategic Income Corporation'}, {'symbol': 'OCSL', 'name': 'Oaktree Specialty Lending Corporation'}, {'symbol': 'OCUL', 'name': 'Ocular Therapeutix Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8861'}, {'symbol': 'OCX', 'name': 'OncoCyte Corporation'}, {'symbol': 'ODC', 'name': 'Oil-Dri Corporation Of America'}, {'symbol': 'ODFL', 'name': 'Old Dominion Freight Line Inc.'}, {'symbol': 'ODP', 'name': 'Office Depot Inc.'}, {'symbol': 'ODT', 'name': 'Odonate Therapeutics Inc.'}, {'symbol': 'OEC', 'name': 'Orion Engineered Carbons S.A'}, {'symbol': 'OESX', 'name': 'Orion Energy Systems Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5099'}, {'symbol': 'OEW', 'name': 'Invesco S&P 100 Equal Weight', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14398'}, {'symbol': 'OFC', 'name': 'Corporate Office Properties Trust'}, {'symbol': 'OFED', 'name': 'Oconee Federal Financial Corp.'}, {'symbol': 'OFG', 'name': 'OFG Bancorp'}, {'symbol': 'OFG-B', 'name': 'OFG Bancorp 7.0% Non Cumulative Monthly Income Preferred Stock Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '5107'}, {'symbol': 'OFIX', 'name': 'Orthofix Medical Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5110'}, {'symbol': 'OFLX', 'name': 'Omega Flex Inc.'}, {'symbol': 'OFS', 'name': 'OFS Capital Corporation'}, {'symbol': 'OFSSZ', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15175'}, {'symbol': 'OGCP', 'name': 'Empire State Realty OP L.P. Series 60 Operating Partnership Units Representing Limited Partnership Interests'}, {'symbol': 'OGE', 'name': 'OGE Energy Corp'}, {'symbol': 'OGEN', 'name': 'Oragenics Inc.'}, {'symbol': 'OGS', 'name': 'ONE Gas Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8204'}, {'symbol': 'OHAI', 'name': 'OHA Investment Corporation'}, {'symbol': 'OHGI', 'name': 'One Horizon Group Inc.'}, {'symbol': 'OHI', 'name': 'Omega Healthcare Investors Inc.'}, {'symbol': 'OHRP', 'name': 'Ohr Pharmaceutical Inc.'}, {'symbol': 'OI', 'name': 'Owens-Illinois Inc.'}, {'symbol': 'OIA', 'name': 'Invesco Municipal Income Opportunities Trust'}, {'symbol': 'OIBR.C', 'name': 'Oi S.A. American Depositary Shares (Each representing 1)'}, {'symbol': 'OII', 'name': 'Oceaneering International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5124'}, {'symbol': 'OIIM', 'name': 'O2Micro International Limited'}, {'symbol': 'OILD', 'name': 'ProShares UltraPro 3x Short Crude Oil', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12735'}, {'symbol': 'OILU', 'name': 'ProShares UltraPro 3x Crude Oil', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12736'}, {'symbol': 'OIS', 'name': 'Oil States International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5130'}, {'symbol': 'OKE', 'name': 'ONEOK Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5131'}, {'symbol': 'OKTA', 'name': 'Okta Inc.'}, {'symbol': 'OLBK', 'name': 'Old Line Bancshares Inc.'}, {'symbol': 'OLED', 'name': 'Universal Display Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5136'}, {'symbol': 'OLLI', 'name': "Ollie's Bargain Outlet Holdings Inc.", 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10203'}, {'symbol': 'OLN', 'name': 'Olin Corporation'}, {'symbol': 'OLP', 'name': 'One Liberty Properties Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5140'}, {'symbol': 'OMAB', 'name': 'Grupo Aeroportuario del Centro Norte S.A.B. de C.V.'}, {'symbol': 'OMAD', 'name': 'One Madison Corporation Class A'}, {'symbol': 'OMAD=', 'name': 'One Madison Corporation Units each consisting of one Class A ordinary share $0.0001 par value and one half of one warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14066'}, {'symbol': 'OMC', 'name': 'Omnicom Group Inc.'}, {'symbol': 'OMCL', 'name': 'Omnicell Inc.'}, {'symbol': 'OMED', 'name': 'OncoMed Pharmaceuticals Inc.'}, {'symbol': 'OMER', 'name': 'Omeros Corporation'}, {'symbol': 'OMEX', 'name': 'Odyssey Marine Exploration Inc.'}, {'symbol': 'OMF', 'name': 'OneMain Holdings Inc.'}, {'symbol': 'OMFS', 'name': 'Oppenheimer Russell 2000 Dynamic Multifactor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13750'}, {'symbol': 'OMI', 'name': 'Owens & Minor Inc.'}, {'symbol': 'OMN', 'name': 'OMNOVA Solutions Inc.'}, {'symbol': 'OMP', 'name': 'Oasis Midstream Partners LP Representing Limited Partner Interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13409'}, {'symbol': 'ON', 'name': 'ON Semiconductor Corporation'}, {'symbol': 'ONB', 'name': 'Old National Bancorp'}, {'symbol': 'ONCE', 'name': 'Spark Therapeutics Inc.'}, {'symbol': 'ONCS', 'name': 'OncoSec Medical Incorporated'}, {'symbol': 'ONCY', 'name': 'Oncolytics Biotech Inc.'}, {'symbol': 'ONDK', 'name': 'On Deck Capital Inc.'}, {'symbol': 'ONE', 'name': 'OneSmart International Education Group Limited ADS'}, {'symbol': 'ONEQ', 'name': 'Fidelity Nasdaq Composite Index Tracking Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5157'}, {'symbol': 'ONEY', 'name': 'SPDR Russell 1000 Yield Focus', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10902'}, {'symbol': 'ONTX', 'name': 'Onconova Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5163'}, {'symbol': 'ONVO', 'name': 'Organovo Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5166'}, {'symbol': 'OOMA', 'name': 'Ooma Inc.'}, {'symbol': 'OPB', 'name': 'Opus Bank'}, {'symbol': 'OPBK', 'name': 'OP Bancorp'}, {'symbol': 'OPES', 'name': 'Opes Acquisition Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14284'}, {'symbol': 'OPESW', 'name': 'Opes Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14308'}, {'symbol': 'OPGN', 'name': 'OpGen Inc.'}, {'symbol': 'OPHC', 'name': 'OptimumBank Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5170'}, {'symbol': 'OPHT', 'name': 'Ophthotech Corporation'}, {'symbol': 'OPI', 'name': 'Office Properties Income Trust'}, {'symbol': 'OPK', 'name': 'Opko Health Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5171'}, {'symbol': 'OPNT', 'name': 'Opiant Pharmaceuticals Inc.'}, {'symbol': 'OPOF', 'name': 'Old Point Financial Corporation'}, {'symbol': 'OPP', 'name': 'RiverNorth/DoubleLine Strategic Opportunity Fund Inc.'}, {'symbol': 'OPRA', 'name': 'Opera Limited'}, {'symbol': 'OPRX', 'name': 'OptimizeRx Corporation'}, {'symbol': 'OPTN', 'name': 'OptiNose Inc.'}, {'symbol': 'OPTT', 'name': 'Ocean Power Technologies Inc.'}, {'symbol': 'OPY', 'name': 'Oppenheimer Holdings Inc. Class A (DE)'}, {'symbol': 'OR', 'name': 'Osisko Gold Royalties Ltd', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11582'}, {'symbol': 'ORA', 'name': 'Ormat Technologies Inc.'}, {'symbol': 'ORAN', 'name': 'Orange'}, {'symbol': 'ORBC', 'name': 'ORBCOMM Inc.'}, {'symbol': 'ORBK', 'name': 'Orbotech Ltd.'}, {'symbol': 'ORC', 'name': 'Orchid Island Capital Inc.'}, {'symbol': 'ORCL', 'name': 'Oracle Corporation'}, {'symbol': 'ORGO', 'name': 'Organogenesis Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12139'}, {'symbol': 'ORGS', 'name': 'Orgenesis Inc.'}, {'symbol': 'ORI', 'name': 'Old Republic International Corporation'}, {'symbol': 'ORIT', 'name': 'Oritani Financial Corp.'}, {'symbol': 'ORLY', 'name': "O'Reilly Automotive Inc."}, {'symbol': 'ORM', 'name': 'Owens Realty Mortgage Inc.'}, {'symbol': 'ORMP', 'name': 'Oramed Pharmaceuticals Inc.'}, {'symbol': 'ORN', 'name': 'Orion Group Holdings Inc. Common'}, {'symbol': 'ORPN', 'name': 'Bioblast Pharma Ltd.'}, {'symbol': 'ORRF', 'name': 'Orrstown Financial Services Inc'}, {'symbol': 'ORTX', 'name': 'Orchard Therapeutics plc'}, {'symbol': 'OSB', 'name': 'Norbord Inc.'}, {'symbol': 'OSBC', 'name': 'Old Second Bancorp Inc.'}, {'symbol': 'OSCV', 'name': 'Opus Small Cap Value Plus', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14841'}, {'symbol': 'OSG', 'name': 'Overseas Shipholding Group Inc. Class A'}, {'symbol': 'OSIR', 'name': 'Osiris Therapeutics Inc.'}, {'symbol': 'OSIS', 'name': 'OSI Systems Inc.'}, {'symbol': 'OSK', 'name': 'Oshkosh Corporation (Holding Company)Common Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5200'}, {'symbol': 'OSMT', 'name': 'Osmotica Pharmaceuticals plc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15028'}, {'symbol': 'OSN', 'name': 'Ossen Innovation Co. Ltd.'}, {'symbol': 'OSPN', 'name': 'OneSpan Inc.'}, {'symbol': 'OSS', 'name': 'One Stop Systems Inc.'}, {'symbol': 'OSTK', 'name': 'Overstock.com Inc.'}, {'symbol': 'OSUR', 'name': 'OraSure Technologies Inc.'}, {'symbol': 'OTEL', 'name': 'Otelco Inc.'}, {'symbol': 'OTEX', 'name': 'Open Text Corporation'}, {'symbol': 'OTIC', 'name': 'Otonomy Inc.'}, {'symbol': 'OTIV', 'name': 'On Track Innovations Ltd'}, {'symbol': 'OTLK', 'name': 'Outlook Therapeutics Inc.'}, {'symbol': 'OTTR', 'name': 'Otter Tail Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5208'}, {'symbol': 'OTTW', 'name': 'Ottawa Bancorp Inc.'}, {'symbol': 'OUSA', 'name': "O'Shares FTSE U.S. Quality Dividend", 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14792'}, {'symbol': 'OUT', 'name': 'OUTFRONT Media Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8291'}, {'symbol': 'OVBC', 'name': 'Ohio Valley Banc Corp.'}, {'symbol': 'OVID', 'name': 'Ovid Therapeutics Inc.'}, {'symbol': 'OVLU', 'name': 'Oppenheimer Russell 1000 Value Factor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13754'}, {'symbol': 'OVLY', 'name': 'Oak Valley Bancorp (CA)'}, {'symbol': 'OXBR', 'name': 'Oxbridge Re Holdings Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8612'}, {'symbol': 'OXFD', 'name': 'Oxford Immunotec Global PLC', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8130'}, {'symbol': 'OXLC', 'name': 'Oxford Lane Capital Corp.'}, {'symbol': 'OXLCO', 'name': 'Oxford Lane Capital Corp. Term Preferred Shares 7.50% Series 2023', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '5220'}, {'symbol': 'OXM', 'name': 'Oxford Industries Inc.'}, {'symbol': 'OXSQ', 'name': 'Oxford Square Capital Corp.'}, {'symbol': 'OXY', 'name': 'Occidental Petroleum Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5223'}, {'symbol': 'OZK', 'name': 'Bank OZK', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13078'}, {'symbol': 'OZM', 'name': 'Och-Ziff Capital Management Group LLC Class A Shares representing Class A limited liability company interests'}, {'symbol': 'PAA', 'name': 'Plains All American Pipeline L.P.'}, {'symbol': 'PAAS', 'name': 'Pan American Silver Corp.'}, {'symbol': 'PAC', 'name': 'Grupo Aeroportuario Del Pacifico S.A. B. de C.V. de C.V. (each representing 10 Series B shares)'}, {'symbol': 'PACB', 'name': 'Pacific Biosciences of California Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5230'}, {'symbol': 'PACD', 'name': 'Pacific Drilling S.A.'}, {'symbol': 'PACQ', 'name': 'Pure Acquisition Corp.'}, {'symbol': 'PACQW', 'name': 'Pure Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14686'}, {'symbol': 'PACW', 'name': 'PacWest Bancorp'}, {'symbol': 'PAG', 'name': 'Penske Automotive Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5238'}, {'symbol': 'PAGP', 'name': 'Plains Group Holdings L.P. Class A Shares representing limited partner interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7859'}, {'symbol': 'PAGS', 'name': 'PagSeguro Digital Ltd. Class A'}, {'symbol': 'PAHC', 'name': 'Phibro Animal Health Corporation'}, {'symbol': 'PAI', 'name': 'Western Asset Investment Grade Income Fund Inc.'}, {'symbol': 'PALL', 'name': 'Aberdeen Standard Physical Palladium Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5242'}, {'symbol': 'PAM', 'name': 'Pampa Energia S.A.'}, {'symbol': 'PANL', 'name': 'Pangaea Logistics Solutions Ltd.'}, {'symbol': 'PANW', 'name': 'Palo Alto Networks Inc.'}, {'symbol': 'PAR', 'name': 'PAR Technology Corporation'}, {'symbol': 'PARR', 'name': 'Par Pacific Holdings Inc.'}, {'symbol': 'PATI', 'name': 'Patriot Transportation Holding Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9627'}, {'symbol': 'PATK', 'name': 'Patrick Industries Inc.'}, {'symbol': 'PAVM', 'name': 'PAVmed Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11659'}, {'symbol': 'PAVMZ', 'name': 'PAVmed Inc. Series Z Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14400'}, {'symbol': 'PAYC', 'name': 'Paycom Software Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8417'}, {'symbol': 'PAYX', 'name': 'Paychex Inc.'}, {'symbol': 'PB', 'name': 'Prosperity Bancshares Inc.'}, {'symbol': 'PBA', 'name': 'Pembina Pipeline Corp. (Canada)'}, {'symbol': 'PBBI', 'name': 'PB Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10829'}, {'symbol': 'PBCT', 'name': "People's United Financial Inc.", 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5255'}, {'symbol': 'PBD', 'name': 'Invesco Global Clean Energy', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5256'}, {'symbol': 'PBE', 'name': 'Invesco Dynamic Biotech & Genome', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5257'}, {'symbol': 'PBF', 'name': 'PBF Energy Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5258'}, {'symbol': 'PBFX', 'name': 'PBF Logistics LP representing limited partner interests'}, {'symbol': 'PBH', 'name': 'Prestige Consumer Healthcare Inc.'}, {'symbol': 'PBHC', 'name': 'Pathfinder Bancorp Inc.'}, {'symbol': 'PBI', 'name': 'Pitney Bowes Inc.'}, {'symbol': 'PBIP', 'name': 'Prudential Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5265'}, {'symbol': 'PBND', 'name': 'Invesco PureBeta US Aggregate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13466'}, {'symbol': 'PBPB', 'name': 'Potbelly Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7860'}, {'symbol': 'PBR', 'name': 'Petroleo Brasileiro S.A.- Petrobras'}, {'symbol': 'PBR.A', 'name': 'Petroleo Brasileiro S.A.- Petrobras American Depositary Shares'}, {'symbol': 'PBSM', 'name': 'Invesco PureBeta MSCI USA Small Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13422'}, {'symbol': 'PBT', 'name': 'Permian Basin Royalty Trust'}, {'symbol': 'PBUS', 'name': 'Invesco PureBeta MSCI USA', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13424'}, {'symbol': 'PBY', 'name': 'Prospect Capital Corporation 6.25% Notes due 2028', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14750'}, {'symbol': 'PBYI', 'name': 'Puma Biotechnology Inc'}, {'symbol': 'PCAR', 'name': 'PACCAR Inc.'}, {'symbol': 'PCB', 'name': 'Pacific City Financial Corporation'}, {'symbol': 'PCF', 'name': 'High Income Securities Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5285'}, {'symbol': 'PCG', 'name': 'Pacific Gas & Electric Co.'}, {'symbol': 'PCG-B', 'name': 'Pacific Gas & Electric Co. 5 1/2% Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '5288'}, {'symbol': 'PCG-D', 'name': 'Pacific Gas & Electric Co. 5% 1st Red. Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '5290'}, {'symbol': 'PCG-G', 'name': 'Pacific Gas & Electric Co. 4.80% 1st Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '5292'}, {'symbol': 'PCG-I', 'name': 'Pacific Gas & Electric Co. 4.36% 1st Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '5294'}, {'symbol': 'PCH', 'name': 'PotlatchDeltic Corporation'}, {'symbol': 'PCI', 'name': 'PIMCO Dynamic Credit and Mortgage Income Fund of Beneficial Interest'}, {'symbol': 'PCK', 'name': 'Pimco California Municipal Income Fund II of Beneficial Interest'}, {'symbol': 'PCM', 'name': 'PCM Fund Inc.'}, {'symbol': 'PCMI', 'name': 'PCM Inc.'}, {'symbol': 'PCN', 'name': 'Pimco Corporate & Income Strategy Fund'}, {'symbol': 'PCOM', 'name': 'Points International Ltd.'}, {'symbol': 'PCQ', 'name': 'PIMCO California Municipal Income Fund'}, {'symbol': 'PCRX', 'name': 'Pacira Pharmaceuticals Inc.'}, {'symbol': 'PCSB', 'name': 'PCSB Financial Corporation'}, {'symbol': 'PCTI', 'name': 'PC-Tel Inc.'}, {'symbol': 'PCTY', 'name': 'Paylocity Holding Corporation'}, {'symbol': 'PCYG', 'name': 'Park City Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5311'}, {'symbol': 'PCYO', 'name': 'Pure Cycle Corporation'}, {'symbol': 'PDCE', 'name': 'PDC Energy Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5313'}, {'symbol': 'PDCO', 'name': 'Patterson Companies Inc.'}, {'symbol': 'PDD', 'name': 'Pinduoduo Inc.'}, {'symbol': 'PDEX', 'name': 'Pro-Dex Inc.'}, {'symbol': 'PDFS', 'name': 'PDF Solutions Inc.'}, {'symbol': 'PDI', 'name': 'PIMCO Dynamic Income Fund'}, {'symbol': 'PDLB', 'name': 'PDL Community Bancorp'}, {'symbol': 'PDLI', 'name': 'PDL BioPharma Inc.'}, {'symbol': 'PDM', 'name': 'Piedmont Office Realty Trust Inc. Class A'}, {'symbol': 'PDP', 'name': 'Invesco DWA Momentum ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5324'}, {'symbol': 'PDS', 'name': 'Precision Drilling Corporation'}, {'symbol': 'PDT', 'name': 'John Hancock Premium Dividend Fund'}, {'symbol': 'PDVW', 'name': 'pdvWireless Inc.'}, {'symbol': 'PE', 'name': 'Parsley Energy Inc. Class A'}, {'symbol': 'PEB', 'name': 'Pebblebrook Hotel Trust of Beneficial Interest'}, {'symbol': 'PEB-D', 'name': 'Pebblebrook Hotel Trust 6.375% Series D Cumulative Redeemable Preferred Shares of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11478'}, {'symbol': 'PEB-F', 'name': 'Pebblebrook Hotel Trust 6.3% Series F Cumulative Redeemable Preferred Shares of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '15278'}, {'symbol': 'PEBK', 'name': 'Peoples Bancorp of North Carolina Inc.'}, {'symbol': 'PEBO', 'name': 'Peoples Bancorp Inc.'}, {'symbol': 'PED', 'name': 'Pedevco Corp.'}, {'symbol': 'PEG', 'name': 'Public Service Enterprise Group Incorporated'}, {'symbol': 'PEGA', 'name': 'Pegasystems Inc.'}, {'symbol': 'PEGI', 'name': 'Pattern Energy Group Inc.'}, {'symbol': 'PEI', 'name': 'Pennsylvania Real Estate Investment Trust'}, {'symbol': 'PEI-C', 'name': 'Pennsylvania Real Estate Investment Trust 7.20% Series C Cumulative Redeemable Perpetual Preferred Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '12358'}, {'symbol': 'PEIX', 'name': 'Pacific Ethanol Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5338'}, {'symbol': 'PEK', 'name': 'VanEck Vectors ChinaAMC CSI 3000', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5340'}, {'symbol': 'PEN', 'name': 'Penumbra Inc.'}, {'symbol': 'PENN', 'name': 'Penn National Gaming Inc.'}, {'symbol': 'PEO', 'name': 'Adams Natural Resources Fund Inc.'}, {'symbol': 'PEP', 'name': 'PepsiCo Inc.'}, {'symbol': 'PER', 'name': 'SandRidge Permian Trust of Benficial Interest'}, {'symbol': 'PERI', 'name': 'Perion Network Ltd'}, {'symbol': 'PES', 'name': 'Pioneer Energy Services Corp. Common Stk'}, {'symbol': 'PESI', 'name': 'Perma-Fix Environmental Services Inc.'}, {'symbol': 'PETQ', 'name': 'PetIQ Inc.'}, {'symbol': 'PETS', 'name': 'PetMed Express Inc.'}, {'symbol': 'PETX', 'name': 'Aratana Therapeutics Inc.'}, {'symbol': 'PETZ', 'name': 'TDH Holdings Inc.'}, {'symbol': 'PEX', 'name': 'ProShares Global Listed Private Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '5357'}, {'symbol': 'PEY', 'name': 'Invesco High Yield Equity Dividend Achievers ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5358'}, {'symbol': 'PFBC', 'name': 'Preferred Bank', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5361'}, {'symbol': 'PFBI', 'name': 'Premier Financial Bancorp Inc.'}, {'symbol': 'PFD', 'name': 'Flaherty & Crumrine Preferred Income Fund Incorporated'}, {'symbol': 'PFE', 'name': 'Pfizer Inc.'}, {'symbol': 'PFFA', 'name': 'Virtus InfraCap U.S. Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14547'}, {'symbol': 'PFFL', 'name': 'ETRACS 2xMonthly Pay Leveraged Preferred Stock Index ETN due September 25 2048', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15075'}, {'symbol': 'PFG', 'name': 'Principal Financial Group Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5368'}, {'symbol': 'PFGC', 'name': 'Performance Food Group Company'}, {'symbol': 'PFI', 'name': 'Invesco DWA Financial Momentum ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5371'}, {'symbol': 'PFIE', 'name': 'Profire Energy Inc.'}, {'symbol': 'PFIN', 'name': 'P & F Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5373'}, {'symbol': 'PFIS', 'name': 'Peoples Financial Services Corp.'}, {'symbol': 'PFL', 'name': 'PIMCO Income Strategy Fund Shares of Beneficial Interest'}, {'symbol': 'PFLT', 'name': 'PennantPark Floating Rate Capital Ltd.'}, {'symbol': 'PFMT', 'name': 'Performant Financial Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5378'}, {'symbol': 'PFN', 'name': 'PIMCO Income Strategy Fund II'}, {'symbol': 'PFNX', 'name': 'Pfenex Inc.'}, {'symbol': 'PFO', 'name': 'Flaherty & Crumrine Preferred Income Opportunity Fund Incorporated'}, {'symbol': 'PFPT', 'name': 'Proofpoint Inc.'}, {'symbol': 'PFS', 'name': 'Provident Financial Services Inc'}, {'symbol': 'PFSI', 'name': 'PennyMac Financial Services Inc.'}, {'symbol': 'PFSW', 'name': 'PFSweb Inc.'}, {'symbol': 'PG', 'name': 'Procter & Gamble Company (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5387'}, {'symbol': 'PGC', 'name': 'Peapack-Gladstone Financial Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5388'}, {'symbol': 'PGHY', 'name': 'Invesco Global Short Term High Yield Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '5393'}, {'symbol': 'PGLC', 'name': 'Pershing Gold Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10267'}, {'symbol': 'PGNX', 'name': 'Progenics Pharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5397'}, {'symbol': 'PGP', 'name': 'Pimco Global Stocksplus & Income Fund StocksPlus & Income Fund of Beneficial Interest'}, {'symbol': 'PGR', 'name': 'Progressive Corporation (The)'}, {'symbol': 'PGRE', 'name': 'Paramount Group Inc.'}, {'symbol': 'PGTI', 'name': 'PGT Innovations Inc.'}, {'symbol': 'PGZ', 'name': 'Principal Real Estate Income Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5403'}, {'symbol': 'PH', 'name': 'Parker-Hannifin Corporation'}, {'symbol': 'PHAS', 'name': 'PhaseBio Pharmaceuticals Inc.'}, {'symbol': 'PHCF', 'name': 'Puhui Wealth Investment Management Co. Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14659'}, {'symbol': 'PHD', 'name': 'Pioneer Floating Rate Trust Shares of Beneficial Interest'}, {'symbol': 'PHG', 'name': 'Koninklijke Philips N.V. NY Registry Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5410'}, {'symbol': 'PHI', 'name': 'PLDT Inc. Sponsored ADR'}, {'symbol': 'PHII', 'name': 'PHI Inc.'}, {'symbol': 'PHIIK', 'name': 'PHI Inc.'}, {'symbol': 'PHIO', 'name': 'Phio Pharmaceuticals Corp.'}, {'symbol': 'PHK', 'name': 'Pimco High Income Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5415'}, {'symbol': 'PHM', 'name': 'PulteGroup Inc.'}, {'symbol': 'PHT', 'name': 'Pioneer High Income Trust of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5419'}, {'symbol': 'PHUN', 'name': 'Phunware Inc.'}, {'symbol': 'PHX', 'name': 'Panhandle Oil and Gas Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5420'}, {'symbol': 'PHYS', 'name': 'Sprott Physical Gold Trust ETV', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5421'}, {'symbol': 'PI', 'name': 'Impinj Inc.'}, {'symbol': 'PICK', 'name': 'iShares MSCI Global Select Metals & Mining Producers Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '5423'}, {'symbol': 'PICO', 'name': 'PICO Holdings Inc.'}, {'symbol': 'PIE', 'name': 'Invesco DWA Emerging Markets Momentum ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5426'}, {'symbol': 'PIH', 'name': '1347 Property Insurance Holdings Inc.'}, {'symbol': 'PII', 'name': 'Polaris Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5428'}, {'symbol': 'PIM', 'name': 'Putnam Master Intermediate Income Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5430'}, {'symbol': 'PINC', 'name': 'Premier Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7795'}, {'symbol': 'PIR', 'name': 'Pier 1 Imports Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5435'}, {'symbol': 'PIRS', 'name': 'Pieris Pharmaceuticals Inc.'}, {'symbol': 'PIXY', 'name': 'ShiftPixy Inc.'}, {'symbol': 'PIZ', 'name': 'Invesco DWA Developed Markets Momentum ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5437'}, {'symbol': 'PJC', 'name': 'Piper Jaffray Companies', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5439'}, {'symbol': 'PJP', 'name': 'Invesco Dynamic Pharmaceuticals', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5442'}, {'symbol': 'PJT', 'name': 'PJT Partners Inc. Class A'}, {'symbol': 'PK', 'name': 'Park Hotels & Resorts Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12193'}, {'symbol': 'PKBK', 'name': 'Parke Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5445'}, {'symbol': 'PKE', 'name': 'Park Electrochemical Corporation'}, {'symbol': 'PKG', 'name': 'Packaging Corporation of America'}, {'symbol': 'PKI', 'name': 'PerkinElmer Inc.'}, {'symbol': 'PKO', 'name': 'Pimco Income Opportunity Fund of Beneficial Interest'}, {'symbol': 'PKOH', 'name': 'Park-Ohio Holdings Corp.'}, {'symbol': 'PKX', 'name': 'POSCO', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5455'}, {'symbol': 'PLAB', 'name': 'Photronics Inc.'}, {'symbol': 'PLAG', 'name': 'Planet Green Holdings Corp.'}, {'symbol': 'PLAN', 'name': 'Anaplan Inc.'}, {'symbol': 'PLAY', 'name': "Dave & Buster's Entertainment Inc."}, {'symbol': 'PLBC', 'name': 'Plumas Bancorp'}, {'symbol': 'PLCE', 'name': "Children's Place Inc. (The)"}, {'symbol': 'PLD', 'name': 'Prologis Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5466'}, {'symbol': 'PLG', 'name': 'Platinum Group Metals Ltd. (Canada)'}, {'symbol': 'PLL', 'name': 'Piedmont Lithium Limited'}, {'symbol': 'PLM', 'name': 'Polymet Mining Corporation (Canada)'}, {'symbol': 'PLNT', 'name': 'Planet Fitness Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10226'}, {'symbol': 'PLOW', 'name': 'Douglas Dynamics Inc.'}, {'symbol': 'PLPC', 'name': 'Preformed Line Products Company'}, {'symbol': 'PLSE', 'name': 'Pulse Biosciences Inc'}, {'symbol': 'PLT', 'name': 'Plantronics Inc.'}, {'symbol': 'PLUG', 'name': 'Plug Power Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5479'}, {'symbol': 'PLUS', 'name': 'ePlus inc.'}, {'symbol': 'PLX', 'name': 'Protalix BioTherapeutics Inc. (DE)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5482'}, {'symbol': 'PLXP', 'name': 'PLx Pharma Inc.'}, {'symbol': 'PLXS', 'name': 'Plexus Corp.'}, {'symbol': 'PLYA', 'name': 'Playa Hotels & Resorts N.V.'}, {'symbol': 'PLYM', 'name': 'Plymouth Industrial REIT Inc.'}, {'symbol': 'PM', 'name': 'Philip Morris International Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5485'}, {'symbol': 'PMBC', 'name': 'Pacific Mercantile Bancorp'}, {'symbol': 'PMD', 'name': 'Psychemedics Corporation'}, {'symbol': 'PME', 'name': 'Pingtan Marine Enterprise Ltd.'}, {'symbol': 'PMF', 'name': 'PIMCO Municipal Income Fund'}, {'symbol': 'PML', 'name': 'Pimco Municipal Income Fund II of Beneficial Interest'}, {'symbol': 'PMM', 'name': 'Putnam Managed Municipal Income Trust'}, {'symbol': 'PMO', 'name': 'Putnam Municipal Opportunities Trust'}, {'symbol': 'PMR', 'name': 'Invesco Dynamic Retail', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5497'}, {'symbol': 'PMT', 'name': 'PennyMac Mortgage Investment Trust of Beneficial Interest'}, {'symbol': 'PMT-B', 'name': 'PennyMac Mortgage Investment Trust 8.00% Series B Fixed-to-Floating Rate Cumulative Redeemable Preferred Shares of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13105'}, {'symbol': 'PMTS', 'name': 'CPI Card Group Inc.'}, {'symbol': 'PMX', 'name': 'PIMCO Municipal Income Fund III of Beneficial Interest'}, {'symbol': 'PNBK', 'name': 'Patriot National Bancorp Inc.'}, {'symbol': 'PNC', 'name': 'PNC Financial Services Group Inc. (The)'}, {'symbol': 'PNC-Q', 'name': 'PNC Financial Services Group Inc. (The) Depositary Shares Series Q', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '5504'}, {'symbol': 'PNF', 'name': 'PIMCO New York Municipal Income Fund'}, {'symbol': 'PNFP', 'name': 'Pinnacle Financial Partners Inc.'}, {'symbol': 'PNI', 'name': 'Pimco New York Municipal Income Fund II of Beneficial Interest'}, {'symbol': 'PNM', 'name': 'PNM Resources Inc. (Holding Co.)'}, {'symbol': 'PNNT', 'name': 'PennantPark Investment Corporation'}, {'symbol': 'PNR', 'name': 'Pentair plc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5513'}, {'symbol': 'PNRG', 'name': 'PrimeEnergy Resources Corporation'}, {'symbol': 'PNRL', 'name': 'Paringa Resources Limited'}, {'symbol': 'PNTR', 'name': 'Pointer Telocation Ltd.'}, {'symbol': 'PNW', 'name': 'Pinnacle West Capital Corporation'}, {'symbol': 'PODD', 'name': 'Insulet Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5521'}, {'symbol': 'POL', 'name': 'PolyOne Corporation'}, {'symbol': 'POLA', 'name': 'Polar Power Inc.'}, {'symbol': 'POOL', 'name': 'Pool Corporation'}, {'symbol': 'POPE', 'name': 'Pope Resources'}, {'symbol': 'POR', 'name': 'Portland General Electric Co'}, {'symbol': 'POST', 'name': 'Post Holdings Inc.'}, {'symbol': 'POWI', 'name': 'Power Integrations Inc.'}, {'symbol': 'POWL', 'name': 'Powell Industries Inc.'}, {'symbol': 'PPBI', 'name': 'Pacific Premier Bancorp Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5534'}, {'symbol': 'PPC', 'name': "Pilgrim's Pride Corporation"}, {'symbol': 'PPDF', 'name': 'PPDAI Group Inc. American Depositary Shares each representing five Class A'}, {'symbol': 'PPEM', 'name': 'PortfolioPlus Emerging Markets', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14160'}, {'symbol': 'PPG', 'name': 'PPG Industries Inc.'}, {'symbol': 'PPIH', 'name': 'Perma-Pipe International Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4354'}, {'symbol': 'PPL', 'name': 'PPL Corporation'}, {'symbol': 'PPLN', 'name': 'Cushing 30 MLP Index ETNs due June 15 2037', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13019'}, {'symbol': 'PPMC', 'name': 'PortfolioPlus S&P Mid Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14161'}, {'symbol': 'PPR', 'name': 'Voya Prime Rate Trust Shares of Beneficial Interest'}, {'symbol': 'PPSI', 'name': 'Pioneer Power Solutions Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7779'}, {'symbol': 'PPT', 'name': 'Putnam Premier Income Trust'}, {'symbol': 'PPX', 'name': 'PPL Capital Funding Inc. 2013 Series B Junior Subordinated Notes due 2073', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '5548'}, {'symbol': 'PQG', 'name': 'PQ Group Holdings Inc.'}, {'symbol': 'PQLC', 'name': 'PGIM QMA Strategic Alpha Large-Cap Core', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15147'}, {'symbol': 'PQSV', 'name': 'PGIM ETF Trust ETF QMA Strategic Alpha Small-Cap Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15230'}, {'symbol': 'PRA', 'name': 'ProAssurance Corporation'}, {'symbol': 'PRAA', 'name': 'PRA Group Inc.'}, {'symbol': 'PRAH', 'name': 'PRA Health Sciences Inc.'}, {'symbol': 'PRAN', 'name': 'Prana Biotechnology Ltd'}, {'symbol': 'PRCP', 'name': 'Perceptron Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5555'}, {'symbol': 'PRE-G', 'name': 'PartnerRe Ltd. 6.50% Series G Cumulative Redeemable Preferred Shares $1.00 par value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14613'}, {'symbol': 'PRE-I', 'name': 'PartnerRe Ltd. 5.875% Series I Non-Cumulative Redeemable Preferred Shares $1.00 par value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14615'}, {'symbol': 'PRF', 'name': 'Invesco FTSE RAFI US 1000', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5557'}, {'symbol': 'PRFT', 'name': 'Perficient Inc.'}, {'symbol': 'PRGO', 'name': 'Perrigo Company plc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5561'}, {'symbol': 'PRGS', 'name': 'Progress Software Corporation'}, {'symbol': 'PRGX', 'name': 'PRGX Global Inc.'}, {'symbol': 'PRI', 'name': 'Primerica Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5565'}, {'symbol': 'PRIF-A', 'name': 'Priority Income Fund Inc. 6.375% Series A Term Preferred Stock due 2025', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14821'}, {'symbol': 'PRIM', 'name': 'Primoris Services Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5566'}, {'symbol': 'PRK', 'name': 'Park National Corporation'}, {'symbol': 'PRLB', 'name': 'Proto Labs Inc.'}, {'symbol': 'PRMW', 'name': 'Primo Water Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5573'}, {'symbol': 'PRNB', 'name': 'Principia Biopharma Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14941'}, {'symbol': 'PRO', 'name': 'PROS Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5575'}, {'symbol': 'PROV', 'name': 'Provident Financial Holdings Inc.'}, {'symbol': 'PRPH', 'name': 'ProPhase Labs Inc.'}, {'symbol': 'PRPL', 'name': 'Purple Innovation Inc.'}, {'symbol': 'PRPO', 'name': 'Precipio Inc.'}, {'symbol': 'PRQR', 'name': 'ProQR Therapeutics N.V.'}, {'symbol': 'PRS', 'name': 'Prudential Financial Inc. 5.625% Junior Subordinated Notes due 2058'}, {'symbol': 'PRSC', 'name': 'The Providence Service Corporation'}, {'symbol': 'PRSP', 'name': 'Perspecta Inc.'}, {'symbol': 'PRT', 'name': 'PermRock Royalty Trust Trust Units'}, {'symbol': 'PRTA', 'name': 'Prothena Corporation plc'}, {'symbol': 'PRTH', 'name': 'Priority Technology Holdings Inc.'}, {'symbol': 'PRTHW', 'name': 'Priority Technology Holdings Inc. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12088'}, {'symbol': 'PRTK', 'name': 'Paratek Pharmaceuticals Inc.'}, {'symbol': 'PRTO', 'name': 'Proteon Therapeutics Inc.'}, {'symbol': 'PRTS', 'name': 'U.S. Auto Parts Network Inc.'}, {'symbol': 'PRTY', 'name': 'Party City Holdco Inc.'}, {'symbol': 'PRU', 'name': 'Prudential Financial Inc.'}, {'symbol': 'PRVB', 'name': 'Provention Bio Inc.'}, {'symbol': 'PS', 'name': 'Pluralsight Inc.'}, {'symbol': 'PSA', 'name': 'Public Storage'}, {'symbol': 'PSA-B', 'name': 'Public Storage Depositary Shares each representing 1/1000 of a 5.40% Cumulative Preferred Share of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11027'}, {'symbol': 'PSA-D', 'name': 'Public Storage Depositary Shares Series D', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11644'}, {'symbol': 'PSA-F', 'name': 'Public Storage Depositary Shares Series F', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '12999'}, {'symbol': 'PSA-U', 'name': 'Public Storage Depositary Shares Series U', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '5594'}, {'symbol': 'PSA-W', 'name': 'Public Storage Depositary Shares Series W', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '5596'}, {'symbol': 'PSA-Y', 'name': 'Public Storage Dep Shs Repstg 1/1000th Pfd Sh Ben Int Ser Y', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '8473'}, {'symbol': 'PSAU', 'name': 'Invesco Global Gold and Precious Metals ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5598'}, {'symbol': 'PSB', 'name': 'PS Business Parks Inc.'}, {'symbol': 'PSB-V', 'name': 'PS Business Parks Inc. Depositary Shares Series V', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '5604'}, {'symbol': 'PSB-X', 'name': 'PS Business Parks Inc. Depositary Shares Series X', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13436'}, {'symbol': 'PSC', 'name': 'Principal U.S. Small-Cap Multi-Factor Index ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11868'}, {'symbol': 'PSCD', 'name': 'Invesco S&P SmallCap Consumer Discretionary ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5607'}, {'symbol': 'PSCF', 'name': 'Invesco S&P SmallCap Financials ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5609'}, {'symbol': 'PSCI', 'name': 'Invesco S&P SmallCap Industrials ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5611'}, {'symbol': 'PSCT', 'name': 'Invesco S&P SmallCap Information Technology ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5613'}, {'symbol': 'PSDO', 'name': 'Presidio Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12447'}, {'symbol': 'PSEC', 'name': 'Prospect Capital Corporation'}, {'symbol': 'PSF', 'name': 'Cohen & Steers Select Preferred and Income Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5619'}, {'symbol': 'PSJ', 'name': 'Invesco Dynamic Software', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5622'}, {'symbol': 'PSL', 'name': 'Invesco DWA Consumer Staples Momentum ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5624'}, {'symbol': 'PSLV', 'name': 'Sprott Physical Silver Trust ETV'}, {'symbol': 'PSMC', 'name': 'Invesco Conservative Multi-Asset Allocation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12405'}, {'symbol': 'PSMM', 'name': 'Invesco Moderately Conservative Multi-Asset Allocation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12407'}, {'symbol': 'PSMT', 'name': 'PriceSmart Inc.'}, {'symbol': 'PSO', 'name': 'Pearson Plc'}, {'symbol': 'PSQ', 'name': 'ProShares Short QQQ', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '5630'}, {'symbol': 'PST', 'name': 'ProShares UltraShort Lehman 7-10 Year Treasury', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5632'}, {'symbol': 'PSTG', 'name': 'Pure Storage Inc. Class A'}, {'symbol': 'PSTI', 'name': 'Pluristem Therapeutics Inc.'}, {'symbol': 'PSX', 'name': 'Phillips 66'}, {'symbol': 'PSXP', 'name': 'Phillips 66 Partners LP representing limited partner interest in the Partnership'}, {'symbol': 'PT', 'name': 'Pintec Technology Holdings Limited'}, {'symbol': 'PTC', 'name': 'PTC Inc.'}, {'symbol': 'PTCT', 'name': 'PTC Therapeutics Inc.'}, {'symbol': 'PTE', 'name': 'PolarityTE Inc.'}, {'symbol': 'PTEN', 'name': 'Patterson-UTI Energy Inc.'}, {'symbol': 'PTF', 'name': 'Invesco DWA Technology Momentum ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5643'}, {'symbol': 'PTGX', 'name': 'Protagonist Therapeutics Inc.'}, {'symbol': 'PTI', 'name': 'Proteostasis Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10964'}, {'symbol': 'PTIE', 'name': 'Pain Therapeutics Inc.'}, {'symbol': 'PTLA', 'name': 'Portola Pharmaceuticals Inc.'}, {'symbol': 'PTMC', 'name': 'Pacer Trendpilot US Mid Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10062'}, {'symbol': 'PTN', 'name': 'Palatin Technologies Inc.'}, {'symbol': 'PTNR', 'name': 'Partner Communications Company Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5651'}, {'symbol': 'PTR', 'name': 'PetroChina Company Limited'}, {'symbol': 'PTSI', 'name': 'P.A.M. Transportation Services Inc.'}, {'symbol': 'PTVCA', 'name': 'Protective Insurance Corporation Class A (voting) Common Stock'}, {'symbol': 'PTVCB', 'name': 'Protective Insurance Corporation Class B (nonvoting) Common Stock'}, {'symbol': 'PTX', 'name': 'Pernix Therapeutics Holdings Inc.'}, {'symbol': 'PTY', 'name': 'Pimco Corporate & Income Opportunity Fund'}, {'symbol': 'PUB', 'name': "People's Utah Bancorp"}, {'symbol': 'PUK', 'name': 'Prudential Public Limited Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5661'}, {'symbol': 'PUK-A', 'name': "Prudential Public Limited Company 6.50% Perpetual Subordinated Capital Securities Exchangeable at the Issuer's Option Into Non-Cumulative Dollar Denominated Pre", 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14617'}, {'symbol': 'PULM', 'name': 'Pulmatrix Inc.'}, {'symbol': 'PUMP', 'name': 'ProPetro Holding Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12471'}, {'symbol': 'PUW', 'name': 'Invesco WilderHill Progressive Energy', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5664'}, {'symbol': 'PVAC', 'name': 'Penn Virginia Corporation'}, {'symbol': 'PVBC', 'name': 'Provident Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10306'}, {'symbol': 'PVG', 'name': 'Pretium Resources Inc. (Canada)'}, {'symbol': 'PVH', 'name': 'PVH Corp.'}, {'symbol': 'PVL', 'name': 'Permianville Royalty Trust Trust Units', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4749'}, {'symbol': 'PVTL', 'name': 'Pivotal Software Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14402'}, {'symbol': 'PW', 'name': 'Power REIT (MD)'}, {'symbol': 'PWB', 'name': 'Invesco Dynamic Large Cap Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5677'}, {'symbol': 'PWOD', 'name': 'Penns Woods Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5681'}, {'symbol': 'PWR', 'name': 'Quanta Services Inc.'}, {'symbol': 'PWV', 'name': 'Invesco Dynamic Large Cap Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5684'}, {'symbol': 'PXD', 'name': 'Pioneer Natural Resources Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5688'}, {'symbol': 'PXF', 'name': 'Invesco FTSE RAFI Developed Markets ex-U.S.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5690'}, {'symbol': 'PXI', 'name': 'Invesco DWA Energy Momentum ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5692'}, {'symbol': 'PXLG', 'name': 'Invesco Russell Top 200 Pure Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5695'}, {'symbol': 'PXLW', 'name': 'Pixelworks Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5697'}, {'symbol': 'PXMV', 'name': 'Invesco Russell Midcap Pure Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5700'}, {'symbol': 'PXR', 'name': 'Invesco Emerging Markets Infrastructure', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5703'}, {'symbol': 'PXS', 'name': 'Pyxis Tankers Inc.'}, {'symbol': 'PXSV', 'name': 'Invesco Russell 2000 Pure Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5706'}, {'symbol': 'PY', 'name': 'Principal Shareholder Yield Index ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11175'}, {'symbol': 'PYDS', 'name': 'Payment Data Systems Inc.'}, {'symbol': 'PYN', 'name': 'PIMCO New York Municipal Income Fund III of Beneficial Interest'}, {'symbol': 'PYPL', 'name': 'PayPal Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10260'}, {'symbol': 'PYT', 'name': 'PPlus Tr GSC-2 Tr Ctf Fltg Rate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '5713'}, {'symbol': 'PYX', 'name': 'Pyxus International Inc.'}, {'symbol': 'PZA', 'name': 'Invesco National AMT-Free Municipal Bond ETFo', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5717'}, {'symbol': 'PZC', 'name': 'PIMCO California Municipal Income Fund III of Beneficial Interest'}, {'symbol': 'PZG', 'name': 'Paramount Gold Nevada Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9878'}, {'symbol': 'PZN', 'name': 'Pzena Investment Management Inc Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5724'}, {'symbol': 'PZZA', 'name': "Papa John's International Inc.", 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5726'}, {'symbol': 'QADA', 'name': 'QAD Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5730'}, {'symbol': 'QADB', 'name': 'QAD Inc.'}, {'symbol': 'QARP', 'name': 'Xtrackers Russell 1000 US QARP', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14342'}, {'symbol': 'QBAK', 'name': 'Qualstar Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5733'}, {'symbol': 'QCOM', 'name': 'QUALCOMM Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5736'}, {'symbol': 'QCRH', 'name': 'QCR Holdings Inc.'}, {'symbol': 'QD', 'name': 'Qudian Inc. American Depositary Shares each representing one Class A'}, {'symbol': 'QDEL', 'name': 'Quidel Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5740'}, {'symbol': 'QDIV', 'name': 'Global X S&P 500 Quality Dividend', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14829'}, {'symbol': 'QED', 'name': 'IQ Hedge Event-Driven Tracker', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9862'}, {'symbol': 'QEMM', 'name': 'SPDR MSCI Emerging Markets StrategicFactors', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8690'}, {'symbol': 'QEP', 'name': 'QEP Resources Inc.'}, {'symbol': 'QES', 'name': 'Quintana Energy Services Inc.'}, {'symbol': 'QFIN', 'name': '360 Finance Inc.'}, {'symbol': 'QGEN', 'name': 'Qiagen N.V.'}, {'symbol': 'QGTA', 'name': 'IQ Leaders GTAA Tracker', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10604'}, {'symbol': 'QHC', 'name': 'Quorum Health Corporation'}, {'symbol': 'QINT', 'name': 'American Century Quality Diversified International', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15012'}, {'symbol': 'QIWI', 'name': 'QIWI plc'}, {'symbol': 'QLD', 'name': 'ProShares Ultra QQQ', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5751'}, {'symbol': 'QLTA', 'name': 'iShares Aaa A Rated Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5754'}, {'symbol': 'QLYS', 'name': 'Qualys Inc.'}, {'symbol': 'QMOM', 'name': 'Alpha Architect U.S. Quantitative Momentum', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10891'}, {'symbol': 'QNST', 'name': 'QuinStreet Inc.'}, {'symbol': 'QQQ', 'name': 'Invesco QQQ Trust Series 1', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5765'}, {'symbol': 'QQQX', 'name': 'Nuveen NASDAQ 100 Dynamic Overwrite Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9612'}, {'symbol': 'QRHC', 'name': 'Quest Resource Holding Corporation.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8645'}, {'symbol': 'QRTEA', 'name': 'Qurate Retail Inc. Series A Common Stock'}, {'symbol': 'QRTEB', 'name': 'Qurate Retail Inc. Series B Common Stock'}, {'symbol': 'QRVO', 'name': 'Qorvo Inc.'}, {'symbol': 'QSR', 'name': 'Restaurant Brands International Inc.'}, {'symbol': 'QTEC', 'name': 'First Trust NASDAQ-100- Technology Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5773'}, {'symbol': 'QTNA', 'name': 'Quantenna Communications Inc.'}, {'symbol': 'QTNT', 'name': 'Quotient Limited'}, {'symbol': 'QTRH', 'name': 'Quarterhill Inc.'}, {'symbol': 'QTRX', 'name': 'Quanterix Corporation'}, {'symbol': 'QTS', 'name': 'QTS Realty Trust Inc. Class A'}, {'symbol': 'QTS-B', 'name': 'QTS Realty Trust Inc. 6.50% Series B Cumulative Convertible Perpetual Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14788'}, {'symbol': 'QTT', 'name': 'Qutoutiao Inc.'}, {'symbol': 'QTWO', 'name': 'Q2 Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8470'}, {'symbol': 'QUAD', 'name': 'Quad Graphics Inc Class A'}, {'symbol': 'QUIK', 'name': 'QuickLogic Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5778'}, {'symbol': 'QUMU', 'name': 'Qumu Corporation'}, {'symbol': 'QUOT', 'name': 'Quotient Technology Inc.'}, {'symbol': 'QURE', 'name': 'uniQure N.V.'}, {'symbol': 'QVAL', 'name': 'Alpha Architect U.S. Quantitative Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9401'}, {'symbol': 'QVM', 'name': 'Arrow QVM Equity Factor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9774'}, {'symbol': 'QXGG', 'name': 'QuantX Risk Managed Growth ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12339'}, {'symbol': 'QYLD', 'name': 'Global X NASDAQ-100 Covered Call ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15336'}, {'symbol': 'R', 'name': 'Ryder System Inc.'}, {'symbol': 'RA', 'name': 'Brookfield Real Assets Income Fund Inc.'}, {'symbol': 'RACE', 'name': 'Ferrari N.V.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10645'}, {'symbol': 'RAD', 'name': 'Rite Aid Corporation'}, {'symbol': 'RADA', 'name': 'RADA Electronic Industries Ltd.'}, {'symbol': 'RAIL', 'name': 'Freightcar America Inc.'}, {'symbol': 'RAMP', 'name': 'LiveRamp Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '82'}, {'symbol': 'RAND', 'name': 'Rand Capital Corporation'}, {'symbol': 'RARE', 'name': 'Ultragenyx Pharmaceutical Inc.'}, {'symbol': 'RARX', 'name': 'Ra Pharmaceuticals Inc.'}, {'symbol': 'RAVE', 'name': 'Rave Restaurant Group Inc.'}, {'symbol': 'RAVN', 'name': 'Raven Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5793'}, {'symbol': 'RBA', 'name': 'Ritchie Bros. Auctioneers Incorporated'}, {'symbol': 'RBB', 'name': 'RBB Bancorp'}, {'symbol': 'RBBN', 'name': 'Ribbon Communications Inc.'}, {'symbol': 'RBC', 'name': 'Regal Beloit Corporation'}, {'symbol': 'RBCAA', 'name': 'Republic Bancorp Inc. Class A Common Stock'}, {'symbol': 'RBCN', 'name': 'Rubicon Technology Inc.'}, {'symbol': 'RBKB', 'name': 'Rhinebeck Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15392'}, {'symbol': 'RBNC', 'name': 'Reliant Bancorp Inc.'}, {'symbol': 'RBS', 'name': 'Royal Bank of Scotland Group Plc New (The) ADS'}, {'symbol': 'RBZ', 'name': 'Reebonz Holding Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15319'}, {'symbol': 'RC', 'name': 'Ready Capital Corproation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7684'}, {'symbol': 'RCD', 'name': 'Invesco S&P 500 Equal Weight Consumer Discretionary', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14404'}, {'symbol': 'RCG', 'name': 'RENN Fund Inc'}, {'symbol': 'RCI', 'name': 'Rogers Communication Inc.'}, {'symbol': 'RCII', 'name': 'Rent-A-Center Inc.'}, {'symbol': 'RCKT', 'name': 'Rocket Pharmaceuticals Inc.'}, {'symbol': 'RCKY', 'name': 'Rocky Brands Inc.'}, {'symbol': 'RCL', 'name': 'Royal Caribbean Cruises Ltd.'}, {'symbol': 'RCM', 'name': 'R1 RCM Inc.'}, {'symbol': 'RCMT', 'name': 'RCM Technologies Inc.'}, {'symbol': 'RCON', 'name': 'Recon Technology Ltd.'}, {'symbol': 'RCS', 'name': 'PIMCO Strategic Income Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5817'}, {'symbol': 'RCUS', 'name': 'Arcus Biosciences Inc.'}, {'symbol': 'RDC', 'name': 'Rowan Companies plc Class A'}, {'symbol': 'RDCM', 'name': 'Radcom Ltd.'}, {'symbol': 'RDFN', 'name': 'Redfin Corporation'}, {'symbol': 'RDHL', 'name': 'Redhill Biopharma Ltd.'}, {'symbol': 'RDI', 'name': 'Reading International Inc'}, {'symbol': 'RDIB', 'name': 'Reading International Inc'}, {'symbol': 'RDN', 'name': 'Radian Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5825'}, {'symbol': 'RDNT', 'name': 'RadNet Inc.'}, {'symbol': 'RDS.A', 'name': 'Royal Dutch Shell PLC American Depositary Shares (Each representing two Class A)'}, {'symbol': 'RDS.B', 'name': 'Royal Dutch Shell PLC American Depositary Shares (Each representing two Class B)'}, {'symbol': 'RDUS', 'name': 'Radius Health Inc.'}, {'symbol': 'RDVT', 'name': 'Red Violet Inc.'}, {'symbol': 'RDWR', 'name': 'Radware Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5829'}, {'symbol': 'RDY', 'name': "Dr. Reddy's Laboratories Ltd"}, {'symbol': 'RE', 'name': 'Everest Re Group Ltd.'}, {'symbol': 'RECN', 'name': 'Resources Connection Inc.'}, {'symbol': 'REDU', 'name': 'RISE Education Cayman Ltd'}, {'symbol': 'REED', 'name': 'Reeds Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5836'}, {'symbol': 'REET', 'name': 'iShares Trust Global REIT', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8941'}, {'symbol': 'REFR', 'name': 'Research Frontiers Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5837'}, {'symbol': 'REG', 'name': 'Regency Centers Corporation'}, {'symbol': 'REGI', 'name': 'Renewable Energy Group Inc.'}, {'symbol': 'REGN', 'name': 'Regeneron Pharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5842'}, {'symbol': 'REI', 'name': 'Ring Energy Inc.'}, {'symbol': 'RELL', 'name': 'Richardson Electronics Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5845'}, {'symbol': 'RELV', 'name': "Reliv' International Inc."}, {'symbol': 'RELX', 'name': 'RELX PLC PLC American Depositary Shares (Each representing One)'}, {'symbol': 'REML', 'name': 'Credit Suisse AG X-Links Monthly Pay 2xLeveraged Mortgage REIT Exchange Traded Notes (ETNs) due July 11 2036', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11595'}, {'symbol': 'REN', 'name': 'Resolute Energy Corporation Comon Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5850'}, {'symbol': 'RENN', 'name': 'Renren Inc. American Depositary Shares each representing fifteen Class A'}, {'symbol': 'REPH', 'name': 'Recro Pharma Inc.'}, {'symbol': 'REPL', 'name': 'Replimune Group Inc.'}, {'symbol': 'RES', 'name': 'RPC Inc.'}, {'symbol': 'RESI', 'name': 'Front Yard Residential Corporation'}, {'symbol': 'RESN', 'name': 'Resonant Inc.'}, {'symbol': 'RETA', 'name': 'Reata Pharmaceuticals Inc.'}, {'symbol': 'RETO', 'name': 'ReTo Eco-Solutions Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13834'}, {'symbol': 'REV', 'name': 'Revlon Inc.'}, {'symbol': 'REVG', 'name': 'REV Group Inc.'}, {'symbol': 'REX', 'name': 'REX American Resources Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5859'}, {'symbol': 'REXR', 'name': 'Rexford Industrial Realty Inc.'}, {'symbol': 'REXR-B', 'name': 'Rexford Industrial Realty Inc. 5.875% Series B Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13802'}, {'symbol': 'REZI', 'name': 'Resideo Technologies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15043'}, {'symbol': 'RF', 'name': 'Regions Financial Corporation'}, {'symbol': 'RF-B', 'name': 'Regions Financial Corporation Depositary Shares Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '8590'}, {'symbol': 'RFCI', 'name': 'RiverFront Dynamic Core Income', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11465'}, {'symbol': 'RFDI', 'name': 'First Trust RiverFront Dynamic Developed International ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11231'}, {'symbol': 'RFEU', 'name': 'First Trust RiverFront Dynamic Europe ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11232'}, {'symbol': 'RFG', 'name': 'Invesco S&P Midcap 400 Pure Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14405'}, {'symbol': 'RFI', 'name': 'Cohen & Steers Total Return Realty Fund Inc.'}, {'symbol': 'RFIL', 'name': 'RF Industries Ltd.'}, {'symbol': 'RFL', 'name': 'Rafael Holdings Inc. Class B'}, {'symbol': 'RFP', 'name': 'Resolute Forest Products Inc.'}, {'symbol': 'RFV', 'name': 'Invesco S&P Midcap 400 Pure Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14406'}, {'symbol': 'RGA', 'name': 'Reinsurance Group of America Incorporated'}, {'symbol': 'RGCO', 'name': 'RGC Resources Inc.'}, {'symbol': 'RGEN', 'name': 'Repligen Corporation'}, {'symbol': 'RGLB', 'name': 'Oppenheimer Global Revenue', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13120'}, {'symbol': 'RGLD', 'name': 'Royal Gold Inc.'}, {'symbol': 'RGLS', 'name': 'Regulus Therapeutics Inc.'}, {'symbol': 'RGNX', 'name': 'REGENXBIO Inc.'}, {'symbol': 'RGR', 'name': 'Sturm Ruger & Company Inc.'}, {'symbol': 'RGS', 'name': 'Regis Corporation'}, {'symbol': 'RGSE', 'name': 'Real Goods Solar Inc.'}, {'symbol': 'RGT', 'name': 'Royce Global Value Trust Inc.'}, {'symbol': 'RH', 'name': 'RH'}, {'symbol': 'RHE', 'name': 'Regional Health Properties Inc.'}, {'symbol': 'RHI', 'name': 'Robert Half International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5890'}, {'symbol': 'RHP', 'name': 'Ryman Hospitality Properties Inc. (REIT)'}, {'symbol': 'RHT', 'name': 'Red Hat Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5893'}, {'symbol': 'RIBT', 'name': 'RiceBran Technologies'}, {'symbol': 'RICK', 'name': 'RCI Hospitality Holdings Inc.'}, {'symbol': 'RIF', 'name': 'RMR Real Estate Income Fund (MD)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12796'}, {'symbol': 'RIG', 'name': 'Transocean Ltd (Switzerland)'}, {'symbol': 'RIGL', 'name': 'Rigel Pharmaceuticals Inc.'}, {'symbol': 'RILY', 'name': 'B. Riley Financial Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10311'}, {'symbol': 'RILYH', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14619'}, {'symbol': 'RILYL', 'name': 'B. Riley Financial Inc. 7.50% Senior Notes', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12110'}, {'symbol': 'RINF', 'name': 'ProShares Inflation Expectations', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5901'}, {'symbol': 'RIO', 'name': 'Rio Tinto Plc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5903'}, {'symbol': 'RIOT', 'name': 'Riot Blockchain Inc'}, {'symbol': 'RIV', 'name': 'RiverNorth Opportunities Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10940'}, {'symbol': 'RIVE', 'name': 'Riverview Financial Corporation'}, {'symbol': 'RJF', 'name': 'Raymond James Financial Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5911'}, {'symbol': 'RJN', 'name': 'AB Svensk Ekportkredit (Swedish Export Credit Corporation) ELEMENTS Linked to the Rogers International Commodity Index - Energy Total Return Structured Product', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5913'}, {'symbol': 'RKDA', 'name': 'Arcadia Biosciences Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9757'}, {'symbol': 'RL', 'name': 'Ralph Lauren Corporation'}, {'symbol': 'RLGT', 'name': 'Radiant Logistics Inc.'}, {'symbol': 'RLGY', 'name': 'Realogy Holdings Corp.'}, {'symbol': 'RLH', 'name': 'Red Lions Hotels Corporation'}, {'symbol': 'RLI', 'name': 'RLI Corp. (DE)'}, {'symbol': 'RLJ', 'name': 'RLJ Lodging Trust of Beneficial Interest $0.01 par value'}, {'symbol': 'RLM', 'name': 'Realm Therapeutics plc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14754'}, {'symbol': 'RM', 'name': 'Regional Management Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5930'}, {'symbol': 'RMAX', 'name': 'RE/MAX Holdings Inc. Class A'}, {'symbol': 'RMBL', 'name': 'RumbleOn Inc.'}, {'symbol': 'RMBS', 'name': 'Rambus Inc.'}, {'symbol': 'RMCF', 'name': 'Rocky Mountain Chocolate Factory Inc.'}, {'symbol': 'RMD', 'name': 'ResMed Inc.'}, {'symbol': 'RMED', 'name': 'Ra Medical Systems Inc.'}, {'symbol': 'RMI', 'name': 'RiverNorth Opportunistic Municipal Income Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15065'}, {'symbol': 'RMNI', 'name': 'Rimini Street Inc.'}, {'symbol': 'RMR', 'name': 'The RMR Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10878'}, {'symbol': 'RMT', 'name': 'Royce Micro-Cap Trust Inc.'}, {'symbol': 'RMTI', 'name': 'Rockwell Medical Inc.'}, {'symbol': 'RNDB', 'name': 'Randolph Bancorp Inc.'}, {'symbol': 'RNDV', 'name': 'First Trust US Equity Dividend Select ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13034'}, {'symbol': 'RNET', 'name': 'RigNet Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5940'}, {'symbol': 'RNG', 'name': 'Ringcentral Inc. Class A'}, {'symbol': 'RNGR', 'name': 'Ranger Energy Services Inc. Class A'}, {'symbol': 'RNMC', 'name': 'First Trust Mid Cap US Equity Select ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13037'}, {'symbol': 'RNN', 'name': 'Rexahn Pharmaceuticals Inc.'}, {'symbol': 'RNP', 'name': 'Cohen & Steers Reit and Preferred Income Fund Inc'}, {'symbol': 'RNR', 'name': 'RenaissanceRe Holdings Ltd.'}, {'symbol': 'RNR-E', 'name': 'RenaissanceRe Holdings Ltd. 5.375% Series E Preference Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14621'}, {'symbol': 'RNSC', 'name': 'First Trust Small Cap US Equity Select ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13038'}, {'symbol': 'RNST', 'name': 'Renasant Corporation'}, {'symbol': 'RNWK', 'name': 'RealNetworks Inc.'}, {'symbol': 'ROAD', 'name': 'Construction Partners Inc.'}, {'symbol': 'ROAN', 'name': 'Roan Resources Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15216'}, {'symbol': 'ROBT', 'name': 'First Trust Nasdaq Artificial Intelligence and Robotics ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14175'}, {'symbol': 'ROCK', 'name': 'Gibraltar Industries Inc.'}, {'symbol': 'RODM', 'name': 'Hartford Multifactor Developed Markets (ex-US)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9769'}, {'symbol': 'ROG', 'name': 'Rogers Corporation'}, {'symbol': 'ROIC', 'name': 'Retail Opportunity Investments Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5955'}, {'symbol': 'ROK', 'name': 'Rockwell Automation Inc.'}, {'symbol': 'ROKU', 'name': 'Roku Inc.'}, {'symbol': 'ROL', 'name': 'Rollins Inc.'}, {'symbol': 'ROLL', 'name': 'RBC Bearings Incorporated'}, {'symbol': 'ROOF', 'name': 'IQ US Real Estate Small Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '5963'}, {'symbol': 'ROP', 'name': 'Roper Technologies Inc.'}, {'symbol': 'ROSE', 'name': 'Rosehill Resources Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11186'}, {'symbol': 'ROSEW', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11200'}, {'symbol': 'ROST', 'name': 'Ross Stores Inc.'}, {'symbol': 'ROX', 'name': 'Castle Brands Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5969'}, {'symbol': 'ROYT', 'name': 'Pacific Coast Oil Trust Units of Beneficial Interest'}, {'symbol': 'RP', 'name': 'RealPage Inc.'}, {'symbol': 'RPAI', 'name': 'Retail Properties of America Inc. Class A'}, {'symbol': 'RPD', 'name': 'Rapid7 Inc.'}, {'symbol': 'RPIBC', 'name': 'Managed Portfolio Series', 'date': '2019-02-08', 'isEnabled': False, 'type': 'N/A', 'iexId': '14176'}, {'symbol': 'RPM', 'name': 'RPM International Inc.'}, {'symbol': 'RPT', 'name': 'RPT Realty'}, {'symbol': 'RPUT', 'name': 'WisdomTree CBOE Russell 2000 PutWrite Strategy Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14102'}, {'symbol': 'RQI', 'name': 'Cohen & Steers Quality Income Realty Fund Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5985'}, {'symbol': 'RRC', 'name': 'Range Resources Corporation'}, {'symbol': 'RRD', 'name': 'R.R. Donnelley & Sons Company'}, {'symbol': 'RRGB', 'name': 'Red Robin Gourmet Burgers Inc.'}, {'symbol': 'RRR', 'name': 'Red Rock Resorts Inc.'}, {'symbol': 'RRTS', 'name': 'Roadrunner Transportation Systems Inc'}, {'symbol': 'RS', 'name': 'Reliance Steel & Aluminum Co. (DE)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5994'}, {'symbol': 'RSG', 'name': 'Republic Services Inc.'}, {'symbol': 'RST', 'name': 'Rosetta Stone Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6004'}, {'symbol': 'RSXJ', 'name': 'VanEck Vectors Russia Small-Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6007'}, {'symbol': 'RTEC', 'name': 'Rudolph Technologies Inc.'}, {'symbol': 'RTIX', 'name': 'RTI Surgical Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6013'}, {'symbol': 'RTM', 'name': 'Invesco S&P 500 Equal Weight Materials', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14412'}, {'symbol': 'RTN', 'name': 'Raytheon Company'}, {'symbol': 'RTRX', 'name': 'Retrophin Inc.'}, {'symbol': 'RTTR', 'name': 'Ritter Pharmaceuticals Inc.'}, {'symbol': 'RTW', 'name': 'RTW Retailwinds Inc.'}, {'symbol': 'RUBI', 'name': 'The Rubicon Project Inc.'}, {'symbol': 'RUBY', 'name': 'Rubius Therapeutics Inc.'}, {'symbol': 'RUN', 'name': 'Sunrun Inc.'}, {'symbol': 'RUSHA', 'name': 'Rush Enterprises Inc. Class A Common Stock'}, {'symbol': 'RUSHB', 'name': 'Rush Enterprises Inc. Class B Common Stock'}, {'symbol': 'RUSS', 'name': 'Direxion Daily Russia Bear 3x Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6026'}, {'symbol': 'RUTH', 'name': "Ruth's Hospitality Group Inc."}, {'symbol': 'RVEN', 'name': 'Reven Housing REIT Inc.'}, {'symbol': 'RVI', 'name': 'Retail Value Inc.'}, {'symbol': 'RVLT', 'name': 'Revolution Lighting Technologies Inc.'}, {'symbol': 'RVNC', 'name': 'Revance Therapeutics Inc.'}, {'symbol': 'RVP', 'name': 'Retractable Technologies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6032'}, {'symbol': 'RVSB', 'name': 'Riverview Bancorp Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6033'}, {'symbol': 'RVT', 'name': 'Royce Value Trust Inc.'}, {'symbol': 'RWDC', 'name': 'Direxion MSCI Defensives Over Cyclicals', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15382'}, {'symbol': 'RWED', 'name': 'Direxion MSCI Emerging Over Developed Markets', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15384'}, {'symbol': 'RWGE', 'name': 'Regalwood Global Energy Ltd. Class A'}, {'symbol': 'RWGE=', 'name': 'Regalwood Global Energy Ltd. Units', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '13869'}, {'symbol': 'RWIU', 'name': 'Direxion FTSE Russell International Over US', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15386'}, {'symbol': 'RWK', 'name': 'Oppenheimer S&P MidCap 400 Revenue', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6038'}, {'symbol': 'RWLK', 'name': 'ReWalk Robotics Ltd', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8952'}, {'symbol': 'RWM', 'name': 'ProShares Short Russell2000', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6040'}, {'symbol': 'RWR', 'name': 'SPDR DJ Wilshire REIT', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6042'}, {'symbol': 'RWT', 'name': 'Redwood Trust Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6043'}, {'symbol': 'RWVG', 'name': 'Direxion Russell 1000 Value Over Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15390'}, {'symbol': 'RWX', 'name': 'SPDR DJ Wilshire Intl Real Estate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6046'}, {'symbol': 'RXI', 'name': 'iShares Global Consumer Discretionary', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6049'}, {'symbol': 'RXN', 'name': 'Rexnord Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6051'}, {'symbol': 'RY', 'name': 'Royal Bank Of Canada', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6052'}, {'symbol': 'RYAAY', 'name': 'Ryanair Holdings plc American Depositary Shares each representing five Ordinary Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6053'}, {'symbol': 'RYAM', 'name': 'Rayonier Advanced Materials Inc.'}, {'symbol': 'RYB', 'name': 'RYB Education Inc. American depositary shares each representing one Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13333'}, {'symbol': 'RYF', 'name': 'Invesco S&P 500 Equal Weight Financial', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14414'}, {'symbol': 'RYI', 'name': 'Ryerson Holding Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7870'}, {'symbol': 'RYN', 'name': 'Rayonier Inc. REIT', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6059'}, {'symbol': 'RYTM', 'name': 'Rhythm Pharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13496'}, {'symbol': 'RZA', 'name': 'Reinsurance Group of America Incorporated 6.20% Fixed-to-Floating Rate Subordinated Debentures due 2042', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6062'}, {'symbol': 'RZG', 'name': 'Invesco S&P Smallcap 600 Pure Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14418'}, {'symbol': 'S', 'name': 'Sprint Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6065'}, {'symbol': 'SA', 'name': 'Seabridge Gold Inc. (Canada)'}, {'symbol': 'SAB', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12218'}, {'symbol': 'SABR', 'name': 'Sabre Corporation'}, {'symbol': 'SACH', 'name': 'Sachem Capital Corp.'}, {'symbol': 'SAEX', 'name': 'SAExploration Holdings Inc.'}, {'symbol': 'SAFE', 'name': 'Safety Income & Growth Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13046'}, {'symbol': 'SAFM', 'name': 'Sanderson Farms Inc.'}, {'symbol': 'SAFT', 'name': 'Safety Insurance Group Inc.'}, {'symbol': 'SAGE', 'name': 'Sage Therapeutics Inc.'}, {'symbol': 'SAH', 'name': 'Sonic Automotive Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6073'}, {'symbol': 'SAIA', 'name': 'Saia Inc.'}, {'symbol': 'SAIC', 'name': 'SCIENCE APPLICATIONS INTERNATIONAL CORPORATION'}, {'symbol': 'SAIL', 'name': 'SailPoint Technologies Holdings Inc.'}, {'symbol': 'SAL', 'name': 'Salisbury Bancorp Inc.'}, {'symbol': 'SALM', 'name': 'Salem Media Group Inc.'}, {'symbol': 'SALT', 'name': 'Scorpio Bulkers Inc.'}, {'symbol': 'SAM', 'name': 'Boston Beer Company Inc. (The)'}, {'symbol': 'SAMA', 'name': 'Schultze Special Purpose Acquisition Corp.'}, {'symbol': 'SAMAW', 'name': 'Schultze Special Purpose Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15372'}, {'symbol': 'SAMG', 'name': 'Silvercrest Asset Management Group Inc.'}, {'symbol': 'SAN', 'name': 'Banco Santander S.A. Sponsored ADR (Spain)'}, {'symbol': 'SAND', 'name': 'Sandstorm Gold Ltd. (Canada)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6082'}, {'symbol': 'SANM', 'name': 'Sanmina Corporation'}, {'symbol': 'SANW', 'name': 'S&W Seed Company'}, {'symbol': 'SAP', 'name': 'SAP SE ADS'}, {'symbol': 'SAR', 'name': 'Saratoga Investment Corp New'}, {'symbol': 'SASR', 'name': 'Sandy Spring Bancorp Inc.'}, {'symbol': 'SATS', 'name': 'EchoStar Corporation'}, {'symbol': 'SAUC', 'name': 'Diversified Restaurant Holdings Inc.'}, {'symbol': 'SAVE', 'name': 'Spirit Airlines Inc.'}, {'symbol': 'SB', 'name': 'Safe Bulkers Inc ($0.001 par value)'}, {'symbol': 'SB-D', 'name': 'Safe Bulkers Inc Perpetual Preferred Series D (Marshall Islands)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14626'}, {'symbol': 'SBAC', 'name': 'SBA Communications Corporation'}, {'symbol': 'SBBC', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14627'}, {'symbol': 'SBBP', 'name': 'Strongbridge Biopharma plc'}, {'symbol': 'SBBX', 'name': 'SB One Bancorp'}, {'symbol': 'SBCF', 'name': 'Seacoast Banking Corporation of Florida'}, {'symbol': 'SBFG', 'name': 'SB Financial Group Inc.'}, {'symbol': 'SBGI', 'name': 'Sinclair Broadcast Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6099'}, {'symbol': 'SBGL', 'name': 'D/B/A Sibanye-Stillwater Limited American Depositary Shares (Each representing four)'}, {'symbol': 'SBH', 'name': 'Sally Beauty Holdings Inc. (Name to be changed from Holdings Inc.)'}, {'symbol': 'SBI', 'name': 'Western Asset Intermediate Muni Fund Inc'}, {'symbol': 'SBLK', 'name': 'Star Bulk Carriers Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6103'}, {'symbol': 'SBM', 'name': 'Short Basic Materials', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6104'}, {'symbol': 'SBNY', 'name': 'Signature Bank', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6106'}, {'symbol': 'SBOT', 'name': 'Stellar Biotechnologies Inc.'}, {'symbol': 'SBOW', 'name': 'SilverBow Resorces Inc.'}, {'symbol': 'SBPH', 'name': 'Spring Bank Pharmaceuticals Inc.'}, {'symbol': 'SBR', 'name': 'Sabine Royalty Trust'}, {'symbol': 'SBRA', 'name': 'Sabra Health Care REIT Inc.'}, {'symbol': 'SBS', 'name': 'Companhia de saneamento Basico Do Estado De Sao Paulo - Sabesp American Depositary Shares (Each repstg 250)'}, {'symbol': 'SBSI', 'name': 'Southside Bancshares Inc.'}, {'symbol': 'SBT', 'name': 'Sterling Bancorp Inc.'}, {'symbol': 'SBUX', 'name': 'Starbucks Corporation'}, {'symbol': 'SC', 'name': 'Santander Consumer USA Holdings Inc.'}, {'symbol': 'SCAC', 'name': 'Saban Capital Acquisition Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12056'}, {'symbol': 'SCACW', 'name': 'Saban Capital Acquisition Corp. Warrants', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12067'}, {'symbol': 'SCC', 'name': 'ProShares UltraShort Consumer Services', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6118'}, {'symbol': 'SCCO', 'name': 'Southern Copper Corporation'}, {'symbol': 'SCD', 'name': 'LMP Capital and Income Fund Inc.'}, {'symbol': 'SCE-C', 'name': 'Southern California Edison Company 4.24% Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '6122'}, {'symbol': 'SCE-E', 'name': 'Southern California Edison Company 4.78% Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '6124'}, {'symbol': 'SCE-H', 'name': 'SCE Trust III Fixed/Floating Rate Trust Preference Securities', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '8432'}, {'symbol': 'SCE-K', 'name': 'Southern California Edison Company 5.45% Fixed-to-Floating Rate Trust Preference Securities', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11146'}, {'symbol': 'SCHA', 'name': 'Schwab U.S. Small-Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6128'}, {'symbol': 'SCHC', 'name': 'Schwab International Small-Cap Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6130'}, {'symbol': 'SCHE', 'name': 'Schwab Emerging Markets Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6132'}, {'symbol': 'SCHG', 'name': 'Schwab U.S. Large-Cap Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6134'}, {'symbol': 'SCHK', 'name': 'Schwab 1000 Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13539'}, {'symbol': 'SCHL', 'name': 'Scholastic Corporation'}, {'symbol': 'SCHN', 'name': 'Schnitzer Steel Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6138'}, {'symbol': 'SCHP', 'name': 'Schwab U.S. TIPs', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6140'}, {'symbol': 'SCHV', 'name': 'Schwab U.S. Large-Cap Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6142'}, {'symbol': 'SCHW', 'name': 'Charles Schwab Corporation (The)'}, {'symbol': 'SCHW-D', 'name': 'The Charles Schwab Corporation Depositary Shares Series D', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11139'}, {'symbol': 'SCHZ', 'name': 'Schwab US Aggregate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6146'}, {'symbol': 'SCI', 'name': 'Service Corporation International'}, {'symbol': 'SCIF', 'name': 'VanEck Vectors India Small-Cap Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6148'}, {'symbol': 'SCIN', 'name': 'Columbia India Small Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6149'}, {'symbol': 'SCIX', 'name': 'Global X Scientific Beta Asia ex-Japan', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9984'}, {'symbol': 'SCKT', 'name': 'Socket Mobile Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11516'}, {'symbol': 'SCL', 'name': 'Stepan Company'}, {'symbol': 'SCM', 'name': 'Stellus Capital Investment Corporation'}, {'symbol': 'SCOM', 'name': 'ProShares UltraPro Short Communication Services Select Sector', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15393'}, {'symbol': 'SCON', 'name': 'Superconductor Technologies Inc.'}, {'symbol': 'SCOR', 'name': 'comScore Inc.'}, {'symbol': 'SCPH', 'name': 'scPharmaceuticals Inc.'}, {'symbol': 'SCS', 'name': 'Steelcase Inc.'}, {'symbol': 'SCSC', 'name': 'ScanSource Inc.'}, {'symbol': 'SCVL', 'name': 'Shoe Carnival Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6169'}, {'symbol': 'SCWX', 'name': 'SecureWorks Corp.'}, {'symbol': 'SCX', 'name': 'L.S. Starrett Company (The)'}, {'symbol': 'SCYX', 'name': 'SCYNEXIS Inc.'}, {'symbol': 'SD', 'name': 'SandRidge Energy Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6172'}, {'symbol': 'SDCI', 'name': 'USCF SummerHaven Dynamic Commodity Strategy No K-1 Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14513'}, {'symbol': 'SDEM', 'name': 'Global X MSCI SuperDividend Emerging Markets', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9829'}, {'symbol': 'SDGA', 'name': 'Impact Shares Sustainable Development Goals Global Equity', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15066'}, {'symbol': 'SDI', 'name': 'Standard Diversified Inc. Class A'}, {'symbol': 'SDLP', 'name': 'Seadrill Partners LLC Representing Limited Liability Company Interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6176'}, {'symbol': 'SDOW', 'name': 'UltraPro Short Dow30', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6182'}, {'symbol': 'SDPI', 'name': 'Superior Drilling Products Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8602'}, {'symbol': 'SDR', 'name': 'SandRidge Mississippian Trust II representing Beneficial Interests'}, {'symbol': 'SDRL', 'name': 'Seadrill Limited'}, {'symbol': 'SDT', 'name': 'SandRidge Mississippian Trust I of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6187'}, {'symbol': 'SDY', 'name': 'SPDR S&P Dividend', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6188'}, {'symbol': 'SE', 'name': 'Sea Limited American Depositary Shares each representing one Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13437'}, {'symbol': 'SEAC', 'name': 'SeaChange International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6192'}, {'symbol': 'SEAS', 'name': 'SeaWorld Entertainment Inc.'}, {'symbol': 'SEB', 'name': 'Seaboard Corporation'}, {'symbol': 'SECO', 'name': 'Secoo Holding Limited'}, {'symbol': 'SEDG', 'name': 'SolarEdge Technologies Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9760'}, {'symbol': 'SEE', 'name': 'Sealed Air Corporation'}, {'symbol': 'SEED', 'name': 'Origin Agritech Limited'}, {'symbol': 'SEEL', 'name': 'Seelos Therapeutics Inc.'}, {'symbol': 'SEIC', 'name': 'SEI Investments Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6199'}, {'symbol': 'SELB', 'name': 'Selecta Biosciences Inc.'}, {'symbol': 'SELF', 'name': 'Global Self Storage Inc.'}, {'symbol': 'SEM', 'name': 'Select Medical Holdings Corporation'}, {'symbol': 'SEMG', 'name': 'Semgroup Corporation Class A'}, {'symbol': 'SENEA', 'name': 'Seneca Foods Corp. Class A Common Stock'}, {'symbol': 'SENEB', 'name': 'Seneca Foods Corp. Class B Common Stock'}, {'symbol': 'SENS', 'name': 'Senseonics Holdings Inc.'}, {'symbol': 'SERV', 'name': 'ServiceMaster Global Holdings Inc.'}, {'symbol': 'SES', 'name': 'Synthesis Energy Systems Inc.'}, {'symbol': 'SESN', 'name': 'Sesen Bio Inc.'}, {'symbol': 'SF', 'name': 'Stifel Financial Corporation'}, {'symbol': 'SFB', 'name': 'Stifel Financial Corporation 5.20% Senior Notes due 2047', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13551'}, {'symbol': 'SFBC', 'name': 'Sound Financial Bancorp Inc.'}, {'symbol': 'SFBS', 'name': 'ServisFirst Bancshares Inc.'}, {'symbol': 'SFE', 'name': 'Safeguard Scientifics Inc.'}, {'symbol': 'SFET', 'name': 'Safe-T Group Ltd.'}, {'symbol': 'SFIG', 'name': 'WisdomTree Fundamental U.S. Short-Term Corporate Bond Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11291'}, {'symbol': 'SFIX', 'name': 'Stitch Fix Inc.'}, {'symbol': 'SFL', 'name': 'Ship Finance International Limited'}, {'symbol': 'SFLY', 'name': 'Shutterfly Inc.'}, {'symbol': 'SFM', 'name': 'Sprouts Farmers Market Inc.'}, {'symbol': 'SFNC', 'name': 'Simmons First National Corporation'}, {'symbol': 'SFS', 'name': 'Smart & Final Stores Inc.'}, {'symbol': 'SFST', 'name': 'Southern First Bancshares Inc.'}, {'symbol': 'SFUN', 'name': 'Fang Holdings Limited American Depositary Shares (Each representing Four Class A HK$1.00 par value)'}, {'symbol': 'SG', 'name': 'Sirius International Insurance Group Ltd.'}, {'symbol': 'SGA', 'name': 'Saga Communications Inc.'}, {'symbol': 'SGB', 'name': 'Southwest Georgia Financial Corporation'}, {'symbol': 'SGBX', 'name': 'SG Blocks Inc.'}, {'symbol': 'SGC', 'name': 'Superior Group of Companies Inc.'}, {'symbol': 'SGDM', 'name': 'Sprott Gold Miners', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8954'}, {'symbol': 'SGEN', 'name': 'Seattle Genetics Inc.'}, {'symbol': 'SGH', 'name': 'SMART Global Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12851'}, {'symbol': 'SGLB', 'name': 'Sigma Labs Inc.'}, {'symbol': 'SGMA', 'name': 'SigmaTron International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6239'}, {'symbol': 'SGMO', 'name': 'Sangamo Therapeutics Inc.'}, {'symbol': 'SGMS', 'name': 'Scientific Games Corp'}, {'symbol': 'SGOC', 'name': 'SGOCO Group Ltd'}, {'symbol': 'SGRP', 'name': 'SPAR Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6245'}, {'symbol': 'SGRY', 'name': 'Surgery Partners Inc.'}, {'symbol': 'SGU', 'name': 'Star Group L.P.'}, {'symbol': 'SGYP', 'name': 'Synergy Pharmaceuticals Inc.'}, {'symbol': 'SH', 'name': 'ProShares Short S&P500', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6251'}, {'symbol': 'SHAK', 'name': 'Shake Shack Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9625'}, {'symbol': 'SHBI', 'name': 'Shore Bancshares Inc'}, {'symbol': 'SHEN', 'name': 'Shenandoah Telecommunications Co', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6253'}, {'symbol': 'SHG', 'name': 'Shinhan Financial Group Co Ltd American Depositary Shares'}, {'symbol': 'SHI', 'name': 'SINOPEC Shangai Petrochemical Company Ltd.'}, {'symbol': 'SHIP', 'name': 'Seanergy Maritime Holdings Corp'}, {'symbol': 'SHLO', 'name': 'Shiloh Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6260'}, {'symbol': 'SHLX', 'name': 'Shell Midstream Partners L.P. representing Limited Partner Interests'}, {'symbol': 'SHO', 'name': 'Sunstone Hotel Investors Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6262'}, {'symbol': 'SHO-F', 'name': 'Sunstone Hotel Investors Inc. 6.450% Series F Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11401'}, {'symbol': 'SHOO', 'name': 'Steven Madden Ltd.'}, {'symbol': 'SHOP', 'name': 'Shopify Inc. Class A Subordinate'}, {'symbol': 'SHOS', 'name': 'Sears Hometown and Outlet Stores Inc.'}, {'symbol': 'SHSP', 'name': 'SharpSpring Inc.'}, {'symbol': 'SHW', 'name': 'Sherwin-Williams Company (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6269'}, {'symbol': 'SHYD', 'name': 'VanEck Vectors Short High-Yield Municipal Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8198'}, {'symbol': 'SHYL', 'name': 'Xtrackers Short Duration High Yield Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14000'}, {'symbol': 'SIBN', 'name': 'SI-BONE Inc.'}, {'symbol': 'SIC', 'name': 'Select Interior Concepts Inc.'}, {'symbol': 'SID', 'name': 'Companhia Siderurgica Nacional S.A.'}, {'symbol': 'SIEB', 'name': 'Siebert Financial Corp.'}, {'symbol': 'SIEN', 'name': 'Sientra Inc.'}, {'symbol': 'SIF', 'name': 'SIFCO Industries Inc.'}, {'symbol': 'SIFI', 'name': 'SI Financial Group Inc.'}, {'symbol': 'SIFY', 'name': 'Sify Technologies Limited'}, {'symbol': 'SIG', 'name': 'Signet Jewelers Limited'}, {'symbol': 'SIGA', 'name': 'SIGA Technologies Inc.'}, {'symbol': 'SIGI', 'name': 'Selective Insurance Group Inc.'}, {'symbol': 'SIL', 'name': 'Global X Silver Miners', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6284'}, {'symbol': 'SILC', 'name': 'Silicom Ltd'}, {'symbol': 'SILV', 'name': 'SilverCrest Metals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14943'}, {'symbol': 'SIM', 'name': 'Grupo Simec S.A.B. de C.V. American Depositary Shares'}, {'symbol': 'SIMO', 'name': 'Silicon Motion Technology Corporation'}, {'symbol': 'SINA', 'name': 'Sina Corporation'}, {'symbol': 'SINO', 'name': 'Sino-Global Shipping America Ltd.'}, {'symbol': 'SINT', 'name': 'SiNtx Technologies Inc.'}, {'symbol': 'SIRI', 'name': 'Sirius XM Holdings Inc.'}, {'symbol': 'SITC', 'name': 'SITE Centers Corp.'}, {'symbol': 'SITC-J', 'name': 'SITE Centers Corp. Dep Shs Repstg 1/20th Pfd Cl J', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '1720'}, {'symbol': 'SITE', 'name': 'SiteOne Landscape Supply Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10592'}, {'symbol': 'SITO', 'name': 'SITO Mobile Ltd.'}, {'symbol': 'SIVB', 'name': 'SVB Financial Group'}, {'symbol': 'SIX', 'name': 'Six Flags Entertainment Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6299'}, {'symbol': 'SIZE', 'name': 'iShares Edge MSCI USA Size Factor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6301'}, {'symbol': 'SJI', 'name': 'South Jersey Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6305'}, {'symbol': 'SJM', 'name': 'J.M. Smucker Company (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6307'}, {'symbol': 'SJR', 'name': 'Shaw Communications Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6309'}, {'symbol': 'SJT', 'name': 'San Juan Basin Royalty Trust'}, {'symbol': 'SJW', 'name': 'SJW Group (DE)'}, {'symbol': 'SKIS', 'name': 'Peak Resorts Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9405'}, {'symbol': 'SKM', 'name': 'SK Telecom Co. Ltd.'}, {'symbol': 'SKT', 'name': 'Tanger Factory Outlet Centers Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6318'}, {'symbol': 'SKX', 'name': 'Skechers U.S.A. Inc.'}, {'symbol': 'SKY', 'name': 'Skyline Champion Corporation'}, {'symbol': 'SKYS', 'name': 'Sky Solar Holdings Ltd.'}, {'symbol': 'SKYW', 'name': 'SkyWest Inc.'}, {'symbol': 'SLAB', 'name': 'Silicon Laboratories Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6325'}, {'symbol': 'SLB', 'name': 'Schlumberger N.V.'}, {'symbol': 'SLCA', 'name': 'U.S. Silica Holdings Inc.'}, {'symbol': 'SLCT', 'name': 'Select Bancorp Inc.'}, {'symbol': 'SLDB', 'name': 'Solid Biosciences Inc.'}, {'symbol': 'SLF', 'name': 'Sun Life Financial Inc.'}, {'symbol': 'SLG', 'name': 'SL Green Realty Corp'}, {'symbol': 'SLGL', 'name': 'Sol-Gel Technologies Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13327'}, {'symbol': 'SLGN', 'name': 'Silgan Holdings Inc.'}, {'symbol': 'SLM', 'name': 'SLM Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6334'}, {'symbol': 'SLNO', 'name': 'Soleno Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8709'}, {'symbol': 'SLP', 'name': 'Simulations Plus Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6337'}, {'symbol': 'SLRC', 'name': 'Solar Capital Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6339'}, {'symbol': 'SLS', 'name': 'SELLAS Life Sciences Group Inc.'}, {'symbol': 'SLTB', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14630'}, {'symbol': 'SLVO', 'name': 'Credit Suisse Silver Shares Covered Call Exchange Traded Notes', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6344'}, {'symbol': 'SLX', 'name': 'VanEck Vectors Steel', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6347'}, {'symbol': 'SLYG', 'name': 'SPDR S&P 600 Small Cap Growth ETF (based on S&P SmallCap 600 Growth Index --symbol CGK)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6350'}, {'symbol': 'SM', 'name': 'SM Energy Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6352'}, {'symbol': 'SMAR', 'name': 'Smartsheet Inc. Class A'}, {'symbol': 'SMBC', 'name': 'Southern Missouri Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6355'}, {'symbol': 'SMBK', 'name': 'SmartFinancial Inc.'}, {'symbol': 'SMDD', 'name': 'UltraPro Short MidCap400', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6357'}, {'symbol': 'SMED', 'name': 'Sharps Compliance Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6358'}, {'symbol': 'SMFG', 'name': 'Sumitomo Mitsui Financial Group Inc Unsponsored American Depositary Shares (Japan)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6360'}, {'symbol': 'SMG', 'name': 'Scotts Miracle-Gro Company (The)'}, {'symbol': 'SMHB', 'name': 'ETRACS Monthly Pay 2x Leveraged Small Cap High Dividend ETN Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15214'}, {'symbol': 'SMHI', 'name': 'SEACOR Marine Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12940'}, {'symbol': 'SMI', 'name': 'Semiconductor Manufacturing International Corporation ADR'}, {'symbol': 'SMIT', 'name': 'Schmitt Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6365'}, {'symbol': 'SMLL', 'name': 'Direxion Daily Small Cap Bull 2X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9100'}, {'symbol': 'SMLP', 'name': 'Summit Midstream Partners LP Representing Limited Partner Interests'}, {'symbol': 'SMM', 'name': 'Salient Midstream of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6369'}, {'symbol': 'SMMF', 'name': 'Summit Financial Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6370'}, {'symbol': 'SMMT', 'name': 'Summit Therapeutics plc'}, {'symbol': 'SMMV', 'name': 'iShares Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11800'}, {'symbol': 'SMP', 'name': 'Standard Motor Products Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6373'}, {'symbol': 'SMPL', 'name': 'The Simply Good Foods Company'}, {'symbol': 'SMRT', 'name': 'Stein Mart Inc.'}, {'symbol': 'SMSI', 'name': 'Smith Micro Software Inc.'}, {'symbol': 'SMTA', 'name': 'Spirit MTA REIT of Beneficial Interest'}, {'symbol': 'SMTC', 'name': 'Semtech Corporation'}, {'symbol': 'SMTS', 'name': 'Sierra Metals Inc.'}, {'symbol': 'SMTX', 'name': 'SMTC Corporation'}, {'symbol': 'SN', 'name': 'Sanchez Energy Corporation'}, {'symbol': 'SNA', 'name': 'Snap-On Incorporated'}, {'symbol': 'SNAP', 'name': 'Snap Inc. Class A'}, {'symbol': 'SNBR', 'name': 'Sleep Number Corporation'}, {'symbol': 'SNCR', 'name': 'Synchronoss Technologies Inc.'}, {'symbol': 'SND', 'name': 'Smart Sand Inc.'}, {'symbol': 'SNDE', 'name': 'Sundance Energy Australia Limited'}, {'symbol': 'SNDR', 'name': 'Schneider National Inc.'}, {'symbol': 'SNDX', 'name': 'Syndax Pharmaceuticals Inc.'}, {'symbol': 'SNE', 'name': 'Sony Corporation'}, {'symbol': 'SNES', 'name': 'SenesTech Inc.'}, {'symbol': 'SNFCA', 'name': 'Security National Financial Corporation Class A Common Stock'}, {'symbol': 'SNGX', 'name': 'Soligenix Inc.'}, {'symbol': 'SNH', 'name': 'Senior Housing Properties Trust', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6389'}, {'symbol': 'SNHNL', 'name': 'Senior Housing Properties Trust 6.25% Senior Notes Due 2046', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11067'}, {'symbol': 'SNHY', 'name': 'Sun Hydraulics Corporation'}, {'symbol': 'SNMP', 'name': 'Sanchez Midstream Partners LP', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1158'}, {'symbol': 'SNN', 'name': 'Smith & Nephew SNATS Inc.'}, {'symbol': 'SNNA', 'name': 'Sienna Biopharmaceuticals Inc.'}, {'symbol': 'SNOA', 'name': 'Sonoma Pharmaceuticals Inc.'}, {'symbol': 'SNP', 'name': 'China Petroleum & Chemical Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6396'}, {'symbol': 'SNPS', 'name': 'Synopsys Inc.'}, {'symbol': 'SNR', 'name': 'New Senior Investment Group Inc.'}, {'symbol': 'SNSS', 'name': 'Sunesis Pharmaceuticals Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6398'}, {'symbol': 'SNV', 'name': 'Synovus Financial Corp.'}, {'symbol': 'SNX', 'name': 'Synnex Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6403'}, {'symbol': 'SNY', 'name': 'Sanofi'}, {'symbol': 'SO', 'name': 'Southern Company (The)'}, {'symbol': 'SOGO', 'name': 'Sogou Inc. American Depositary Shares each representing one Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13565'}, {'symbol': 'SOHO', 'name': 'Sotherly Hotels Inc.'}, {'symbol': 'SOHOK', 'name': 'Sotherly Hotels LP 7.25% Senior Unsecured Notes Due 2021', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14169'}, {'symbol': 'SOHU', 'name': 'Sohu.com Limited', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14691'}, {'symbol': 'SOI', 'name': 'Solaris Oilfield Infrastructure Inc. Class A'}, {'symbol': 'SOJA', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10674'}, {'symbol': 'SOJC', 'name': 'Southern Company (The) Series 2017B 5.25% Junior Subordinated Notes due December 1 2077', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13843'}, {'symbol': 'SOL', 'name': 'Renesola Ltd. ADR'}, {'symbol': 'SOLO', 'name': 'Electrameccanica Vehicles Corp. Ltd.'}, {'symbol': 'SON', 'name': 'Sonoco Products Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6414'}, {'symbol': 'SONA', 'name': 'Southern National Bancorp of Virginia Inc.'}, {'symbol': 'SONO', 'name': 'Sonos Inc.'}, {'symbol': 'SOR', 'name': 'Source Capital Inc.'}, {'symbol': 'SORL', 'name': 'SORL Auto Parts Inc.'}, {'symbol': 'SOXL', 'name': 'Direxion Daily Semiconductor Bull 3x Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6422'}, {'symbol': 'SOXX', 'name': 'iShares PHLX SOX Semiconductor Sector Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6424'}, {'symbol': 'SP', 'name': 'SP Plus Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6519'}, {'symbol': 'SPA', 'name': 'Sparton Corporation'}, {'symbol': 'SPAQ', 'name': 'Spartan Energy Acquisition Corp Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15057'}, {'symbol': 'SPAQ=', 'name': 'Spartan Energy Acquisition Corp Units (each consisting of one Class A Common Stock and one-third of one Warrant)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14860'}, {'symbol': 'SPAR', 'name': 'Spartan Motors Inc.'}, {'symbol': 'SPB', 'name': 'Spectrum Brands Holdings Inc.'}, {'symbol': 'SPCB', 'name': 'SuperCom Ltd.'}, {'symbol': 'SPDV', 'name': 'AAM S&P 500 High Dividend Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13844'}, {'symbol': 'SPE', 'name': 'Special Opportunities Fund Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6433'}, {'symbol': 'SPEM', 'name': 'SPDR Index Shares Fund Portfolio Emerging Markets', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '2926'}, {'symbol': 'SPEX', 'name': 'Spherix Incorporated'}, {'symbol': 'SPG', 'name': 'Simon Property Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6438'}, {'symbol': 'SPGI', 'name': 'S&P Global Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4385'}, {'symbol': 'SPH', 'name': 'Suburban Propane Partners L.P.'}, {'symbol': 'SPHD', 'name': 'Invesco S&P 500 High Dividend Low Volatility', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6443'}, {'symbol': 'SPHS', 'name': 'Sophiris Bio Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7739'}, {'symbol': 'SPI', 'name': 'SPI Energy Co. Ltd.'}, {'symbol': 'SPKE', 'name': 'Spark Energy Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8819'}, {'symbol': 'SPLB', 'name': 'SPDR Portfolio Long Term Corporate Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '4200'}, {'symbol': 'SPLK', 'name': 'Splunk Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6446'}, {'symbol': 'SPLP', 'name': 'Steel Partners Holdings LP LTD PARTNERSHIP UNIT'}, {'symbol': 'SPLV', 'name': 'Invesco S&P 500 Low Volatility', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6449'}, {'symbol': 'SPMO', 'name': 'Invesco S&P 500 Momentum', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10679'}, {'symbol': 'SPN', 'name': 'Superior Energy Services Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6450'}, {'symbol': 'SPNE', 'name': 'SeaSpine Holdings Corporation'}, {'symbol': 'SPNS', 'name': 'Sapiens International Corporation N.V.'}, {'symbol': 'SPOK', 'name': 'Spok Holdings Inc.'}, {'symbol': 'SPOT', 'name': 'Spotify Technology S.A.'}, {'symbol': 'SPPI', 'name': 'Spectrum Pharmaceuticals Inc.'}, {'symbol': 'SPPP', 'name': 'Sprott Physical Platinum and Palladium Trust'}, {'symbol': 'SPR', 'name': 'Spirit Aerosystems Holdings Inc.'}, {'symbol': 'SPRO', 'name': 'Spero Therapeutics Inc.'}, {'symbol': 'SPRT', 'name': 'Support.com Inc.'}, {'symbol': 'SPSC', 'name': 'SPS Commerce Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6463'}, {'symbol': 'SPTL', 'name': 'SPDR Portfolio Long Term Treasury', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6826'}, {'symbol': 'SPTN', 'name': 'SpartanNash Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6464'}, {'symbol': 'SPUU', 'name': 'Direxion Daily S&P 500 Bull 2X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '8671'}, {'symbol': 'SPVU', 'name': 'Invesco S&P 500 Enhanced Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10680'}, {'symbol': 'SPWH', 'name': "Sportsman's Warehouse Holdings Inc."}, {'symbol': 'SPWR', 'name': 'SunPower Corporation'}, {'symbol': 'SPXC', 'name': 'SPX Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6466'}, {'symbol': 'SPXL', 'name': 'Direxion Daily S&P 500 Bull 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6469'}, {'symbol': 'SPXS', 'name': 'Direxion Daily S&P 500 Bear 3X', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6470'}, {'symbol': 'SPXU', 'name': 'ProShares UltraPro Short S&P500', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6471'}, {'symbol': 'SPXX', 'name': 'Nuveen S&P 500 Dynamic Overwrite Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '3819'}, {'symbol': 'SPYB', 'name': 'SPDR S&P 500 Buyback', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9728'}, {'symbol': 'SPYG', 'name': 'SPDR Series Trust Portfolio S&P 500 Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6473'}, {'symbol': 'SPYX', 'name': 'SPDR S&P 500 Fossil Fuel Reserves Free', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10887'}, {'symbol': 'SQ', 'name': 'Square Inc. Class A'}, {'symbol': 'SQBG', 'name': 'Sequential Brands Group Inc.'}, {'symbol': 'SQM', 'name': 'Sociedad Quimica y Minera S.A.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6476'}, {'symbol': 'SQNS', 'name': 'Sequans Communications S.A. American Depositary Shares each representing one'}, {'symbol': 'SR', 'name': 'Spire Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '4068'}, {'symbol': 'SRAX', 'name': 'Social Reality Inc.'}, {'symbol': 'SRC', 'name': 'Spirit Realty Capital Inc.'}, {'symbol': 'SRCE', 'name': '1st Source Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6482'}, {'symbol': 'SRCI', 'name': 'SRC Energy Inc.'}, {'symbol': 'SRCL', 'name': 'Stericycle Inc.'}, {'symbol': 'SRDX', 'name': 'Surmodics Inc.'}, {'symbol': 'SRE', 'name': 'Sempra Energy'}, {'symbol': 'SRE-B', 'name': 'Sempra Energy 6.75% Mandatory Convertible Preferred Stock Series B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14843'}, {'symbol': 'SREV', 'name': 'ServiceSource International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6486'}, {'symbol': 'SRF', 'name': 'Cushing Energy Income Fund of Beneficial Interest'}, {'symbol': 'SRG', 'name': 'Seritage Growth Properties Class A'}, {'symbol': 'SRI', 'name': 'Stoneridge Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6488'}, {'symbol': 'SRLP', 'name': 'Sprague Resources LP representing Limited Partner Interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7872'}, {'symbol': 'SRNE', 'name': 'Sorrento Therapeutics Inc.'}, {'symbol': 'SRPT', 'name': 'Sarepta Therapeutics Inc.'}, {'symbol': 'SRRA', 'name': 'Sierra Oncology Inc.'}, {'symbol': 'SRRK', 'name': 'Scholar Rock Holding Corporation'}, {'symbol': 'SRT', 'name': 'StarTek Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6492'}, {'symbol': 'SRTS', 'name': 'Sensus Healthcare Inc.'}, {'symbol': 'SRTY', 'name': 'ProShares UltraPro Short Russell2000', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6493'}, {'symbol': 'SRV', 'name': 'Cushing MLP & Infrastructure Total Return Fund'}, {'symbol': 'SSB', 'name': 'South State Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6117'}, {'symbol': 'SSBI', 'name': 'Summit State Bank'}, {'symbol': 'SSD', 'name': 'Simpson Manufacturing Company Inc.'}, {'symbol': 'SSFN', 'name': 'Stewardship Financial Corp'}, {'symbol': 'SSI', 'name': 'Stage Stores Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6500'}, {'symbol': 'SSKN', 'name': 'Strata Skin Sciences Inc.'}, {'symbol': 'SSL', 'name': 'Sasol Ltd. American Depositary Shares'}, {'symbol': 'SSLJ', 'name': 'SSLJ.com Limited'}, {'symbol': 'SSNC', 'name': 'SS&C Technologies Holdings Inc.'}, {'symbol': 'SSNT', 'name': 'SilverSun Technologies Inc.'}, {'symbol': 'SSP', 'name': 'E.W. Scripps Company (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6506'}, {'symbol': 'SSRM', 'name': 'SSR Mining Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6507'}, {'symbol': 'SSTI', 'name': 'ShotSpotter Inc.'}, {'symbol': 'SSTK', 'name': 'Shutterstock Inc.'}, {'symbol': 'SSW', 'name': 'Seaspan Corporation'}, {'symbol': 'SSW-E', 'name': 'Seaspan Corporation Cumulative Redeemable Perpetual Preferred Series E (Marshall Islands)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14632'}, {'symbol': 'SSW-H', 'name': 'Seaspan Corporation 7.875% Cumulative Redeemable Perpetual Preferred Shares - Series H', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14634'}, {'symbol': 'SSWA', 'name': 'Seaspan Corporation 7.125% Notes due 2027', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14635'}, {'symbol': 'SSY', 'name': 'SunLink Health Systems Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6512'}, {'symbol': 'SSYS', 'name': 'Stratasys Ltd.'}, {'symbol': 'ST', 'name': 'Sensata Technologies Holding plc'}, {'symbol': 'STAA', 'name': 'STAAR Surgical Company'}, {'symbol': 'STAF', 'name': 'Staffing 360 Solutions Inc.'}, {'symbol': 'STAG', 'name': 'Stag Industrial Inc.'}, {'symbol': 'STAR', 'name': 'iStar Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6212'}, {'symbol': 'STAR-G', 'name': 'iStar Inc. Series G Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '6216'}, {'symbol': 'STAY', 'name': 'Extended Stay America Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8070'}, {'symbol': 'STBA', 'name': 'S&T Bancorp Inc.'}, {'symbol': 'STC', 'name': 'Stewart Information Services Corporation'}, {'symbol': 'STCN', 'name': 'Steel Connect Inc.'}, {'symbol': 'STE', 'name': 'STERIS plc'}, {'symbol': 'STFC', 'name': 'State Auto Financial Corporation'}, {'symbol': 'STG', 'name': 'Sunlands Online Education Group American Depositary Shares representing Class A'}, {'symbol': 'STI', 'name': 'SunTrust Banks Inc.'}, {'symbol': 'STIM', 'name': 'Neuronetics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14703'}, {'symbol': 'STK', 'name': 'Columbia Seligman Premium Technology Growth Fund Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6535'}, {'symbol': 'STKL', 'name': 'SunOpta Inc.'}, {'symbol': 'STKS', 'name': 'The ONE Group Hospitality Inc.'}, {'symbol': 'STL', 'name': 'Sterling Bancorp'}, {'symbol': 'STLD', 'name': 'Steel Dynamics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6539'}, {'symbol': 'STM', 'name': 'STMicroelectronics N.V.'}, {'symbol': 'STML', 'name': 'Stemline Therapeutics Inc.'}, {'symbol': 'STMP', 'name': 'Stamps.com Inc.'}, {'symbol': 'STN', 'name': 'Stantec Inc'}, {'symbol': 'STND', 'name': 'Standard AVB Financial Corp.'}, {'symbol': 'STNE', 'name': 'StoneCo Ltd.'}, {'symbol': 'STNG', 'name': 'Scorpio Tankers Inc.'}, {'symbol': 'STNL', 'name': 'Sentinel Energy Services Inc.'}, {'symbol': 'STNLW', 'name': 'Sentinel Energy Services Inc. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13956'}, {'symbol': 'STON', 'name': 'StoneMor Partners L.P. Rep Limited Partnership Interests'}, {'symbol': 'STOR', 'name': 'STORE Capital Corporation'}, {'symbol': 'STPP', 'name': 'iPath US Treasury Steepener ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6551'}, {'symbol': 'STRA', 'name': 'Strategic Education Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6554'}, {'symbol': 'STRL', 'name': 'Sterling Construction Company Inc'}, {'symbol': 'STRM', 'name': 'Streamline Health Solutions Inc.'}, {'symbol': 'STRO', 'name': 'Sutro Biopharma Inc.'}, {'symbol': 'STRS', 'name': 'Stratus Properties Inc.'}, {'symbol': 'STRT', 'name': 'STRATTEC SECURITY CORPORATION'}, {'symbol': 'STT', 'name': 'State Street Corporation'}, {'symbol': 'STT-D', 'name': 'State Street Corporation Depositary Shares Series D', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '8436'}, {'symbol': 'STT-G', 'name': 'State Street Corporation Depositary shares each representing a 1/4000th ownership interest in a share of Fixed-to-Floating Rate Non-Cumulative', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11240'}, {'symbol': 'STWD', 'name': 'STARWOOD PROPERTY TRUST INC. Starwood Property Trust Inc.'}, {'symbol': 'STX', 'name': 'Seagate Technology PLC'}, {'symbol': 'STXB', 'name': 'Spirit of Texas Bancshares Inc.'}, {'symbol': 'STZ', 'name': 'Constellation Brands Inc.'}, {'symbol': 'STZ.B', 'name': 'Constellation Brands Inc.'}, {'symbol': 'SU', 'name': 'Suncor Energy Inc.'}, {'symbol': 'SUI', 'name': 'Sun Communities Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6578'}, {'symbol': 'SUM', 'name': 'Summit Materials Inc. Class A'}, {'symbol': 'SUMR', 'name': 'Summer Infant Inc.'}, {'symbol': 'SUN', 'name': 'Sunoco LP representing limited partner interests'}, {'symbol': 'SUNS', 'name': 'Solar Senior Capital Ltd.'}, {'symbol': 'SUNW', 'name': 'Sunworks Inc.'}, {'symbol': 'SUP', 'name': 'Superior Industries International Inc. (DE)'}, {'symbol': 'SUPN', 'name': 'Supernus Pharmaceuticals Inc.'}, {'symbol': 'SUPV', 'name': 'Grupo Supervielle S.A. American Depositary Shares each Representing five Class B shares'}, {'symbol': 'SURF', 'name': 'Surface Oncology Inc.'}, {'symbol': 'SUSB', 'name': 'iShares ESG 1-5 Year USD Corporate Bond ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13124'}, {'symbol': 'SUZ', 'name': 'Suzano Papel e Celulose S.A. American Depositary Shares (each representing two)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15296'}, {'symbol': 'SVA', 'name': 'Sinovac Biotech Ltd.'}, {'symbol': 'SVBI', 'name': 'Severn Bancorp Inc'}, {'symbol': 'SVM', 'name': 'Silvercorp Metals Inc.'}, {'symbol': 'SVMK', 'name': 'SVMK Inc.'}, {'symbol': 'SVRA', 'name': 'Savara Inc.'}, {'symbol': 'SVT', 'name': 'Servotronics Inc.'}, {'symbol': 'SVVC', 'name': 'Firsthand Technology Value Fund Inc.'}, {'symbol': 'SWAN', 'name': 'Amplify ETF Trust BlackSwan Growth & Treasury Core', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15207'}, {'symbol': 'SWCH', 'name': 'Switch Inc. Class A'}, {'symbol': 'SWI', 'name': 'SolarWinds Corporation'}, {'symbol': 'SWIR', 'name': 'Sierra Wireless Inc.'}, {'symbol': 'SWK', 'name': 'Stanley Black & Decker Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6608'}, {'symbol': 'SWKS', 'name': 'Skyworks Solutions Inc.'}, {'symbol': 'SWM', 'name': 'Schweitzer-Mauduit International Inc.'}, {'symbol': 'SWN', 'name': 'Southwestern Energy Company'}, {'symbol': 'SWX', 'name': 'Southwest Gas Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12350'}, {'symbol': 'SWZ', 'name': 'Swiss Helvetia Fund Inc. (The)'}, {'symbol': 'SXC', 'name': 'SunCoke Energy Inc.'}, {'symbol': 'SXCP', 'name': 'SunCoke Energy Partners L.P. Representing Limited partner Interests'}, {'symbol': 'SXE', 'name': 'Southcross Energy Partners L.P.'}, {'symbol': 'SXI', 'name': 'Standex International Corporation'}, {'symbol': 'SXT', 'name': 'Sensient Technologies Corporation'}, {'symbol': 'SXTC', 'name': 'China SXT Pharmaceuticals Inc.'}, {'symbol': 'SYBT', 'name': 'Stock Yards Bancorp Inc.'}, {'symbol': 'SYBX', 'name': 'Synlogic Inc.'}, {'symbol': 'SYF', 'name': 'Synchrony Financial', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8465'}, {'symbol': 'SYK', 'name': 'Stryker Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6627'}, {'symbol': 'SYKE', 'name': 'Sykes Enterprises Incorporated'}, {'symbol': 'SYMC', 'name': 'Symantec Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6630'}, {'symbol': 'SYN', 'name': 'Synthetic Biologics Inc.'}, {'symbol': 'SYNA', 'name': 'Synaptics Incorporated'}, {'symbol': 'SYNC', 'name': 'Synacor Inc.'}, {'symbol': 'SYNH', 'name': 'Syneos Health Inc.'}, {'symbol': 'SYNL', 'name': 'Synalloy Corporation'}, {'symbol': 'SYPR', 'name': 'Sypris Solutions Inc.'}, {'symbol': 'SYRS', 'name': 'Syros Pharmaceuticals Inc.'}, {'symbol': 'SYX', 'name': 'Systemax Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6643'}, {'symbol': 'SYY', 'name': 'Sysco Corporation'}, {'symbol': 'SZC', 'name': 'Cushing Renaissance Fund (The) of Beneficial Interest'}, {'symbol': 'SZNE', 'name': 'Pacer CFRA-Stovall Equal Weight Seasonal Rotation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14861'}, {'symbol': 'T', 'name': 'AT&T Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6649'}, {'symbol': 'TA', 'name': 'TravelCenters of America LLC'}, {'symbol': 'TAC', 'name': 'TransAlta Corporation'}, {'symbol': 'TACO', 'name': 'Del Taco Restaurants Inc.'}, {'symbol': 'TACT', 'name': 'TransAct Technologies Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6652'}, {'symbol': 'TAHO', 'name': 'Tahoe Resources Inc. (Canada)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6654'}, {'symbol': 'TAIT', 'name': 'Taitron Components Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6656'}, {'symbol': 'TAK', 'name': 'Takeda Pharmaceutical Company Limited American Depositary Shares (each representing 1/2 of a share of)'}, {'symbol': 'TAL', 'name': 'TAL Education Group American Depositary Shares'}, {'symbol': 'TALO', 'name': 'Talos Energy Inc.'}, {'symbol': 'TAN', 'name': 'Invesco Solar', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14661'}, {'symbol': 'TANH', 'name': 'Tantech Holdings Ltd.'}, {'symbol': 'TANNL', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9572'}, {'symbol': 'TAO', 'name': 'Invesco China Real Estate', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14422'}, {'symbol': 'TAOP', 'name': 'Taoping Inc.'}, {'symbol': 'TAP', 'name': 'Molson Coors Brewing Company Class B'}, {'symbol': 'TAP.A', 'name': 'Molson Coors Brewing Company Class A'}, {'symbol': 'TARO', 'name': 'Taro Pharmaceutical Industries Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6665'}, {'symbol': 'TAST', 'name': 'Carrols Restaurant Group Inc.'}, {'symbol': 'TAT', 'name': 'TransAtlantic Petroleum Ltd (Bermuda)'}, {'symbol': 'TATT', 'name': 'TAT Technologies Ltd.'}, {'symbol': 'TAXF', 'name': 'American Century Diversified Municipal Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15013'}, {'symbol': 'TAYD', 'name': 'Taylor Devices Inc.'}, {'symbol': 'TBBK', 'name': 'The Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6679'}, {'symbol': 'TBF', 'name': 'ProShares Short 20+ Year Treasury', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6680'}, {'symbol': 'TBI', 'name': 'TrueBlue Inc.'}, {'symbol': 'TBIO', 'name': 'Translate Bio Inc.'}, {'symbol': 'TBK', 'name': 'Triumph Bancorp Inc.'}, {'symbol': 'TBLT', 'name': 'ToughBuilt Industries Inc.'}, {'symbol': 'TBLTW', 'name': 'ToughBuilt Industries Inc. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15272'}, {'symbol': 'TBNK', 'name': 'Territorial Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6682'}, {'symbol': 'TBPH', 'name': 'Theravance Biopharma Inc.'}, {'symbol': 'TBRG', 'name': 'Thunder Bridge Acquisition Ltd.'}, {'symbol': 'TBRGW', 'name': 'Thunder Bridge Acquisition Ltd. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14839'}, {'symbol': 'TBX', 'name': 'ProShares Short 7 10 Year Treasury', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6685'}, {'symbol': 'TC', 'name': 'TuanChe Limited'}, {'symbol': 'TCBI', 'name': 'Texas Capital Bancshares Inc.'}, {'symbol': 'TCBIP', 'name': 'Texas Capital Bancshares Inc. Non Cumulative Preferred Perpetual Stock Series A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '6695'}, {'symbol': 'TCBK', 'name': 'TriCo Bancshares'}, {'symbol': 'TCCO', 'name': 'Technical Communications Corporation'}, {'symbol': 'TCDA', 'name': 'Tricida Inc.'}, {'symbol': 'TCF', 'name': 'TCF Financial Corporation'}, {'symbol': 'TCFC', 'name': 'The Community Financial Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7803'}, {'symbol': 'TCI', 'name': 'Transcontinental Realty Investors Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6701'}, {'symbol': 'TCMD', 'name': 'Tactile Systems Technology Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11029'}, {'symbol': 'TCO', 'name': 'Taubman Centers Inc.'}, {'symbol': 'TCO-K', 'name': 'Taubman Centers Inc. Preferred Series K', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '6705'}, {'symbol': 'TCON', 'name': 'TRACON Pharmaceuticals Inc.'}, {'symbol': 'TCP', 'name': 'TC PipeLines LP representing Limited Partner Interests'}, {'symbol': 'TCPC', 'name': 'BlackRock TCP Capital Corp.'}, {'symbol': 'TCRD', 'name': 'THL Credit Inc.'}, {'symbol': 'TCRZ', 'name': 'THL Credit Inc. 6.75% Notes due 2022', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10932'}, {'symbol': 'TCS', 'name': 'Container Store (The)'}, {'symbol': 'TCX', 'name': 'Tucows Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6709'}, {'symbol': 'TD', 'name': 'Toronto Dominion Bank (The)'}, {'symbol': 'TDAC', 'name': 'Trident Acquisitions Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14264'}, {'symbol': 'TDACW', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14733'}, {'symbol': 'TDC', 'name': 'Teradata Corporation'}, {'symbol': 'TDF', 'name': 'Templeton Dragon Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6715'}, {'symbol': 'TDG', 'name': 'Transdigm Group Incorporated Inc.'}, {'symbol': 'TDIV', 'name': 'First Trust NASDAQ Technology Dividend Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6719'}, {'symbol': 'TDOC', 'name': 'Teladoc Health Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10118'}, {'symbol': 'TDS', 'name': 'Telephone and Data Systems Inc.'}, {'symbol': 'TDTT', 'name': 'FlexShares iBoxx 3 Year Target Duration TIPS Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6724'}, {'symbol': 'TDW', 'name': 'Tidewater Inc.'}, {'symbol': 'TDW+A', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13513'}, {'symbol': 'TDY', 'name': 'Teledyne Technologies Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6728'}, {'symbol': 'TEAM', 'name': 'Atlassian Corporation Plc'}, {'symbol': 'TECD', 'name': 'Tech Data Corporation'}, {'symbol': 'TECH', 'name': 'Bio-Techne Corp'}, {'symbol': 'TECK', 'name': 'Teck Resources Ltd'}, {'symbol': 'TECS', 'name': 'Direxion Technology Bear 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6734'}, {'symbol': 'TEDU', 'name': 'Tarena International Inc.'}, {'symbol': 'TEF', 'name': 'Telefonica SA'}, {'symbol': 'TEI', 'name': 'Templeton Emerging Markets Income Fund Inc.'}, {'symbol': 'TEL', 'name': 'TE Connectivity Ltd. New Switzerland Registered Shares'}, {'symbol': 'TELL', 'name': 'Tellurian Inc.'}, {'symbol': 'TEN', 'name': 'Tenneco Inc. Class A Voting'}, {'symbol': 'TENB', 'name': 'Tenable Holdings Inc.'}, {'symbol': 'TENX', 'name': 'Tenax Therapeutics Inc.'}, {'symbol': 'TEO', 'name': 'Telecom Argentina SA'}, {'symbol': 'TER', 'name': 'Teradyne Inc.'}, {'symbol': 'TERP', 'name': 'TerraForm Power Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8680'}, {'symbol': 'TESS', 'name': 'TESSCO Technologies Incorporated'}, {'symbol': 'TEUM', 'name': 'Pareteum Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '2269'}, {'symbol': 'TEVA', 'name': 'Teva Pharmaceutical Industries Limited American Depositary Shares'}, {'symbol': 'TEX', 'name': 'Terex Corporation'}, {'symbol': 'TFIV', 'name': 'Global X TargetIncome 5', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14874'}, {'symbol': 'TFLT', 'name': 'Global X TargetIncome Plus 2', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14875'}, {'symbol': 'TFSL', 'name': 'TFS Financial Corporation'}, {'symbol': 'TFX', 'name': 'Teleflex Incorporated'}, {'symbol': 'TG', 'name': 'Tredegar Corporation'}, {'symbol': 'TGA', 'name': 'TransGlobe Energy Corporation'}, {'symbol': 'TGB', 'name': 'Taseko Mines Ltd.'}, {'symbol': 'TGC', 'name': 'Tengasco Inc.'}, {'symbol': 'TGE', 'name': 'Tallgrass Energy LP Class A Shares'}, {'symbol': 'TGEN', 'name': 'Tecogen Inc.'}, {'symbol': 'TGH', 'name': 'Textainer Group Holdings Limited'}, {'symbol': 'TGI', 'name': 'Triumph Group Inc.'}, {'symbol': 'TGLS', 'name': 'Tecnoglass Inc.'}, {'symbol': 'TGNA', 'name': 'TEGNA Inc'}, {'symbol': 'TGP', 'name': 'Teekay LNG Partners L.P.'}, {'symbol': 'TGP-B', 'name': 'Teekay LNG Partners L.P. 8.50% Series B Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units representing limited partner interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14638'}, {'symbol': 'TGS', 'name': 'Transportadora de Gas del Sur SA TGS'}, {'symbol': 'TGT', 'name': 'Target Corporation'}, {'symbol': 'TGTX', 'name': 'TG Therapeutics Inc.'}, {'symbol': 'THC', 'name': 'Tenet Healthcare Corporation'}, {'symbol': 'THFF', 'name': 'First Financial Corporation Indiana', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6777'}, {'symbol': 'THG', 'name': 'Hanover Insurance Group Inc'}, {'symbol': 'THM', 'name': 'International Tower Hill Mines Ltd. (Canada)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6783'}, {'symbol': 'THO', 'name': 'Thor Industries Inc.'}, {'symbol': 'THOR', 'name': 'Synthorx Inc.'}, {'symbol': 'THQ', 'name': 'Tekla Healthcare Opportunies Fund Shares of Beneficial Interest'}, {'symbol': 'THR', 'name': 'Thermon Group Holdings Inc.'}, {'symbol': 'THRM', 'name': 'Gentherm Inc'}, {'symbol': 'THS', 'name': 'Treehouse Foods Inc.'}, {'symbol': 'THST', 'name': 'Truett-Hurst Inc.'}, {'symbol': 'THW', 'name': 'Tekla World Healthcare Fund Shares of Beneficial Interest'}, {'symbol': 'TI', 'name': 'Telecom Italia S.P.A. New'}, {'symbol': 'TI.A', 'name': 'Telecom Italia S.P.A. New'}, {'symbol': 'TIBR', 'name': 'Tiberius Acquisition Corporation'}, {'symbol': 'TIBRW', 'name': 'Tiberius Acquisition Corporation Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14430'}, {'symbol': 'TIER', 'name': 'TIER REIT Inc.'}, {'symbol': 'TIF', 'name': 'Tiffany & Co.'}, {'symbol': 'TIGO', 'name': 'Millicom International Cellular S.A.'}, {'symbol': 'TIK', 'name': 'Tel-Instrument Electronics Corp.'}, {'symbol': 'TILE', 'name': 'Interface Inc.'}, {'symbol': 'TIP', 'name': 'iShares TIPS Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6804'}, {'symbol': 'TIPT', 'name': 'Tiptree Inc.'}, {'symbol': 'TIPZ', 'name': 'PIMCO Broad U.S. TIPS Index Exchange-Traded Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6806'}, {'symbol': 'TIS', 'name': 'Orchids Paper Products Company'}, {'symbol': 'TISA', 'name': 'Top Image Systems Ltd.'}, {'symbol': 'TISI', 'name': 'Team Inc.'}, {'symbol': 'TITN', 'name': 'Titan Machinery Inc.'}, {'symbol': 'TIVO', 'name': 'TiVo Corporation'}, {'symbol': 'TJX', 'name': 'TJX Companies Inc. (The)'}, {'symbol': 'TK', 'name': 'Teekay Corporation'}, {'symbol': 'TKAT', 'name': 'Takung Art Co. Ltd.'}, {'symbol': 'TKC', 'name': 'Turkcell Iletisim Hizmetleri AS'}, {'symbol': 'TKKS', 'name': 'TKK Symphony Acquisition Corporation'}, {'symbol': 'TKKSU', 'name': 'TKK Symphony Acquisition Corporation Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14881'}, {'symbol': 'TKR', 'name': 'Timken Company (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6817'}, {'symbol': 'TLC', 'name': 'Taiwan Liposome Company Ltd.'}, {'symbol': 'TLEH', 'name': 'FlexShares Currency Hedged Morningstar EM Factor Tilt Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10832'}, {'symbol': 'TLF', 'name': 'Tandy Leather Factory Inc.'}, {'symbol': 'TLGT', 'name': 'Teligent Inc.'}, {'symbol': 'TLI', 'name': 'Western Asset Corporate Loan Fund Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6821'}, {'symbol': 'TLK', 'name': 'PT Telekomunikasi Indonesia Tbk'}, {'symbol': 'TLND', 'name': 'Talend S.A.'}, {'symbol': 'TLP', 'name': 'TransMontaigne Partners L.P. Transmontaigne Partners L.P. representing limited partner interests'}, {'symbol': 'TLRA', 'name': 'Telaria Inc.'}, {'symbol': 'TLRD', 'name': 'Tailored Brands Inc.'}, {'symbol': 'TLRY', 'name': 'Tilray Inc.'}, {'symbol': 'TLSA', 'name': 'Tiziana Life Sciences plc'}, {'symbol': 'TLTD', 'name': 'FlexShares Morningstar Developed Markets ex-US Factor Tilt Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6830'}, {'symbol': 'TLYS', 'name': "Tilly's Inc.", 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6832'}, {'symbol': 'TM', 'name': 'Toyota Motor Corporation'}, {'symbol': 'TMCX', 'name': 'Trinity Merger Corp.'}, {'symbol': 'TMCXW', 'name': 'Trinity Merger Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14689'}, {'symbol': 'TMDI', 'name': 'Titan Medical Inc.'}, {'symbol': 'TME', 'name': 'Tencent Music Entertainment Group American Depositary Shares each representing two Class A'}, {'symbol': 'TMFC', 'name': 'Motley Fool 100 Index ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14089'}, {'symbol': 'TMHC', 'name': 'Taylor Morrison Home Corporation Class A'}, {'symbol': 'TMK', 'name': 'Torchmark Corporation'}, {'symbol': 'TMO', 'name': 'Thermo Fisher Scientific Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6840'}, {'symbol': 'TMP', 'name': 'Tompkins Financial Corporation'}, {'symbol': 'TMQ', 'name': 'Trilogy Metals Inc.'}, {'symbol': 'TMSR', 'name': 'TMSR Holding Company Limited'}, {'symbol': 'TMST', 'name': 'TimkenSteel Corporation'}, {'symbol': 'TMUS', 'name': 'T-Mobile US Inc.'}, {'symbol': 'TNA', 'name': 'Direxion Small Cap Bull 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6845'}, {'symbol': 'TNAV', 'name': 'Telenav Inc.'}, {'symbol': 'TNC', 'name': 'Tennant Company'}, {'symbol': 'TNDM', 'name': 'Tandem Diabetes Care Inc.'}, {'symbol': 'TNET', 'name': 'TriNet Group Inc.'}, {'symbol': 'TNK', 'name': 'Teekay Tankers Ltd.'}, {'symbol': 'TNP', 'name': 'Tsakos Energy Navigation Ltd'}, {'symbol': 'TNP-C', 'name': 'Tsakos Energy Navigation Ltd 8.875% Series C Preferred Cumulative Redeemable Perpetual Preferred Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14640'}, {'symbol': 'TNP-E', 'name': 'Tsakos Energy Navigation Ltd Series E Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Shares par value $1.00', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14642'}, {'symbol': 'TNXP', 'name': 'Tonix Pharmaceuticals Holding Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7714'}, {'symbol': 'TOCA', 'name': 'Tocagen Inc.'}, {'symbol': 'TOL', 'name': 'Toll Brothers Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6856'}, {'symbol': 'TOO', 'name': 'Teekay Offshore Partners L.P. representing Limited Partner Interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6857'}, {'symbol': 'TOO-B', 'name': 'Teekay Offshore Partners L.P. 8.50% Series B Cumulative Redeemable Preferred Units representing limited partner interests', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14644'}, {'symbol': 'TOPS', 'name': 'TOP Ships Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6858'}, {'symbol': 'TORC', 'name': 'resTORbio Inc.'}, {'symbol': 'TOT', 'name': 'Total S.A.'}, {'symbol': 'TOTA', 'name': 'Tottenham Acquisition I Limited'}, {'symbol': 'TOTAU', 'name': 'Tottenham Acquisition I Limited Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14808'}, {'symbol': 'TOTL', 'name': 'SPDR DoubleLine Total Return Tactical', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9764'}, {'symbol': 'TOUR', 'name': 'Tuniu Corporation'}, {'symbol': 'TOWN', 'name': 'Towne Bank'}, {'symbol': 'TOWR', 'name': 'Tower International Inc.'}, {'symbol': 'TPB', 'name': 'Turning Point Brands Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10818'}, {'symbol': 'TPC', 'name': 'Tutor Perini Corporation'}, {'symbol': 'TPCO', 'name': 'Tribune Publishing Company'}, {'symbol': 'TPGH', 'name': 'TPG Pace Holdings Corp. Class A'}, {'symbol': 'TPGH=', 'name': 'TPG Pace Holdings Corp. Units each consisting of one Class A ordinary share $.0001 par value and one-third of one warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '13085'}, {'symbol': 'TPH', 'name': 'TRI Pointe Group Inc.'}, {'symbol': 'TPHS', 'name': 'Trinity Place Holdings Inc.'}, {'symbol': 'TPIC', 'name': 'TPI Composites Inc.'}, {'symbol': 'TPL', 'name': 'Texas Pacific Land Trust'}, {'symbol': 'TPNL', 'name': '3PEA International Inc.'}, {'symbol': 'TPR', 'name': 'Tapestry Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1389'}, {'symbol': 'TPRE', 'name': 'Third Point Reinsurance Ltd.'}, {'symbol': 'TPVG', 'name': 'TriplePoint Venture Growth BDC Corp.'}, {'symbol': 'TPX', 'name': 'Tempur Sealy International Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6871'}, {'symbol': 'TPZ', 'name': 'Tortoise Power and Energy Infrastructure Fund Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6872'}, {'symbol': 'TR', 'name': 'Tootsie Roll Industries Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6875'}, {'symbol': 'TRC', 'name': 'Tejon Ranch Co'}, {'symbol': 'TRCB', 'name': 'Two River Bancorp'}, {'symbol': 'TRCH', 'name': 'Torchlight Energy Resources Inc.'}, {'symbol': 'TRCO', 'name': 'Tribune Media Company Class A'}, {'symbol': 'TREC', 'name': 'Trecora Resources'}, {'symbol': 'TREE', 'name': 'LendingTree Inc.'}, {'symbol': 'TREX', 'name': 'Trex Company Inc.'}, {'symbol': 'TRGP', 'name': 'Targa Resources Inc.'}, {'symbol': 'TRHC', 'name': 'Tabula Rasa HealthCare Inc.'}, {'symbol': 'TRI', 'name': 'Thomson Reuters Corp'}, {'symbol': 'TRIB', 'name': 'Trinity Biotech plc'}, {'symbol': 'TRIL', 'name': 'Trillium Therapeutics Inc.'}, {'symbol': 'TRIP', 'name': 'TripAdvisor Inc.'}, {'symbol': 'TRK', 'name': 'Speedway Motorsports Inc.'}, {'symbol': 'TRMB', 'name': 'Trimble Inc.'}, {'symbol': 'TRMD', 'name': 'TORM plc'}, {'symbol': 'TRMK', 'name': 'Trustmark Corporation'}, {'symbol': 'TRMT', 'name': 'Tremont Mortgage Trust'}, {'symbol': 'TRN', 'name': 'Trinity Industries Inc.'}, {'symbol': 'TRNO', 'name': 'Terreno Realty Corporation'}, {'symbol': 'TRNS', 'name': 'Transcat Inc.'}, {'symbol': 'TROV', 'name': 'TrovaGene Inc.'}, {'symbol': 'TROW', 'name': 'T. Rowe Price Group Inc.'}, {'symbol': 'TROX', 'name': 'Tronox Limited Class A $0.01 par'}, {'symbol': 'TRP', 'name': 'TransCanada Corporation'}, {'symbol': 'TRPX', 'name': 'Therapix Biosciences Ltd.'}, {'symbol': 'TRQ', 'name': 'Turquoise Hill Resources Ltd.'}, {'symbol': 'TRS', 'name': 'TriMas Corporation'}, {'symbol': 'TRST', 'name': 'TrustCo Bank Corp NY'}, {'symbol': 'TRT', 'name': 'Trio-Tech International'}, {'symbol': 'TRTN', 'name': 'Triton International Limited'}, {'symbol': 'TRTX', 'name': 'TPG RE Finance Trust Inc.'}, {'symbol': 'TRU', 'name': 'TransUnion', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10130'}, {'symbol': 'TRUE', 'name': 'TrueCar Inc.'}, {'symbol': 'TRUP', 'name': 'Trupanion Inc.'}, {'symbol': 'TRV', 'name': 'The Travelers Companies Inc.'}, {'symbol': 'TRVG', 'name': 'trivago N.V.'}, {'symbol': 'TRVN', 'name': 'Trevena Inc.'}, {'symbol': 'TRX', 'name': 'Tanzanian Royalty Exploration Corporation'}, {'symbol': 'TRXC', 'name': 'TransEnterix Inc.'}, {'symbol': 'TS', 'name': 'Tenaris S.A. American Depositary Shares'}, {'symbol': 'TSBK', 'name': 'Timberland Bancorp Inc.'}, {'symbol': 'TSC', 'name': 'TriState Capital Holdings Inc.'}, {'symbol': 'TSCAP', 'name': 'TriState Capital Holdings Inc. Dep Shs Rep 1/40th Int 6.75% Srs A Non-Cum Pfd'}, {'symbol': 'TSCO', 'name': 'Tractor Supply Company'}, {'symbol': 'TSE', 'name': 'Trinseo S.A.'}, {'symbol': 'TSEM', 'name': 'Tower Semiconductor Ltd.'}, {'symbol': 'TSG', 'name': 'The Stars Group Inc.'}, {'symbol': 'TSI', 'name': 'TCW Strategic Income Fund Inc.'}, {'symbol': 'TSLA', 'name': 'Tesla Inc.'}, {'symbol': 'TSLF', 'name': 'THL Credit Senior Loan Fund of Beneficial Interest'}, {'symbol': 'TSLX', 'name': 'TPG Specialty Lending Inc.'}, {'symbol': 'TSM', 'name': 'Taiwan Semiconductor Manufacturing Company Ltd.'}, {'symbol': 'TSN', 'name': 'Tyson Foods Inc.'}, {'symbol': 'TSQ', 'name': 'Townsquare Media Inc. Class A'}, {'symbol': 'TSRI', 'name': 'TSR Inc.'}, {'symbol': 'TSS', 'name': 'Total System Services Inc.'}, {'symbol': 'TST', 'name': 'TheStreet Inc.'}, {'symbol': 'TSU', 'name': 'TIM Participacoes S.A. American Depositary Shares (Each representing 5)'}, {'symbol': 'TTAI', 'name': 'TRIMTABS ETF TRUST', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13072'}, {'symbol': 'TTC', 'name': 'Toro Company (The)'}, {'symbol': 'TTD', 'name': 'The Trade Desk Inc.'}, {'symbol': 'TTEC', 'name': 'TTEC Holdings Inc.'}, {'symbol': 'TTEK', 'name': 'Tetra Tech Inc.'}, {'symbol': 'TTGT', 'name': 'TechTarget Inc.'}, {'symbol': 'TTI', 'name': 'Tetra Technologies Inc.'}, {'symbol': 'TTM', 'name': 'Tata Motors Ltd Limited'}, {'symbol': 'TTMI', 'name': 'TTM Technologies Inc.'}, {'symbol': 'TTNP', 'name': 'Titan Pharmaceuticals Inc.'}, {'symbol': 'TTOO', 'name': 'T2 Biosystems Inc.'}, {'symbol': 'TTP', 'name': 'Tortoise Pipeline & Energy Fund Inc.'}, {'symbol': 'TTPH', 'name': 'Tetraphase Pharmaceuticals Inc.'}, {'symbol': 'TTS', 'name': 'Tile Shop Hldgs Inc.'}, {'symbol': 'TTTN', 'name': 'TigerShares China-U.S. Internet Titans ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15209'}, {'symbol': 'TTWO', 'name': 'Take-Two Interactive Software Inc.'}, {'symbol': 'TU', 'name': 'Telus Corporation'}, {'symbol': 'TUES', 'name': 'Tuesday Morning Corp.'}, {'symbol': 'TUP', 'name': 'Tupperware Brands Corporation'}, {'symbol': 'TURN', 'name': '180 Degree Capital Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6803'}, {'symbol': 'TUSK', 'name': 'Mammoth Energy Services Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11812'}, {'symbol': 'TV', 'name': 'Grupo Televisa S.A.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6960'}, {'symbol': 'TVC', 'name': 'Tennessee Valley Authority'}, {'symbol': 'TVIX', 'name': 'VelocityShares Daily 2x VIX Short Term ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6963'}, {'symbol': 'TVPT', 'name': 'Travelport Worldwide Limited'}, {'symbol': 'TVTY', 'name': 'Tivity Health Inc.'}, {'symbol': 'TWI', 'name': 'Titan International Inc. (DE)'}, {'symbol': 'TWIN', 'name': 'Twin Disc Incorporated'}, {'symbol': 'TWLO', 'name': 'Twilio Inc. Class A'}, {'symbol': 'TWLV', 'name': 'Twelve Seas Investment Company'}, {'symbol': 'TWLVU', 'name': 'Twelve Seas Investment Company Units', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '14705'}, {'symbol': 'TWM', 'name': 'ProShares UltraShort Russell2000', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '6971'}, {'symbol': 'TWMC', 'name': 'Trans World Entertainment Corp.'}, {'symbol': 'TWN', 'name': 'Taiwan Fund Inc. (The)'}, {'symbol': 'TWNK', 'name': 'Hostess Brands Inc.'}, {'symbol': 'TWO', 'name': 'Two Harbors Investment Corp', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6974'}, {'symbol': 'TWO-B', 'name': 'Two Harbors Investments Corp 7.625% Series B Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13171'}, {'symbol': 'TWO-D', 'name': 'Two Harbors Investments Corp 7.75% Series D Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14890'}, {'symbol': 'TWOU', 'name': '2U Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8471'}, {'symbol': 'TWST', 'name': 'Twist Bioscience Corporation'}, {'symbol': 'TWTR', 'name': 'Twitter Inc.'}, {'symbol': 'TX', 'name': 'Ternium S.A. American Depositary Shares (each representing ten shares USD1.00 par value)'}, {'symbol': 'TXMD', 'name': 'TherapeuticsMD Inc.'}, {'symbol': 'TXN', 'name': 'Texas Instruments Incorporated'}, {'symbol': 'TXRH', 'name': 'Texas Roadhouse Inc.'}, {'symbol': 'TXT', 'name': 'Textron Inc.'}, {'symbol': 'TY', 'name': 'Tri Continental Corporation'}, {'symbol': 'TYBS', 'name': 'Direxion Daily 20 Year Treasury Bear 1X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6990'}, {'symbol': 'TYG', 'name': 'Tortoise Energy Infrastructure Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6993'}, {'symbol': 'TYHT', 'name': 'Shineco Inc.'}, {'symbol': 'TYL', 'name': 'Tyler Technologies Inc.'}, {'symbol': 'TYME', 'name': 'Tyme Technologies Inc.'}, {'symbol': 'TYO', 'name': 'Direxion Daily 10-Yr Treasury Bear 3x Shrs', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '6998'}, {'symbol': 'TYPE', 'name': 'Monotype Imaging Holdings Inc.'}, {'symbol': 'TZAC', 'name': 'Tenzing Acquisition Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15148'}, {'symbol': 'TZACW', 'name': 'Tenzing Acquisition Corp. Warrants', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15153'}, {'symbol': 'TZOO', 'name': 'Travelzoo'}, {'symbol': 'UA', 'name': 'Under Armour Inc. Class C'}, {'symbol': 'UAA', 'name': 'Under Armour Inc. Class A'}, {'symbol': 'UAG', 'name': 'E-TRACS USB Bloomberg Commodity Index Exchange Traded Notes UBS Bloomberg CMCI Agriculture ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7016'}, {'symbol': 'UAL', 'name': 'United Continental Holdings Inc.'}, {'symbol': 'UAMY', 'name': 'United States Antimony Corporation'}, {'symbol': 'UAN', 'name': 'CVR Partners LP representing Limited Partner Interests'}, {'symbol': 'UAVS', 'name': 'AgEagle Aerial Systems Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8833'}, {'symbol': 'UBA', 'name': 'Urstadt Biddle Properties Inc.'}, {'symbol': 'UBCP', 'name': 'United Bancorp Inc.'}, {'symbol': 'UBFO', 'name': 'United Security Bancshares'}, {'symbol': 'UBIO', 'name': 'Proshares UltraPro Nasdaq Biotechnology', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10205'}, {'symbol': 'UBNK', 'name': 'United Financial Bancorp Inc.'}, {'symbol': 'UBNT', 'name': 'Ubiquiti Networks Inc.'}, {'symbol': 'UBOH', 'name': 'United Bancshares Inc.'}, {'symbol': 'UBP', 'name': 'Urstadt Biddle Properties Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7032'}, {'symbol': 'UBP-H', 'name': 'Urstadt Biddle Properties Inc. 6.250% Series H Cumulative Redeemable Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13431'}, {'symbol': 'UBS', 'name': 'UBS Group AG Registered', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9418'}, {'symbol': 'UBSH', 'name': 'Union Bankshares Corporation'}, {'symbol': 'UBSI', 'name': 'United Bankshares Inc.'}, {'symbol': 'UBX', 'name': 'Unity Biotechnology Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14352'}, {'symbol': 'UCBI', 'name': 'United Community Banks Inc.'}, {'symbol': 'UCFC', 'name': 'United Community Financial Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7046'}, {'symbol': 'UCI', 'name': 'E-TRACS USB Bloomberg Commodity Index Exchange Traded Notes UBS Bloomberg CMCI ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7047'}, {'symbol': 'UCO', 'name': 'ProShares Ultra Bloomberg Crude Oil', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7048'}, {'symbol': 'UCON', 'name': 'First Trust TCW Unconstrained Plus Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14706'}, {'symbol': 'UCTT', 'name': 'Ultra Clean Holdings Inc.'}, {'symbol': 'UDN', 'name': 'Invesco DB USD Index Bearish', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7051'}, {'symbol': 'UDR', 'name': 'UDR Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7054'}, {'symbol': 'UE', 'name': 'Urban Edge Properties of Beneficial Interest'}, {'symbol': 'UEC', 'name': 'Uranium Energy Corp.'}, {'symbol': 'UEIC', 'name': 'Universal Electronics Inc.'}, {'symbol': 'UEPS', 'name': 'Net 1 UEPS Technologies Inc.'}, {'symbol': 'UEVM', 'name': 'USAA MSCI Emerging Markets Value Momentum Blend Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13652'}, {'symbol': 'UFAB', 'name': 'Unique Fabricating Inc.'}, {'symbol': 'UFCS', 'name': 'United Fire Group Inc'}, {'symbol': 'UFI', 'name': 'Unifi Inc.'}, {'symbol': 'UFPI', 'name': 'Universal Forest Products Inc.'}, {'symbol': 'UFPT', 'name': 'UFP Technologies Inc.'}, {'symbol': 'UFS', 'name': 'Domtar Corporation (NEW)'}, {'symbol': 'UG', 'name': 'United-Guardian Inc.'}, {'symbol': 'UGAZ', 'name': 'VelocityShares 3X Long Natural Gas ETN linked to the S&P GSCI Natural Gas Index Excess Return', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7065'}, {'symbol': 'UGE', 'name': 'ProShares Ultra Consumer Goods', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7066'}, {'symbol': 'UGI', 'name': 'UGI Corporation'}, {'symbol': 'UGLD', 'name': 'VelocityShares 3x Long Gold ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7070'}, {'symbol': 'UGP', 'name': 'Ultrapar Participacoes S.A. (New) American Depositary Shares (Each representing one)'}, {'symbol': 'UHAL', 'name': 'Amerco'}, {'symbol': 'UHS', 'name': 'Universal Health Services Inc.'}, {'symbol': 'UHT', 'name': 'Universal Health Realty Income Trust'}, {'symbol': 'UIHC', 'name': 'United Insurance Holdings Corp.'}, {'symbol': 'UIS', 'name': 'Unisys Corporation'}, {'symbol': 'UIVM', 'name': 'USAA MSCI International Value Momentum Blend Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13654'}, {'symbol': 'UJB', 'name': 'ProShares Ultra High Yield', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7081'}, {'symbol': 'UJUL', 'name': 'Innovator S&P 500 Ultra Buffer ETF - July', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14904'}, {'symbol': 'UL', 'name': 'Unilever PLC'}, {'symbol': 'ULBI', 'name': 'Ultralife Corporation'}, {'symbol': 'ULE', 'name': 'ProShares Ultra Euro', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7087'}, {'symbol': 'ULH', 'name': 'Universal Logistics Holdings Inc.'}, {'symbol': 'ULTA', 'name': 'Ulta Beauty Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12351'}, {'symbol': 'ULTI', 'name': 'The Ultimate Software Group Inc.'}, {'symbol': 'UMBF', 'name': 'UMB Financial Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7091'}, {'symbol': 'UMC', 'name': 'United Microelectronics Corporation (NEW)'}, {'symbol': 'UMH', 'name': 'UMH Properties Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7094'}, {'symbol': 'UMH-C', 'name': 'UMH Properties Inc. 6.75% Series C Cumulative Redeemable Preferred Stock Liquidation Preference $25 per share', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '13188'}, {'symbol': 'UMPQ', 'name': 'Umpqua Holdings Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7096'}, {'symbol': 'UMRX', 'name': 'Unum Therapeutics Inc.'}, {'symbol': 'UN', 'name': 'Unilever NV'}, {'symbol': 'UNAM', 'name': 'Unico American Corporation'}, {'symbol': 'UNB', 'name': 'Union Bankshares Inc.'}, {'symbol': 'UNF', 'name': 'Unifirst Corporation'}, {'symbol': 'UNFI', 'name': 'United Natural Foods Inc.'}, {'symbol': 'UNH', 'name': 'UnitedHealth Group Incorporated (DE)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7104'}, {'symbol': 'UNIT', 'name': 'Uniti Group Inc.'}, {'symbol': 'UNM', 'name': 'Unum Group', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7107'}, {'symbol': 'UNP', 'name': 'Union Pacific Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7108'}, {'symbol': 'UNT', 'name': 'Unit Corporation'}, {'symbol': 'UNTY', 'name': 'Unity Bancorp Inc.'}, {'symbol': 'UNVR', 'name': 'Univar Inc.'}, {'symbol': 'UONE', 'name': 'Urban One Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '5953'}, {'symbol': 'UONEK', 'name': 'Urban One Inc.'}, {'symbol': 'UPL', 'name': 'Ultra Petroleum Corp.'}, {'symbol': 'UPLD', 'name': 'Upland Software Inc.'}, {'symbol': 'UPS', 'name': 'United Parcel Service Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7121'}, {'symbol': 'UPW', 'name': 'ProShares Ultra Utilities', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7123'}, {'symbol': 'UPWK', 'name': 'Upwork Inc.'}, {'symbol': 'UQM', 'name': 'UQM Technologies Inc'}, {'symbol': 'URBN', 'name': 'Urban Outfitters Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7126'}, {'symbol': 'URG', 'name': 'Ur-Energy Inc (Canada)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7128'}, {'symbol': 'URGN', 'name': 'UroGen Pharma Ltd.'}, {'symbol': 'URI', 'name': 'United Rentals Inc.'}, {'symbol': 'UROV', 'name': 'Urovant Sciences Ltd.'}, {'symbol': 'URTH', 'name': 'Ishares MSCI World Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7133'}, {'symbol': 'USA', 'name': 'Liberty All-Star Equity Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7136'}, {'symbol': 'USAC', 'name': 'USA Compression Partners LP Representing Limited Partner Interests'}, {'symbol': 'USAK', 'name': 'USA Truck Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7139'}, {'symbol': 'USAP', 'name': 'Universal Stainless & Alloy Products Inc.'}, {'symbol': 'USAS', 'name': 'Americas Silver Corporation no par value'}, {'symbol': 'USAT', 'name': 'USA Technologies Inc.'}, {'symbol': 'USAU', 'name': 'U.S. Gold Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '1869'}, {'symbol': 'USB', 'name': 'U.S. Bancorp'}, {'symbol': 'USB-H', 'name': 'U.S. Bancorp Depositary Shares repstg 1/1000th Pfd Ser B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '7145'}, {'symbol': 'USB-O', 'name': 'US Bancorp Del Dep Shs Repstg 1/1000th Perp Pfd Ser H', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '7148'}, {'symbol': 'USCI', 'name': 'United States Commodity Index Fund ETV', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7150'}, {'symbol': 'USCR', 'name': 'U S Concrete Inc.'}, {'symbol': 'USDP', 'name': 'USD Partners LP representing limited partner interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9212'}, {'symbol': 'USEG', 'name': 'U.S. Energy Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7153'}, {'symbol': 'USFD', 'name': 'US Foods Holding Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11066'}, {'symbol': 'USG', 'name': 'USG Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7154'}, {'symbol': 'USIG', 'name': 'iShares Broad USD Investment Grade Corporate Bond ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '1181'}, {'symbol': 'USLB', 'name': 'Invesco Russell 1000 Low Beta Equal Weight ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10811'}, {'symbol': 'USLM', 'name': 'United States Lime & Minerals Inc.'}, {'symbol': 'USM', 'name': 'United States Cellular Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7158'}, {'symbol': 'USMF', 'name': 'WisdomTree U.S. Multifactor Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13079'}, {'symbol': 'USNA', 'name': 'USANA Health Sciences Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7163'}, {'symbol': 'USOD', 'name': 'United States 3x Short Oil Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13165'}, {'symbol': 'USOU', 'name': 'United States 3x Oil Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13166'}, {'symbol': 'USPH', 'name': 'U.S. Physical Therapy Inc.'}, {'symbol': 'USRT', 'name': 'iShares Core U.S. REIT'}, {'symbol': 'USTB', 'name': 'USAA Core Short-Term Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13656'}, {'symbol': 'USVM', 'name': 'USAA MSCI USA Small Cap Value Momentum Blend Index', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13657'}, {'symbol': 'USWS', 'name': 'U.S. Well Services Inc.'}, {'symbol': 'USX', 'name': 'U.S. Xpress Enterprises Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14530'}, {'symbol': 'UTF', 'name': 'Cohen & Steers Infrastructure Fund Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7171'}, {'symbol': 'UTG', 'name': 'Reaves Utility Income Fund of Beneficial Interest'}, {'symbol': 'UTHR', 'name': 'United Therapeutics Corporation'}, {'symbol': 'UTI', 'name': 'Universal Technical Institute Inc'}, {'symbol': 'UTL', 'name': 'UNITIL Corporation'}, {'symbol': 'UTMD', 'name': 'Utah Medical Products Inc.'}, {'symbol': 'UTSI', 'name': 'UTStarcom Holdings Corp', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7179'}, {'symbol': 'UTX', 'name': 'United Technologies Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7180'}, {'symbol': 'UUU', 'name': 'Universal Security Instruments Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7184'}, {'symbol': 'UUUU', 'name': 'Energy Fuels Inc (Canada)'}, {'symbol': 'UVE', 'name': 'UNIVERSAL INSURANCE HOLDINGS INC', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7185'}, {'symbol': 'UVSP', 'name': 'Univest Financial Corporation'}, {'symbol': 'UVV', 'name': 'Universal Corporation'}, {'symbol': 'UWM', 'name': 'ProShares Ultra Russell2000', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7193'}, {'symbol': 'UWN', 'name': 'Nevada Gold & Casinos Inc.'}, {'symbol': 'UXI', 'name': 'ProShares Ultra Industrials', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7196'}, {'symbol': 'UXIN', 'name': 'Uxin Limited'}, {'symbol': 'UYM', 'name': 'ProShares Ultra Basic Materials', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7199'}, {'symbol': 'UZB', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9556'}, {'symbol': 'V', 'name': 'Visa Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7201'}, {'symbol': 'VAC', 'name': 'Marriot Vacations Worldwide Corporation'}, {'symbol': 'VALE', 'name': 'VALE S.A. American Depositary Shares Each Representing one'}, {'symbol': 'VALU', 'name': 'Value Line Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7206'}, {'symbol': 'VAM', 'name': 'The Vivaldi Opportunities Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14531'}, {'symbol': 'VAPO', 'name': 'Vapotherm Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '15161'}, {'symbol': 'VAR', 'name': 'Varian Medical Systems Inc.'}, {'symbol': 'VB', 'name': 'Vanguard Small-Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7210'}, {'symbol': 'VBF', 'name': 'Invesco Bond Fund'}, {'symbol': 'VBFC', 'name': 'Village Bank and Trust Financial Corp.'}, {'symbol': 'VBIV', 'name': 'VBI Vaccines Inc.'}, {'symbol': 'VBLT', 'name': 'Vascular Biogenics Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9107'}, {'symbol': 'VBR', 'name': 'Vanguard Small-Cap Value', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7214'}, {'symbol': 'VBTX', 'name': 'Veritex Holdings Inc.'}, {'symbol': 'VC', 'name': 'Visteon Corporation'}, {'symbol': 'VCEL', 'name': 'Vericel Corporation'}, {'symbol': 'VCF', 'name': 'Delaware Investments Colorado Municipal Income Fund Inc'}, {'symbol': 'VCLT', 'name': 'Vanguard Long-Term Corporate Bond ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7221'}, {'symbol': 'VCNX', 'name': 'Vaccinex Inc.'}, {'symbol': 'VCRA', 'name': 'Vocera Communications Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7224'}, {'symbol': 'VCTR', 'name': 'Victory Capital Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14094'}, {'symbol': 'VCV', 'name': 'Invesco California Value Municipal Income Trust'}, {'symbol': 'VCYT', 'name': 'Veracyte Inc.'}, {'symbol': 'VDE', 'name': 'Vanguard Energy', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7228'}, {'symbol': 'VEAC', 'name': 'Vantage Energy Acquisition Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12826'}, {'symbol': 'VEACW', 'name': 'Vantage Energy Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12837'}, {'symbol': 'VEC', 'name': 'Vectrus Inc.'}, {'symbol': 'VECO', 'name': 'Veeco Instruments Inc.'}, {'symbol': 'VEDL', 'name': 'Vedanta Limited American Depositary Shares (Each representing four equity shares)'}, {'symbol': 'VEEV', 'name': 'Veeva Systems Inc. Class A'}, {'symbol': 'VEGI', 'name': 'iShares MSCI Agriculture Producers Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7234'}, {'symbol': 'VEON', 'name': 'VEON Ltd.'}, {'symbol': 'VER', 'name': 'VEREIT Inc.'}, {'symbol': 'VERI', 'name': 'Veritone Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12478'}, {'symbol': 'VERU', 'name': 'Veru Inc.'}, {'symbol': 'VET', 'name': 'Vermilion Energy Inc. Common (Canada)'}, {'symbol': 'VEU', 'name': 'Vanguard FTSE All World Ex US', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7238'}, {'symbol': 'VFC', 'name': 'V.F. Corporation'}, {'symbol': 'VFL', 'name': 'Delaware Investments National Municipal Income Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7241'}, {'symbol': 'VFMF', 'name': 'Vanguard U.S. Multifactor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14146'}, {'symbol': 'VFMV', 'name': 'Vanguard U.S. Minimum Volatility', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14148'}, {'symbol': 'VFVA', 'name': 'Vanguard U.S. Value Factor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14150'}, {'symbol': 'VG', 'name': 'Vonage Holdings Corp.'}, {'symbol': 'VGI', 'name': 'Virtus Global Multi-Sector Income Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7244'}, {'symbol': 'VGK', 'name': 'Vanguard FTSEEuropean', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7246'}, {'symbol': 'VGM', 'name': 'Invesco Trust for Investment Grade Municipals (DE)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7248'}, {'symbol': 'VGR', 'name': 'Vector Group Ltd.'}, {'symbol': 'VGT', 'name': 'Vanguard Information Tech', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7251'}, {'symbol': 'VGZ', 'name': 'Vista Gold Corp'}, {'symbol': 'VHC', 'name': 'VirnetX Holding Corp'}, {'symbol': 'VHI', 'name': 'Valhi Inc.'}, {'symbol': 'VIA', 'name': 'Viacom Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7257'}, {'symbol': 'VIAB', 'name': 'Viacom Inc.'}, {'symbol': 'VIAV', 'name': 'Viavi Solutions Inc.'}, {'symbol': 'VICI', 'name': 'VICI Properties Inc.'}, {'symbol': 'VICL', 'name': 'Vical Incorporated'}, {'symbol': 'VICR', 'name': 'Vicor Corporation'}, {'symbol': 'VIG', 'name': 'Vanguard Div Appreciation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7264'}, {'symbol': 'VIIX', 'name': 'VelocityShares VIX Short Term ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7266'}, {'symbol': 'VIOO', 'name': 'Vanguard S&P Small-Cap 600', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7270'}, {'symbol': 'VIOT', 'name': 'Viomi Technology Co. Ltd'}, {'symbol': 'VIPS', 'name': 'Vipshop Holdings Limited American Depositary Shares each representing two', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7273'}, {'symbol': 'VIRC', 'name': 'Virco Manufacturing Corporation'}, {'symbol': 'VIRT', 'name': 'Virtu Financial Inc.'}, {'symbol': 'VISI', 'name': 'Volt Information Sciences Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9202'}, {'symbol': 'VIV', 'name': 'Telefonica Brasil S.A. ADS'}, {'symbol': 'VIVE', 'name': 'Viveve Medical Inc.'}, {'symbol': 'VIVO', 'name': 'Meridian Bioscience Inc.'}, {'symbol': 'VIXY', 'name': 'ProShares Trust VIX Short-Term Futures', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7282'}, {'symbol': 'VJET', 'name': 'voxeljet AG American Depositary Shares each representing one-fifth of an/'}, {'symbol': 'VKI', 'name': 'Invesco Advantage Municipal Income Trust II of Beneficial Interest (DE)'}, {'symbol': 'VKQ', 'name': 'Invesco Municipal Trust'}, {'symbol': 'VKTX', 'name': 'Viking Therapeutics Inc.'}, {'symbol': 'VLGEA', 'name': 'Village Super Market Inc. Class A Common Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7286'}, {'symbol': 'VLO', 'name': 'Valero Energy Corporation'}, {'symbol': 'VLRS', 'name': 'Controladora Vuela Compania de Aviacion S.A.B. de C.V. American Depositary Shares each representing ten (10) Ordinary Participation Certificates'}, {'symbol': 'VLRX', 'name': 'Valeritas Holdings Inc.'}, {'symbol': 'VLT', 'name': 'Invesco High Income Trust II'}, {'symbol': 'VLUE', 'name': 'iShares Edge MSCI USA Value Factor', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7292'}, {'symbol': 'VLY', 'name': 'Valley National Bancorp'}, {'symbol': 'VLYPP', 'name': 'Valley National Bancorp 6.25% Fixed-to-Floating Rate Series A Non-Cumulative Perpetual Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '10273'}, {'symbol': 'VMC', 'name': 'Vulcan Materials Company (Holding Company)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7296'}, {'symbol': 'VMI', 'name': 'Valmont Industries Inc.'}, {'symbol': 'VMM', 'name': 'Delaware Investments Minnesota Municipal Income Fund II Inc.'}, {'symbol': 'VMO', 'name': 'Invesco Municipal Opportunity Trust'}, {'symbol': 'VMW', 'name': 'Vmware Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7300'}, {'symbol': 'VNCE', 'name': 'Vince Holding Corp.'}, {'symbol': 'VNDA', 'name': 'Vanda Pharmaceuticals Inc.'}, {'symbol': 'VNE', 'name': 'Veoneer Inc.'}, {'symbol': 'VNET', 'name': '21Vianet Group Inc.'}, {'symbol': 'VNM', 'name': 'VanEck Vectors Vietnam', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7303'}, {'symbol': 'VNO', 'name': 'Vornado Realty Trust'}, {'symbol': 'VNO-L', 'name': 'Vornado Realty Trust Pfd Ser L %', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '7309'}, {'symbol': 'VNOM', 'name': 'Viper Energy Partners LP', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8621'}, {'symbol': 'VNQI', 'name': 'Vanguard Global ex-U.S. Real Estate ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7312'}, {'symbol': 'VNRX', 'name': 'VolitionRX Limited'}, {'symbol': 'VNTR', 'name': 'Venator Materials PLC'}, {'symbol': 'VOC', 'name': 'VOC Energy Trust Units of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7317'}, {'symbol': 'VOD', 'name': 'Vodafone Group Plc'}, {'symbol': 'VONE', 'name': 'Vanguard Russell 1000 ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7322'}, {'symbol': 'VONV', 'name': 'Vanguard Russell 1000 Value ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7324'}, {'symbol': 'VOOG', 'name': 'Vanguard S&P 500 Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7326'}, {'symbol': 'VOT', 'name': 'Vanguard Mid-Cap Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7328'}, {'symbol': 'VOXX', 'name': 'VOXX International Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7330'}, {'symbol': 'VOYA', 'name': 'Voya Financial Inc.'}, {'symbol': 'VPG', 'name': 'Vishay Precision Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7333'}, {'symbol': 'VPU', 'name': 'Vanguard Utilities', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7337'}, {'symbol': 'VPV', 'name': 'Invesco Pennsylvania Value Municipal Income Trust (DE)'}, {'symbol': 'VRA', 'name': 'Vera Bradley Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7341'}, {'symbol': 'VRAY', 'name': 'ViewRay Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11203'}, {'symbol': 'VRCA', 'name': 'Verrica Pharmaceuticals Inc.'}, {'symbol': 'VREX', 'name': 'Varex Imaging Corporation'}, {'symbol': 'VRML', 'name': 'Vermillion Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7343'}, {'symbol': 'VRNA', 'name': 'Verona Pharma plc'}, {'symbol': 'VRNS', 'name': 'Varonis Systems Inc.'}, {'symbol': 'VRNT', 'name': 'Verint Systems Inc.'}, {'symbol': 'VRRM', 'name': 'Verra Mobility Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12429'}, {'symbol': 'VRS', 'name': 'Verso Corporation'}, {'symbol': 'VRSK', 'name': 'Verisk Analytics Inc.'}, {'symbol': 'VRSN', 'name': 'VeriSign Inc.'}, {'symbol': 'VRTS', 'name': 'Virtus Investment Partners Inc.'}, {'symbol': 'VRTU', 'name': 'Virtusa Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7353'}, {'symbol': 'VRTV', 'name': 'Veritiv Corporation'}, {'symbol': 'VRTX', 'name': 'Vertex Pharmaceuticals Incorporated'}, {'symbol': 'VSAT', 'name': 'ViaSat Inc.'}, {'symbol': 'VSEC', 'name': 'VSE Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7361'}, {'symbol': 'VSH', 'name': 'Vishay Intertechnology Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7362'}, {'symbol': 'VSI', 'name': 'Vitamin Shoppe Inc'}, {'symbol': 'VSLR', 'name': 'Vivint Solar Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9203'}, {'symbol': 'VSM', 'name': 'Versum Materials Inc.'}, {'symbol': 'VSS', 'name': 'Vanguard FTSE All-Wld ex-US SmCp Idx', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7366'}, {'symbol': 'VST', 'name': 'Vistra Energy Corp.'}, {'symbol': 'VSTM', 'name': 'Verastem Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7367'}, {'symbol': 'VSTO', 'name': 'Vista Outdoor Inc.'}, {'symbol': 'VTA', 'name': 'Invesco Credit Opportunities Fund of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7369'}, {'symbol': 'VTEB', 'name': 'Vanguard Tax-Exempt Bond', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10439'}, {'symbol': 'VTGN', 'name': 'VistaGen Therapeutics Inc.'}, {'symbol': 'VTI', 'name': 'Vanguard Total Stock Market', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7372'}, {'symbol': 'VTIQ', 'name': 'VectoIQ Acquisition Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14723'}, {'symbol': 'VTIQW', 'name': 'VectoIQ Acquisition Corp. Warrant', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14726'}, {'symbol': 'VTL', 'name': 'Vital Therapies Inc.'}, {'symbol': 'VTN', 'name': 'Invesco Trust for Investment Grade New York Municipals'}, {'symbol': 'VTNR', 'name': 'Vertex Energy Inc'}, {'symbol': 'VTR', 'name': 'Ventas Inc.'}, {'symbol': 'VTSI', 'name': 'VirTra Inc.'}, {'symbol': 'VTVT', 'name': 'vTv Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10206'}, {'symbol': 'VTWO', 'name': 'Vanguard Russell 2000 ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7383'}, {'symbol': 'VUG', 'name': 'Vanguard Growth', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7385'}, {'symbol': 'VUZI', 'name': 'Vuzix Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9698'}, {'symbol': 'VVI', 'name': 'Viad Corp', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7388'}, {'symbol': 'VVPR', 'name': 'VivoPower International PLC'}, {'symbol': 'VVR', 'name': 'Invesco Senior Income Trust (DE)'}, {'symbol': 'VVUS', 'name': 'VIVUS Inc.'}, {'symbol': 'VVV', 'name': 'Valvoline Inc.'}, {'symbol': 'VWOB', 'name': 'Vanguard Emerging Markets Government Bond ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7393'}, {'symbol': 'VXRT', 'name': 'Vaxart Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '858'}, {'symbol': 'VXXB', 'name': 'IPATH SERIES B S&P 500 VIX', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14034'}, {'symbol': 'VYGR', 'name': 'Voyager Therapeutics Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10689'}, {'symbol': 'VYMI', 'name': 'Vanguard International High Dividend Yield ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11110'}, {'symbol': 'VZ', 'name': 'Verizon Communications Inc.'}, {'symbol': 'W', 'name': 'Wayfair Inc. Class A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9167'}, {'symbol': 'WAAS', 'name': 'AquaVenture Holdings Limited'}, {'symbol': 'WAB', 'name': 'Westinghouse Air Brake Technologies Corporation'}, {'symbol': 'WABC', 'name': 'Westamerica Bancorporation'}, {'symbol': 'WAFD', 'name': 'Washington Federal Inc.'}, {'symbol': 'WAGE', 'name': 'WageWorks Inc.'}, {'symbol': 'WAIR', 'name': 'Wesco Aircraft Holdings Inc.'}, {'symbol': 'WAL', 'name': 'Western Alliance Bancorporation (DE)'}, {'symbol': 'WANT', 'name': 'Direxion Daily Consumer Discretionary Bull 3X Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15263'}, {'symbol': 'WASH', 'name': 'Washington Trust Bancorp Inc.'}, {'symbol': 'WAT', 'name': 'Waters Corporation'}, {'symbol': 'WATT', 'name': 'Energous Corporation'}, {'symbol': 'WB', 'name': 'Weibo Corporation'}, {'symbol': 'WBA', 'name': 'Walgreens Boots Alliance Inc.'}, {'symbol': 'WBAI', 'name': '500.com Limited American Depositary Shares each representing 10 Class A shares'}, {'symbol': 'WBC', 'name': 'Wabco Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7415'}, {'symbol': 'WBIB', 'name': 'WBI BullBear Value 2000', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9194'}, {'symbol': 'WBID', 'name': 'WBI BullBear Quality 2000', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9195'}, {'symbol': 'WBIF', 'name': 'WBI BullBear Value 1000', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9196'}, {'symbol': 'WBIH', 'name': 'WBI BullBear Global High Income', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9198'}, {'symbol': 'WBIL', 'name': 'WBI BullBear Quality 1000', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9200'}, {'symbol': 'WBIY', 'name': 'WBI Power Factor High Dividend', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12214'}, {'symbol': 'WBK', 'name': 'Westpac Banking Corporation'}, {'symbol': 'WBS', 'name': 'Webster Financial Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7420'}, {'symbol': 'WBT', 'name': 'Welbilt Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11083'}, {'symbol': 'WCC', 'name': 'WESCO International Inc.'}, {'symbol': 'WCFB', 'name': 'WCF Bancorp Inc.'}, {'symbol': 'WCG', 'name': 'Wellcare Health Plans Inc.'}, {'symbol': 'WCN', 'name': 'Waste Connections Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '748'}, {'symbol': 'WD', 'name': 'Walker & Dunlop Inc'}, {'symbol': 'WDAY', 'name': 'Workday Inc.'}, {'symbol': 'WDC', 'name': 'Western Digital Corporation'}, {'symbol': 'WDFC', 'name': 'WD-40 Company'}, {'symbol': 'WDR', 'name': 'Waddell & Reed Financial Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7433'}, {'symbol': 'WEA', 'name': 'Western Asset Bond Fund Share of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7435'}, {'symbol': 'WEBK', 'name': 'Wellesley Bancorp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7437'}, {'symbol': 'WEC', 'name': 'WEC Energy Group Inc.'}, {'symbol': 'WEI', 'name': 'Weidai Ltd. American depositary shares each representing one (1) Class A'}, {'symbol': 'WELL', 'name': 'Welltower Inc.'}, {'symbol': 'WEN', 'name': "Wendy's Company (The)", 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7440'}, {'symbol': 'WERN', 'name': 'Werner Enterprises Inc.'}, {'symbol': 'WES', 'name': 'Western Gas Partners LP Limited Partner Interests'}, {'symbol': 'WETF', 'name': 'WisdomTree Investments Inc.'}, {'symbol': 'WEX', 'name': 'WEX Inc.'}, {'symbol': 'WEYS', 'name': 'Weyco Group Inc.'}, {'symbol': 'WFC', 'name': 'Wells Fargo & Company', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7448'}, {'symbol': 'WFC-N', 'name': 'Wells Fargo & Company Dep Shs Repstg 1/1000th Perp Pfd Cl A Ser N', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '7451'}, {'symbol': 'WFC-P', 'name': 'Wells Fargo & Company Dep Shs Repstg 1/1000th Int Non Cum Perp Cl A Pfd (Ser P)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '7453'}, {'symbol': 'WFC-R', 'name': 'Wells Fargo & Company Dep Shs Repstg 1/1000th Int Perp Pfd Cl A (Ser R Fixed To Flltg)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '8178'}, {'symbol': 'WFC-V', 'name': 'Wells Fargo & Company Depositary Shares Series V', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '10541'}, {'symbol': 'WFC-X', 'name': 'Wells Fargo & Company Depositary Shares Series X', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '11498'}, {'symbol': 'WFE-A', 'name': 'Wells Fargo & Company Cumulative Perpetual Preferred Stock Series A Liquidation Preference $25 per share', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '9574'}, {'symbol': 'WFIG', 'name': 'WisdomTree Fundamental U.S. Corporate Bond Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11293'}, {'symbol': 'WFT', 'name': 'Weatherford International plc (Ireland)'}, {'symbol': 'WGO', 'name': 'Winnebago Industries Inc.'}, {'symbol': 'WGP', 'name': 'Western Gas Equity Partners LP Representing Limited Partner Interests'}, {'symbol': 'WH', 'name': 'Wyndham Hotels & Resorts Inc.'}, {'symbol': 'WHD', 'name': 'Cactus Inc. Class A'}, {'symbol': 'WHF', 'name': 'WhiteHorse Finance Inc.'}, {'symbol': 'WHG', 'name': 'Westwood Holdings Group Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7466'}, {'symbol': 'WHLM', 'name': 'Wilhelmina International Inc.'}, {'symbol': 'WHLR', 'name': 'Wheeler Real Estate Investment Trust Inc.'}, {'symbol': 'WHLRP', 'name': 'Wheeler Real Estate Investment Trust Inc. Preferred Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '8586'}, {'symbol': 'WHR', 'name': 'Whirlpool Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7468'}, {'symbol': 'WIA', 'name': 'Western Asset Inflation-Linked Income Fund'}, {'symbol': 'WIFI', 'name': 'Boingo Wireless Inc.'}, {'symbol': 'WILC', 'name': 'G. Willi-Food International  Ltd.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7474'}, {'symbol': 'WIN', 'name': 'Windstream Holdings Inc.'}, {'symbol': 'WINA', 'name': 'Winmark Corporation'}, {'symbol': 'WING', 'name': 'Wingstop Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '9970'}, {'symbol': 'WINS', 'name': 'Wins Finance Holdings Inc.'}, {'symbol': 'WIRE', 'name': 'Encore Wire Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7479'}, {'symbol': 'WISA', 'name': 'Summit Wireless Technologies Inc.'}, {'symbol': 'WIT', 'name': 'Wipro Limited'}, {'symbol': 'WIW', 'name': 'Western Asset Inflation-Linked Opportunities & Income Fund'}, {'symbol': 'WIX', 'name': 'Wix.com Ltd.'}, {'symbol': 'WK', 'name': 'Workiva Inc. Class A'}, {'symbol': 'WKHS', 'name': 'Workhorse Group Inc.'}, {'symbol': 'WLDN', 'name': 'Willdan Group Inc.'}, {'symbol': 'WLFC', 'name': 'Willis Lease Finance Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7486'}, {'symbol': 'WLH', 'name': 'Lyon William Homes (Class A)'}, {'symbol': 'WLK', 'name': 'Westlake Chemical Corporation'}, {'symbol': 'WLKP', 'name': 'Westlake Chemical Partners LP representing limited partner interests'}, {'symbol': 'WLL', 'name': 'Whiting Petroleum Corporation'}, {'symbol': 'WLTW', 'name': 'Willis Towers Watson Public Limited Company'}, {'symbol': 'WM', 'name': 'Waste Management Inc.'}, {'symbol': 'WMB', 'name': 'Williams Companies Inc. (The)'}, {'symbol': 'WMC', 'name': 'Western Asset Mortgage Capital Corporation'}, {'symbol': 'WMGI', 'name': 'Wright Medical Group N.V.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '6900'}, {'symbol': 'WMK', 'name': 'Weis Markets Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7499'}, {'symbol': 'WMS', 'name': 'Advanced Drainage Systems Inc.'}, {'symbol': 'WMT', 'name': 'Walmart Inc.'}, {'symbol': 'WNC', 'name': 'Wabash National Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7504'}, {'symbol': 'WNEB', 'name': 'Western New England Bancorp Inc.'}, {'symbol': 'WNS', 'name': 'WNS (Holdings) Limited Sponsored ADR (Jersey)'}, {'symbol': 'WOOD', 'name': 'iShares S&P Global Timber & Forestry Index Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7507'}, {'symbol': 'WOR', 'name': 'Worthington Industries Inc.'}, {'symbol': 'WORX', 'name': 'SCWorx Corp.'}, {'symbol': 'WOW', 'name': 'WideOpenWest Inc.'}, {'symbol': 'WP', 'name': 'Worldpay Inc. Class A'}, {'symbol': 'WPC', 'name': 'W.P. Carey Inc. REIT'}, {'symbol': 'WPG', 'name': 'Washington Prime Group Inc.'}, {'symbol': 'WPG-I', 'name': 'Washington Prime Group Inc. 6.875% Series I Cumulative Redeemable Preferred SBI', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '9676'}, {'symbol': 'WPM', 'name': 'Wheaton Precious Metals Corp (Canada)'}, {'symbol': 'WPP', 'name': 'WPP plc American Depositary Shares'}, {'symbol': 'WPRT', 'name': 'Westport Fuel Systems Inc'}, {'symbol': 'WPX', 'name': 'WPX Energy Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7518'}, {'symbol': 'WRB', 'name': 'W.R. Berkley Corporation'}, {'symbol': 'WRB-C', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11114'}, {'symbol': 'WRB-E', 'name': 'W.R. Berkley Corporation 5.70% Subordinated Debentures due 2058', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '14324'}, {'symbol': 'WRE', 'name': 'Washington Real Estate Investment Trust'}, {'symbol': 'WRI', 'name': 'Weingarten Realty Investors', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7527'}, {'symbol': 'WRK', 'name': 'Westrock Company'}, {'symbol': 'WRLD', 'name': 'World Acceptance Corporation'}, {'symbol': 'WRLS', 'name': 'Pensare Acquisition Corp.'}, {'symbol': 'WRLSU', 'name': 'Pensare Acquisition Corp. Unit', 'date': '2019-02-08', 'isEnabled': True, 'type': 'su', 'iexId': '13181'}, {'symbol': 'WRN', 'name': 'Western Copper and Gold Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7530'}, {'symbol': 'WRTC', 'name': 'Wrap Technologies Inc.'}, {'symbol': 'WSBC', 'name': 'WesBanco Inc.'}, {'symbol': 'WSBF', 'name': 'Waterstone Financial Inc.'}, {'symbol': 'WSC', 'name': 'WillScot Corporation'}, {'symbol': 'WSFS', 'name': 'WSFS Financial Corporation'}, {'symbol': 'WSM', 'name': 'Williams-Sonoma Inc. (DE)'}, {'symbol': 'WSO', 'name': 'Watsco Inc.'}, {'symbol': 'WSO.B', 'name': 'Watsco Inc. Class B'}, {'symbol': 'WSR', 'name': 'Whitestone REIT'}, {'symbol': 'WST', 'name': 'West Pharmaceutical Services Inc.'}, {'symbol': 'WSTG', 'name': 'Wayside Technology Group Inc.'}, {'symbol': 'WSTL', 'name': 'Westell Technologies Inc.'}, {'symbol': 'WTBA', 'name': 'West Bancorporation'}, {'symbol': 'WTER', 'name': 'The Alkaline Water Company Inc.'}, {'symbol': 'WTFC', 'name': 'Wintrust Financial Corporation'}, {'symbol': 'WTI', 'name': 'W&T Offshore Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7548'}, {'symbol': 'WTIU', 'name': 'UBS ETRACS - ProShares Daily 3x Long Crude ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12264'}, {'symbol': 'WTM', 'name': 'White Mountains Insurance Group Ltd.'}, {'symbol': 'WTR', 'name': 'Aqua America Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7550'}, {'symbol': 'WTRH', 'name': 'Waitr Holdings Inc.'}, {'symbol': 'WTS', 'name': 'Watts Water Technologies Inc. Class A'}, {'symbol': 'WTT', 'name': 'Wireless Telecom Group Inc.'}, {'symbol': 'WTTR', 'name': 'Select Energy Services Inc. Class A'}, {'symbol': 'WTW', 'name': 'Weight Watchers International Inc'}, {'symbol': 'WU', 'name': 'Western Union Company (The)'}, {'symbol': 'WUBA', 'name': '58.com Inc. American Depositary Shares each representing 2 Class A'}, {'symbol': 'WVE', 'name': 'Wave Life Sciences Ltd.'}, {'symbol': 'WVFC', 'name': 'WVS Financial Corp.'}, {'symbol': 'WVVI', 'name': 'Willamette Valley Vineyards Inc.'}, {'symbol': 'WWD', 'name': 'Woodward Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7560'}, {'symbol': 'WWE', 'name': 'World Wrestling Entertainment Inc. Class A'}, {'symbol': 'WWR', 'name': 'Westwater Resources Inc.'}, {'symbol': 'WWW', 'name': 'Wolverine World Wide Inc.'}, {'symbol': 'WY', 'name': 'Weyerhaeuser Company'}, {'symbol': 'WYND', 'name': 'Wyndham Destinations Inc. Common Stock', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7567'}, {'symbol': 'WYNN', 'name': 'Wynn Resorts Limited'}, {'symbol': 'WYY', 'name': 'WidePoint Corporation'}, {'symbol': 'X', 'name': 'United States Steel Corporation'}, {'symbol': 'XAN', 'name': 'Exantas Capital Corp.'}, {'symbol': 'XAR', 'name': 'SPDR S&P Aerospace & Defense', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7572'}, {'symbol': 'XBIO', 'name': 'Xenetic Biosciences Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12068'}, {'symbol': 'XBIT', 'name': 'XBiotech Inc.'}, {'symbol': 'XCEM', 'name': 'Columbia EM Core ex-China', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10471'}, {'symbol': 'XDIV', 'name': 'U.S. Equity Ex-Dividend Fund Series 2027 Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '14109'}, {'symbol': 'XEC', 'name': 'Cimarex Energy Co'}, {'symbol': 'XEL', 'name': 'Xcel Energy Inc.'}, {'symbol': 'XELA', 'name': 'Exela Technologies Inc.'}, {'symbol': 'XELB', 'name': 'Xcel Brands Inc'}, {'symbol': 'XENE', 'name': 'Xenon Pharmaceuticals Inc.'}, {'symbol': 'XENT', 'name': 'Intersect ENT Inc.'}, {'symbol': 'XERS', 'name': 'Xeris Pharmaceuticals Inc.'}, {'symbol': 'XFLT', 'name': 'XAI Octagon Floating Rate & Alternative Income Term Trust of Beneficial Interest', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13447'}, {'symbol': 'XGTI', 'name': 'XG Technology Inc'}, {'symbol': 'XHE', 'name': 'SPDR S&P Health Care Equipment', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7584'}, {'symbol': 'XHR', 'name': 'Xenia Hotels & Resorts Inc.'}, {'symbol': 'XIN', 'name': 'Xinyuan Real Estate Co Ltd American Depositary Shares', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7586'}, {'symbol': 'XITK', 'name': 'SPDR FactSet Innovative Technology', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11017'}, {'symbol': 'XKFF', 'name': 'SPDR Kensho Final Frontiers', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15163'}, {'symbol': 'XKII', 'name': 'SPDR Kensho Intelligent Structures', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13958'}, {'symbol': 'XLB', 'name': 'Materials Select Sector SPDR', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7591'}, {'symbol': 'XLE', 'name': 'SPDR Select Sector Fund - Energy Select Sector', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7592'}, {'symbol': 'XLF', 'name': 'SPDR Select Sector Fund - Financial', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7593'}, {'symbol': 'XLI', 'name': 'SPDR Select Sector Fund - Industrial', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7595'}, {'symbol': 'XLNX', 'name': 'Xilinx Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7597'}, {'symbol': 'XLRE', 'name': 'Real Estate Select Sector SPDR Fund (The)', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10669'}, {'symbol': 'XLRN', 'name': 'Acceleron Pharma Inc.'}, {'symbol': 'XLTY', 'name': 'Cushing Transportation & MLP', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15281'}, {'symbol': 'XLUY', 'name': 'Cushing Utility & MLP', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15282'}, {'symbol': 'XLY', 'name': 'SPDR Select Sector Fund - Consumer Discretionary', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7602'}, {'symbol': 'XMLV', 'name': 'Invesco S&P MidCap Low Volatility', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7604'}, {'symbol': 'XMX', 'name': 'WisdomTree Global ex-Mexico Equity Fund', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12372'}, {'symbol': 'XNCR', 'name': 'Xencor Inc.'}, {'symbol': 'XNET', 'name': 'Xunlei Limited'}, {'symbol': 'XOG', 'name': 'Extraction Oil & Gas Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11935'}, {'symbol': 'XOM', 'name': 'Exxon Mobil Corporation'}, {'symbol': 'XOMA', 'name': 'XOMA Corporation'}, {'symbol': 'XON', 'name': 'Intrexon Corporation'}, {'symbol': 'XONE', 'name': 'The ExOne Company'}, {'symbol': 'XPER', 'name': 'Xperi Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '12147'}, {'symbol': 'XPL', 'name': 'Solitario Zinc Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7617'}, {'symbol': 'XPO', 'name': 'XPO Logistics Inc.'}, {'symbol': 'XRAY', 'name': 'DENTSPLY SIRONA Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7622'}, {'symbol': 'XRF', 'name': 'China Rapid Finance Limited American Depositary Shares each representing one Class A'}, {'symbol': 'XRT', 'name': 'SPDR S&P Retail', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7626'}, {'symbol': 'XRX', 'name': 'Xerox Corporation'}, {'symbol': 'XSHD', 'name': 'Invesco S&P SmallCap High Dividend Low Volatility', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12131'}, {'symbol': 'XSLV', 'name': 'Invesco S&P SmallCap Low Volatility', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7630'}, {'symbol': 'XSPA', 'name': 'XpresSpa Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7344'}, {'symbol': 'XT', 'name': 'iShares Exponential Technologies ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '9846'}, {'symbol': 'XTL', 'name': 'SPDR S&P Telecom', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7633'}, {'symbol': 'XTLB', 'name': 'XTL Biopharmaceuticals Ltd.'}, {'symbol': 'XTNT', 'name': 'Xtant Medical Holdings Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '851'}, {'symbol': 'XVZ', 'name': 'iPath S&P 500 Dynamic VIX ETN', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '7640'}, {'symbol': 'XXII', 'name': '22nd Century Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '8453'}, {'symbol': 'XYF', 'name': 'X Financial American Depositary Shares each representing two Class A'}, {'symbol': 'XYL', 'name': 'Xylem Inc. New'}, {'symbol': 'Y', 'name': 'Alleghany Corporation'}, {'symbol': 'YAO', 'name': 'Invesco China All-Cap', 'date': '2019-02-08', 'isEnabled': True, 'type': 'et', 'iexId': '14426'}, {'symbol': 'YCOM', 'name': 'ProShares UltraShort Communication Services Select Sector', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '15396'}, {'symbol': 'YELP', 'name': 'Yelp Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7651'}, {'symbol': 'YETI', 'name': 'YETI Holdings Inc.'}, {'symbol': 'YEXT', 'name': 'Yext Inc.'}, {'symbol': 'YGYI', 'name': 'Youngevity International Inc.'}, {'symbol': 'YI', 'name': '111 Inc.'}, {'symbol': 'YIN', 'name': 'Yintech Investment Holdings Limited'}, {'symbol': 'YLCO', 'name': 'Global X YieldCo & Renewable Energy Income ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '10034'}, {'symbol': 'YLDE', 'name': 'ClearBridge Dividend Strategy ESG ETF', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '12946'}, {'symbol': 'YMAB', 'name': 'Y-mAbs Therapeutics Inc.'}, {'symbol': 'YMLP', 'name': 'VanEck Vectors High Income MLP', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7656'}, {'symbol': 'YNDX', 'name': 'Yandex N.V.'}, {'symbol': 'YOGA', 'name': 'YogaWorks Inc.'}, {'symbol': 'YORW', 'name': 'The York Water Company'}, {'symbol': 'YPF', 'name': 'YPF Sociedad Anonima'}, {'symbol': 'YRCW', 'name': 'YRC Worldwide Inc.'}, {'symbol': 'YRD', 'name': 'Yirendai Ltd. American Depositary Shares each representing two'}, {'symbol': 'YRIV', 'name': 'Yangtze River Port and Logistics Limited'}, {'symbol': 'YTEN', 'name': 'Yield10 Bioscience Inc.'}, {'symbol': 'YTRA', 'name': 'Yatra Online Inc.'}, {'symbol': 'YUM', 'name': 'Yum! Brands Inc.'}, {'symbol': 'YUMA', 'name': 'Yuma Energy Inc.'}, {'symbol': 'YUMC', 'name': 'Yum China Holdings Inc.'}, {'symbol': 'YVR', 'name': 'Liquid Media Group Ltd.'}, {'symbol': 'YY', 'name': 'YY Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7667'}, {'symbol': 'Z', 'name': 'Zillow Group Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '10337'}, {'symbol': 'ZAGG', 'name': 'ZAGG Inc'}, {'symbol': 'ZAYO', 'name': 'Zayo Group Holdings Inc.'}, {'symbol': 'ZB-A', 'name': 'Zions Bancorporation N.A. Depositary Shares Series A', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '7674'}, {'symbol': 'ZB-H', 'name': 'Zions Bancorporation N.A. Dep Shs Repstg 1/40th Int Sh Ser H Perp Pfd Stk', 'date': '2019-02-08', 'isEnabled': True, 'type': 'ps', 'iexId': '7678'}, {'symbol': 'ZBH', 'name': 'Zimmer Biomet Holdings Inc.'}, {'symbol': 'ZBIO', 'name': 'ProShares UltraPro Short NASDAQ Biotechnology'}, {'symbol': 'ZBRA', 'name': 'Zebra Technologies Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7680'}, {'symbol': 'ZBZZT', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11843'}, {'symbol': 'ZCZZT', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '11844'}, {'symbol': 'ZDGE', 'name': 'Zedge Inc. Class B', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '11417'}, {'symbol': 'ZEAL', 'name': 'Zealand Pharma A/S'}, {'symbol': 'ZEN', 'name': 'Zendesk Inc.'}, {'symbol': 'ZEUS', 'name': 'Olympic Steel Inc.'}, {'symbol': 'ZF', 'name': 'Virtus Total Return Fund Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7683'}, {'symbol': 'ZFGN', 'name': 'Zafgen Inc.'}, {'symbol': 'ZG', 'name': 'Zillow Group Inc.'}, {'symbol': 'ZGNX', 'name': 'Zogenix Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7685'}, {'symbol': 'ZIEXT', 'name': 'ZIEXT Test Incorporated', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '13389'}, {'symbol': 'ZION', 'name': 'Zions Bancorporation N.A.'}, {'symbol': 'ZIOP', 'name': 'ZIOPHARM Oncology Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7691'}, {'symbol': 'ZIXI', 'name': 'Zix Corporation', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7694'}, {'symbol': 'ZJZZT', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7905'}, {'symbol': 'ZKIN', 'name': 'ZK International Group Co. Ltd'}, {'symbol': 'ZLAB', 'name': 'Zai Lab Limited'}, {'symbol': 'ZN', 'name': 'Zion Oil & Gas Inc', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '7699'}, {'symbol': 'ZNGA', 'name': 'Zynga Inc.'}, {'symbol': 'ZNH', 'name': 'China Southern Airlines Company Limited'}, {'symbol': 'ZOM', 'name': 'Zomedica Pharmaceuticals Corp.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '13820'}, {'symbol': 'ZS', 'name': 'Zscaler Inc.', 'date': '2019-02-08', 'isEnabled': True, 'type': 'cs', 'iexId': '14171'}, {'symbol': 'ZSAN', 'name': 'Zosano Pharma Corporation'}, {'symbol': 'ZTEST', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7906'}, {'symbol': 'ZTO', 'name': 'ZTO Express (Cayman) Inc. American Depositary Shares each representing one Class A.'}, {'symbol': 'ZTR', 'name': 'Virtus Global Dividend & Income Fund Inc.'}, {'symbol': 'ZTS', 'name': 'Zoetis Inc. Class A'}, {'symbol': 'ZUMZ', 'name': 'Zumiez Inc.'}, {'symbol': 'ZUO', 'name': 'Zuora Inc. Class A'}, {'symbol': 'ZVVV', 'name': '', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7908'}, {'symbol': 'ZWZZT', 'name': 'NASDAQ TEST STOCK', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7910'}, {'symbol': 'ZXZZT', 'name': 'NASDAQ TEST STOCK', 'date': '2019-02-08', 'isEnabled': True, 'type': 'N/A', 'iexId': '7911'}, {'symbol': 'ZYME', 'name': 'Zymeworks Inc.'}, {'symbol': 'ZYNE', 'name': 'Zynerba Pharmaceuticals Inc.'}, {'symbol': 'EOSUSDT', 'name': 'EOS USD', 'date': '2019-02-08', 'isEnabled': True, 'type': 'crypto', 'iexId': 10000001}, {'symbol': 'BNBUSDT', 'name': 'Binance Coin USD', 'date': '2019-02-08', 'isEnabled': True, 'type': 'crypto', 'iexId': 10000003}, {'symbol': 'BCCUSDT', 'name': 'Bitcoin Cash USD', 'date': '2019-02-08', 'isEnabled': True, 'type': 'crypto', 'iexId': 10000005}, {'symbol': 'XRPUSDT', 'name': 'Ripple USD', 'date': '2019-02-08', 'isEnabled': True, 'type': 'crypto', 'iexId': 10000007}, {'symbol': 'TRXUSDT', 'name': 'TRON USD', 'date': '2019-02-08', 'isEnabled': True, 'type': 'crypto', 'iexId': 10000009}, {'symbol': 'ETCUSDT', 'name': 'Ethereum Classic USD', 'date': '2019-02-08', 'isEnabled': True, 'type': 'crypto', 'iexId': 10000011}, {'symbol': 'ICXUSDT', 'name': 'ICON USD', 'date': '2019-02-08', 'isEnabled': True, 'type': 'crypto', 'iexId': 10000013}, {'symbol': 'VENUSDT', 'name': 'VeChain USD', 'date': '2019-02-08', 'isEnabled': True, 'type': 'crypto', 'iexId': 10000015}, {'symbol': 'QTUMUSDT', 'name': 'Qtum USD', 'date': '2019-02-08', 'isEnabled': True, 'type': 'crypto', 'iexId': 10000017}]
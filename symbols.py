@@ -0,0 +1,108 @@
+"""
+The universe of tradeable symbols and a prefix search over it.
+
+Symbols live in data/symbols.tsv, one "SYMBOL<tab>Company name" line per
+stock sorted by symbol. The file is only read the first time a search
+runs, and its strings are interned into plain lists.
+"""
+import os
+import re
+import sys
+import threading
+
+from bisect import bisect_left
+
+PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+        'data', 'symbols.tsv')
+
+
+class SymbolIndex:
+    """
+    Prefix search over (symbol, name) pairs.
+
+    Symbols are kept in one sorted list and every word of every company
+    name in another, so a query is two binary searches plus a short walk
+    over the matches rather than a scan of every stock.
+    """
+
+    def __init__(self, entries):
+        entries = sorted(entries)
+        self.symbols = [symbol for symbol, name in entries]
+        self.names = [name for symbol, name in entries]
+        self.words = sorted(
+                (word, i)
+                for i, name in enumerate(self.names)
+                for word in set(re.findall(r'\w+', name.upper())))
+
+    @classmethod
+    def load(cls, path=PATH):
+        """Build an index from a symbols file"""
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        return cls(
+                (sys.intern(symbol), sys.intern(name))
+                for symbol, name in (line.split('\t', 1) for line in lines))
+
+    def search(self, query, limit=10):
+        """Stocks whose symbol or a word of whose name starts with query"""
+        query = query.strip().upper()
+        if not query:
+            return []
+        found = []
+        start = bisect_left(self.symbols, query)
+        for i in range(start, len(self.symbols)):
+            if len(found) == limit or not self.symbols[i].startswith(query):
+                break
+            found.append(i)
+
+        start = bisect_left(self.words, (query, -1))
+        for j in range(start, len(self.words)):
+            word, i = self.words[j]
+            if len(found) == limit or not word.startswith(query):
+                break
+            if i not in found:
+                found.append(i)
+        return [(self.symbols[i], self.names[i]) for i in found]
+
+    def name(self, symbol):
+        """Company name for an exact symbol, or None"""
+        i = bisect_left(self.symbols, symbol)
+        if i < len(self.symbols) and self.symbols[i] == symbol:
+            return self.names[i]
+        return None
+
+
+def write(stocks, path=PATH):
+    """
+    Write a symbols file from API-style stock dicts, keeping only the
+    symbol and name
+    """
+    lines = sorted({
+        (s['symbol'].upper(), ' '.join(s['name'].split()))
+        for s in stocks})
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(f'{symbol}\t{name}\n' for symbol, name in lines)
+
+
+_index = None
+_lock = threading.Lock()
+
+
+def get_index():
+    """The index over the symbols file, loaded on first use"""
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index = SymbolIndex.load()
+    return _index
+
+
+def search(query, limit=10):
+    """Search the symbol universe; see SymbolIndex.search"""
+    return get_index().search(query, limit)
+
+
+def name(symbol):
+    """Company name for a symbol in the symbol universe, or None"""
+    return get_index().name(symbol.upper())
@@ -1,17 +1,32 @@
 import os
 import tempfile
+import time
 import urllib
 
 import flask
 from flask_testing import TestCase, LiveServerTestCase
 from flask_sqlalchemy import SQLAlchemy
 import pytest
+import sqlalchemy
 from werkzeug.security import generate_password_hash
 
 from config import create_app
 from application import app, db
+import application
+import dbpool
 import helpers as h
+import instrumentation
+import migrations
 import queries as q
+import quotes
+import symbols
+from leaderboard import Leaderboard, board
+from valuation import Valuation
+from datetime import datetime, timedelta
+from pricefeed import PriceFeed, PriceStore
+import passwords
+import pricehistory
+from sessionstore import SessionStore
 
 class MyTest(TestCase):
     """Complete Flask-Testing test suite"""
@@ -21,12 +36,21 @@ class MyTest(TestCase):
         """Start new instance of app & initialize db"""
         app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite://"
         app.config['TESTING'] = True
+        app.config['QUOTE_PROVIDER'] = 'simulated'
         db.init_app(app)
         return app
 
     def setUp(self):
         """Create db models in test db"""
         db.create_all()
+        board.clear()
+        q.stock_ids.clear()
+        h.quote_provider = quotes.create_provider(app.config)
+        h.price_recorder = None
+        h.quote_cache.configure(
+                app.config['QUOTE_CACHE_TTL'],
+                app.config['QUOTE_CACHE_STALE_TTL'],
+                app.config['QUOTE_CACHE_SIZE'])
 
     def populateTestDb(self):
         """Optional: populate db with test data"""
@@ -65,6 +89,112 @@ class MyTest(TestCase):
         db.session.commit()
         q.delete_transactions_by_user(1)
         assert sum(1 for t in q.Transaction.query.all()) == 0
+        assert sum(1 for p in q.Position.query.all()) == 0
+
+    def test_execute_trade_buy(self):
+        """Buying adds the stock, ledger row, position and cash change"""
+        self.populateTestDb()
+        q.execute_trade(1, 'TSLA', 'Tesla', 2, 100)
+        stock = q.select_stock_by_symbol('TSLA')
+        assert q.select_transactions_by_stock(stock.id, 1).shares == 2
+        assert q.User.query.first().cash == q.STARTING_CASH - 200
+
+    def test_stock_id_cache(self):
+        """Committed stocks are found by symbol without a query"""
+        self.populateTestDb()
+        stock_id = q.execute_trade(1, 'TSLA', 'Tesla', 1, 100)
+        assert q.stock_ids['TSLA'] == stock_id
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sqlalchemy.event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            q.execute_trade(1, 'TSLA', 'Tesla', 1, 100)
+        finally:
+            sqlalchemy.event.remove(db.engine, 'before_cursor_execute',
+                    record)
+        assert not [sql for sql in statements if 'FROM stock' in sql]
+
+    def test_execute_trade_sell(self):
+        """Selling credits cash and reduces the position"""
+        self.populateTestDb()
+        q.execute_trade(1, 'AAPL', 'Apple', -1, 50)
+        assert q.select_transactions_by_stock(1, 1).shares == 0
+        assert q.User.query.first().cash == q.STARTING_CASH + 50
+
+    def test_execute_trade_lock_order(self):
+        """Sales lock the user row before the position, like buys do"""
+        self.populateTestDb()
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(' '.join(statement.split()))
+
+        sqlalchemy.event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            q.execute_trade(1, 'AAPL', 'Apple', -1, 50)
+        finally:
+            sqlalchemy.event.remove(db.engine, 'before_cursor_execute',
+                    record)
+        update = [i for i, sql in enumerate(statements)
+                if sql.startswith('UPDATE user')]
+        lock = [i for i, sql in enumerate(statements)
+                if 'FROM position' in sql]
+        assert update and lock and update[0] < lock[0]
+
+    def test_execute_trade_insufficient_funds(self):
+        """Orders over the user's cash are rejected without side effects"""
+        self.populateTestDb()
+        with pytest.raises(q.TradeError, match='Not enough cash'):
+            q.execute_trade(1, 'TSLA', 'Tesla', 1000, 10000)
+        assert q.select_stock_by_symbol('TSLA') is None
+        assert 'TSLA' not in q.stock_ids
+        assert q.User.query.first().cash == q.STARTING_CASH
+        assert sum(1 for t in q.Transaction.query.all()) == 1
+
+    def test_execute_trade_insufficient_shares(self):
+        """Sales of shares the user doesn't hold are rejected"""
+        self.populateTestDb()
+        with pytest.raises(q.TradeError, match='own enough'):
+            q.execute_trade(1, 'AAPL', 'Apple', -2, 50)
+        with pytest.raises(q.TradeError, match='own that stock'):
+            q.execute_trade(1, 'BIDU', 'Baidu', -1, 50)
+        with pytest.raises(q.TradeError, match='own that stock'):
+            q.execute_trade(1, 'TSLA', 'Tesla', -1, 50)
+        assert q.User.query.first().cash == q.STARTING_CASH
+
+    def test_execute_trade_name_collision(self):
+        """A new symbol named like a listed stock is refused, not a 500"""
+        self.populateTestDb()
+        q.execute_trade(1, 'GOOG', 'Alphabet Inc.', 1, 100)
+        with pytest.raises(q.TradeError, match='shares its name'):
+            q.execute_trade(1, 'GOOGL', 'Alphabet Inc.', 1, 100)
+        assert q.select_stock_by_symbol('GOOGL') is None
+        assert q.User.query.first().cash == q.STARTING_CASH - 100
+
+    def test_execute_trade_concurrent_new_stock(self):
+        """A stock inserted by a concurrent order is retried and reused"""
+        self.populateTestDb()
+        real = q.select_stock_id
+        calls = []
+
+        def racing(symbol):
+            # The first lookup misses; the stock appears before the insert
+            calls.append(symbol)
+            if len(calls) == 1:
+                q.insert_stock(symbol, 'Tesla')
+                q.stock_ids.clear()
+                return None
+            return real(symbol)
+
+        q.select_stock_id = racing
+        try:
+            stock_id = q.execute_trade(1, 'TSLA', 'Tesla', 1, 100)
+        finally:
+            q.select_stock_id = real
+        assert q.select_stock_by_symbol('TSLA').id == stock_id
 
     def test_insert_stock(self):
         """Creates a new stock in database"""
@@ -81,6 +211,28 @@ class MyTest(TestCase):
         q.insert_user('a', 'a')
         assert sum(1 for u in q.User.query.all()) == 1
 
+    def test_reset_user(self):
+        """Resetting clears a user's ledger and positions and restores cash"""
+        self.populateTestDb()
+        q.insert_user('other', 'x')
+        q.insert_transaction(2, 2, 1, 1)
+        q.update_user_cash(-500, 1)
+        q.reset_user(1)
+        assert q.select_user_by_id(1).cash == q.STARTING_CASH
+        assert q.select_stocks_by_user(1) == []
+        assert len(q.select_stocks_by_user(2)) == 1
+
+    def test_reset_users(self):
+        """Resetting with no ids restarts every user"""
+        self.populateTestDb()
+        q.insert_user('other', 'x')
+        q.insert_transaction(2, 2, 1, 1)
+        q.update_user_cash(-500, 2)
+        q.reset_users()
+        assert q.Transaction.query.count() == 0
+        assert q.Position.query.count() == 0
+        assert all(u.cash == q.STARTING_CASH for u in q.User.query)
+
     def test_select_user_by_id(self):
         """Get a user based on ID"""
         self.populateTestDb()
@@ -101,11 +253,83 @@ class MyTest(TestCase):
         self.populateTestDb()
         assert (1.0, 'Apple', 'AAPL') in q.select_stocks_by_user(1)
 
+    def test_select_stocks_by_user_held_only(self):
+        """Sold-out stocks are left out in SQL when held_only is set"""
+        self.populateTestDb()
+        q.insert_transaction(1, 2, 1, 1)
+        q.insert_transaction(1, 2, -1, 1)
+        assert len(q.select_stocks_by_user(1)) == 2
+        assert len(q.select_stocks_by_user(1, held_only=True)) == 1
+
+    def test_select_held_symbols(self):
+        """Only symbols with shares still held are polled"""
+        self.populateTestDb()
+        q.insert_transaction(1, 2, 1, 1)
+        q.insert_transaction(1, 2, -1, 1)
+        assert q.select_held_symbols() == ['AAPL']
+
+    def test_select_positions(self):
+        """Get every user's positions in one query"""
+        self.populateTestDb()
+        q.insert_transaction(2, 2, 3, 1)
+        q.insert_transaction(2, 1, -1, 1)
+        positions = q.select_positions()
+        assert (1, 1.0, 'Apple', 'AAPL') in positions
+        assert (2, 3.0, 'Baidu', 'BIDU') in positions
+        assert len(positions) == 3
+        assert len(q.select_positions(held_only=True)) == 2
+        assert q.select_positions([2], held_only=True) == [
+                (2, 3.0, 'Baidu', 'BIDU')]
+
+    def test_insert_transaction_updates_position(self):
+        """Each trade updates the user's position and cost basis"""
+        q.insert_transaction(1, 1, 4, 10)
+        q.insert_transaction(1, 1, -1, 20)
+        position = q.Position.query.get((1, 1))
+        assert position.quantity == 3
+        assert position.cost == 30
+
+    def test_rebuild_positions(self):
+        """Positions are regenerated from the ledger"""
+        self.populateTestDb()
+        q.insert_transaction(1, 2, 2, 5)
+        q.Position.query.delete()
+        db.session.commit()
+        q.rebuild_positions()
+        assert q.Position.query.get((1, 1)).quantity == 1
+        assert q.Position.query.get((1, 2)).cost == 10
+        assert q.check_positions() == []
+
+    def test_check_positions(self):
+        """Positions that drift from the ledger are reported"""
+        self.populateTestDb()
+        q.Position.query.get((1, 1)).quantity = 5
+        db.session.commit()
+        assert q.check_positions() == [(1, 1, (5, 1), (1, 1))]
+
     def test_select_transactions_by_user(self):
         """Get a user's transactions"""
         self.populateTestDb()
         assert 'AAPL' in q.select_transactions_by_user(1)[0]
 
+    def test_select_transactions_page(self):
+        """Pages of a user's transactions, newest first, by keyset"""
+        self.populateTestDb()
+        for price in range(2, 6):
+            q.insert_transaction(1, 1, 1, price)
+        first = q.select_transactions_page(1, limit=2)
+        assert [t.price for t in first] == [5, 4]
+        second = q.select_transactions_page(
+                1, (first[-1].time, first[-1].id), limit=2)
+        assert [t.price for t in second] == [3, 2]
+
+    def test_stream_transactions_by_user(self):
+        """Stream a user's transactions newest first"""
+        self.populateTestDb()
+        q.insert_transaction(1, 2, 1, 2)
+        assert [t.symbol for t in q.stream_transactions_by_user(1)] == [
+                'BIDU', 'AAPL']
+
     def test_select_transactions_by_stock(self):
         """Get sum of users transactions of a stock"""
         self.populateTestDb()
@@ -115,7 +339,7 @@ class MyTest(TestCase):
         """Add amount to user cash"""
         self.populateTestDb()
         q.update_user_cash(999, 1)
-        assert q.User.query.first().cash == 10999
+        assert q.User.query.first().cash == q.STARTING_CASH + 999
 
     def test_update_user_hash(self):
         """Update user's password hash"""
@@ -148,6 +372,88 @@ class MyTest(TestCase):
                 == "<Transaction <User user>: <Stock AAPL>>")
 
 
+    def test_position_repr(self):
+        """Test __repr__ in Position model"""
+        self.populateTestDb()
+        assert repr(q.Position.query.first()) == "<Position 1: 1 x1>"
+
+
+    ### migrations.py ###
+    def test_create_indexes(self):
+        """Missing model indexes are added to an existing database"""
+        index, = [index for index in q.Transaction.__table__.indexes
+                if index.name == 'ix_transaction_stock']
+        index.drop(db.engine)
+        assert migrations.create_indexes() == ['ix_transaction_stock']
+        assert migrations.create_indexes() == []
+
+    def test_convert_money_to_cents(self):
+        """Float dollar columns of an old database become integer cents"""
+        db.drop_all()
+        for sql in (
+                'CREATE TABLE user (id INTEGER PRIMARY KEY, username TEXT, '
+                    'password_hash TEXT, cash FLOAT)',
+                'CREATE TABLE stock (id INTEGER PRIMARY KEY, symbol TEXT, '
+                    'name TEXT)',
+                'CREATE TABLE "transaction" (id INTEGER PRIMARY KEY, '
+                    'user_id INTEGER, stock_id INTEGER, quantity FLOAT, '
+                    'price FLOAT, time DATETIME)',
+                'CREATE TABLE position (user_id INTEGER, stock_id INTEGER, '
+                    'quantity FLOAT, cost FLOAT, '
+                    'PRIMARY KEY (user_id, stock_id))',
+                "INSERT INTO user VALUES (1, 'user', 'x', 9876.54)",
+                "INSERT INTO stock VALUES (1, 'AAPL', 'Apple')",
+                'INSERT INTO "transaction" VALUES '
+                    "(1, 1, 1, 2.0, 61.73, '2019-01-01 00:00:00')",
+                'INSERT INTO position VALUES (1, 1, 2.0, 123.46)'):
+            db.session.execute(sql)
+        db.session.commit()
+        with pytest.raises(RuntimeError, match='convert-money'):
+            application.check_money_columns()
+        assert sorted(migrations.convert_money_to_cents()) == [
+                'position', 'transaction', 'user']
+        application.check_money_columns()
+        assert migrations.convert_money_to_cents() == []
+        assert q.User.query.one().cash == 987654
+        transaction = q.Transaction.query.one()
+        assert (transaction.quantity, transaction.price) == (2, 6173)
+        assert isinstance(transaction.price, int)
+        assert q.Position.query.one().cost == 12346
+        assert q.check_positions() == []
+        assert migrations.create_indexes() == []
+
+
+    ### symbols.py ###
+    def test_symbol_search_prefix(self):
+        """Symbols starting with the query come first"""
+        index = symbols.SymbolIndex([
+            ('AAPL', 'Apple Inc.'),
+            ('AA', 'Alcoa Corporation'),
+            ('GOOG', 'Alphabet Inc.'),
+            ('BABA', 'Alibaba Group'),
+        ])
+        assert index.search('aa') == [
+                ('AA', 'Alcoa Corporation'), ('AAPL', 'Apple Inc.')]
+        assert index.search('AL', limit=2) == [
+                ('AA', 'Alcoa Corporation'), ('BABA', 'Alibaba Group')]
+        assert index.search('group') == [('BABA', 'Alibaba Group')]
+        assert index.search(' ') == []
+        assert index.name('GOOG') == 'Alphabet Inc.'
+        assert index.name('GO') is None
+
+    def test_symbols_file(self):
+        """Symbols file round trips through write and load"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'symbols.tsv')
+            symbols.write([
+                {'symbol': 'goog', 'name': 'Alphabet  Inc.', 'type': 'cs'},
+                {'symbol': 'AFGH', 'name': ''},
+            ], path)
+            index = symbols.SymbolIndex.load(path)
+        assert index.symbols == ['AFGH', 'GOOG']
+        assert index.search('alpha') == [('GOOG', 'Alphabet Inc.')]
+
+
     ### helpers.py ###
     def test_apology(self):
         """Bad password renders an apology"""
@@ -161,6 +467,28 @@ class MyTest(TestCase):
         )
         assert b'Error' in response.data
 
+    def test_load_user(self):
+        """Users are loaded once per request"""
+        self.populateTestDb()
+        with app.test_request_context():
+            user = h.load_user(1)
+            q.update_user_cash(100, 1)
+            assert h.load_user(1) is user
+        with app.test_request_context():
+            assert h.load_user(1).cash == q.STARTING_CASH + 100
+
+    def test_load_user_across_requests(self):
+        """Requests sharing an app context don't reuse each other's users"""
+        self.populateTestDb()
+        self.startSession()
+        with app.app_context():
+            assert self.client.get('/').status_code == 200
+            db.session.remove()
+            q.update_user_cash(100, 1)
+            response = self.client.get('/profile')
+            assert response.status_code == 200
+            assert b'$10,001.00' in response.data
+
     def test_login_required(self):
         """Users who aren't logged in get redirected"""
         with self.client.session_transaction() as sess:
@@ -172,9 +500,17 @@ class MyTest(TestCase):
         """Create dictionary from user transaction history"""
         self.populateTestDb()
         history = h.build_history(q.select_transactions_by_user(1))
-        assert 'name' in history[1]
-        assert 'price' in history[1]
-        assert 'time' in history[1]
+        assert history[1].name == 'Apple'
+        assert history[1].type == 'Buy'
+        assert history[1].total == 1
+
+    def test_cursor(self):
+        """Pagination cursors round trip and reject garbage"""
+        self.populateTestDb()
+        transaction = q.Transaction.query.first()
+        cursor = h.decode_cursor(h.encode_cursor(transaction))
+        assert cursor == (transaction.time, transaction.id)
+        assert h.decode_cursor('garbage') is None
 
     def test_build_portfolio(self):
         """Create portfolio w/ current prices from user stocks"""
@@ -183,12 +519,11 @@ class MyTest(TestCase):
                 q.select_stocks_by_user(1),
                 9999
                 )
-        assert 'stocks' in portfolio
-        assert 'AAPL' in portfolio['stocks']
-        assert 'name' in portfolio['stocks']['AAPL']
-        assert 'value' in portfolio['stocks']['AAPL']
-        assert 'cash' in portfolio
-        assert 'total' in portfolio
+        stock, = portfolio.stocks
+        assert stock.symbol == 'AAPL'
+        assert stock.value == stock.price
+        assert portfolio.cash == 9999
+        assert portfolio.total == 9999 + stock.value
 
     def test_build_portfolio_negative_quantity(self):
         """Build Portfolio should exclude stocks that've been sold"""
@@ -204,20 +539,581 @@ class MyTest(TestCase):
             q.select_stocks_by_user(1),
             9999,
         )
-        assert 'AAPL' not in portfolio['stocks']
-        assert 'cash' in portfolio
-        assert 'total' in portfolio
+        assert portfolio.stocks == []
+        assert portfolio.total == 9999
 
     def test_usd(self):
         """Format value as USD string"""
-        assert h.usd(800) == "$800.00"
+        assert h.usd(80000) == "$800.00"
         assert h.usd(0) == "$0.00"
-        assert h.usd(9.99) == "$9.99"
+        assert h.usd(999) == "$9.99"
+        assert h.usd(123456789) == "$1,234,567.89"
+
+    def fakeFetch(self, calls):
+        """Batch quote fetcher that records calls instead of hitting the API"""
+        def fetch_many(symbols):
+            calls.extend(sorted(symbols))
+            return {symbol: {'name': symbol, 'price': 100, 'symbol': symbol}
+                    for symbol in symbols if symbol != 'FOOBAR'}
+        return fetch_many
+
+    def fakeSession(self, requests):
+        """HTTP session that answers batch quote requests locally"""
+        class Response:
+            def __init__(self, symbols):
+                self.symbols = symbols
+            def raise_for_status(self):
+                pass
+            def json(self):
+                return {symbol: {'quote': {'companyName': symbol,
+                    'latestPrice': 1, 'symbol': symbol}}
+                    for symbol in self.symbols}
+        class Session:
+            def get(self, url, params, timeout):
+                requests.append((params['symbols'], timeout))
+                return Response(params['symbols'].split(','))
+        return Session()
+
+    def test_quote_client_batches(self):
+        """Long symbol lists are split into concurrent batches"""
+        requests = []
+        client = quotes.HTTPProvider(timeout=(1, 2), batch_size=2, workers=2,
+                session=self.fakeSession(requests))
+        fetched = client.fetch_quotes(['A', 'B', 'C', 'D', 'E'])
+        assert sorted(fetched) == ['A', 'B', 'C', 'D', 'E']
+        assert sorted(requests) == [('A,B', (1, 2)), ('C,D', (1, 2)),
+                ('E', (1, 2))]
+
+    def test_quote_client_session(self):
+        """Client builds one pooled session with retries"""
+        client = quotes.HTTPProvider(retries=3)
+        session = client.session
+        assert client.session is session
+        assert session.get_adapter(client.url).max_retries.total == 3
+
+    def test_simulated_provider(self):
+        """Simulated prices follow a seeded walk, one step per interval"""
+        now = [0]
+        a = quotes.SimulatedProvider(seed=1, clock=lambda: now[0])
+        b = quotes.SimulatedProvider(seed=1, clock=lambda: now[0])
+        first = a.fetch_quotes(['AAPL', 'FOOBAR'])
+        assert list(first) == ['AAPL']
+        assert first['AAPL']['name'] == 'Apple Inc.'
+        now[0] = 5
+        assert a.fetch_quotes(['AAPL']) == b.fetch_quotes(['AAPL'])
+        assert a.fetch_quotes(['AAPL']) != first
+
+    def test_replay_provider(self):
+        """Replayed prices are the last recorded tick, looping at the end"""
+        now = [0]
+        with tempfile.NamedTemporaryFile('w', suffix='.csv') as f:
+            f.write('seconds,symbol,price\n0,AAPL,1\n2,AAPL,2\n4,AAPL,3\n')
+            f.flush()
+            provider = quotes.ReplayProvider(f.name, clock=lambda: now[0])
+        prices = []
+        for now[0] in (0, 1, 2, 5):
+            prices.append(provider.fetch_quotes(['AAPL'])['AAPL']['price'])
+        assert prices == [100, 100, 200, 100]
+        assert provider.fetch_quotes(['BIDU']) == {}
+
+    def test_create_provider(self):
+        """Provider is picked by config"""
+        assert isinstance(quotes.create_provider(app.config),
+                quotes.SimulatedProvider)
+        with pytest.raises(ValueError):
+            quotes.create_provider({'QUOTE_PROVIDER': 'ticker-tape'})
+
+    def test_quote_cache_hit(self):
+        """Repeated lookups within the TTL are served from cache"""
+        calls = []
+        cache = h.QuoteCache(self.fakeFetch(calls), ttl=60)
+        assert cache.get('aapl')['symbol'] == 'AAPL'
+        assert cache.get('AAPL')['symbol'] == 'AAPL'
+        assert calls == ['AAPL']
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_quote_cache_skips_unknown(self):
+        """Unknown symbols aren't cached"""
+        calls = []
+        cache = h.QuoteCache(self.fakeFetch(calls))
+        assert cache.get('FOOBAR') is None
+        assert cache.get('FOOBAR') is None
+        assert len(calls) == 2
+
+    def test_quote_cache_eviction(self):
+        """Least recently used quote is evicted when cache is full"""
+        calls = []
+        cache = h.QuoteCache(self.fakeFetch(calls), maxsize=2)
+        cache.get('A')
+        cache.get('B')
+        cache.get('A')
+        cache.get('C')
+        cache.get('A')
+        cache.get('B')
+        assert calls == ['A', 'B', 'C', 'B']
+
+    def test_quote_cache_stale_while_revalidate(self):
+        """Expired quotes are served at once and refreshed in background"""
+        calls = []
+        cache = h.QuoteCache(self.fakeFetch(calls), ttl=0, stale_ttl=60)
+        cache.get('AAPL')
+        assert cache.get('AAPL')['symbol'] == 'AAPL'
+        for _ in range(100):
+            if cache.stats()['refreshes']:
+                break
+            time.sleep(0.01)
+        assert cache.stats()['stale_hits'] == 1
+        assert cache.stats()['refreshes'] == 1
+        assert calls == ['AAPL', 'AAPL']
+
+    def test_quote_cache_get_many(self):
+        """Uncached symbols are fetched together in one batch"""
+        calls = []
+        cache = h.QuoteCache(self.fakeFetch(calls))
+        cache.get('AAPL')
+        found = cache.get_many(['aapl', 'BIDU', 'GOOG', 'FOOBAR'])
+        assert sorted(found) == ['AAPL', 'BIDU', 'GOOG']
+        assert calls == ['AAPL', 'BIDU', 'FOOBAR', 'GOOG']
+
+    ### pricefeed.py ###
+    def test_price_store(self):
+        """Store serves published quotes until they are max_age old"""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = PriceStore(os.path.join(tmp, 'prices.db'), max_age=60)
+            store.put_many({'AAPL': {'name': 'Apple', 'price': 150,
+                'symbol': 'AAPL'}}, now=1000)
+            assert store.get_many(['AAPL', 'BIDU'], now=1030) == {
+                    'AAPL': {'name': 'Apple', 'price': 150, 'symbol': 'AAPL'}}
+            assert store.get_many(['AAPL'], now=1061) == {}
+
+    def test_price_feed_poll(self):
+        """One poll fetches every held symbol in one batch and publishes it"""
+        calls = []
+        with tempfile.TemporaryDirectory() as tmp:
+            store = PriceStore(os.path.join(tmp, 'prices.db'))
+            feed = PriceFeed(store, self.fakeFetch(calls),
+                    lambda: ['AAPL', 'BIDU'])
+            assert feed.poll_once() == 2
+            assert calls == ['AAPL', 'BIDU']
+            assert sorted(store.get_many(['AAPL', 'BIDU'])) == ['AAPL', 'BIDU']
+
+    def test_price_feed_interval(self):
+        """A feed with no interval refuses to poll in a busy loop"""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = PriceStore(os.path.join(tmp, 'prices.db'))
+            feed = PriceFeed(store, self.fakeFetch([]), list, interval=0)
+            with pytest.raises(ValueError):
+                feed.run()
+
+    def test_lookup_from_price_store(self):
+        """Lookups read fresh prices from the store before the API"""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = PriceStore(os.path.join(tmp, 'prices.db'))
+            store.put_many({'FOOBAR': {'name': 'Foo', 'price': 200,
+                'symbol': 'FOOBAR'}})
+            h.price_store = store
+            try:
+                assert h.lookup('foobar')['price'] == 200
+            finally:
+                h.price_store = None
+
+
+    ### pricehistory.py ###
+    def test_price_recorder(self):
+        """Fetched quotes are recorded at most once per interval"""
+        recorder = pricehistory.Recorder(app, interval=60, batch_size=3)
+        h.price_recorder = recorder
+        h.fetch_upstream(['AAPL'])
+        h.fetch_upstream(['AAPL'])
+        assert recorder.flush() == 1
+        now = datetime(2019, 5, 1, 12)
+        recorder.record({'BIDU': {'price': 2}}, now=now)
+        recorder.record({'BIDU': {'price': 3}},
+                now=now + timedelta(seconds=30))
+        recorder.record({'BIDU': {'price': 4}, 'GOOG': {'price': 5}},
+                now=now + timedelta(seconds=60))
+        ticks = q.PriceTick.query.filter_by(symbol='BIDU').all()
+        assert [tick.price for tick in ticks] == [2, 4]
+        assert q.PriceTick.query.count() == 4
+
+    def test_price_recorder_in_request(self):
+        """Flushing during a request leaves the request's session alone"""
+        self.populateTestDb()
+        recorder = pricehistory.Recorder(app, interval=0, flush_after=0)
+        with app.test_request_context():
+            flask.g.user = q.select_user_by_id(1)
+            session = db.session()
+            recorder.record({'AAPL': {'price': 100}})
+            assert q.PriceTick.query.count() == 1
+            assert db.session() is session
+            assert not sqlalchemy.inspect(flask.g.user).detached
+
+    def test_value_series(self):
+        """Ledger and prices are merged into values at each sample time"""
+        day = [datetime(2019, 1, d) for d in range(1, 6)]
+        ledger = [(day[1], 'AAPL', 10, 100), (day[3], 'AAPL', -5, 300)]
+        ticks = [[(day[0], 'AAPL', 90), (day[2], 'AAPL', 200)],
+                [(day[2], 'BIDU', 50)]]
+        series = pricehistory.value_series(ledger, ticks, day, cash=2000)
+        assert list(series) == [(day[0], 2000), (day[1], 2000),
+                (day[2], 3000), (day[3], 4000), (day[4], 4000)]
+
+
+    ### sessionstore.py ###
+    def test_session_store(self):
+        """Sessions live in the table and are only rewritten on change"""
+        self.startSession()
+        stored = q.StoredSession.query.one()
+        assert q.select_session(stored.id).expiry == stored.expiry
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sqlalchemy.event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            self.client.get('/quote')
+            self.client.get('/quote')
+        finally:
+            sqlalchemy.event.remove(db.engine, 'before_cursor_execute',
+                    record)
+        assert not [sql for sql in statements if 'user_session' in sql]
+
+    def test_session_cache_ttl(self):
+        """A cached session is dropped once its row is gone"""
+        self.startSession()
+        store = app.session_interface
+        sid = q.StoredSession.query.one().id
+        q.delete_session(sid)
+        assert self.client.get('/quote').status_code == 200
+        ttl, store.cache_ttl = store.cache_ttl, 0
+        try:
+            assert self.client.get('/quote').status_code == 302
+        finally:
+            store.cache_ttl = ttl
+
+    def test_session_purge(self):
+        """Purge deletes expired sessions only"""
+        store = SessionStore()
+        store.create(app, {'user_id': 1})
+        store.create(app, {'user_id': 2})
+        later = datetime.utcnow() + app.permanent_session_lifetime
+        assert store.purge() == 0
+        assert store.purge(later + timedelta(seconds=1)) == 2
+        assert q.StoredSession.query.count() == 0
+
+    def test_login_new_session(self):
+        """Logging in moves the session to a new id"""
+        self.populateTestDb()
+        self.client.get('/login')
+        with self.client.session_transaction() as sess:
+            sess['visited'] = True
+        before = q.StoredSession.query.one().id
+        self.client.post('/login', data={'username': 'user',
+            'password': 'test'})
+        assert [s.id for s in q.StoredSession.query] != [before]
+        assert q.StoredSession.query.count() == 1
+
+
+    ### passwords.py ###
+    def test_hasher(self):
+        """Hashes check and name the method they were made with"""
+        hasher = passwords.Hasher('pbkdf2:sha256:1000')
+        pwhash = hasher.hash('secret')
+        assert pwhash.startswith('pbkdf2:sha256:1000$')
+        assert hasher.check(pwhash, 'secret')
+        assert not hasher.check(pwhash, 'wrong')
+        assert not hasher.needs_rehash(pwhash)
+        assert passwords.Hasher('pbkdf2:sha256:2000').needs_rehash(pwhash)
+        assert passwords.Hasher('pbkdf2:sha256:1000',
+                salt_length=32).needs_rehash(pwhash)
+        assert hasher.needs_rehash('not a hash')
+
+    def test_hasher_pool(self):
+        """Pooled hashing works and fails fast when every slot is taken"""
+        hasher = passwords.Hasher('pbkdf2:sha256:1000', workers=1,
+                queue_factor=1, timeout=0)
+        assert hasher.check(hasher.hash('secret'), 'secret')
+        hasher._slots.acquire()
+        with pytest.raises(passwords.Busy):
+            hasher.check('x', 'secret')
+        hasher._pool.shutdown()
+
+    def test_login_rehash(self):
+        """Logging in upgrades a hash made with an old method"""
+        self.populateTestDb()
+        q.update_user_hash(
+                generate_password_hash('test', 'pbkdf2:sha256:1000'), 1)
+        self.client.post('/login', data={'username': 'user',
+            'password': 'test'})
+        pwhash = q.select_user_by_id(1).password_hash
+        assert not passwords.hasher.needs_rehash(pwhash)
+        assert passwords.hasher.check(pwhash, 'test')
+
+
+    ### dbpool.py ###
+    def test_engine_options(self):
+        """Server databases get pool settings; Postgres a statement timeout"""
+        options = dbpool.engine_options(app.config, 'postgresql')
+        assert options['poolclass'] is dbpool.MeteredPool
+        assert options['pool_size'] == app.config['DB_POOL_SIZE']
+        assert 'statement_timeout' in options['connect_args']['options']
+        assert 'connect_args' not in dbpool.engine_options(
+                app.config, 'mysql')
+
+    def test_metered_pool(self):
+        """Pool counts checkouts and timeouts and drops forked connections"""
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = sqlalchemy.create_engine(
+                    f'sqlite:///{tmp}/pool.db', poolclass=dbpool.MeteredPool,
+                    pool_size=1, max_overflow=0, pool_timeout=0.01)
+            conn = engine.connect()
+            with pytest.raises(sqlalchemy.exc.TimeoutError):
+                engine.connect()
+            inherited = conn.connection.connection
+            conn.connection._connection_record.info['pid'] = -1
+            conn.close()
+            conn = engine.connect()
+            assert conn.connection.connection is not inherited
+            conn.close()
+            stats = engine.pool.stats()
+            assert stats['checkouts'] == 3
+            assert stats['timeouts'] == 1
+            assert stats['checked_out'] == 0
+            assert 'app_db_pool_timeouts_total 1' in dbpool.metrics(
+                    engine.pool)
+            engine.dispose()
+
+
+    ### replicas.py ###
+    def test_replica_routing(self):
+        """Reads use the replica until a write, then stick to the primary"""
+        with tempfile.TemporaryDirectory() as tmp:
+            probe = create_app(f'sqlite:///{tmp}/primary.db')
+            probe.config['SQLALCHEMY_BINDS'] = {
+                    'replica': f'sqlite:///{tmp}/replica.db'}
+            db.init_app(probe)
+            with probe.app_context():
+                db.create_all()
+                replica = db.get_engine(probe, 'replica')
+                db.Model.metadata.create_all(replica)
+                q.insert_user('primary', 'x')
+                replica.execute(q.User.__table__.insert().values(
+                    username='replica', password_hash='x'))
+
+            with probe.test_request_context():
+                assert q.select_user_by_username('replica')
+                assert not q.select_user_by_username('primary')
+                q.insert_user('new', 'x')
+                assert q.select_user_by_username('new')
+                assert 'wrote_at' in flask.session
+            with probe.test_request_context():
+                flask.session['wrote_at'] = time.time()
+                assert q.select_user_by_username('primary')
+            with probe.test_request_context():
+                flask.session['wrote_at'] = time.time() - 60
+                assert q.select_user_by_username('replica')
+
+            with probe.app_context():
+                db.get_engine(probe).dispose()
+                db.get_engine(probe, 'replica').dispose()
+
+    def test_replica_after_register(self):
+        """A new user's first pages don't read a replica that lags"""
+        state = app.extensions['sqlalchemy']
+        with tempfile.TemporaryDirectory() as tmp:
+            app.config['SQLALCHEMY_BINDS'] = {
+                    'replica': f'sqlite:///{tmp}/replica.db'}
+            try:
+                db.Model.metadata.create_all(db.get_engine(app, 'replica'))
+                response = self.client.post('/register', data={
+                    'username': 'new', 'password': 'pw',
+                    'confirmation': 'pw'})
+                assert response.status_code == 302
+                db.session.remove()
+                response = self.client.get('/')
+                assert response.status_code == 200
+            finally:
+                db.session.remove()
+                state.connectors.pop('replica').get_engine().dispose()
+                app.config['SQLALCHEMY_BINDS'] = None
+
+
+    ### instrumentation.py ###
+    def test_instrumentation(self):
+        """Requests report SQL, quote and template time"""
+        probe = create_app('sqlite://')
+        probe.config['INSTRUMENTATION'] = True
+        instrumentation.init_app(probe)
+        engine = sqlalchemy.create_engine('sqlite://')
+
+        @probe.route('/probe')
+        def probe_view():
+            engine.execute('SELECT 1')
+            with instrumentation.timed('quote'):
+                pass
+            return flask.render_template_string('{{ 1 }}')
+
+        client = probe.test_client()
+        timing = client.get('/probe').headers['Server-Timing']
+        for kind in ('sql', 'quote', 'template', 'total'):
+            assert f'{kind};dur=' in timing
+        client.get('/metrics')
+        metrics = client.get('/metrics').data.decode()
+        assert 'app_sql_statements_total{endpoint="probe_view"} 1' in metrics
+        assert 'app_quote_fetches_total{endpoint="probe_view"} 1' in metrics
+        assert ('app_requests_total{endpoint="probe_view",method="GET",'
+                'status="200"} 1') in metrics
+        families = [line.split()[2] for line in metrics.splitlines()
+                if line.startswith('# TYPE')]
+        samples = [line.split('{')[0].split()[0]
+                for line in metrics.splitlines() if not line.startswith('#')]
+        assert len(families) == len(set(families))
+        assert samples == sorted(samples, key=lambda name: next(
+                i for i, f in enumerate(families) if name.startswith(f)))
+
+    def test_instrumentation_streamed(self):
+        """Streamed templates are timed and counted when the body is sent"""
+        probe = create_app('sqlite://')
+        probe.config['INSTRUMENTATION'] = True
+        instrumentation.init_app(probe)
+
+        @probe.route('/stream')
+        def stream_view():
+            template = probe.jinja_env.from_string(
+                    '{% for i in range(3) %}{{ i }}{% endfor %}')
+            return flask.Response(flask.stream_with_context(
+                template.generate()))
+
+        client = probe.test_client()
+        response = client.get('/stream')
+        assert response.data == b'012'
+        response.close()
+        metrics = client.get('/metrics').data.decode()
+        assert ('app_template_renders_total{endpoint="stream_view"} 1'
+                in metrics)
+        assert ('app_requests_total{endpoint="stream_view",method="GET",'
+                'status="200"} 1') in metrics
+
+    def test_instrumentation_access(self):
+        """Metrics need the token, or localhost when there is none"""
+        probe = create_app('sqlite://')
+        probe.config['INSTRUMENTATION'] = True
+        instrumentation.init_app(probe)
+        client = probe.test_client()
+        remote = {'REMOTE_ADDR': '203.0.113.5'}
+        for path in ('/metrics', '/debug/profile'):
+            assert client.get(path).status_code == 200
+            assert client.get(path, environ_base=remote).status_code == 404
+        probe.config['METRICS_TOKEN'] = 'secret'
+        bearer = {'Authorization': 'Bearer secret'}
+        for path in ('/metrics', '/debug/profile'):
+            assert client.get(path).status_code == 404
+            assert client.get(path, headers=bearer,
+                    environ_base=remote).status_code == 200
+
+    def test_instrumented_profile_page(self):
+        """The user profile page still renders with instrumentation on"""
+        probe = create_app('sqlite://')
+        probe.config['INSTRUMENTATION'] = True
+        probe.jinja_env.filters['usd'] = h.usd
+        db.init_app(probe)
+        instrumentation.init_app(probe)
+        probe.add_url_rule('/profile', 'profile', application.profile,
+                methods=['GET', 'POST'])
+        with probe.app_context():
+            db.create_all()
+            q.insert_user('user', generate_password_hash('test'))
+        client = probe.test_client()
+        with client.session_transaction() as sess:
+            sess['user_id'] = 1
+        response = client.get('/profile')
+        assert b'Your Profile' in response.data
+        with probe.app_context():
+            db.get_engine(probe).dispose()
+
+    def test_sampler(self):
+        """Sampler counts stacks of the threads it was started in"""
+        sampler = instrumentation.Sampler(interval=0.001)
+        sampler.start('busy')
+        deadline = time.monotonic() + 0.2
+        while time.monotonic() < deadline and not sampler.stacks:
+            sum(range(1000))
+        sampler.stop()
+        assert 'tests.py:test_sampler' in sampler.collapsed('busy')
+        assert sampler.collapsed('idle') == ''
+
+
+    ### valuation.py ###
+    def test_valuation_totals(self):
+        """Every user is valued at once, at current or what-if prices"""
+        valuation = Valuation()
+        valuation.add_users([(1, 'a', 1000), (2, 'b', 500)])
+        valuation.add_positions([(1, 'AAPL', 2), (2, 'AAPL', 1),
+            (2, 'BIDU', 3)])
+        valuation.reprice({'AAPL': {'price': 100}, 'BIDU': {'price': 10}})
+        assert valuation.totals().tolist() == [1200, 630]
+        assert valuation.what_if({'BIDU': {'price': 1000}}).tolist() == [
+                1200, 3600]
+        assert valuation.totals().tolist() == [1200, 630]
+        assert valuation.top(1) == [('a', 1200)]
+
+    def test_valuation_trade(self):
+        """Trades and resets update cash and positions in place"""
+        self.populateTestDb()
+        valuation = Valuation.load()
+        assert valuation.held_symbols() == ['AAPL']
+        valuation.trade(1, 'BIDU', 2, 50)
+        valuation.trade(1, 'AAPL', -1, 3)
+        assert valuation.held_symbols() == ['BIDU']
+        assert valuation.totals().tolist() == [q.STARTING_CASH + 3]
+        valuation.reset(1, 0)
+        assert valuation.totals().tolist() == [0]
+
+
+    ### leaderboard.py ###
+    def test_leaderboard_load(self):
+        """Leaderboard ranks users loaded from the db"""
+        self.populateTestDb()
+        q.insert_user('poor', 'x')
+        q.update_user_cash(-500000, 2)
+        leaders = Leaderboard()
+        leaders.refresh()
+        assert leaders.symbols() == ['AAPL']
+        leaders.reprice({'AAPL': {'price': 10000}})
+        assert leaders.top() == [('user', 1010000), ('poor', 500000)]
+
+    def test_leaderboard_record_trade(self):
+        """Trades update the standings without a reload"""
+        self.populateTestDb()
+        leaders = Leaderboard(size=1)
+        leaders.refresh()
+        leaders.add_user(2, 'new', q.STARTING_CASH)
+        leaders.record_trade(2, 'BIDU', 10, 50)
+        leaders.reprice({'AAPL': {'price': 1}, 'BIDU': {'price': 60}})
+        assert leaders.top() == [('new', q.STARTING_CASH + 100)]
+        leaders.record_trade(2, 'BIDU', -10, 60)
+        assert leaders.symbols() == ['AAPL']
+        leaders.reset_user(1, q.STARTING_CASH)
+        assert leaders.symbols() == []
+
+    def test_leaderboard_reprice_unchanged(self):
+        """Unchanged prices don't force a re-rank"""
+        self.populateTestDb()
+        leaders = Leaderboard()
+        leaders.refresh()
+        leaders.reprice({'AAPL': {'price': 1}})
+        top = leaders.top()
+        leaders.reprice({'AAPL': {'price': 1}})
+        assert leaders.top() is top
 
 
     ### application.py ###
     def startSession(self):
         """Initialize a user session for login_required routes"""
+        if q.select_user_by_id(1) is None:
+            q.insert_user('user', generate_password_hash('test'))
         with self.client.session_transaction() as sess:
             sess['user_id'] = 1
             sess.modified = True
@@ -283,6 +1179,87 @@ class MyTest(TestCase):
         self.startSession()
         response = self.client.get('/history')
         assert b'Apple' in response.data
+        assert b'$0.01' in response.data
+
+    def test_history_pages(self):
+        """History is split into pages linked by cursors"""
+        self.populateTestDb()
+        self.startSession()
+        app.config['HISTORY_PAGE_SIZE'] = 1
+        q.insert_transaction(1, 2, 1, 1)
+        try:
+            response = self.client.get('/history')
+            assert b'Baidu' in response.data
+            assert b'Apple' not in response.data
+            before = q.Transaction.query.get(2)
+            response = self.client.get(
+                    f'/history?before={h.encode_cursor(before)}')
+            assert b'Apple' in response.data
+            assert b'Older' not in response.data
+        finally:
+            app.config['HISTORY_PAGE_SIZE'] = 50
+
+    def test_history_stream(self):
+        """Full history can be streamed"""
+        self.populateTestDb()
+        self.startSession()
+        response = self.client.get('/history?stream=1')
+        assert response.is_streamed
+        assert b'Apple' in response.data
+
+    def test_history_invalid_page(self):
+        """Renders error for a malformed cursor"""
+        self.startSession()
+        response = self.client.get('/history?before=garbage')
+        assert b'Invalid page' in response.data
+
+    def test_leaders(self):
+        """Leader board shows users ranked by portfolio value"""
+        self.populateTestDb()
+        self.startSession()
+        h.quote_cache.put_many({'AAPL': {
+            'name': 'Apple', 'price': 10000, 'symbol': 'AAPL'}})
+        response = self.client.get('/leaders')
+        assert b'$10,100.00' in response.data
+
+    def test_performance(self):
+        """Portfolio value is replayed against recorded prices"""
+        self.populateTestDb()
+        self.startSession()
+        start = q.Transaction.query.get(1).time
+        later = start + timedelta(hours=1)
+        q.insert_price_ticks([{'symbol': 'AAPL', 'day': later.date(),
+            'time': later, 'price': 101}])
+        response = self.client.get('/performance', query_string={
+            'start': start.isoformat(),
+            'end': (start + timedelta(hours=2)).isoformat(),
+            'step': 3600})
+        assert [value for _, value in response.json['points']] == [
+                q.STARTING_CASH, q.STARTING_CASH + 100, q.STARTING_CASH + 100]
+
+    def test_performance_invalid_range(self):
+        """Rejects malformed and oversized ranges"""
+        self.startSession()
+        for args in ({'start': 'garbage'}, {'step': '0'},
+                {'start': '2019-01-01', 'end': '2018-01-01'},
+                {'step': '1'}, {'end': '2019-13-01'},
+                {'start': '2019-01-01T00:00:00+02:00',
+                    'end': '2018-12-31T21:00:00Z'}):
+            response = self.client.get('/performance', query_string=args)
+            assert response.status_code == 400
+
+    def test_performance_offset_times(self):
+        """Times with an offset are converted to UTC"""
+        self.startSession()
+        start = (datetime.utcnow() - timedelta(days=1)).replace(
+                microsecond=0)
+        response = self.client.get('/performance', query_string={
+            'start': start.isoformat() + '-05:00'})
+        assert response.status_code == 200
+        response = self.client.get('/performance', query_string={
+            'start': '2019-01-01T02:00:00+02:00',
+            'end': '2019-01-01T00:00:00Z', 'step': 3600})
+        assert response.json['points'][0][0] == '2019-01-01T00:00:00'
 
     def test_nuke_post(self):
         """Nuking resets user portfolio"""
@@ -358,6 +1335,7 @@ class MyTest(TestCase):
         self.startSession()
         response = self.client.get('/profile')
         assert b'Your Profile' in response.data
+        assert b'$10,000.00' in response.data
 
     def test_quote_post(self):
         """Requesting quote with valid symbol returns quote"""
@@ -471,6 +1449,12 @@ class MyTest(TestCase):
         response = self.client.get('/register')
         assert b'Create a New Account' in response.data
 
+    def test_symbols(self):
+        """Symbol search returns autocomplete suggestions as JSON"""
+        self.startSession()
+        response = self.client.get('/symbols?q=tsla')
+        assert {'label': 'TSLA - Tesla Inc.', 'value': 'TSLA'} in response.json
+
     def test_sell_post(self):
         """Sell route redirects to portfolio on success"""
         self.populateTestDb()
@@ -533,3 +1517,4 @@ class MyTest(TestCase):
         self.startSession()
         response = self.client.get('/sell')
         assert b'Sell Stocks' in response.data
+        assert b"<option value='AAPL'>" in response.data
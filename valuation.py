@@ -0,0 +1,152 @@
+"""
+Columnar portfolio valuation.
+
+Every user's cash and every held position are kept in NumPy arrays: a
+cash vector indexed by user, and position columns of user index, symbol
+index and quantity. Valuing the whole game at a price vector is then one
+gather (prices[symbols]), one multiply and one bincount reduction by
+user, instead of a Python loop over every position.
+
+Amounts are integer cents. bincount sums in float64, which is exact for
+integers below 2**53 cents, far above any portfolio in the game.
+"""
+import numpy as np
+
+import queries as q
+
+
+class Valuation:
+    """Cash and positions of many users, valued together"""
+
+    def __init__(self):
+        self.user_ids = []
+        self.usernames = []
+        self.symbols = []
+        self._users = {}
+        self._symbols = {}
+        self._rows = {}
+        self.cash = np.zeros(0, dtype=np.int64)
+        self.prices = np.zeros(0, dtype=np.int64)
+        self.owners = np.zeros(0, dtype=np.intp)
+        self.stocks = np.zeros(0, dtype=np.intp)
+        self.quantities = np.zeros(0, dtype=np.int64)
+
+    @classmethod
+    def load(cls, user_ids=None):
+        """Snapshot users and their held positions from the database"""
+        valuation = cls()
+        users = q.select_all_users()
+        if user_ids is not None:
+            user_ids = set(user_ids)
+            users = [user for user in users if user.id in user_ids]
+        valuation.add_users(
+                (user.id, user.username, user.cash) for user in users)
+        positions = [p for p in q.select_positions(user_ids, held_only=True)
+                if p.user_id in valuation._users]
+        valuation.add_positions(
+                (p.user_id, p.symbol, p.quantity) for p in positions)
+        return valuation
+
+    def add_users(self, users):
+        """Add (user_id, username, cash) rows"""
+        cash = []
+        for user_id, username, balance in users:
+            self._users[user_id] = len(self.user_ids)
+            self.user_ids.append(user_id)
+            self.usernames.append(username)
+            cash.append(balance)
+        self.cash = np.concatenate(
+                [self.cash, np.asarray(cash, dtype=np.int64)])
+
+    def add_positions(self, positions):
+        """Add (user_id, symbol, quantity) rows for users already added"""
+        owners, stocks, quantities = [], [], []
+        for user_id, symbol, quantity in positions:
+            owner, stock = self._users[user_id], self.symbol_index(symbol)
+            self._rows[owner, stock] = len(self._rows)
+            owners.append(owner)
+            stocks.append(stock)
+            quantities.append(quantity)
+        self.owners = np.concatenate(
+                [self.owners, np.asarray(owners, dtype=np.intp)])
+        self.stocks = np.concatenate(
+                [self.stocks, np.asarray(stocks, dtype=np.intp)])
+        self.quantities = np.concatenate(
+                [self.quantities, np.asarray(quantities, dtype=np.int64)])
+
+    def symbol_index(self, symbol):
+        """Column of symbol in the price vector, adding it if new"""
+        if symbol not in self._symbols:
+            self._symbols[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+            self.prices = np.append(self.prices, 0)
+        return self._symbols[symbol]
+
+    def __contains__(self, user_id):
+        return user_id in self._users
+
+    def held_symbols(self):
+        """Symbols with shares held by any user"""
+        held = np.unique(self.stocks[self.quantities > 0])
+        return [self.symbols[i] for i in held]
+
+    def trade(self, user_id, symbol, quantity, price):
+        """Apply a buy (positive quantity) or sell (negative) to a user"""
+        owner, stock = self._users[user_id], self.symbol_index(symbol)
+        self.cash[owner] -= quantity * price
+        row = self._rows.get((owner, stock))
+        if row is None:
+            self.add_positions([(user_id, symbol, quantity)])
+        else:
+            self.quantities[row] += quantity
+        if not self.prices[stock]:
+            self.prices[stock] = price
+
+    def reset(self, user_id, cash):
+        """Empty a user's positions and set their cash"""
+        owner = self._users[user_id]
+        self.quantities[self.owners == owner] = 0
+        self.cash[owner] = cash
+
+    def price_vector(self, quotes, base=None):
+        """
+        Prices aligned with symbols, from a {symbol: quote} dict over a
+        base vector (the current prices by default)
+        """
+        prices = (self.prices if base is None else base).copy()
+        for symbol, quote in quotes.items():
+            if symbol in self._symbols:
+                prices[self._symbols[symbol]] = quote['price']
+        return prices
+
+    def reprice(self, quotes):
+        """Take new current prices; returns whether any changed"""
+        prices = self.price_vector(quotes)
+        changed = not np.array_equal(prices, self.prices)
+        self.prices = prices
+        return changed
+
+    def holdings(self, prices=None):
+        """Market value of each user's positions at prices"""
+        prices = self.prices if prices is None else prices
+        values = self.quantities * prices[self.stocks]
+        return np.rint(np.bincount(self.owners, weights=values,
+                minlength=len(self.user_ids))).astype(np.int64)
+
+    def totals(self, prices=None):
+        """Cash plus holdings of each user at prices"""
+        return self.cash + self.holdings(prices)
+
+    def what_if(self, quotes):
+        """Each user's total if quotes replaced the current prices"""
+        return self.totals(self.price_vector(quotes))
+
+    def top(self, n, totals=None):
+        """The n best (username, total) pairs, highest total first"""
+        totals = self.totals() if totals is None else totals
+        n = min(n, len(totals))
+        if not n:
+            return []
+        best = np.argpartition(-totals, n - 1)[:n]
+        best = best[np.argsort(-totals[best], kind='stable')]
+        return [(self.usernames[i], int(totals[i])) for i in best]